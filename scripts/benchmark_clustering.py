@@ -0,0 +1,145 @@
+"""Script to benchmark mini-batch constrained KMeans against COP KMeans on the demo archives.
+
+Usage: `python scripts/benchmark_clustering.py [--copies 1] [--batch-size 1024] [--cop-max-texts 5000]`.
+
+For each demo archive of `docs/examples`, texts (not deleted) are vectorized with TF-IDF, and annotated constraints
+(not hidden) are loaded in a constraints manager. Texts and constraints can be copied several times to simulate a
+larger project. Both algorithms cluster texts with the settings of the last iteration of the archive (COP KMeans is
+skipped above `--cop-max-texts` texts, as each of its iterations checks constraints of all pairs of texts), then their
+duration, their number of violated constraints and their inertia are compared. COP KMeans is run on texts, and on
+components of MUST_LINK constraints (noted `(ML)`, as in the clustering task).
+"""
+
+import argparse
+import json
+import zipfile
+from pathlib import Path
+from typing import Any, Dict, List, Tuple
+
+from scipy.sparse import csr_matrix
+
+from cognitivefactory.interactive_clustering.constraints.binary import BinaryConstraintsManager
+from cognitivefactory.interactive_clustering_gui.clustering import run_clustering_with_several_random_seeds
+from cognitivefactory.interactive_clustering_gui.nlp import vectorize
+
+EXAMPLES_DIRECTORY = Path(__file__).parent.parent / "docs" / "examples"
+
+
+def load_archive(
+    archive_path: Path, nb_copies: int
+) -> Tuple[Dict[str, str], List[Tuple[str, str, str]], Dict[str, Any]]:
+    """Load texts, constraints and clustering settings of the last iteration of an archive, copied `nb_copies` times."""
+    with zipfile.ZipFile(archive_path) as archive:
+        texts = json.loads(archive.read("texts.json"))
+        constraints = json.loads(archive.read("constraints.json"))
+        settings = json.loads(archive.read("settings.json"))
+    dict_of_texts = {
+        "{0}.{1}".format(copy_id, text_id): text_value["text_preprocessed"]
+        for copy_id in range(nb_copies)
+        for text_id, text_value in texts.items()
+        if text_value["is_deleted"] is False
+    }
+    list_of_constraints = [
+        (
+            "{0}.{1}".format(copy_id, constraint_value["data"]["id_1"]),
+            "{0}.{1}".format(copy_id, constraint_value["data"]["id_2"]),
+            constraint_value["constraint_type"],
+        )
+        for copy_id in range(nb_copies)
+        for constraint_value in constraints.values()
+        if constraint_value["constraint_type"] in {"MUST_LINK", "CANNOT_LINK"}
+        and constraint_value["is_hidden"] is False
+    ]
+    return dict_of_texts, list_of_constraints, settings[max(settings.keys(), key=int)]["clustering"]
+
+
+def run(
+    algorithm: str,
+    init_kargs: Dict[str, Any],
+    clustering_settings: Dict[str, Any],
+    constraints_manager: BinaryConstraintsManager,
+    vectors: Dict[str, csr_matrix],
+    list_of_constraints: List[Tuple[str, str, str]],
+    reduce_components: bool = False,
+) -> str:
+    """Run a clustering (as the clustering task, with one random seed), and format its duration and its score."""
+    _, metrics = run_clustering_with_several_random_seeds(
+        constraints_manager=constraints_manager,
+        vectors=vectors,
+        nb_clusters=clustering_settings["nb_clusters"],
+        algorithm=algorithm,
+        random_seed=clustering_settings["random_seed"],
+        init_kargs=init_kargs,
+        list_of_constraints=list_of_constraints,
+        processes_number=1,
+        reduce_components=reduce_components,
+    )
+    return "{d:8.2f} s  {v:4d} violations  inertia={i:9.2f}".format(
+        d=metrics["clustering_duration"],
+        v=metrics["clustering_constraints_violations"],
+        i=metrics["clustering_inertia"],
+    )
+
+
+def main(nb_copies: int, batch_size: int, cop_max_texts: int):
+    """Run the benchmark."""
+    for archive_path in sorted(EXAMPLES_DIRECTORY.glob("archive-demo-*.zip")):
+        dict_of_texts, list_of_constraints, clustering_settings = load_archive(archive_path, nb_copies=nb_copies)
+        vectors = vectorize(dict_of_texts=dict_of_texts, vectorizer_type="tfidf")
+        constraints_manager = BinaryConstraintsManager(list_of_data_IDs=list(dict_of_texts.keys()))
+        list_of_added_constraints: List[Tuple[str, str, str]] = []
+        for data_ID1, data_ID2, constraint_type in list_of_constraints:
+            try:
+                constraints_manager.add_constraint(
+                    data_ID1=data_ID1, data_ID2=data_ID2, constraint_type=constraint_type
+                )
+            except ValueError:  # Constraints in conflict are skipped, as in modelization update.
+                continue
+            list_of_added_constraints.append((data_ID1, data_ID2, constraint_type))
+        list_of_constraints = list_of_added_constraints
+        print(
+            "{a}: {t} texts, {c} constraints, {k} clusters".format(
+                a=archive_path.stem,
+                t=len(dict_of_texts),
+                c=len(list_of_constraints),
+                k=clustering_settings["nb_clusters"],
+            )
+        )
+        if len(dict_of_texts) <= cop_max_texts:
+            for name, reduce_components in (("COP KMeans", False), ("COP KMeans (ML)", True)):
+                print(
+                    "    {n:18s} {r}".format(
+                        n=name,
+                        r=run(
+                            algorithm="kmeans",
+                            init_kargs={"model": "COP", "max_iteration": 150, "tolerance": 0.0001},
+                            clustering_settings=clustering_settings,
+                            constraints_manager=constraints_manager,
+                            vectors=vectors,
+                            list_of_constraints=list_of_constraints,
+                            reduce_components=reduce_components,
+                        ),
+                    )
+                )
+        print(
+            "    {n:18s} {r}".format(
+                n="Mini-batch KMeans",
+                r=run(
+                    algorithm="minibatch_kmeans",
+                    init_kargs={"batch_size": batch_size, "max_iteration": 100, "tolerance": 0.0001},
+                    clustering_settings=clustering_settings,
+                    constraints_manager=constraints_manager,
+                    vectors=vectors,
+                    list_of_constraints=list_of_constraints,
+                ),
+            )
+        )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--copies", type=int, default=1)
+    parser.add_argument("--batch-size", type=int, default=1024)
+    parser.add_argument("--cop-max-texts", type=int, default=5000)
+    arguments = parser.parse_args()
+    main(nb_copies=arguments.copies, batch_size=arguments.batch_size, cop_max_texts=arguments.cop_max_texts)
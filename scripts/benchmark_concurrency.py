@@ -0,0 +1,216 @@
+"""Script to benchmark the latency of the web application under concurrent annotators.
+
+Usage: `python scripts/benchmark_concurrency.py [--annotators 50] [--requests 10] [--texts 5000] [--constraints 20000]`.
+
+A synthetic project is created in a temporary data directory and served by Uvicorn (in a subprocess), then each
+annotator repeatedly annotates a random constraint and loads the data of its pages (a page of constraints, the
+modelization and the clustering results). A probe measures at the same time the latency of a trivial request
+(the list of projects): it shows how long any other user is blocked by annotators requests.
+"""
+
+import argparse
+import asyncio
+import json
+import math
+import os
+import random
+import subprocess  # noqa: S404
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Dict, List
+
+from httpx import AsyncClient
+
+from cognitivefactory.interactive_clustering_gui.models.settings import (
+    default_ClusteringSettingsModel,
+    default_PreprocessingSettingsModel,
+    default_SamplingSettingsModel,
+    default_VectorizationSettingsModel,
+)
+from cognitivefactory.interactive_clustering_gui.models.states import ICGUIStates
+from cognitivefactory.interactive_clustering_gui.storage.factory import storage_factory
+
+PROJECT_ID = "benchmark"
+
+
+def create_project(data_directory: Path, nb_texts: int, nb_constraints: int) -> List[str]:
+    """Create a synthetic project at annotation step, and return the IDs of its constraints."""
+    project_directory = data_directory / PROJECT_ID
+    project_directory.mkdir()
+    rng = random.Random(42)  # noqa: S311
+
+    # Small artifacts.
+    files: Dict[str, object] = {
+        "metadata.json": {"project_id": PROJECT_ID, "project_name": "benchmark", "creation_timestamp": time.time()},
+        "status.json": {"iteration_id": 1, "state": ICGUIStates.ANNOTATION_WITH_UPTODATE_MODELIZATION, "task": None},
+        "settings.json": {
+            str(iteration_id): {
+                "preprocessing": default_PreprocessingSettingsModel().to_dict(),
+                "vectorization": default_VectorizationSettingsModel().to_dict(),
+                "sampling": default_SamplingSettingsModel().to_dict(),
+                "clustering": default_ClusteringSettingsModel().to_dict(),
+            }
+            for iteration_id in (0, 1)
+        },
+        "sampling.json": {"1": []},
+        # Large artifacts.
+        "modelization.json": {"COMPONENT": {str(i): i for i in range(nb_texts)}, "CANNOT_LINK": {}},
+        "clustering.json": {"0": {str(i): rng.randrange(20) for i in range(nb_texts)}},
+    }
+    for file_name, content in files.items():
+        with open(project_directory / file_name, "w") as fileobject:
+            json.dump(content, fileobject, indent=4)
+
+    # Texts and constraints.
+    constraints: Dict[str, Dict[str, object]] = {}
+    while len(constraints) < nb_constraints:
+        id_1, id_2 = sorted(rng.sample(range(nb_texts), 2))
+        constraints["({id_1},{id_2})".format(id_1=id_1, id_2=id_2)] = {
+            "data": {"id_1": str(id_1), "id_2": str(id_2)},
+            "constraint_type": None,
+            "constraint_type_previous": [],
+            "is_hidden": False,
+            "to_annotate": True,
+            "to_review": False,
+            "to_fix_conflict": False,
+            "comment": "",
+            "date_of_update": None,
+            "iteration_of_sampling": 1,
+        }
+    project_storage = storage_factory(project_directory=project_directory)
+    with project_storage.transaction():
+        project_storage.set_texts(
+            texts={
+                str(i): {
+                    "text_original": "text {i}".format(i=i),
+                    "text": "text {i}".format(i=i),
+                    "text_preprocessed": "text {i}".format(i=i),
+                    "is_deleted": False,
+                }
+                for i in range(nb_texts)
+            }
+        )
+        project_storage.set_constraints(constraints=constraints)
+    return list(constraints.keys())
+
+
+async def annotator(
+    client: AsyncClient, constraint_ids: List[str], nb_requests: int, latencies: Dict[str, List[float]]
+):
+    """Simulate an annotator: annotate a random constraint, then reload the data of the annotation page."""
+    rng = random.Random()  # noqa: S311
+    for _ in range(nb_requests):
+        for route, method, url in (
+            (
+                "PUT annotate",
+                "PUT",
+                "/api/projects/{p}/constraints/{c}/annotate?constraint_type={t}".format(
+                    p=PROJECT_ID, c=rng.choice(constraint_ids), t=rng.choice(["MUST_LINK", "CANNOT_LINK"])
+                ),
+            ),
+            ("GET constraints", "GET", "/api/projects/{p}/constraints?limit=50".format(p=PROJECT_ID)),
+            ("GET modelization", "GET", "/api/projects/{p}/modelization".format(p=PROJECT_ID)),
+            ("GET clustering", "GET", "/api/projects/{p}/clustering?iteration_id=0".format(p=PROJECT_ID)),
+        ):
+            start = time.perf_counter()
+            response = await client.request(method, url)
+            latencies[route].append(time.perf_counter() - start)
+            assert response.status_code < 300, response.text  # noqa: S101
+
+
+async def probe(client: AsyncClient, latencies: List[float], stop: asyncio.Event):
+    """Measure the latency of a trivial request every 10 ms, until `stop` is set."""
+    while not stop.is_set():
+        start = time.perf_counter()
+        await client.get("/api/projects")
+        latencies.append(time.perf_counter() - start)
+        await asyncio.sleep(0.01)
+
+
+def percentiles(values: List[float]) -> str:
+    """Format p50, p95, p99 and max of latencies (in milliseconds)."""
+    sorted_values = sorted(values)
+    quantiles = [sorted_values[max(0, math.ceil(q * len(sorted_values) / 100) - 1)] * 1000 for q in (50, 95, 99, 100)]
+    return "p50={0:8.1f}  p95={1:8.1f}  p99={2:8.1f}  max={3:8.1f}  (n={n})".format(*quantiles, n=len(values))
+
+
+async def main(nb_annotators: int, nb_requests: int, nb_texts: int, nb_constraints: int, port: int):
+    """Run the benchmark."""
+    with tempfile.TemporaryDirectory() as data_directory:
+        constraint_ids = create_project(Path(data_directory), nb_texts=nb_texts, nb_constraints=nb_constraints)
+
+        # Start the server.
+        server = subprocess.Popen(  # noqa: S603
+            [
+                sys.executable,
+                "-m",
+                "uvicorn",
+                "cognitivefactory.interactive_clustering_gui.app:app",
+                "--port",
+                str(port),
+                "--log-level",
+                "warning",
+            ],
+            env={**os.environ, "DATA_DIRECTORY": data_directory},
+        )
+        try:
+            async with AsyncClient(base_url="http://127.0.0.1:{port}".format(port=port), timeout=600) as client:
+                # Wait for the server.
+                while True:
+                    try:
+                        await client.get("/alive")
+                        break
+                    except Exception:
+                        await asyncio.sleep(0.2)
+
+                # Run annotators and probe.
+                latencies: Dict[str, List[float]] = {
+                    "PUT annotate": [],
+                    "GET constraints": [],
+                    "GET modelization": [],
+                    "GET clustering": [],
+                }
+                probe_latencies: List[float] = []
+                stop = asyncio.Event()
+                probe_task = asyncio.create_task(probe(client=client, latencies=probe_latencies, stop=stop))
+                start = time.perf_counter()
+                await asyncio.gather(
+                    *[annotator(client, constraint_ids, nb_requests, latencies) for _ in range(nb_annotators)]
+                )
+                duration = time.perf_counter() - start
+                stop.set()
+                await probe_task
+        finally:
+            server.terminate()
+            server.wait()
+
+    nb_total = sum(len(route_latencies) for route_latencies in latencies.values())
+    print(
+        "{a} annotators, {t} texts, {c} constraints: {n} requests in {d:.1f} s ({r:.0f} requests/s)".format(
+            a=nb_annotators, t=nb_texts, c=nb_constraints, n=nb_total, d=duration, r=nb_total / duration
+        )
+    )
+    for route, route_latencies in latencies.items():
+        print("{route:18s} {p} ms".format(route=route, p=percentiles(route_latencies)))
+    print("{route:18s} {p} ms".format(route="probe", p=percentiles(probe_latencies)))
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--annotators", type=int, default=50)
+    parser.add_argument("--requests", type=int, default=10)
+    parser.add_argument("--texts", type=int, default=5000)
+    parser.add_argument("--constraints", type=int, default=20000)
+    parser.add_argument("--port", type=int, default=8765)
+    arguments = parser.parse_args()
+    asyncio.run(
+        main(
+            nb_annotators=arguments.annotators,
+            nb_requests=arguments.requests,
+            nb_texts=arguments.texts,
+            nb_constraints=arguments.constraints,
+            port=arguments.port,
+        )
+    )
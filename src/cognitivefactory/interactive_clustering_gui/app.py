@@ -12,13 +12,14 @@
 # IMPORT PYTHON DEPENDENCIES
 # ==============================================================================
 
+import asyncio
 import html
 import json
 import os
 import pathlib
 import shutil
 from datetime import datetime
-from typing import Any, Callable, Dict, List, Optional, Tuple
+from typing import Any, AsyncIterator, Callable, Dict, List, Optional, Tuple
 
 import pandas as pd
 from dateutil import tz
@@ -36,20 +37,26 @@ from fastapi import (
     status,
 )
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import FileResponse  # HTMLResponse
+from fastapi.responses import FileResponse, JSONResponse, StreamingResponse  # HTMLResponse
 from fastapi.staticfiles import StaticFiles
 from fastapi.templating import Jinja2Templates
-from filelock import FileLock
 from importlib_metadata import version
 from prometheus_client import Gauge
 from prometheus_fastapi_instrumentator import Instrumentator, metrics
 from zipp import zipfile
 
-from cognitivefactory.interactive_clustering_gui import backgroundtasks
+from cognitivefactory.interactive_clustering_gui import backgroundtasks, workers
+from cognitivefactory.interactive_clustering_gui.events import KEEPALIVE_DELAY, project_events
 from cognitivefactory.interactive_clustering_gui.models.queries import (
+    ConstraintsBulkOperationModel,
     ConstraintsSortOptions,
+    ConstraintsTypeFilters,
     ConstraintsValues,
+    TextsBulkOperationModel,
+    TextsFields,
     TextsSortOptions,
+    decode_cursor,
+    encode_cursor,
 )
 from cognitivefactory.interactive_clustering_gui.models.settings import (
     ClusteringSettingsModel,
@@ -63,6 +70,18 @@ from cognitivefactory.interactive_clustering_gui.models.settings import (
     default_VectorizationSettingsModel,
 )
 from cognitivefactory.interactive_clustering_gui.models.states import ICGUIStates, get_ICGUIStates_details
+from cognitivefactory.interactive_clustering_gui.storage.abstract import AbstractProjectStorage
+from cognitivefactory.interactive_clustering_gui.storage.artifacts_cache import artifacts_cache, load_json, store_json
+from cognitivefactory.interactive_clustering_gui.storage.executor import run_io, run_io_with_project_lock
+from cognitivefactory.interactive_clustering_gui.storage.factory import storage_factory
+from cognitivefactory.interactive_clustering_gui.storage.modelization import (
+    build_modelization,
+    compact_modelization,
+    expand_modelization,
+    is_compact_modelization,
+    is_legacy_modelization,
+)
+from cognitivefactory.interactive_clustering_gui.storage.projects_registry import projects_registry
 
 # ==============================================================================
 # CONFIGURE FASTAPI APPLICATION
@@ -94,6 +113,23 @@ app.mount("/resources", StaticFiles(directory=pathlib.Path(__file__).parent / "r
 DATA_DIRECTORY = pathlib.Path(os.environ.get("DATA_DIRECTORY", ".data"))
 DATA_DIRECTORY.mkdir(parents=True, exist_ok=True)
 
+# Define `ARCHIVE_FORMAT_VERSION` (the format of project archives, stored in their `metadata.json` file).
+# Version `1` (archives without version) has a legacy modelization inference, version `2` a compact one.
+ARCHIVE_FORMAT_VERSION: int = 2
+
+
+# Define function to store the status of a project, and push it to browsers that follow the project.
+def store_project_status(project_id: str, project_status: Dict[str, Any]) -> None:
+    """
+    Store the status of a project, and publish it to the subscribers of project events.
+
+    Args:
+        project_id (str): The ID of the project.
+        project_status (Dict[str, Any]): The new status of the project.
+    """
+    store_json(DATA_DIRECTORY / project_id / "status.json", project_status)
+    project_events.publish(project_id=project_id, project_status=project_status)
+
 
 # ==============================================================================
 # CONFIGURE JINJA2 TEMPLATES
@@ -231,11 +267,39 @@ async def startup() -> None:  # pragma: no cover
 
     # Initialize ready state.
     app.state.ready = False
+    app.state.preloaded_models = []
+
+    # Populate the projects registry.
+    await run_io(projects_registry.get_summaries, data_directory=DATA_DIRECTORY)
+
+    # Requeue background tasks interrupted by the previous server stop.
+    workers.workers_pool.recover(data_directory=DATA_DIRECTORY)
+
+    # Define the long loading: the server of worker processes preloads spaCy models, shared with every background task.
+    async def warm_up() -> None:  # noqa: WPS430 (nested function)
+        """
+        Wait for the preloading of background tasks dependencies, then update ready state.
+        """
+
+        app.state.preloaded_models = await asyncio.get_running_loop().run_in_executor(
+            None,
+            workers.workers_pool.warm_up,
+        )
+        app.state.ready = True
 
-    # Apply database connection, long loading, etc.
+    # Run the long loading in background (the API is available, but not ready until it is done).
+    app.state.warm_up_task = asyncio.create_task(warm_up())
 
-    # Update ready state when done.
-    app.state.ready = True
+
+###
+### STATE: Shutdown event.
+###
+@app.on_event("shutdown")
+async def shutdown() -> None:  # pragma: no cover
+    """Shutdown event."""
+
+    # Stop running background tasks (they will be requeued at next startup).
+    workers.workers_pool.shutdown()
 
 
 ###
@@ -319,13 +383,18 @@ async def get_html_welcome_page(
         name="welcome.html",
         context={
             "request": request,
-            # Get projects and their description.
+            # Get projects and their description (from the listing summary of projects registry).
             "projects": {
                 project_id: {
-                    "metadata": (await get_metadata(project_id=project_id))["metadata"],
-                    "status": (await get_status(project_id=project_id))["status"],
+                    "metadata": project_summary["metadata"],
+                    "status": {
+                        **project_summary["status"],
+                        "state_details": get_ICGUIStates_details(state=project_summary["status"]["state"]),
+                    },
                 }
-                for project_id in (await get_projects())
+                for project_id, project_summary in (
+                    await run_io(projects_registry.get_summaries, data_directory=DATA_DIRECTORY)
+                ).items()
             },
         },
         status_code=status.HTTP_200_OK,
@@ -386,8 +455,8 @@ async def get_projects() -> List[str]:
         List[str]: The list of existing project IDs.
     """
 
-    # Return the list of project IDs.
-    return [project_id for project_id in os.listdir(DATA_DIRECTORY) if os.path.isdir(DATA_DIRECTORY / project_id)]
+    # Return the list of project IDs (the listing of the data directory is only done again when it is modified).
+    return projects_registry.get_project_ids(data_directory=DATA_DIRECTORY)
 
 
 ###
@@ -446,7 +515,8 @@ async def create_project(
         # "text/csv" == ".csv"
         # "application/vnd.ms-excel" == ".xls"
         try:  # noqa: WPS229  # Found too long `try` body length
-            dataset_csv: pd.Dataframe = pd.read_csv(
+            dataset_csv: pd.Dataframe = await run_io(
+                pd.read_csv,
                 filepath_or_buffer=dataset_file.file,
                 sep=";",
                 header=None,  # No header expected in the csv file.
@@ -461,7 +531,8 @@ async def create_project(
     elif dataset_file.content_type == "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet":
         # "application/vnd.ms-excel" == ".xlsx"
         try:  # noqa: WPS229  # Found too long `try` body length
-            dataset_xlsx: pd.Dataframe = pd.read_excel(
+            dataset_xlsx: pd.Dataframe = await run_io(
+                pd.read_excel,
                 io=dataset_file.file.read(),
                 engine="openpyxl",
                 header=None,  # No header expected in the xlsx file.
@@ -482,68 +553,65 @@ async def create_project(
             ),
         )
 
-    # Create the directory and subdirectories of the new project.
-    os.mkdir(DATA_DIRECTORY / current_project_id)
+    # Define the initialization of the new project.
+    def store_project_data() -> None:  # noqa: WPS430 (nested function)
+        """
+        Create the directory of the project, and initialize its data.
+        """
 
-    # Initialize storage of metadata.
-    with open(DATA_DIRECTORY / current_project_id / "metadata.json", "w") as metadata_fileobject:
-        json.dump(
+        # Create the directory and subdirectories of the new project.
+        os.mkdir(DATA_DIRECTORY / current_project_id)
+
+        # Initialize storage of metadata.
+        store_json(
+            DATA_DIRECTORY / current_project_id / "metadata.json",
             {
                 "project_id": current_project_id,
                 "project_name": str(project_name.strip()),
                 "creation_timestamp": current_timestamp,
             },
-            metadata_fileobject,
-            indent=4,
         )
 
-    # Initialize storage of status.
-    with open(DATA_DIRECTORY / current_project_id / "status.json", "w") as status_fileobject:
-        json.dump(
+        # Initialize storage of status.
+        store_json(
+            DATA_DIRECTORY / current_project_id / "status.json",
             {
                 "iteration_id": 0,  # Use string format for JSON serialization in dictionaries.
                 "state": ICGUIStates.INITIALIZATION_WITHOUT_MODELIZATION,
                 "task": None,  # "progression", "detail".
             },
-            status_fileobject,
-            indent=4,
-        )
-
-    # Initialize storage of texts.
-    with open(DATA_DIRECTORY / current_project_id / "texts.json", "w") as texts_fileobject:
-        json.dump(
-            {
-                str(i): {
-                    "text_original": str(text),  # Will never be changed.
-                    "text": str(text),  # Can be change by renaming.
-                    "text_preprocessed": str(text),  # Will be preprocessed during `Modelizationpdate` task.
-                    "is_deleted": False,
-                }
-                for i, text in enumerate(list_of_texts)
-            },
-            texts_fileobject,
-            indent=4,
         )
 
-    # Initialize storage of constraints.
-    with open(DATA_DIRECTORY / current_project_id / "constraints.json", "w") as constraints_fileobject:
-        json.dump(
-            {},  # Dict[str, Any]
-            constraints_fileobject,
-            indent=4,
-        )
+        # Initialize storage of texts and constraints.
+        project_storage: AbstractProjectStorage = storage_factory(project_directory=DATA_DIRECTORY / current_project_id)
+        with project_storage.transaction():
+            project_storage.set_texts(
+                texts={
+                    str(i): {
+                        "text_original": str(text),  # Will never be changed.
+                        "text": str(text),  # Can be change by renaming.
+                        "text_preprocessed": str(text),  # Will be preprocessed during `Modelizationpdate` task.
+                        "is_deleted": False,
+                    }
+                    for i, text in enumerate(list_of_texts)
+                },
+            )
+            project_storage.set_constraints(
+                constraints={},  # Dict[str, Any]
+            )
 
-    # Initialize storage of modelization inference assignations.
-    with open(DATA_DIRECTORY / current_project_id / "modelization.json", "w") as modelization_fileobject:
-        json.dump(
-            {str(i): {"MUST_LINK": [str(i)], "CANNOT_LINK": [], "COMPONENT": i} for i in range(len(list_of_texts))},
-            modelization_fileobject,
-            indent=4,
+        # Initialize storage of modelization inference assignations.
+        store_json(
+            DATA_DIRECTORY / current_project_id / "modelization.json",
+            build_modelization(
+                list_of_data_IDs=[str(i) for i in range(len(list_of_texts))],
+                components=range(len(list_of_texts)),
+            ),
         )
 
-    # Initialize settings storage.
-    with open(DATA_DIRECTORY / current_project_id / "settings.json", "w") as settings_fileobject:
-        json.dump(
+        # Initialize settings storage.
+        store_json(
+            DATA_DIRECTORY / current_project_id / "settings.json",
             {
                 "0": {
                     "preprocessing": default_PreprocessingSettingsModel().to_dict(),
@@ -551,17 +619,19 @@ async def create_project(
                     "clustering": default_ClusteringSettingsModel().to_dict(),
                 },
             },
-            settings_fileobject,
-            indent=4,
         )
 
-    # Initialize storage of sampling results.
-    with open(DATA_DIRECTORY / current_project_id / "sampling.json", "w") as sampling_fileobject:
-        json.dump({}, sampling_fileobject, indent=4)  # Dict[str, List[str]]
+        # Initialize storage of sampling results.
+        store_json(DATA_DIRECTORY / current_project_id / "sampling.json", {})  # Dict[str, List[str]]
+
+        # Initialize storage of clustering results.
+        store_json(DATA_DIRECTORY / current_project_id / "clustering.json", {})  # Dict[str, Dict[str, str]]
+
+        # Register the new project.
+        projects_registry.add(data_directory=DATA_DIRECTORY, project_id=current_project_id)
 
-    # Initialize storage of clustering results.
-    with open(DATA_DIRECTORY / current_project_id / "clustering.json", "w") as clustering_fileobject:
-        json.dump({}, clustering_fileobject, indent=4)  # Dict[str, Dict[str, str]]
+    # Initialize the new project (in the I/O threads pool).
+    await run_io(store_project_data)
 
     # Return the ID of the created project.
     return {
@@ -601,7 +671,20 @@ async def delete_project(
 
     # Delete the project.
     if os.path.isdir(DATA_DIRECTORY / project_id):
-        shutil.rmtree(DATA_DIRECTORY / project_id, ignore_errors=True)
+        # Cancel its queued or running task.
+        await run_io(
+            workers.workers_pool.cancel,
+            data_directory=DATA_DIRECTORY,
+            project_id=project_id,
+        )
+
+        # Unregister the project, and delete its data.
+        await run_io(projects_registry.remove, data_directory=DATA_DIRECTORY, project_id=project_id)
+        await run_io(shutil.rmtree, DATA_DIRECTORY / project_id, ignore_errors=True)
+
+        # Release its cached artifacts, and close the streams of its events.
+        artifacts_cache.invalidate(directory_path=DATA_DIRECTORY / project_id)
+        project_events.publish(project_id=project_id, project_status=None)
 
     # Return the deleted project id.
     return {
@@ -640,7 +723,7 @@ async def get_metadata(
     """
 
     # Check project id.
-    if project_id not in (await get_projects()):
+    if not projects_registry.exists(data_directory=DATA_DIRECTORY, project_id=project_id):
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="The project with id '{project_id_str}' doesn't exist.".format(
@@ -649,12 +732,13 @@ async def get_metadata(
         )
 
     # Load the project metadata.
-    with open(DATA_DIRECTORY / project_id / "metadata.json", "r") as metadata_fileobject:
-        # Return the project metadata.
-        return {
-            "project_id": project_id,
-            "metadata": json.load(metadata_fileobject),
-        }
+    metadata: Dict[str, Any] = await run_io(load_json, DATA_DIRECTORY / project_id / "metadata.json")
+
+    # Return the project metadata.
+    return {
+        "project_id": project_id,
+        "metadata": metadata,
+    }
 
 
 ###
@@ -688,7 +772,7 @@ async def download_project(
     """
 
     # Check project id.
-    if project_id not in (await get_projects()):
+    if not projects_registry.exists(data_directory=DATA_DIRECTORY, project_id=project_id):
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="The project with id '{project_id_str}' doesn't exist.".format(
@@ -700,20 +784,44 @@ async def download_project(
     archive_name: str = "archive-{project_id_str}.zip".format(project_id_str=str(project_id))
     archive_path: pathlib.Path = DATA_DIRECTORY / project_id / archive_name
 
-    # Zip the project in an archive.
-    with zipfile.ZipFile(archive_path, "w", zipfile.ZIP_DEFLATED) as archive_filewriter:
-        archive_filewriter.write(DATA_DIRECTORY / project_id / "metadata.json", arcname="metadata.json")
-        archive_filewriter.write(DATA_DIRECTORY / project_id / "status.json", arcname="status.json")
-        archive_filewriter.write(DATA_DIRECTORY / project_id / "texts.json", arcname="texts.json")
-        archive_filewriter.write(DATA_DIRECTORY / project_id / "constraints.json", arcname="constraints.json")
-        archive_filewriter.write(DATA_DIRECTORY / project_id / "settings.json", arcname="settings.json")
-        archive_filewriter.write(DATA_DIRECTORY / project_id / "sampling.json", arcname="sampling.json")
-        archive_filewriter.write(DATA_DIRECTORY / project_id / "clustering.json", arcname="clustering.json")
-        archive_filewriter.write(DATA_DIRECTORY / project_id / "modelization.json", arcname="modelization.json")
-        if "vectors_2D.json" in os.listdir(DATA_DIRECTORY / project_id):
-            archive_filewriter.write(DATA_DIRECTORY / project_id / "vectors_2D.json", arcname="vectors_2D.json")
-        if "vectors_3D.json" in os.listdir(DATA_DIRECTORY / project_id):
-            archive_filewriter.write(DATA_DIRECTORY / project_id / "vectors_3D.json", arcname="vectors_3D.json")
+    # Define the archive writing.
+    def write_project_archive() -> None:  # noqa: WPS430 (nested function)
+        """
+        Zip the project in an archive.
+        """
+
+        with zipfile.ZipFile(archive_path, "w", zipfile.ZIP_DEFLATED) as archive_filewriter:
+            archive_filewriter.writestr(
+                "metadata.json",
+                json.dumps(
+                    {
+                        **load_json(DATA_DIRECTORY / project_id / "metadata.json"),
+                        "archive_format_version": ARCHIVE_FORMAT_VERSION,
+                    },
+                    indent=4,
+                ),
+            )
+            archive_filewriter.write(DATA_DIRECTORY / project_id / "status.json", arcname="status.json")
+            project_storage: AbstractProjectStorage = storage_factory(project_directory=DATA_DIRECTORY / project_id)
+            archive_filewriter.writestr("texts.json", json.dumps(project_storage.get_texts(), indent=4))
+            archive_filewriter.writestr("constraints.json", json.dumps(project_storage.get_constraints(), indent=4))
+            archive_filewriter.write(DATA_DIRECTORY / project_id / "settings.json", arcname="settings.json")
+            archive_filewriter.write(DATA_DIRECTORY / project_id / "sampling.json", arcname="sampling.json")
+            archive_filewriter.write(DATA_DIRECTORY / project_id / "clustering.json", arcname="clustering.json")
+            archive_filewriter.writestr(
+                "modelization.json",
+                json.dumps(
+                    compact_modelization(load_json(DATA_DIRECTORY / project_id / "modelization.json")),
+                    indent=4,
+                ),
+            )
+            if "vectors_2D.json" in os.listdir(DATA_DIRECTORY / project_id):
+                archive_filewriter.write(DATA_DIRECTORY / project_id / "vectors_2D.json", arcname="vectors_2D.json")
+            if "vectors_3D.json" in os.listdir(DATA_DIRECTORY / project_id):
+                archive_filewriter.write(DATA_DIRECTORY / project_id / "vectors_3D.json", arcname="vectors_3D.json")
+
+    # Zip the project in an archive (in the I/O threads pool).
+    await run_io(write_project_archive)
 
     # Define a backgroundtask to clear archive after downloading.
     def clear_after_download_project():  # noqa: WPS430 (nested function)
@@ -784,8 +892,17 @@ async def import_project(
         new_current_project_id_str=str(new_current_project_id)
     )
     import_archive_path: pathlib.Path = DATA_DIRECTORY / import_archive_name
-    with open(import_archive_path, "wb") as import_archive_fileobject_w:
-        shutil.copyfileobj(project_archive.file, import_archive_fileobject_w)
+
+    def store_project_archive() -> None:  # noqa: WPS430 (nested function)
+        """
+        Copy the uploaded archive in the data directory.
+        """
+
+        with open(import_archive_path, "wb") as import_archive_fileobject_w:
+            shutil.copyfileobj(project_archive.file, import_archive_fileobject_w)
+
+    # Copy the uploaded archive (in the I/O threads pool).
+    await run_io(store_project_archive)
 
     # Define a backgroundtask to clear archive after importation.
     def clear_after_import_project():  # noqa: WPS430 (nested function)
@@ -802,8 +919,18 @@ async def import_project(
         func=clear_after_import_project,
     )
 
-    # Try to open archive file.
-    try:
+    # Define the reading of the archive file.
+    def read_project_archive() -> Tuple[Dict[str, Any], ...]:  # noqa: WPS430 (nested function)
+        """
+        Read and check the files of the archive.
+
+        Raises:
+            ValueError: Raises error if the archive content is invalid.
+
+        Returns:
+            Tuple[Dict[str, Any], ...]: The metadata, status, texts, constraints, settings, sampling, clustering and modelization of the project.
+        """
+
         with zipfile.ZipFile(import_archive_path, "r") as import_archive_file:
             ###
             ### Check archive content.
@@ -837,6 +964,13 @@ async def import_project(
             with import_archive_file.open("metadata.json") as metadata_fileobject_r:
                 metadata: Dict[str, Any] = json.load(metadata_fileobject_r)
             metadata["project_id"] = new_current_project_id
+            archive_format_version: Any = metadata.pop("archive_format_version", 1)
+            if archive_format_version not in {1, ARCHIVE_FORMAT_VERSION}:
+                raise ValueError(
+                    "The project archive file has an unsupported format version ('{archive_format_version_str}').".format(
+                        archive_format_version_str=str(archive_format_version),
+                    )
+                )
             if (
                 "project_name" not in metadata.keys()
                 or not isinstance(metadata["project_name"], str)
@@ -935,9 +1069,32 @@ async def import_project(
             with import_archive_file.open("clustering.json") as clustering_fileobject_r:
                 clustering: Dict[str, Dict[str, str]] = json.load(clustering_fileobject_r)
 
-            # TODO: Check `modelization.json`.
+            ###
+            ### Check `modelization.json`.
+            ###
             with import_archive_file.open("modelization.json") as modelization_fileobject_r:
-                modelization: Dict[str, Dict[str, Any]] = json.load(modelization_fileobject_r)
+                modelization: Dict[str, Any] = json.load(modelization_fileobject_r)
+
+            # Case of legacy archive: legacy modelization inference is compacted.
+            if archive_format_version == 1 and is_legacy_modelization(modelization):
+                modelization = compact_modelization(modelization)
+            elif archive_format_version == 1 or not is_compact_modelization(modelization):
+                raise ValueError("The project archive file has an invalid `modelization.json` file.")
+
+        return metadata, project_status, texts, constraints, settings, sampling, clustering, modelization
+
+    # Try to read archive file (in the I/O threads pool).
+    try:
+        (
+            metadata,
+            project_status,
+            texts,
+            constraints,
+            settings,
+            sampling,
+            clustering,
+            modelization,
+        ) = await run_io(read_project_archive)
 
     # Error: case of custom raised errors.
     except ValueError as value_error:
@@ -953,40 +1110,46 @@ async def import_project(
             detail="An error occurs in project import. Project archive is probably invalid.",
         )
 
-    # Create the directory and subdirectories of the new project.
-    os.mkdir(DATA_DIRECTORY / metadata["project_id"])
+    # Define the storage of the imported project.
+    def store_project_data() -> None:  # noqa: WPS430 (nested function)
+        """
+        Create the directory of the project, and store its data.
+        """
+
+        # Create the directory and subdirectories of the new project.
+        os.mkdir(DATA_DIRECTORY / metadata["project_id"])
+
+        # Store `metadata.json`.
+        store_json(DATA_DIRECTORY / metadata["project_id"] / "metadata.json", metadata)
 
-    # Store `metadata.json`.
-    with open(DATA_DIRECTORY / metadata["project_id"] / "metadata.json", "w") as metadata_fileobject_w:
-        json.dump(metadata, metadata_fileobject_w, indent=4)
+        # Store `status.json`.
+        store_project_status(project_id=metadata["project_id"], project_status=project_status)
 
-    # Store `status.json`.
-    with open(DATA_DIRECTORY / metadata["project_id"] / "status.json", "w") as status_fileobject_w:
-        json.dump(project_status, status_fileobject_w, indent=4)
+        # Store texts and constraints.
+        project_storage: AbstractProjectStorage = storage_factory(
+            project_directory=DATA_DIRECTORY / metadata["project_id"]
+        )
+        with project_storage.transaction():
+            project_storage.set_texts(texts=texts)
+            project_storage.set_constraints(constraints=constraints)
 
-    # Store `texts.json`.
-    with open(DATA_DIRECTORY / metadata["project_id"] / "texts.json", "w") as texts_fileobject_w:
-        json.dump(texts, texts_fileobject_w, indent=4)
+        # Store `settings.json`.
+        store_json(DATA_DIRECTORY / metadata["project_id"] / "settings.json", settings)
 
-    # Store `constraints.json`.
-    with open(DATA_DIRECTORY / metadata["project_id"] / "constraints.json", "w") as constraints_fileobject_w:
-        json.dump(constraints, constraints_fileobject_w, indent=4)
+        # Store `sampling.json`.
+        store_json(DATA_DIRECTORY / metadata["project_id"] / "sampling.json", sampling)
 
-    # Store `settings.json`.
-    with open(DATA_DIRECTORY / metadata["project_id"] / "settings.json", "w") as settings_fileobject_w:
-        json.dump(settings, settings_fileobject_w, indent=4)
+        # Store `clustering.json`.
+        store_json(DATA_DIRECTORY / metadata["project_id"] / "clustering.json", clustering)
 
-    # Store `sampling.json`.
-    with open(DATA_DIRECTORY / metadata["project_id"] / "sampling.json", "w") as sampling_fileobject_w:
-        json.dump(sampling, sampling_fileobject_w, indent=4)
+        # Store `modelization.json`.
+        store_json(DATA_DIRECTORY / metadata["project_id"] / "modelization.json", modelization)
 
-    # Store `clustering.json`.
-    with open(DATA_DIRECTORY / metadata["project_id"] / "clustering.json", "w") as clustering_fileobject_w:
-        json.dump(clustering, clustering_fileobject_w, indent=4)
+        # Register the imported project.
+        projects_registry.add(data_directory=DATA_DIRECTORY, project_id=metadata["project_id"])
 
-    # Store `modelization.json`.
-    with open(DATA_DIRECTORY / metadata["project_id"] / "modelization.json", "w") as modelization_fileobject_w:
-        json.dump(modelization, modelization_fileobject_w, indent=4)
+    # Store the imported project (in the I/O threads pool).
+    await run_io(store_project_data)
 
     # Return the new ID of the imported project.
     return {
@@ -1046,6 +1209,14 @@ async def get_html_project_home_page(
                         without_hidden_constraints=True,
                         sorted_by=ConstraintsSortOptions.ITERATION_OF_SAMPLING,
                         sorted_reverse=False,
+                        iteration_of_sampling=None,
+                        constraint_type=None,
+                        to_annotate=None,
+                        to_review=None,
+                        to_fix_conflict=None,
+                        offset=0,
+                        limit=None,
+                        cursor=None,
                     )
                 )["constraints"],
             },
@@ -1099,7 +1270,151 @@ async def get_status(
     """
 
     # Check project id.
-    if project_id not in (await get_projects()):
+    if not projects_registry.exists(data_directory=DATA_DIRECTORY, project_id=project_id):
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="The project with id '{project_id_str}' doesn't exist.".format(
+                project_id_str=str(project_id),
+            ),
+        )
+
+    # Load status file.
+    project_status: Dict[str, Any] = await run_io(load_json, DATA_DIRECTORY / project_id / "status.json")
+
+    # Return the requested status (with the details of its state).
+    return {
+        "project_id": project_id,
+        "status": {
+            **project_status,
+            "state_details": get_ICGUIStates_details(state=project_status["state"]),
+        },
+    }
+
+
+###
+### ROUTE: Stream status changes.
+###
+@app.get(
+    "/api/projects/{project_id}/status/stream",
+    tags=["Status"],
+    response_class=StreamingResponse,
+    status_code=status.HTTP_200_OK,
+)
+async def stream_status(
+    project_id: str = Path(
+        ...,
+        description="The ID of the project.",
+    ),
+) -> StreamingResponse:
+    """
+    Stream the status of a project and its changes (task progression, state), as Server-Sent Events.
+    The first event is the current status, and the stream ends when the project is deleted.
+    Status changes are pushed by the events broker, so open streams don't read the status file.
+
+    Args:
+        project_id (str): The ID of the project.
+
+    Raises:
+        HTTPException: Raises `HTTP_404_NOT_FOUND` if the project with id `project_id` doesn't exist.
+
+    Returns:
+        StreamingResponse: A stream of events, whose data is formatted as the response of `get_status` route.
+    """
+
+    # Check project id.
+    if not projects_registry.exists(data_directory=DATA_DIRECTORY, project_id=project_id):
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="The project with id '{project_id_str}' doesn't exist.".format(
+                project_id_str=str(project_id),
+            ),
+        )
+
+    # Define the stream of status changes.
+    async def generate_status_events() -> AsyncIterator[str]:  # noqa: WPS430 (nested function)
+        """
+        Generate an event for the current status, and for each status change.
+
+        Yields:
+            str: A Server-Sent Event (or a comment to keep the connection alive).
+        """
+
+        # Subscribe to project events before loading the current status, in order to not miss a change.
+        with project_events.subscribe(project_id=project_id) as events_queue:
+            project_status: Optional[Dict[str, Any]] = await run_io(
+                load_json, DATA_DIRECTORY / project_id / "status.json"
+            )
+
+            while project_status is not None:
+                # Send the status (with the details of its state).
+                yield "data: {data}\n\n".format(
+                    data=json.dumps(
+                        {
+                            "project_id": project_id,
+                            "status": {
+                                **project_status,
+                                "state_details": get_ICGUIStates_details(state=project_status["state"]),
+                            },
+                        }
+                    ),
+                )
+
+                # Wait for the next status change (only the latest one is sent if several are queued).
+                next_project_status: Optional[Dict[str, Any]] = project_status
+                while next_project_status == project_status:
+                    try:
+                        next_project_status = (await asyncio.wait_for(events_queue.get(), timeout=KEEPALIVE_DELAY))[
+                            "status"
+                        ]
+                        while not events_queue.empty():
+                            next_project_status = events_queue.get_nowait()["status"]
+
+                    # Case of no event: check the status file (it can be changed by another web server process), and keep the connection alive.
+                    except asyncio.TimeoutError:
+                        if not projects_registry.exists(data_directory=DATA_DIRECTORY, project_id=project_id):
+                            return
+                        next_project_status = await run_io(load_json, DATA_DIRECTORY / project_id / "status.json")
+                        yield ": keepalive\n\n"
+                project_status = next_project_status
+
+    # Return the stream.
+    return StreamingResponse(
+        generate_status_events(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache"},
+    )
+
+
+###
+### ROUTE: Cancel the pending or working task.
+###
+@app.put(
+    "/api/projects/{project_id}/task/cancel",
+    tags=["Status"],
+    status_code=status.HTTP_202_ACCEPTED,
+)
+async def cancel_task(
+    project_id: str = Path(
+        ...,
+        description="The ID of the project.",
+    ),
+) -> Dict[str, Any]:
+    """
+    Cancel the pending or working task of a project, and restore the project state before the task request.
+
+    Args:
+        project_id (str): The ID of the project.
+
+    Raises:
+        HTTPException: Raises `HTTP_404_NOT_FOUND` if the project with id `project_id` doesn't exist.
+        HTTPException: Raises `HTTP_403_FORBIDDEN` if the project has no pending or working task.
+
+    Returns:
+        Dict[str, Any]: A dictionary that contains the confirmation of the task cancellation.
+    """
+
+    # Check project id.
+    if not projects_registry.exists(data_directory=DATA_DIRECTORY, project_id=project_id):
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="The project with id '{project_id_str}' doesn't exist.".format(
@@ -1108,12 +1423,33 @@ async def get_status(
         )
 
     # Load status file.
-    with open(DATA_DIRECTORY / project_id / "status.json", "r") as status_fileobject:
-        project_status: Dict[str, Any] = json.load(status_fileobject)
-        project_status["state_details"] = get_ICGUIStates_details(state=project_status["state"])
+    project_status: Dict[str, Any] = await run_io(load_json, DATA_DIRECTORY / project_id / "status.json")
 
-        # Return the requested status.
-        return {"project_id": project_id, "status": project_status}
+    # Check status.
+    if project_status["state"] not in workers.CANCELLED_STATES.keys():
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="The project with id '{project_id_str}' has no task to cancel during this state (state='{state_str}').".format(
+                project_id_str=str(project_id),
+                state_str=str(project_status["state"]),
+            ),
+        )
+
+    # Cancel the task (the status file is locked by the workers pool during the state restoration).
+    await run_io(
+        workers.workers_pool.cancel,
+        data_directory=DATA_DIRECTORY,
+        project_id=project_id,
+        task_names=workers.STATE_TASKS,
+    )
+
+    # Return statement.
+    return {
+        "project_id": project_id,
+        "detail": "In project with id '{project_id_str}', the task has been cancelled.".format(
+            project_id_str=str(project_id),
+        ),
+    }
 
 
 ###
@@ -1145,7 +1481,7 @@ async def move_to_next_iteration(
     """
 
     # Check project id.
-    if project_id not in (await get_projects()):
+    if not projects_registry.exists(data_directory=DATA_DIRECTORY, project_id=project_id):
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="The project with id '{project_id_str}' doesn't exist.".format(
@@ -1153,19 +1489,24 @@ async def move_to_next_iteration(
             ),
         )
 
-    # Lock status file in order to check project status for this step.
-    with FileLock(str(DATA_DIRECTORY / project_id / "status.json.lock")):
+    # Define the update of project data, to run with the status file locked.
+    def update_project_data() -> Dict[str, Any]:  # noqa: WPS430 (nested function)
+        """
+        Check project status, and move the project to the next iteration.
+
+        Returns:
+            Dict[str, Any]: The response, with the ID of the new iteration.
+        """
+
         ###
         ### Load needed data.
         ###
 
         # Load status file.
-        with open(DATA_DIRECTORY / project_id / "status.json", "r") as status_fileobject_r:
-            project_status: Dict[str, Any] = json.load(status_fileobject_r)
+        project_status: Dict[str, Any] = load_json(DATA_DIRECTORY / project_id / "status.json", mutable=True)
 
         # Load settings file.
-        with open(DATA_DIRECTORY / project_id / "settings.json", "r") as settings_fileobject_r:
-            project_settings: Dict[str, Any] = json.load(settings_fileobject_r)
+        project_settings: Dict[str, Any] = load_json(DATA_DIRECTORY / project_id / "settings.json", mutable=True)
 
         # Get current iteration id.
         current_iteration_id: int = project_status["iteration_id"]
@@ -1212,12 +1553,10 @@ async def move_to_next_iteration(
         ###
 
         # Store project settings.
-        with open(DATA_DIRECTORY / project_id / "settings.json", "w") as settings_fileobject_w:
-            json.dump(project_settings, settings_fileobject_w, indent=4)
+        store_json(DATA_DIRECTORY / project_id / "settings.json", project_settings)
 
         # Store project status.
-        with open(DATA_DIRECTORY / project_id / "status.json", "w") as status_fileobject_w:
-            json.dump(project_status, status_fileobject_w, indent=4)
+        store_project_status(project_id=project_id, project_status=project_status)
 
         # Return the new iteration id.
         return {
@@ -1229,6 +1568,9 @@ async def move_to_next_iteration(
             ),
         }
 
+    # Lock status file in order to check project status for this step, and update project data (in the I/O threads pool).
+    return await run_io_with_project_lock(project_directory=DATA_DIRECTORY / project_id, function=update_project_data)
+
 
 # ==============================================================================
 # DEFINE ROUTES FOR TEXTS
@@ -1260,8 +1602,28 @@ async def get_texts(
         False,
         description="The option to reverse texts order. Defaults to `False`.",
     ),
-    # TODO: filter_text
-    # TODO: limit_size + offset
+    filter_text: Optional[str] = Query(
+        None,
+        description="A substring that texts must contain (case insensitive). If `None`, texts are not filtered. Defaults to `None`.",
+    ),
+    fields: Optional[List[TextsFields]] = Query(
+        None,
+        description="The fields of texts to return (e.g. to not return `text_original` and `text_preprocessed`). If `None`, return all fields. Defaults to `None`.",
+    ),
+    offset: int = Query(
+        0,
+        ge=0,
+        description="The number of texts to skip (after the cursor, if given). Defaults to `0`.",
+    ),
+    limit: Optional[int] = Query(
+        None,
+        ge=0,
+        description="The maximum number of texts to return. If `None`, return all texts. Defaults to `None`.",
+    ),
+    cursor: Optional[str] = Query(
+        None,
+        description="The cursor of the page to return (the `next_cursor` of the previous page, with the same sort and filters). If `None`, start from the first text. Defaults to `None`.",
+    ),
 ) -> Dict[str, Any]:
     """
     Get texts.
@@ -1271,16 +1633,22 @@ async def get_texts(
         without_deleted_texts (bool): The option to not return deleted texts. Defaults to `True`.
         sorted_by (TextsSortOptions, optional): The option to sort texts. Defaults to `ALPHABETICAL`.
         sorted_reverse (bool, optional): The option to reverse texts order. Defaults to `False`.
+        filter_text (Optional[str], optional): A substring that texts must contain (case insensitive). If `None`, texts are not filtered. Defaults to `None`.
+        fields (Optional[List[TextsFields]], optional): The fields of texts to return. If `None`, return all fields. Defaults to `None`.
+        offset (int, optional): The number of texts to skip (after the cursor, if given). Defaults to `0`.
+        limit (Optional[int], optional): The maximum number of texts to return. If `None`, return all texts. Defaults to `None`.
+        cursor (Optional[str], optional): The cursor of the page to return (the `next_cursor` of the previous page). If `None`, start from the first text. Defaults to `None`.
 
     Raises:
         HTTPException: Raises `HTTP_404_NOT_FOUND` if the project with id `project_id` doesn't exist.
+        HTTPException: Raises `HTTP_400_BAD_REQUEST` if the parameter `cursor` is invalid.
 
     Returns:
-        Dict[str, Any]: A dictionary that contains texts.
+        Dict[str, Any]: A dictionary that contains texts, and the pagination state (number of matching texts, cursor of the next page).
     """
 
     # Check project id.
-    if project_id not in (await get_projects()):
+    if not projects_registry.exists(data_directory=DATA_DIRECTORY, project_id=project_id):
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="The project with id '{project_id_str}' doesn't exist.".format(
@@ -1288,60 +1656,61 @@ async def get_texts(
             ),
         )
 
-    ###
-    ### Load needed data.
-    ###
-
-    # Load texts.
-    with open(DATA_DIRECTORY / project_id / "texts.json", "r") as texts_fileobject:
-        texts: Dict[str, Any] = {
-            text_id: text_value
-            for text_id, text_value in json.load(texts_fileobject).items()
-            if (without_deleted_texts is False or text_value["is_deleted"] is False)
-        }
+    # Check cursor.
+    try:
+        after_position: Optional[Tuple[Any, int]] = decode_cursor(cursor) if (cursor is not None) else None
+    except ValueError:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="The cursor '{cursor_str}' is invalid.".format(
+                cursor_str=str(cursor),
+            ),
+        )
 
     ###
-    ### Sort texts.
+    ### Load requested texts.
     ###
 
-    # Define the values selection method.
-    def get_value_for_texts_sorting(text_to_sort: Tuple[str, Dict[str, Any]]) -> Any:  # noqa: WPS430 (nested function)
-        """Return the values expected for texts sorting.
-
-        Args:
-            text_to_sort (Tuple[str, Dict[str, Any]]): A text (from `.items()`).
-
-        Returns:
-            Any: The expected values of the text need for the sort.
-        """
-        # By text id.
-        if sorted_by == TextsSortOptions.ID:
-            return text_to_sort[0]
-        # By text value.
-        if sorted_by == TextsSortOptions.ALPHABETICAL:
-            return text_to_sort[1]["text_preprocessed"]
-        # By deletion status.
-        #### if sorted_by == TextsSortOptions.IS_DELETED:
-        return text_to_sort[1]["is_deleted"]
-
-    # Sorted the texts to return.
-    sorted_texts: Dict[str, Any] = dict(
-        sorted(
-            texts.items(),
-            key=get_value_for_texts_sorting,
-            reverse=sorted_reverse,
-        )
+    # Load the requested page of sorted texts (and one more text, to know if there is a next page), in the I/O threads pool.
+    texts, positions, total = await run_io(
+        storage_factory(project_directory=DATA_DIRECTORY / project_id).query_texts,
+        without_deleted_texts=without_deleted_texts,
+        filter_text=filter_text,
+        sorted_by=sorted_by.value,
+        sorted_reverse=sorted_reverse,
+        after_position=after_position,
+        offset=offset,
+        limit=(limit + 1 if (limit is not None) else None),
+        fields=([field.value for field in fields] if (fields is not None) else None),
     )
 
+    # Remove the additional text, and define the cursor of the next page.
+    next_cursor: Optional[str] = None
+    if limit is not None and len(positions) > limit:
+        texts = dict(list(texts.items())[:limit])
+        positions = positions[:limit]
+        if limit > 0:
+            next_cursor = encode_cursor(positions[-1])
+
     # Return the requested texts.
     return {
         "project_id": project_id,
-        "texts": sorted_texts,
+        "texts": texts,
         # Get the request parameters.
         "parameters": {
             "without_deleted_texts": without_deleted_texts,
             "sorted_by": sorted_by.value,
             "sorted_reverse": sorted_reverse,
+            "filter_text": filter_text,
+            "fields": ([field.value for field in fields] if (fields is not None) else None),
+            "offset": offset,
+            "limit": limit,
+            "cursor": cursor,
+        },
+        # Get the pagination state.
+        "pagination": {
+            "total": total,
+            "next_cursor": next_cursor,
         },
     }
 
@@ -1381,7 +1750,7 @@ async def delete_text(
     """
 
     # Check project id.
-    if project_id not in (await get_projects()):
+    if not projects_registry.exists(data_directory=DATA_DIRECTORY, project_id=project_id):
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="The project with id '{project_id_str}' doesn't exist.".format(
@@ -1389,30 +1758,30 @@ async def delete_text(
             ),
         )
 
-    # Lock status file in order to check project status for this step.
-    with FileLock(str(DATA_DIRECTORY / project_id / "status.json.lock")):
+    # Define the update of project data, to run with the status file locked.
+    def update_project_data() -> None:  # noqa: WPS430 (nested function)
+        """
+        Check project status, then delete the text and hide its constraints.
+        """
+
         ###
         ### Load needed data.
         ###
 
         # Load status file.
-        with open(DATA_DIRECTORY / project_id / "status.json", "r") as status_fileobject:
-            project_status: Dict[str, Any] = json.load(status_fileobject)
+        project_status: Dict[str, Any] = load_json(DATA_DIRECTORY / project_id / "status.json", mutable=True)
 
-        # Load texts file.
-        with open(DATA_DIRECTORY / project_id / "texts.json", "r") as texts_fileobject_r:
-            texts: Dict[str, Any] = json.load(texts_fileobject_r)
-
-        # Load constraints file.
-        with open(DATA_DIRECTORY / project_id / "constraints.json", "r") as constraints_fileobject_r:
-            constraints: Dict[str, Any] = json.load(constraints_fileobject_r)
+        # Load the text and the constraints associated with it.
+        project_storage: AbstractProjectStorage = storage_factory(project_directory=DATA_DIRECTORY / project_id)
+        text: Optional[Dict[str, Any]] = project_storage.get_text(text_id=text_id)
+        constraints: Dict[str, Any] = project_storage.get_constraints_of_texts(text_ids=[text_id])
 
         ###
         ### Check parameters.
         ###
 
         # Check text id.
-        if text_id not in texts.keys():
+        if text is None:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
                 detail="In project with id '{project_id_str}', the text with id '{text_id_str}' to delete doesn't exist.".format(
@@ -1448,34 +1817,27 @@ async def delete_text(
         ####    project_status["state"] = ICGUIStates.ANNOTATION_WITH_OUTDATED_MODELIZATION_WITH_CONFLICTS
 
         # Update texts by deleting the text.
-        texts[text_id]["is_deleted"] = True
+        texts_updates: Dict[str, Dict[str, Any]] = {text_id: {"is_deleted": True}}
 
         # Update constraints by hidding those associated with the deleted text.
-        for constraint_id, constraint_value in constraints.items():
-            data_id1: str = constraint_value["data"]["id_1"]
-            data_id2: str = constraint_value["data"]["id_2"]
-
-            if text_id in {
-                data_id1,
-                data_id2,
-            }:
-                constraints[constraint_id]["is_hidden"] = True
+        constraints_updates: Dict[str, Dict[str, Any]] = {
+            constraint_id: {"is_hidden": True} for constraint_id in constraints.keys()
+        }
 
         ###
         ### Store updated data.
         ###
 
         # Store updated status in file.
-        with open(DATA_DIRECTORY / project_id / "status.json", "w") as status_fileobject_w:
-            json.dump(project_status, status_fileobject_w, indent=4)
+        store_project_status(project_id=project_id, project_status=project_status)
 
-        # Store updated texts in file.
-        with open(DATA_DIRECTORY / project_id / "texts.json", "w") as texts_fileobject_w:
-            json.dump(texts, texts_fileobject_w, indent=4)
+        # Store updated texts and constraints.
+        with project_storage.transaction():
+            project_storage.update_texts(texts_updates=texts_updates)
+            project_storage.update_constraints(constraints_updates=constraints_updates)
 
-        # Store updated constraints in file.
-        with open(DATA_DIRECTORY / project_id / "constraints.json", "w") as constraints_fileobject_w:
-            json.dump(constraints, constraints_fileobject_w, indent=4)
+    # Lock status file in order to check project status for this step, and update project data (in the I/O threads pool).
+    await run_io_with_project_lock(project_directory=DATA_DIRECTORY / project_id, function=update_project_data)
 
     # Return statement.
     return {
@@ -1523,7 +1885,7 @@ async def undelete_text(
     """
 
     # Check project id.
-    if project_id not in (await get_projects()):
+    if not projects_registry.exists(data_directory=DATA_DIRECTORY, project_id=project_id):
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="The project with id '{project_id_str}' doesn't exist.".format(
@@ -1531,30 +1893,30 @@ async def undelete_text(
             ),
         )
 
-    # Lock status file in order to check project status for this step.
-    with FileLock(str(DATA_DIRECTORY / project_id / "status.json.lock")):
+    # Define the update of project data, to run with the status file locked.
+    def update_project_data() -> None:  # noqa: WPS430 (nested function)
+        """
+        Check project status, then undelete the text and unhide its constraints.
+        """
+
         ###
         ### Load needed data.
         ###
 
         # Load status file.
-        with open(DATA_DIRECTORY / project_id / "status.json", "r") as status_fileobject:
-            project_status: Dict[str, Any] = json.load(status_fileobject)
-
-        # Load texts file.
-        with open(DATA_DIRECTORY / project_id / "texts.json", "r") as texts_fileobject_r:
-            texts: Dict[str, Any] = json.load(texts_fileobject_r)
+        project_status: Dict[str, Any] = load_json(DATA_DIRECTORY / project_id / "status.json", mutable=True)
 
-        # Load constraints file.
-        with open(DATA_DIRECTORY / project_id / "constraints.json", "r") as constraints_fileobject_r:
-            constraints: Dict[str, Any] = json.load(constraints_fileobject_r)
+        # Load the text and the constraints associated with it.
+        project_storage: AbstractProjectStorage = storage_factory(project_directory=DATA_DIRECTORY / project_id)
+        text: Optional[Dict[str, Any]] = project_storage.get_text(text_id=text_id)
+        constraints: Dict[str, Any] = project_storage.get_constraints_of_texts(text_ids=[text_id])
 
         ###
         ### Check parameters.
         ###
 
         # Check text id.
-        if text_id not in texts.keys():
+        if text is None:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
                 detail="In project with id '{project_id_str}', the text with id '{text_id_str}' to undelete doesn't exist.".format(
@@ -1590,33 +1952,40 @@ async def undelete_text(
         ####    project_status["state"] = ICGUIStates.ANNOTATION_WITH_OUTDATED_MODELIZATION_WITH_CONFLICTS
 
         # Update texts by undeleting the text.
-        texts[text_id]["is_deleted"] = False
+        texts_updates: Dict[str, Dict[str, Any]] = {text_id: {"is_deleted": False}}
 
         # Update constraints by unhidding those associated with the undeleted text.
-        for constraint_id, constraint_value in constraints.items():
-            data_id1: str = constraint_value["data"]["id_1"]
-            data_id2: str = constraint_value["data"]["id_2"]
-
-            if text_id in {data_id1, data_id2}:
-                constraints[constraint_id]["is_hidden"] = (
-                    texts[data_id1]["is_deleted"] is True or texts[data_id2]["is_deleted"] is True
-                )
+        linked_texts: Dict[str, Any] = project_storage.get_texts(
+            text_ids=sorted(
+                {constraint_value["data"]["id_1"] for constraint_value in constraints.values()}
+                | {constraint_value["data"]["id_2"] for constraint_value in constraints.values()}
+            )
+        )
+        linked_texts[text_id] = {"is_deleted": False}
+        constraints_updates: Dict[str, Dict[str, Any]] = {
+            constraint_id: {
+                "is_hidden": (
+                    linked_texts[constraint_value["data"]["id_1"]]["is_deleted"] is True
+                    or linked_texts[constraint_value["data"]["id_2"]]["is_deleted"] is True
+                ),
+            }
+            for constraint_id, constraint_value in constraints.items()
+        }
 
         ###
         ### Store updated data.
         ###
 
         # Store updated status in file.
-        with open(DATA_DIRECTORY / project_id / "status.json", "w") as status_fileobject_w:
-            json.dump(project_status, status_fileobject_w, indent=4)
+        store_project_status(project_id=project_id, project_status=project_status)
 
-        # Store updated texts in file.
-        with open(DATA_DIRECTORY / project_id / "texts.json", "w") as texts_fileobject_w:
-            json.dump(texts, texts_fileobject_w, indent=4)
+        # Store updated texts and constraints.
+        with project_storage.transaction():
+            project_storage.update_texts(texts_updates=texts_updates)
+            project_storage.update_constraints(constraints_updates=constraints_updates)
 
-        # Store updated constraints in file.
-        with open(DATA_DIRECTORY / project_id / "constraints.json", "w") as constraints_fileobject_w:
-            json.dump(constraints, constraints_fileobject_w, indent=4)
+    # Lock status file in order to check project status for this step, and update project data (in the I/O threads pool).
+    await run_io_with_project_lock(project_directory=DATA_DIRECTORY / project_id, function=update_project_data)
 
     # Return statement.
     return {
@@ -1671,7 +2040,7 @@ async def rename_text(
     """
 
     # Check project id.
-    if project_id not in (await get_projects()):
+    if not projects_registry.exists(data_directory=DATA_DIRECTORY, project_id=project_id):
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="The project with id '{project_id_str}' doesn't exist.".format(
@@ -1679,26 +2048,29 @@ async def rename_text(
             ),
         )
 
-    # Lock status file in order to check project status for this step.
-    with FileLock(str(DATA_DIRECTORY / project_id / "status.json.lock")):
+    # Define the update of project data, to run with the status file locked.
+    def update_project_data() -> None:  # noqa: WPS430 (nested function)
+        """
+        Check project status, then rename the text and update its constraints.
+        """
+
         ###
         ### Load needed data.
         ###
 
         # Load status file.
-        with open(DATA_DIRECTORY / project_id / "status.json", "r") as status_fileobject:
-            project_status: Dict[str, Any] = json.load(status_fileobject)
+        project_status: Dict[str, Any] = load_json(DATA_DIRECTORY / project_id / "status.json", mutable=True)
 
-        # Load texts file.
-        with open(DATA_DIRECTORY / project_id / "texts.json", "r") as texts_fileobject_r:
-            texts: Dict[str, Any] = json.load(texts_fileobject_r)
+        # Load the text.
+        project_storage: AbstractProjectStorage = storage_factory(project_directory=DATA_DIRECTORY / project_id)
+        text: Optional[Dict[str, Any]] = project_storage.get_text(text_id=text_id)
 
         ###
         ### Check parameters.
         ###
 
         # Check text id.
-        if text_id not in texts.keys():
+        if text is None:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
                 detail="In project with id '{project_id_str}', the text with id '{text_id_str}' to rename doesn't exist.".format(
@@ -1734,19 +2106,20 @@ async def rename_text(
         ####    project_status["state"] = ICGUIStates.ANNOTATION_WITH_OUTDATED_MODELIZATION_WITH_CONFLICTS
 
         # Update texts by renaming the new text.
-        texts[text_id]["text"] = text_value
+        texts_updates: Dict[str, Dict[str, Any]] = {text_id: {"text": text_value}}
 
         ###
         ### Store updated data.
         ###
 
         # Store updated status in file.
-        with open(DATA_DIRECTORY / project_id / "status.json", "w") as status_fileobject_w:
-            json.dump(project_status, status_fileobject_w, indent=4)
+        store_project_status(project_id=project_id, project_status=project_status)
 
-        # Store updated texts in file.
-        with open(DATA_DIRECTORY / project_id / "texts.json", "w") as texts_fileobject_w:
-            json.dump(texts, texts_fileobject_w, indent=4)
+        # Store updated texts.
+        project_storage.update_texts(texts_updates=texts_updates)
+
+    # Lock status file in order to check project status for this step, and update project data (in the I/O threads pool).
+    await run_io_with_project_lock(project_directory=DATA_DIRECTORY / project_id, function=update_project_data)
 
     # Return statement.
     return {
@@ -1761,46 +2134,263 @@ async def rename_text(
 
 
 ###
-### ROUTE: Get HTML texts page.
+### ROUTE: Bulk update texts.
 ###
-@app.get(
-    "/gui/projects/{project_id}/texts",
+@app.put(
+    "/api/projects/{project_id}/texts/bulk",
     tags=["Texts"],
-    response_class=Response,
-    status_code=status.HTTP_200_OK,
+    status_code=status.HTTP_202_ACCEPTED,
 )
-async def get_html_texts_page(
-    request: Request,
+async def bulk_update_texts(
     project_id: str = Path(
         ...,
         description="The ID of the project.",
     ),
-    sorted_by: TextsSortOptions = Query(
-        TextsSortOptions.ALPHABETICAL,
-        description="The option to sort texts. Defaults to `ALPHABETICAL`.",
-    ),
-    sorted_reverse: bool = Query(
-        False,
-        description="The option to reverse texts order. Defaults to `False`.",
+    operations: List[TextsBulkOperationModel] = Body(
+        ...,
+        description="The operations to apply (deletion, undeletion and renaming of texts), in order.",
     ),
-    # TODO: filter_text
-    # TODO: limit_size + offset
-) -> Response:
+) -> Dict[str, Any]:
     """
-    Get HTML texts page.
+    Bulk update texts: delete, undelete and rename several texts at once.
+    Operations are applied atomically (all or none), in one update of project data.
+    Only constraints of deleted or undeleted texts are looked up (with the index of constraints by text), and only those whose visibility changes are updated.
 
     Args:
-        request (Request): The request context.
         project_id (str): The ID of the project.
-        sorted_by (TextsSortOptions, optional): The option to sort texts. Defaults to `ALPHABETICAL`.
-        sorted_reverse (bool, optional): The option to reverse texts order. Defaults to `False`.
+        operations (List[TextsBulkOperationModel]): The operations to apply (deletion, undeletion and renaming of texts), in order.
+
+    Raises:
+        HTTPException: Raises `HTTP_404_NOT_FOUND` if the project with id `project_id` doesn't exist.
+        HTTPException: Raises `HTTP_404_NOT_FOUND` if some texts to update don't exist.
+        HTTPException: Raises `HTTP_403_FORBIDDEN` if the current status of the project doesn't allow modification.
 
     Returns:
-        Response: The requested page.
+        Dict[str, Any]: A dictionary that contains the updated fields of each operation.
     """
 
-    # Return HTML constraints page.
+    # Check project id.
+    if not projects_registry.exists(data_directory=DATA_DIRECTORY, project_id=project_id):
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="The project with id '{project_id_str}' doesn't exist.".format(
+                project_id_str=str(project_id),
+            ),
+        )
+
+    # Define the update of project data, to run with the status file locked.
+    def update_project_data() -> Tuple[List[Dict[str, Any]], int]:  # noqa: WPS430 (nested function)
+        """
+        Check project status, then apply the operations and hide or unhide the constraints of deleted or undeleted texts.
+
+        Returns:
+            Tuple[List[Dict[str, Any]], int]: The updated fields of each operation, and the number of hidden or unhidden constraints.
+        """
+
+        ###
+        ### Load needed data.
+        ###
+
+        # Load status file.
+        project_status: Dict[str, Any] = load_json(DATA_DIRECTORY / project_id / "status.json", mutable=True)
+
+        # Load the texts.
+        text_ids: List[str] = list(dict.fromkeys(operation.text_id for operation in operations))
+        project_storage: AbstractProjectStorage = storage_factory(project_directory=DATA_DIRECTORY / project_id)
+        texts: Dict[str, Any] = project_storage.get_texts(text_ids=text_ids)
+
+        ###
+        ### Check parameters.
+        ###
+
+        # Check text ids.
+        missing_text_ids: List[str] = [text_id for text_id in text_ids if text_id not in texts.keys()]
+        if len(missing_text_ids) != 0:  # noqa: WPS507
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail="In project with id '{project_id_str}', the texts with ids {text_ids_str} to update don't exist.".format(
+                    project_id_str=str(project_id),
+                    text_ids_str=", ".join("'{text_id}'".format(text_id=text_id) for text_id in missing_text_ids),
+                ),
+            )
+
+        # Check status.
+        if (
+            project_status["state"] != ICGUIStates.ANNOTATION_WITH_UPTODATE_MODELIZATION  # noqa: WPS514
+            and project_status["state"] != ICGUIStates.ANNOTATION_WITH_OUTDATED_MODELIZATION_WITHOUT_CONFLICTS
+            and project_status["state"] != ICGUIStates.ANNOTATION_WITH_OUTDATED_MODELIZATION_WITH_CONFLICTS
+        ):
+            raise HTTPException(
+                status_code=status.HTTP_403_FORBIDDEN,
+                detail="The project with id '{project_id_str}' doesn't allow modification during this state (state='{state_str}').".format(
+                    project_id_str=str(project_id),
+                    state_str=str(project_status["state"]),
+                ),
+            )
+
+        ###
+        ### Update data.
+        ###
+
+        # Apply operations in order (only updated fields are stored).
+        texts_updates: Dict[str, Dict[str, Any]] = {}
+        results: List[Dict[str, Any]] = []
+        for operation in operations:
+            text: Dict[str, Any] = texts[operation.text_id]
+            text_update: Dict[str, Any] = texts_updates.setdefault(operation.text_id, {})
+            updated_fields: List[str] = []
+
+            # Delete or undelete the text.
+            if operation.is_deleted is not None:
+                text["is_deleted"] = operation.is_deleted
+                text_update["is_deleted"] = text["is_deleted"]
+                updated_fields.append("is_deleted")
+
+            # Rename the text.
+            if operation.text is not None:
+                text["text"] = operation.text
+                text_update["text"] = text["text"]
+                updated_fields.append("text")
+
+            results.append(
+                {
+                    "text_id": operation.text_id,
+                    "updated_fields": updated_fields,
+                }
+            )
+
+        # Update constraints by hidding those associated with a deleted text, and unhidding the others.
+        deleted_or_undeleted_text_ids: List[str] = [
+            text_id for text_id, text_update in texts_updates.items() if "is_deleted" in text_update.keys()
+        ]
+        constraints: Dict[str, Any] = project_storage.get_constraints_of_texts(text_ids=deleted_or_undeleted_text_ids)
+        linked_texts: Dict[str, Any] = project_storage.get_texts(
+            text_ids=sorted(
+                (
+                    {constraint_value["data"]["id_1"] for constraint_value in constraints.values()}
+                    | {constraint_value["data"]["id_2"] for constraint_value in constraints.values()}
+                )
+                - set(texts.keys())
+            )
+        )
+        linked_texts.update(texts)
+        constraints_updates: Dict[str, Dict[str, Any]] = {}
+        for constraint_id, constraint_value in constraints.items():
+            is_hidden: bool = (
+                linked_texts[constraint_value["data"]["id_1"]]["is_deleted"] is True
+                or linked_texts[constraint_value["data"]["id_2"]]["is_deleted"] is True
+            )
+            if constraint_value["is_hidden"] != is_hidden:
+                constraints_updates[constraint_id] = {"is_hidden": is_hidden}
+
+        # Update status by forcing "outdated" status.
+        if len(texts_updates) != 0 and project_status["state"] == ICGUIStates.ANNOTATION_WITH_UPTODATE_MODELIZATION:
+            project_status["state"] = ICGUIStates.ANNOTATION_WITH_OUTDATED_MODELIZATION_WITHOUT_CONFLICTS
+
+        ###
+        ### Store updated data.
+        ###
+
+        # Store updated status in file.
+        store_project_status(project_id=project_id, project_status=project_status)
+
+        # Store updated texts and constraints (in one transaction).
+        with project_storage.transaction():
+            project_storage.update_texts(texts_updates=texts_updates)
+            project_storage.update_constraints(constraints_updates=constraints_updates)
+
+        return results, len(constraints_updates)
+
+    # Lock status file in order to check project status for this step, and update project data (in the I/O threads pool).
+    results: List[Dict[str, Any]]
+    nb_updated_constraints: int
+    results, nb_updated_constraints = await run_io_with_project_lock(
+        project_directory=DATA_DIRECTORY / project_id,
+        function=update_project_data,
+    )
+
+    # Return statement.
+    return {
+        "project_id": project_id,
+        "results": results,
+        "detail": "In project with id '{project_id_str}', {nb_texts_str} texts have been updated. {nb_constraints_str} constraints have been hidden or unhidden.".format(
+            project_id_str=str(project_id),
+            nb_texts_str=str(len(dict.fromkeys(result["text_id"] for result in results))),
+            nb_constraints_str=str(nb_updated_constraints),
+        ),
+    }
+
+
+###
+### ROUTE: Get HTML texts page.
+###
+@app.get(
+    "/gui/projects/{project_id}/texts",
+    tags=["Texts"],
+    response_class=Response,
+    status_code=status.HTTP_200_OK,
+)
+async def get_html_texts_page(
+    request: Request,
+    project_id: str = Path(
+        ...,
+        description="The ID of the project.",
+    ),
+    sorted_by: TextsSortOptions = Query(
+        TextsSortOptions.ALPHABETICAL,
+        description="The option to sort texts. Defaults to `ALPHABETICAL`.",
+    ),
+    sorted_reverse: bool = Query(
+        False,
+        description="The option to reverse texts order. Defaults to `False`.",
+    ),
+    filter_text: Optional[str] = Query(
+        None,
+        description="A substring that texts must contain (case insensitive). If `None`, texts are not filtered. Defaults to `None`.",
+    ),
+    offset: int = Query(
+        0,
+        ge=0,
+        description="The number of texts to skip. Defaults to `0`.",
+    ),
+    limit: int = Query(
+        100,
+        ge=1,
+        description="The number of texts to display in the page. Defaults to `100`.",
+    ),
+) -> Response:
+    """
+    Get HTML texts page.
+
+    Args:
+        request (Request): The request context.
+        project_id (str): The ID of the project.
+        sorted_by (TextsSortOptions, optional): The option to sort texts. Defaults to `ALPHABETICAL`.
+        sorted_reverse (bool, optional): The option to reverse texts order. Defaults to `False`.
+        filter_text (Optional[str], optional): A substring that texts must contain (case insensitive). If `None`, texts are not filtered. Defaults to `None`.
+        offset (int, optional): The number of texts to skip. Defaults to `0`.
+        limit (int, optional): The number of texts to display in the page. Defaults to `100`.
+
+    Returns:
+        Response: The requested page.
+    """
+
+    # Return HTML constraints page.
     try:
+        # Get the requested page of texts.
+        texts_page: Dict[str, Any] = await get_texts(
+            project_id=project_id,
+            without_deleted_texts=False,
+            sorted_by=sorted_by,
+            sorted_reverse=sorted_reverse,
+            filter_text=(filter_text if filter_text else None),
+            fields=None,
+            offset=offset,
+            limit=limit,
+            cursor=None,
+        )
+
+        # Return HTML texts page.
         return templates.TemplateResponse(
             name="texts.html",
             context={
@@ -1812,20 +2402,46 @@ async def get_html_texts_page(
                     "without_deleted_texts": True,
                     "sorted_by": sorted_by.value,
                     "sorted_reverse": sorted_reverse,
+                    "filter_text": (filter_text if filter_text else None),
+                    "offset": offset,
+                    "limit": limit,
+                    "total": texts_page["pagination"]["total"],
                 },
                 # Get the project metadata (ID, name, creation date).
                 "metadata": (await get_metadata(project_id=project_id))["metadata"],
                 # Get the project status (iteration, step name and status, modelization state and conflict).
                 "status": (await get_status(project_id=project_id))["status"],
-                # Get the project texts.
-                "texts": (
-                    await get_texts(
-                        project_id=project_id,
-                        without_deleted_texts=False,
-                        sorted_by=sorted_by,
-                        sorted_reverse=sorted_reverse,
-                    )
-                )["texts"],
+                # Get the number of texts (without loading them).
+                "number_of_texts": {
+                    "all": (
+                        await get_texts(
+                            project_id=project_id,
+                            without_deleted_texts=False,
+                            sorted_by=TextsSortOptions.ID,
+                            sorted_reverse=False,
+                            filter_text=None,
+                            fields=[TextsFields.IS_DELETED],
+                            offset=0,
+                            limit=0,
+                            cursor=None,
+                        )
+                    )["pagination"]["total"],
+                    "remaining": (
+                        await get_texts(
+                            project_id=project_id,
+                            without_deleted_texts=True,
+                            sorted_by=TextsSortOptions.ID,
+                            sorted_reverse=False,
+                            filter_text=None,
+                            fields=[TextsFields.IS_DELETED],
+                            offset=0,
+                            limit=0,
+                            cursor=None,
+                        )
+                    )["pagination"]["total"],
+                },
+                # Get the requested page of project texts.
+                "texts": texts_page["texts"],
                 # Get the project constraints.
                 "constraints": (
                     await get_constraints(
@@ -1833,6 +2449,14 @@ async def get_html_texts_page(
                         without_hidden_constraints=True,
                         sorted_by=ConstraintsSortOptions.ID,
                         sorted_reverse=False,
+                        iteration_of_sampling=None,
+                        constraint_type=None,
+                        to_annotate=None,
+                        to_review=None,
+                        to_fix_conflict=None,
+                        offset=0,
+                        limit=None,
+                        cursor=None,
                     )
                 )["constraints"],
             },
@@ -1883,8 +2507,40 @@ async def get_constraints(
         False,
         description="The option to reverse constraints order. Defaults to `False`.",
     ),
-    # TODO: filter_text
-    # TODO: limit_size + offset
+    iteration_of_sampling: Optional[int] = Query(
+        None,
+        description="The iteration of sampling of constraints to return. If `None`, constraints are not filtered by iteration. Defaults to `None`.",
+    ),
+    constraint_type: Optional[List[ConstraintsTypeFilters]] = Query(
+        None,
+        description="The types of constraints to return (`SKIP` for constraints annotated without type). If `None`, constraints are not filtered by type. Defaults to `None`.",
+    ),
+    to_annotate: Optional[bool] = Query(
+        None,
+        description="The annotation status of constraints to return. If `None`, constraints are not filtered by annotation status. Defaults to `None`.",
+    ),
+    to_review: Optional[bool] = Query(
+        None,
+        description="The review status of constraints to return. If `None`, constraints are not filtered by review status. Defaults to `None`.",
+    ),
+    to_fix_conflict: Optional[bool] = Query(
+        None,
+        description="The conflict status of constraints to return. If `None`, constraints are not filtered by conflict status. Defaults to `None`.",
+    ),
+    offset: int = Query(
+        0,
+        ge=0,
+        description="The number of constraints to skip (after the cursor, if given). Defaults to `0`.",
+    ),
+    limit: Optional[int] = Query(
+        None,
+        ge=0,
+        description="The maximum number of constraints to return. If `None`, return all constraints. Defaults to `None`.",
+    ),
+    cursor: Optional[str] = Query(
+        None,
+        description="The cursor of the page to return (the `next_cursor` of the previous page, with the same sort and filters). If `None`, start from the first constraint. Defaults to `None`.",
+    ),
 ) -> Dict[str, Any]:
     """
     Get constraints.
@@ -1894,16 +2550,25 @@ async def get_constraints(
         without_hidden_constraints (bool, optional): The option to not return hidden constraints. Defaults to `True`.
         sorted_by (ConstraintsSortOptions, optional): The option to sort constraints. Defaults to `ID`.
         sorted_reverse (bool, optional): The option to reverse constraints order. Defaults to `False`.
+        iteration_of_sampling (Optional[int], optional): The iteration of sampling of constraints to return. If `None`, constraints are not filtered by iteration. Defaults to `None`.
+        constraint_type (Optional[List[ConstraintsTypeFilters]], optional): The types of constraints to return. If `None`, constraints are not filtered by type. Defaults to `None`.
+        to_annotate (Optional[bool], optional): The annotation status of constraints to return. If `None`, constraints are not filtered by annotation status. Defaults to `None`.
+        to_review (Optional[bool], optional): The review status of constraints to return. If `None`, constraints are not filtered by review status. Defaults to `None`.
+        to_fix_conflict (Optional[bool], optional): The conflict status of constraints to return. If `None`, constraints are not filtered by conflict status. Defaults to `None`.
+        offset (int, optional): The number of constraints to skip (after the cursor, if given). Defaults to `0`.
+        limit (Optional[int], optional): The maximum number of constraints to return. If `None`, return all constraints. Defaults to `None`.
+        cursor (Optional[str], optional): The cursor of the page to return (the `next_cursor` of the previous page). If `None`, start from the first constraint. Defaults to `None`.
 
     Raises:
         HTTPException: Raises `HTTP_404_NOT_FOUND` if the project with id `project_id` doesn't exist.
+        HTTPException: Raises `HTTP_400_BAD_REQUEST` if the parameter `cursor` is invalid.
 
     Returns:
-        Dict[str, Any]: A dictionary that contains constraints.
+        Dict[str, Any]: A dictionary that contains constraints, and the pagination state (number of matching constraints, cursor of the next page).
     """
 
     # Check project id.
-    if project_id not in (await get_projects()):
+    if not projects_registry.exists(data_directory=DATA_DIRECTORY, project_id=project_id):
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="The project with id '{project_id_str}' doesn't exist.".format(
@@ -1911,88 +2576,80 @@ async def get_constraints(
             ),
         )
 
-    ###
-    ### Load needed data.
-    ###
-
-    # Load constraints.
-    with open(DATA_DIRECTORY / project_id / "constraints.json", "r") as constraints_fileobject:
-        constraints: Dict[str, Any] = {
-            constraint_id: constraint_value
-            for constraint_id, constraint_value in json.load(constraints_fileobject).items()
-            if (without_hidden_constraints is False or constraint_value["is_hidden"] is False)
-        }
-
-    # Load texts.
-    with open(DATA_DIRECTORY / project_id / "texts.json", "r") as texts_fileobject:
-        texts: Dict[str, Any] = json.load(texts_fileobject)
+    # Check cursor (constraints sorted by texts use two sort values).
+    try:
+        after_position: Optional[Tuple[Any, int]] = (
+            decode_cursor(cursor, nb_sort_values=(2 if sorted_by == ConstraintsSortOptions.TEXT else 1))
+            if (cursor is not None)
+            else None
+        )
+    except ValueError:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="The cursor '{cursor_str}' is invalid.".format(
+                cursor_str=str(cursor),
+            ),
+        )
 
     ###
-    ### Sort constraints.
+    ### Load requested constraints.
     ###
 
-    # Define the values selection method.
-    def get_value_for_constraints_sorting(  # noqa: WPS430 (nested function)
-        constraint_to_sort: Tuple[str, Dict[str, Any]]
-    ) -> Any:
-        """Return the values expected for constraints sorting.
-
-        Args:
-            constraint_to_sort (Tuple[str, Dict[str, Any]]): A constraint (from `.items()`).
-
-        Returns:
-            Any: The expected values of the constraint need for the sort.
-        """
-        # By constraint id.
-        if sorted_by == ConstraintsSortOptions.ID:
-            return constraint_to_sort[0]
-        # By texts.
-        if sorted_by == ConstraintsSortOptions.TEXT:
-            return (
-                texts[constraint_to_sort[1]["data"]["id_1"]]["text"],
-                texts[constraint_to_sort[1]["data"]["id_2"]]["text"],
-            )
-        # By constraint type.
-        if sorted_by == ConstraintsSortOptions.CONSTRAINT_TYPE:
-            return (
-                constraint_to_sort[1]["constraint_type"] is None,
-                constraint_to_sort[1]["constraint_type"] == "CANNOT_LINK",
-                constraint_to_sort[1]["constraint_type"] == "MUST_LINK",
-            )
-        # By date of update.
-        if sorted_by == ConstraintsSortOptions.DATE_OF_UPDATE:
-            return constraint_to_sort[1]["date_of_update"] if constraint_to_sort[1]["date_of_update"] is not None else 0
-        # By iteration of sampling.
-        if sorted_by == ConstraintsSortOptions.ITERATION_OF_SAMPLING:
-            return constraint_to_sort[1]["iteration_of_sampling"]
-        # To annotation.
-        if sorted_by == ConstraintsSortOptions.TO_ANNOTATE:
-            return constraint_to_sort[1]["to_annotate"] is False
-        # To review.
-        if sorted_by == ConstraintsSortOptions.TO_REVIEW:
-            return constraint_to_sort[1]["to_review"] is False
-        # To fix conflict.
-        #### if sorted_by == ConstraintsSortOptions.TO_FIX_CONFLICT:
-        return constraint_to_sort[1]["to_fix_conflict"] is False
-
-    # Sorted the constraints to return.
-    sorted_constraints: Dict[str, Any] = dict(
-        sorted(
-            constraints.items(),
-            key=get_value_for_constraints_sorting,
-            reverse=sorted_reverse,
-        )
+    # Load the requested page of sorted constraints (and one more constraint, to know if there is a next page), in the I/O threads pool.
+    constraints, positions, total = await run_io(
+        storage_factory(project_directory=DATA_DIRECTORY / project_id).query_constraints,
+        without_hidden_constraints=without_hidden_constraints,
+        iteration_of_sampling=iteration_of_sampling,
+        constraint_types=(
+            [
+                (None if (type_filter == ConstraintsTypeFilters.SKIP) else type_filter.value)
+                for type_filter in constraint_type
+            ]
+            if (constraint_type is not None)
+            else None
+        ),
+        to_annotate=to_annotate,
+        to_review=to_review,
+        to_fix_conflict=to_fix_conflict,
+        sorted_by=sorted_by.value,
+        sorted_reverse=sorted_reverse,
+        after_position=after_position,
+        offset=offset,
+        limit=(limit + 1 if (limit is not None) else None),
     )
 
+    # Remove the additional constraint, and define the cursor of the next page.
+    next_cursor: Optional[str] = None
+    if limit is not None and len(positions) > limit:
+        constraints = dict(list(constraints.items())[:limit])
+        positions = positions[:limit]
+        if limit > 0:
+            next_cursor = encode_cursor(positions[-1])
+
     # Return the requested constraints.
     return {
         "project_id": project_id,
-        "constraints": sorted_constraints,
+        "constraints": constraints,
         # Get the request parameters.
         "parameters": {
             "without_hidden_constraints": without_hidden_constraints,
             "sorted_by": sorted_by.value,
             "sorted_reverse": sorted_reverse,
+            "iteration_of_sampling": iteration_of_sampling,
+            "constraint_type": (
+                [type_filter.value for type_filter in constraint_type] if (constraint_type is not None) else None
+            ),
+            "to_annotate": to_annotate,
+            "to_review": to_review,
+            "to_fix_conflict": to_fix_conflict,
+            "offset": offset,
+            "limit": limit,
+            "cursor": cursor,
+        },
+        # Get the pagination state.
+        "pagination": {
+            "total": total,
+            "next_cursor": next_cursor,
         },
     }
 
@@ -2037,7 +2694,7 @@ async def annotate_constraint(
     """
 
     # Check project id.
-    if project_id not in (await get_projects()):
+    if not projects_registry.exists(data_directory=DATA_DIRECTORY, project_id=project_id):
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="The project with id '{project_id_str}' doesn't exist.".format(
@@ -2045,19 +2702,22 @@ async def annotate_constraint(
             ),
         )
 
-    # Lock status file in order to check project status for this step.
-    with FileLock(str(DATA_DIRECTORY / project_id / "status.json.lock")):
+    # Define the update of project data, to run with the status file locked.
+    def update_project_data() -> None:  # noqa: WPS430 (nested function)
+        """
+        Check project status, then annotate the constraint.
+        """
+
         ###
         ### Load needed data.
         ###
 
         # Load status file.
-        with open(DATA_DIRECTORY / project_id / "status.json", "r") as status_fileobject:
-            project_status: Dict[str, Any] = json.load(status_fileobject)
+        project_status: Dict[str, Any] = load_json(DATA_DIRECTORY / project_id / "status.json", mutable=True)
 
-        # Load constraints file.
-        with open(DATA_DIRECTORY / project_id / "constraints.json", "r") as constraints_fileobject_r:
-            constraints: Dict[str, Any] = json.load(constraints_fileobject_r)
+        # Load the constraint.
+        project_storage: AbstractProjectStorage = storage_factory(project_directory=DATA_DIRECTORY / project_id)
+        constraints: Dict[str, Any] = project_storage.get_constraints(constraint_ids=[constraint_id])
 
         ###
         ### Check parameters.
@@ -2114,12 +2774,13 @@ async def annotate_constraint(
         ###
 
         # Store updated status in file.
-        with open(DATA_DIRECTORY / project_id / "status.json", "w") as status_fileobject_w:
-            json.dump(project_status, status_fileobject_w, indent=4)
+        store_project_status(project_id=project_id, project_status=project_status)
+
+        # Store updated constraint.
+        project_storage.update_constraints(constraints_updates=constraints)
 
-        # Store updated constraints in file.
-        with open(DATA_DIRECTORY / project_id / "constraints.json", "w") as constraints_fileobject_w:
-            json.dump(constraints, constraints_fileobject_w, indent=4)
+    # Lock status file in order to check project status for this step, and update project data (in the I/O threads pool).
+    await run_io_with_project_lock(project_directory=DATA_DIRECTORY / project_id, function=update_project_data)
 
     # Return statement.
     return {
@@ -2172,7 +2833,7 @@ async def review_constraint(
     """
 
     # Check project id.
-    if project_id not in (await get_projects()):
+    if not projects_registry.exists(data_directory=DATA_DIRECTORY, project_id=project_id):
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="The project with id '{project_id_str}' doesn't exist.".format(
@@ -2180,15 +2841,19 @@ async def review_constraint(
             ),
         )
 
-    # Lock status file in order to check project status for this step.
-    with FileLock(str(DATA_DIRECTORY / project_id / "status.json.lock")):
+    # Define the update of project data, to run with the status file locked.
+    def update_project_data() -> None:  # noqa: WPS430 (nested function)
+        """
+        Check project status, then review the constraint.
+        """
+
         ###
         ### Load needed data.
         ###
 
-        # Load constraints file.
-        with open(DATA_DIRECTORY / project_id / "constraints.json", "r") as constraints_fileobject_r:
-            constraints: Dict[str, Any] = json.load(constraints_fileobject_r)
+        # Load the constraint.
+        project_storage: AbstractProjectStorage = storage_factory(project_directory=DATA_DIRECTORY / project_id)
+        constraints: Dict[str, Any] = project_storage.get_constraints(constraint_ids=[constraint_id])
 
         ###
         ### Check parameters.
@@ -2215,9 +2880,11 @@ async def review_constraint(
         ### Store updated data.
         ###
 
-        # Store updated constraints in file.
-        with open(DATA_DIRECTORY / project_id / "constraints.json", "w") as constraints_fileobject_w:
-            json.dump(constraints, constraints_fileobject_w, indent=4)
+        # Store updated constraint.
+        project_storage.update_constraints(constraints_updates=constraints)
+
+    # Lock status file in order to check project status for this step, and update project data (in the I/O threads pool).
+    await run_io_with_project_lock(project_directory=DATA_DIRECTORY / project_id, function=update_project_data)
 
     # Return statement.
     return {
@@ -2272,7 +2939,7 @@ async def comment_constraint(
     """
 
     # Check project id.
-    if project_id not in (await get_projects()):
+    if not projects_registry.exists(data_directory=DATA_DIRECTORY, project_id=project_id):
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="The project with id '{project_id_str}' doesn't exist.".format(
@@ -2280,15 +2947,19 @@ async def comment_constraint(
             ),
         )
 
-    # Lock status file in order to check project status for this step.
-    with FileLock(str(DATA_DIRECTORY / project_id / "status.json.lock")):
+    # Define the update of project data, to run with the status file locked.
+    def update_project_data() -> None:  # noqa: WPS430 (nested function)
+        """
+        Check project status, then comment the constraint.
+        """
+
         ###
         ### Load needed data.
         ###
 
-        # Load constraints file.
-        with open(DATA_DIRECTORY / project_id / "constraints.json", "r") as constraints_fileobject_r:
-            constraints: Dict[str, Any] = json.load(constraints_fileobject_r)
+        # Load the constraint.
+        project_storage: AbstractProjectStorage = storage_factory(project_directory=DATA_DIRECTORY / project_id)
+        constraints: Dict[str, Any] = project_storage.get_constraints(constraint_ids=[constraint_id])
 
         ###
         ### Check parameters.
@@ -2315,9 +2986,11 @@ async def comment_constraint(
         ### Store updated data.
         ###
 
-        # Store updated constraints in file.
-        with open(DATA_DIRECTORY / project_id / "constraints.json", "w") as constraints_fileobject_w:
-            json.dump(constraints, constraints_fileobject_w, indent=4)
+        # Store updated constraint.
+        project_storage.update_constraints(constraints_updates=constraints)
+
+    # Lock status file in order to check project status for this step, and update project data (in the I/O threads pool).
+    await run_io_with_project_lock(project_directory=DATA_DIRECTORY / project_id, function=update_project_data)
 
     # Return statement.
     return {
@@ -2331,6 +3004,185 @@ async def comment_constraint(
     }
 
 
+###
+### ROUTE: Bulk update constraints.
+###
+@app.put(
+    "/api/projects/{project_id}/constraints/bulk",
+    tags=["Constraints"],
+    status_code=status.HTTP_202_ACCEPTED,
+)
+async def bulk_update_constraints(
+    project_id: str = Path(
+        ...,
+        description="The ID of the project.",
+    ),
+    operations: List[ConstraintsBulkOperationModel] = Body(
+        ...,
+        description="The operations to apply (annotation, comment and review of constraints), in order.",
+    ),
+) -> Dict[str, Any]:
+    """
+    Bulk update constraints: annotate, comment and review several constraints at once.
+    Operations are applied atomically (all or none), in one update of project data.
+
+    Args:
+        project_id (str): The ID of the project.
+        operations (List[ConstraintsBulkOperationModel]): The operations to apply (annotation, comment and review of constraints), in order.
+
+    Raises:
+        HTTPException: Raises `HTTP_404_NOT_FOUND` if the project with id `project_id` doesn't exist.
+        HTTPException: Raises `HTTP_404_NOT_FOUND` if some constraints to update don't exist.
+        HTTPException: Raises `HTTP_403_FORBIDDEN` if some constraints are annotated and the current status of the project doesn't allow modification.
+
+    Returns:
+        Dict[str, Any]: A dictionary that contains the updated fields of each operation.
+    """
+
+    # Check project id.
+    if not projects_registry.exists(data_directory=DATA_DIRECTORY, project_id=project_id):
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="The project with id '{project_id_str}' doesn't exist.".format(
+                project_id_str=str(project_id),
+            ),
+        )
+
+    # Define the update of project data, to run with the status file locked.
+    def update_project_data() -> List[Dict[str, Any]]:  # noqa: WPS430 (nested function)
+        """
+        Check project status, then apply the operations.
+
+        Returns:
+            List[Dict[str, Any]]: The updated fields of each operation.
+        """
+
+        ###
+        ### Load needed data.
+        ###
+
+        # Load status file.
+        project_status: Dict[str, Any] = load_json(DATA_DIRECTORY / project_id / "status.json", mutable=True)
+
+        # Load the constraints.
+        constraint_ids: List[str] = list(dict.fromkeys(operation.constraint_id for operation in operations))
+        project_storage: AbstractProjectStorage = storage_factory(project_directory=DATA_DIRECTORY / project_id)
+        constraints: Dict[str, Any] = project_storage.get_constraints(constraint_ids=constraint_ids)
+
+        ###
+        ### Check parameters.
+        ###
+
+        # Check constraint ids.
+        missing_constraint_ids: List[str] = [
+            constraint_id for constraint_id in constraint_ids if constraint_id not in constraints.keys()
+        ]
+        if len(missing_constraint_ids) != 0:  # noqa: WPS507
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail="In project with id '{project_id_str}', the constraints with ids {constraint_ids_str} to update don't exist.".format(
+                    project_id_str=str(project_id),
+                    constraint_ids_str=", ".join(
+                        "'{constraint_id}'".format(constraint_id=constraint_id)
+                        for constraint_id in missing_constraint_ids
+                    ),
+                ),
+            )
+
+        # Check status (only annotations depend on project status).
+        has_annotations: bool = any(operation.has_annotation() for operation in operations)
+        if has_annotations and (
+            project_status["state"] != ICGUIStates.ANNOTATION_WITH_UPTODATE_MODELIZATION  # noqa: WPS514
+            and project_status["state"] != ICGUIStates.ANNOTATION_WITH_OUTDATED_MODELIZATION_WITHOUT_CONFLICTS
+            and project_status["state"] != ICGUIStates.ANNOTATION_WITH_OUTDATED_MODELIZATION_WITH_CONFLICTS
+        ):
+            raise HTTPException(
+                status_code=status.HTTP_403_FORBIDDEN,
+                detail="The project with id '{project_id_str}' doesn't allow modification during this state (state='{state_str}').".format(
+                    project_id_str=str(project_id),
+                    state_str=str(project_status["state"]),
+                ),
+            )
+
+        ###
+        ### Update data.
+        ###
+
+        # Apply operations in order (only updated fields are stored).
+        date_of_update: float = datetime.now().timestamp()
+        constraints_updates: Dict[str, Dict[str, Any]] = {}
+        results: List[Dict[str, Any]] = []
+        for operation in operations:
+            constraint: Dict[str, Any] = constraints[operation.constraint_id]
+            constraint_update: Dict[str, Any] = constraints_updates.setdefault(operation.constraint_id, {})
+            updated_fields: List[str] = []
+
+            # Annotate the constraint (update the constraint history, and force annotation status).
+            if operation.has_annotation():
+                constraint["constraint_type_previous"].append(constraint["constraint_type"])
+                constraint["constraint_type"] = operation.constraint_type
+                constraint["date_of_update"] = date_of_update
+                constraint["to_annotate"] = False
+                constraint_update.update(
+                    {
+                        "constraint_type": constraint["constraint_type"],
+                        "constraint_type_previous": constraint["constraint_type_previous"],
+                        "date_of_update": constraint["date_of_update"],
+                        "to_annotate": constraint["to_annotate"],
+                    }
+                )
+                updated_fields.append("constraint_type")
+
+            # Comment the constraint.
+            if operation.comment is not None:
+                constraint["comment"] = operation.comment
+                constraint_update["comment"] = constraint["comment"]
+                updated_fields.append("comment")
+
+            # Review the constraint.
+            if operation.to_review is not None:
+                constraint["to_review"] = operation.to_review
+                constraint_update["to_review"] = constraint["to_review"]
+                updated_fields.append("to_review")
+
+            results.append(
+                {
+                    "constraint_id": operation.constraint_id,
+                    "updated_fields": updated_fields,
+                }
+            )
+
+        ###
+        ### Store updated data.
+        ###
+
+        # Update status by forcing "outdated" status, and store it.
+        if has_annotations and project_status["state"] == ICGUIStates.ANNOTATION_WITH_UPTODATE_MODELIZATION:
+            project_status["state"] = ICGUIStates.ANNOTATION_WITH_OUTDATED_MODELIZATION_WITHOUT_CONFLICTS
+            store_project_status(project_id=project_id, project_status=project_status)
+
+        # Store updated constraints (in one transaction).
+        project_storage.update_constraints(constraints_updates=constraints_updates)
+
+        return results
+
+    # Lock status file in order to check project status for this step, and update project data (in the I/O threads pool).
+    results: List[Dict[str, Any]] = await run_io_with_project_lock(
+        project_directory=DATA_DIRECTORY / project_id,
+        function=update_project_data,
+    )
+
+    # Return statement.
+    return {
+        "project_id": project_id,
+        "results": results,
+        "detail": "In project with id '{project_id_str}', {nb_constraints_str} constraints have been updated.".format(
+            project_id_str=str(project_id),
+            nb_constraints_str=str(len(dict.fromkeys(result["constraint_id"] for result in results))),
+        ),
+    }
+
+
 ###
 ### ROUTE: Approve all constraints.
 ###
@@ -2360,7 +3212,7 @@ async def approve_all_constraints(
     """
 
     # Check project id.
-    if project_id not in (await get_projects()):
+    if not projects_registry.exists(data_directory=DATA_DIRECTORY, project_id=project_id):
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="The project with id '{project_id_str}' doesn't exist.".format(
@@ -2368,11 +3220,14 @@ async def approve_all_constraints(
             ),
         )
 
-    # Lock status file in order to check project status for this step.
-    with FileLock(str(DATA_DIRECTORY / project_id / "status.json.lock")):
+    # Define the update of project data, to run with the status file locked.
+    def update_project_data() -> None:  # noqa: WPS430 (nested function)
+        """
+        Check project status, then approve all constraints.
+        """
+
         # Load status file.
-        with open(DATA_DIRECTORY / project_id / "status.json", "r") as status_fileobject:
-            project_status: Dict[str, Any] = json.load(status_fileobject)
+        project_status: Dict[str, Any] = load_json(DATA_DIRECTORY / project_id / "status.json", mutable=True)
 
         # Check status.
         if project_status["state"] != ICGUIStates.ANNOTATION_WITH_UPTODATE_MODELIZATION:
@@ -2396,8 +3251,10 @@ async def approve_all_constraints(
         ###
 
         # Store updated status in file.
-        with open(DATA_DIRECTORY / project_id / "status.json", "w") as status_fileobject_w:
-            json.dump(project_status, status_fileobject_w, indent=4)
+        store_project_status(project_id=project_id, project_status=project_status)
+
+    # Lock status file in order to check project status for this step, and update project data (in the I/O threads pool).
+    await run_io_with_project_lock(project_directory=DATA_DIRECTORY / project_id, function=update_project_data)
 
     # Return statement.
     return {
@@ -2431,8 +3288,16 @@ async def get_html_constraints_page(
         False,
         description="The option to reverse constraints order. Defaults to `False`.",
     ),
-    # TODO: filter_text
-    # TODO: limit_size + offset
+    offset: int = Query(
+        0,
+        ge=0,
+        description="The number of constraints to skip. Defaults to `0`.",
+    ),
+    limit: int = Query(
+        100,
+        ge=1,
+        description="The number of constraints to display in the page. Defaults to `100`.",
+    ),
 ) -> Response:
     """
     Get HTML constraints page.
@@ -2442,6 +3307,8 @@ async def get_html_constraints_page(
         project_id (str): The ID of the project.
         sorted_by (ConstraintsSortOptions, optional): The option to sort constraints. Defaults to `ITERATION_OF_SAMPLING`.
         sorted_reverse (bool, optional): The option to reverse constraints order. Defaults to `False`.
+        offset (int, optional): The number of constraints to skip. Defaults to `0`.
+        limit (int, optional): The number of constraints to display in the page. Defaults to `100`.
 
     Returns:
         Response: The requested page.
@@ -2449,6 +3316,80 @@ async def get_html_constraints_page(
 
     # Return HTML constraints page.
     try:
+        # Get the requested page of constraints.
+        constraints_page: Dict[str, Any] = await get_constraints(
+            project_id=project_id,
+            without_hidden_constraints=True,
+            sorted_by=sorted_by,
+            sorted_reverse=sorted_reverse,
+            iteration_of_sampling=None,
+            constraint_type=None,
+            to_annotate=None,
+            to_review=None,
+            to_fix_conflict=None,
+            offset=offset,
+            limit=limit,
+            cursor=None,
+        )
+
+        # Define the loading of texts and constraints counts, and of the texts of the requested constraints.
+        def load_counts_and_texts() -> Dict[str, Any]:  # noqa: WPS430 (nested function)
+            """
+            Count texts and constraints (without loading them), and load the texts of the requested constraints.
+
+            Returns:
+                Dict[str, Any]: The counts of texts and constraints, the first constraint to annotate, and the texts.
+            """
+            project_storage: AbstractProjectStorage = storage_factory(project_directory=DATA_DIRECTORY / project_id)
+            constraints_to_annotate, _, number_of_constraints_to_annotate = project_storage.query_constraints(
+                without_hidden_constraints=True,
+                to_annotate=True,
+                sorted_by=sorted_by.value,
+                sorted_reverse=sorted_reverse,
+                limit=1,
+            )
+            return {
+                # Get the number of texts.
+                "number_of_texts": {
+                    "all": project_storage.query_texts(limit=0)[2],
+                    "remaining": project_storage.query_texts(without_deleted_texts=True, limit=0)[2],
+                },
+                # Get the number of constraints (by type and by status), and the first constraint to annotate.
+                "number_of_constraints": {
+                    "MUST_LINK": project_storage.query_constraints(
+                        without_hidden_constraints=True, constraint_types=["MUST_LINK"], limit=0
+                    )[2],
+                    "CANNOT_LINK": project_storage.query_constraints(
+                        without_hidden_constraints=True, constraint_types=["CANNOT_LINK"], limit=0
+                    )[2],
+                    "SKIP": project_storage.query_constraints(
+                        without_hidden_constraints=True, constraint_types=[None], limit=0
+                    )[2],
+                    "to_annotate": number_of_constraints_to_annotate,
+                    "to_review": project_storage.query_constraints(
+                        without_hidden_constraints=True, to_review=True, limit=0
+                    )[2],
+                    "to_fix_conflict": project_storage.query_constraints(
+                        without_hidden_constraints=True, to_fix_conflict=True, limit=0
+                    )[2],
+                },
+                "first_constraint_to_annotate_id": next(iter(constraints_to_annotate.keys()), None),
+                # Get the texts of the requested constraints.
+                "texts": project_storage.get_texts(
+                    text_ids=sorted(
+                        {
+                            text_id
+                            for constraint_value in constraints_page["constraints"].values()
+                            for text_id in (constraint_value["data"]["id_1"], constraint_value["data"]["id_2"])
+                        }
+                    )
+                ),
+            }
+
+        # Load texts and constraints counts (in the I/O threads pool).
+        counts_and_texts: Dict[str, Any] = await run_io(load_counts_and_texts)
+
+        # Return HTML constraints page.
         return templates.TemplateResponse(
             name="constraints.html",
             context={
@@ -2460,29 +3401,18 @@ async def get_html_constraints_page(
                     "without_hidden_constraints": True,
                     "sorted_by": sorted_by.value,
                     "sorted_reverse": sorted_reverse,
+                    "offset": offset,
+                    "limit": limit,
+                    "total": constraints_page["pagination"]["total"],
                 },
                 # Get the project metadata (ID, name, creation date).
                 "metadata": (await get_metadata(project_id=project_id))["metadata"],
                 # Get the project status (iteration, step name and status, modelization state and conflict).
                 "status": (await get_status(project_id=project_id))["status"],
-                # Get the project texts.
-                "texts": (
-                    await get_texts(
-                        project_id=project_id,
-                        without_deleted_texts=False,
-                        sorted_by=TextsSortOptions.ID,
-                        sorted_reverse=False,
-                    )
-                )["texts"],
-                # Get the project constraints.
-                "constraints": (
-                    await get_constraints(
-                        project_id=project_id,
-                        without_hidden_constraints=True,
-                        sorted_by=sorted_by,
-                        sorted_reverse=sorted_reverse,
-                    )
-                )["constraints"],
+                # Get the number of texts and constraints, the first constraint to annotate, and the texts of the requested constraints.
+                **counts_and_texts,
+                # Get the requested page of project constraints.
+                "constraints": constraints_page["constraints"],
             },
             status_code=status.HTTP_200_OK,
         )
@@ -2535,6 +3465,24 @@ async def get_html_constraint_annotation_page(
 
     # Return HTML constraints page.
     try:
+        # Get the project constraints.
+        constraints: Dict[str, Any] = (
+            await get_constraints(
+                project_id=project_id,
+                without_hidden_constraints=False,
+                sorted_by=ConstraintsSortOptions.TO_ANNOTATE,
+                sorted_reverse=False,
+                iteration_of_sampling=None,
+                constraint_type=None,
+                to_annotate=None,
+                to_review=None,
+                to_fix_conflict=None,
+                offset=0,
+                limit=None,
+                cursor=None,
+            )
+        )["constraints"]
+
         return templates.TemplateResponse(
             name="constraint_annotation.html",
             context={
@@ -2554,6 +3502,11 @@ async def get_html_constraint_annotation_page(
                         without_deleted_texts=False,
                         sorted_by=TextsSortOptions.ID,
                         sorted_reverse=False,
+                        filter_text=None,
+                        fields=None,
+                        offset=0,
+                        limit=None,
+                        cursor=None,
                     )
                 )["texts"],
                 "texts_html_escaped": {  # TODO: Escape HTML for javascript
@@ -2567,24 +3520,29 @@ async def get_html_constraint_annotation_page(
                             without_deleted_texts=False,
                             sorted_by=TextsSortOptions.ID,
                             sorted_reverse=False,
+                            filter_text=None,
+                            fields=None,
+                            offset=0,
+                            limit=None,
+                            cursor=None,
                         )
                     )["texts"].items()
                 },
                 # Get the project constraints.
-                "constraints": (
-                    await get_constraints(
-                        project_id=project_id,
-                        without_hidden_constraints=False,
-                        sorted_by=ConstraintsSortOptions.TO_ANNOTATE,
-                        sorted_reverse=False,
-                    )
-                )["constraints"],
+                "constraints": constraints,
                 # Get the project clustering result.
-                "clusters": (await get_constrained_clustering_results(project_id=project_id, iteration_id=None))[
+                "clusters": (await load_constrained_clustering_results(project_id=project_id, iteration_id=None))[
                     "clustering"
                 ],
-                # Get the project modelization inference result.
-                "modelization": (await get_modelization(project_id=project_id))["modelization"],
+                # Get the project modelization inference result of the texts of the constraint.
+                "modelization": await load_texts_modelization(
+                    project_id=project_id,
+                    list_of_text_ids=(
+                        [constraints[constraint_id]["data"]["id_1"], constraints[constraint_id]["data"]["id_2"]]
+                        if constraint_id in constraints
+                        else []
+                    ),
+                ),
             },
             status_code=status.HTTP_200_OK,
         )
@@ -2652,7 +3610,7 @@ async def get_settings(
     """
 
     # Check project id.
-    if project_id not in (await get_projects()):
+    if not projects_registry.exists(data_directory=DATA_DIRECTORY, project_id=project_id):
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="The project with id '{project_id_str}' doesn't exist.".format(
@@ -2661,12 +3619,10 @@ async def get_settings(
         )
 
     # Load settings.
-    with open(DATA_DIRECTORY / project_id / "settings.json", "r") as settings_fileobject:
-        project_settings: Dict[str, Dict[str, Any]] = json.load(settings_fileobject)
+    project_settings: Dict[str, Dict[str, Any]] = await run_io(load_json, DATA_DIRECTORY / project_id / "settings.json")
 
     # Load status file.
-    with open(DATA_DIRECTORY / project_id / "status.json", "r") as status_fileobject:
-        project_status: Dict[str, Any] = json.load(status_fileobject)
+    project_status: Dict[str, Any] = await run_io(load_json, DATA_DIRECTORY / project_id / "status.json")
 
     # Get current iteration id if needed.
     if iteration_id is None:
@@ -2754,7 +3710,7 @@ async def update_settings(
     # TODO: examples: https://fastapi.tiangolo.com/tutorial/schema-extra-example/#body-with-multiple-examples
 
     # Check project id.
-    if project_id not in (await get_projects()):
+    if not projects_registry.exists(data_directory=DATA_DIRECTORY, project_id=project_id):
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="The project with id '{project_id_str}' doesn't exist.".format(
@@ -2762,20 +3718,25 @@ async def update_settings(
             ),
         )
 
-    # Lock status file in order to check project status for this step.
-    with FileLock(str(DATA_DIRECTORY / project_id / "status.json.lock")):
+    # Define the update of project data, to run with the status file locked.
+    def update_project_data() -> List[ICGUISettings]:  # noqa: WPS430 (nested function)
+        """
+        Check project status, then update the settings.
+
+        Returns:
+            List[ICGUISettings]: The list of updated settings.
+        """
+
         ###
         ### Load needed data.
         ###
 
         # Load status file.
-        with open(DATA_DIRECTORY / project_id / "status.json", "r") as status_fileobject_r:
-            project_status: Dict[str, Any] = json.load(status_fileobject_r)
+        project_status: Dict[str, Any] = load_json(DATA_DIRECTORY / project_id / "status.json", mutable=True)
         iteration_id: int = project_status["iteration_id"]
 
         # Load settings file.
-        with open(DATA_DIRECTORY / project_id / "settings.json", "r") as settings_fileobject_r:
-            project_settings: Dict[str, Any] = json.load(settings_fileobject_r)
+        project_settings: Dict[str, Any] = load_json(DATA_DIRECTORY / project_id / "settings.json", mutable=True)
 
         list_of_updated_settings: List[ICGUISettings] = []
 
@@ -2909,12 +3870,17 @@ async def update_settings(
         ###
 
         # Store updated status in file.
-        with open(DATA_DIRECTORY / project_id / "status.json", "w") as status_fileobject_w:
-            json.dump(project_status, status_fileobject_w, indent=4)
+        store_project_status(project_id=project_id, project_status=project_status)
 
         # Store updated settings in file.
-        with open(DATA_DIRECTORY / project_id / "settings.json", "w") as settings_fileobject_w:
-            json.dump(project_settings, settings_fileobject_w, indent=4)
+        store_json(DATA_DIRECTORY / project_id / "settings.json", project_settings)
+
+        return list_of_updated_settings
+
+    # Lock status file in order to check project status for this step, and update project data (in the I/O threads pool).
+    list_of_updated_settings: List[ICGUISettings] = await run_io_with_project_lock(
+        project_directory=DATA_DIRECTORY / project_id, function=update_project_data
+    )
 
     ###
     ### Return statement.
@@ -3019,54 +3985,169 @@ async def get_html_settings_page(
         )
 
 
-# ==============================================================================
-# DEFINE ROUTES FOR MODELIZATION
-# ==============================================================================
+# ==============================================================================
+# DEFINE ROUTES FOR MODELIZATION
+# ==============================================================================
+
+
+###
+### ROUTE: Get modelization inference.
+###
+@app.get(
+    "/api/projects/{project_id}/modelization",
+    tags=["Data modelization"],
+    status_code=status.HTTP_200_OK,
+)
+async def get_modelization(
+    project_id: str = Path(
+        ...,
+        description="The ID of the project.",
+    ),
+) -> JSONResponse:
+    """
+    Get modelization inference.
+
+    Args:
+        project_id (str, optional): The ID of the project.
+
+    Raises:
+        HTTPException: Raises `HTTP_404_NOT_FOUND` if the project with id `project_id` doesn't exist.
+
+    Returns:
+        JSONResponse: A dictionary that contains modelization inference result.
+    """
+
+    # Return the project modelization inference (encoded in the I/O threads pool, as it can be large).
+    return await run_io(JSONResponse, content=await load_modelization(project_id=project_id))
+
+
+async def load_modelization(
+    project_id: str,
+) -> Dict[str, Any]:
+    """
+    Load modelization inference (used by `get_modelization` route and HTML pages).
+
+    Args:
+        project_id (str): The ID of the project.
+
+    Raises:
+        HTTPException: Raises `HTTP_404_NOT_FOUND` if the project with id `project_id` doesn't exist.
+
+    Returns:
+        Dict[str, Any]: A dictionary that contains modelization inference result.
+    """
+
+    # Check project id.
+    if not projects_registry.exists(data_directory=DATA_DIRECTORY, project_id=project_id):
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="The project with id '{project_id_str}' doesn't exist.".format(
+                project_id_str=str(project_id),
+            ),
+        )
+
+    # Load the modelization inference results (legacy modelization inference is compacted).
+    modelization: Dict[str, Any] = await run_io(load_json, DATA_DIRECTORY / project_id / "modelization.json")
+    modelization = await run_io(compact_modelization, modelization)
+
+    # Return the project modelization inference.
+    return {
+        "project_id": project_id,
+        "modelization": modelization,
+    }
+
+
+async def load_texts_modelization(
+    project_id: str,
+    list_of_text_ids: List[str],
+) -> Dict[str, Dict[str, Any]]:
+    """
+    Load modelization inference of some texts (used by HTML pages, that don't need the modelization of all texts).
+
+    Args:
+        project_id (str): The ID of the project.
+        list_of_text_ids (List[str]): The IDs of the texts.
+
+    Raises:
+        HTTPException: Raises `HTTP_404_NOT_FOUND` if the project with id `project_id` doesn't exist.
+
+    Returns:
+        Dict[str, Dict[str, Any]]: The modelization inference result of each modelized text (texts not modelized are missing).
+    """
+
+    # Load the project modelization inference.
+    modelization: Dict[str, Any] = (await load_modelization(project_id=project_id))["modelization"]
+
+    # Expand the modelization inference of the texts.
+    dict_of_texts_modelization: Dict[str, Dict[str, Any]] = {}
+    for text_id in list_of_text_ids:
+        text_modelization: Optional[Dict[str, Any]] = await run_io(
+            expand_modelization,
+            modelization=modelization,
+            data_ID=text_id,
+        )
+        if text_modelization is not None:
+            dict_of_texts_modelization[text_id] = text_modelization
+    return dict_of_texts_modelization
 
 
 ###
-### ROUTE: Get modelization inference.
+### ROUTE: Get modelization inference of a text.
 ###
 @app.get(
-    "/api/projects/{project_id}/modelization",
+    "/api/projects/{project_id}/modelization/{text_id}",
     tags=["Data modelization"],
     status_code=status.HTTP_200_OK,
 )
-async def get_modelization(
+async def get_text_modelization(
     project_id: str = Path(
         ...,
         description="The ID of the project.",
     ),
+    text_id: str = Path(
+        ...,
+        description="The ID of the text.",
+    ),
 ) -> Dict[str, Any]:
     """
-    Get modelization inference.
+    Get modelization inference of a text (texts inferred as `"MUST_LINK"` and `"CANNOT_LINK"`, expanded from stored components).
 
     Args:
         project_id (str, optional): The ID of the project.
+        text_id (str, optional): The ID of the text.
 
     Raises:
         HTTPException: Raises `HTTP_404_NOT_FOUND` if the project with id `project_id` doesn't exist.
+        HTTPException: Raises `HTTP_404_NOT_FOUND` if the text with id `text_id` isn't modelized (unknown or deleted text).
 
     Returns:
-        Dict[str, Any]: A dictionary that contains modelization inference result.
+        Dict[str, Any]: A dictionary that contains modelization inference result of the text.
     """
 
-    # Check project id.
-    if project_id not in (await get_projects()):
+    # Load the project modelization inference.
+    modelization: Dict[str, Any] = (await load_modelization(project_id=project_id))["modelization"]
+
+    # Expand the modelization inference of the text.
+    text_modelization: Optional[Dict[str, Any]] = await run_io(
+        expand_modelization,
+        modelization=modelization,
+        data_ID=text_id,
+    )
+    if text_modelization is None:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
-            detail="The project with id '{project_id_str}' doesn't exist.".format(
+            detail="In project with id '{project_id_str}', the text with id '{text_id_str}' isn't modelized.".format(
                 project_id_str=str(project_id),
+                text_id_str=str(text_id),
             ),
         )
 
-    # Load the modelization inference results.
-    with open(DATA_DIRECTORY / project_id / "modelization.json", "r") as modelization_fileobject:
-        # Return the project modelization inference.
-        return {
-            "project_id": project_id,
-            "modelization": json.load(modelization_fileobject),
-        }
+    # Return the modelization inference of the text.
+    return {
+        "project_id": project_id,
+        "text_id": text_id,
+        "modelization": text_modelization,
+    }
 
 
 ###
@@ -3078,6 +4159,7 @@ async def get_modelization(
     status_code=status.HTTP_200_OK,
 )
 async def get_vectors(
+    response: Response,
     project_id: str = Path(
         ...,
         description="The ID of the project.",
@@ -3085,21 +4167,24 @@ async def get_vectors(
 ) -> Dict[str, Any]:
     """
     Get 2D and 3D vectors.
+    Projections are computed lazily: the first request launches the projection task and returns `HTTP_202_ACCEPTED` with its progression.
 
     Args:
+        response (Response): The response, whose status code is set to `HTTP_202_ACCEPTED` while projections are computed.
         project_id (str, optional): The ID of the project.
 
     Raises:
         HTTPException: Raises `HTTP_404_NOT_FOUND` if the project with id `project_id` doesn't exist.
         HTTPException: Raises `HTTP_404_NOT_FOUND` if the iteration with id `iteration_id` doesn't exist.
         HTTPException: Raises `HTTP_403_FORBIDDEN` if the status of the project hasn't completed its clustering step.
+        HTTPException: Raises `HTTP_500_INTERNAL_SERVER_ERROR` if the projection task failed on current vectors.
 
     Returns:
-        Dict[str, Any]: A dictionary that contains clustering result.
+        Dict[str, Any]: A dictionary that contains 2D and 3D vectors, or the progression of the projection task.
     """
 
     # Check project id.
-    if project_id not in (await get_projects()):
+    if not projects_registry.exists(data_directory=DATA_DIRECTORY, project_id=project_id):
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="The project with id '{project_id_str}' doesn't exist.".format(
@@ -3108,8 +4193,7 @@ async def get_vectors(
         )
 
     # Load status file.
-    with open(DATA_DIRECTORY / project_id / "status.json", "r") as status_fileobject:
-        project_status: Dict[str, Any] = json.load(status_fileobject)
+    project_status: Dict[str, Any] = await run_io(load_json, DATA_DIRECTORY / project_id / "status.json")
 
     # Check project status.
     if (
@@ -3135,21 +4219,85 @@ async def get_vectors(
             ),
         )
 
-    # Load the 2D vectors.
-    with open(DATA_DIRECTORY / project_id / "vectors_2D.json", "r") as vectors_2D_fileobject:
-        vectors_2D: Dict[str, Dict[str, float]] = json.load(vectors_2D_fileobject)  # noqa: S301  # Usage of Pickle
+    # Define the loading of projections, or the request of the projection task (blocking file accesses and workers pool lock).
+    def load_or_request_projections() -> Dict[str, Any]:  # noqa: WPS430 (nested function)
+        """
+        Load the 2D and 3D vectors, or launch the projection task (if not already queued or running) if they aren't computed yet.
+
+        Raises:
+            HTTPException: Raises `HTTP_500_INTERNAL_SERVER_ERROR` if the projection task failed on current vectors.
+
+        Returns:
+            Dict[str, Any]: A dictionary that contains 2D and 3D vectors, or the progression of the projection task.
+        """
+
+        # Case of projections computed: load them (they can be removed meanwhile by a modelization update).
+        if (DATA_DIRECTORY / project_id / "vectors_2D.json").exists() and (
+            DATA_DIRECTORY / project_id / "vectors_3D.json"
+        ).exists():
+            try:
+                return {
+                    "vectors_2d": load_json(DATA_DIRECTORY / project_id / "vectors_2D.json"),
+                    "vectors_3d": load_json(DATA_DIRECTORY / project_id / "vectors_3D.json"),
+                }
+            except OSError:
+                pass  # The projections have been removed: request them again.
+
+        # Load the projection task progression.
+        projection_task: Dict[str, Any] = {
+            "progression": 1,
+            "detail": "Waiting for background task allocation...",
+        }
+        try:
+            with open(
+                DATA_DIRECTORY / project_id / backgroundtasks.PROJECTION_STATUS_NAME, "r"
+            ) as projection_status_fileobject:
+                projection_task = json.load(projection_status_fileobject)
+        except (OSError, ValueError):
+            pass  # The projection task hasn't started yet.
+
+        # Case of failed projection task: return its error (the task is requested again after next modelization update).
+        if "error" in projection_task:
+            raise HTTPException(
+                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+                detail="In project with id '{project_id_str}', the projection of vectors failed ({error_str}). Update the modelization to request it again.".format(
+                    project_id_str=str(project_id),
+                    error_str=str(projection_task["error"]),
+                ),
+            )
+
+        # Launch the projection task.
+        workers.workers_pool.enqueue(
+            data_directory=DATA_DIRECTORY,
+            project_id=project_id,
+            task_name="projection",
+        )
+        return {"task": projection_task}
 
-    # Load the 3D vectors.
-    with open(DATA_DIRECTORY / project_id / "vectors_3D.json", "r") as vectors_3D_fileobject:
-        vectors_3D: Dict[str, Dict[str, float]] = json.load(vectors_3D_fileobject)  # noqa: S301  # Usage of Pickle
+    # Load the projections, or request them.
+    projections: Dict[str, Any] = await run_io(load_or_request_projections)
 
-        # Return the project vectors.
+    # Case of projections not computed yet: return the projection task progression.
+    if "task" in projections:
+        response.status_code = status.HTTP_202_ACCEPTED
         return {
             "project_id": project_id,
-            "vectors_2d": vectors_2D,
-            "vectors_3d": vectors_3D,
+            "task": projections["task"],
+            "detail": "In project with id '{project_id_str}', the projection of vectors has been requested and is waiting for a background task.".format(
+                project_id_str=str(project_id),
+            ),
         }
 
+    # Return the project vectors (encoded in the I/O threads pool, as they can be large).
+    return await run_io(
+        JSONResponse,
+        content={
+            "project_id": project_id,
+            "vectors_2d": projections["vectors_2d"],
+            "vectors_3d": projections["vectors_3d"],
+        },
+    )
+
 
 ###
 ### ROUTE: Prepare modelization update task.
@@ -3160,7 +4308,6 @@ async def get_vectors(
     status_code=status.HTTP_202_ACCEPTED,
 )
 async def prepare_modelization_update_task(
-    background_tasks: BackgroundTasks,
     project_id: str = Path(
         ...,
         description="The ID of the project.",
@@ -3170,7 +4317,6 @@ async def prepare_modelization_update_task(
     Prepare modelization update task.
 
     Args:
-        background_tasks (BackgroundTasks): A background task to run after the return statement.
         project_id (str): The ID of the project.
 
     Raises:
@@ -3182,7 +4328,7 @@ async def prepare_modelization_update_task(
     """
 
     # Check project id.
-    if project_id not in (await get_projects()):
+    if not projects_registry.exists(data_directory=DATA_DIRECTORY, project_id=project_id):
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="The project with id '{project_id_str}' doesn't exist.".format(
@@ -3190,15 +4336,21 @@ async def prepare_modelization_update_task(
             ),
         )
 
-    # Lock status file in order to check project status for this step.
-    with FileLock(str(DATA_DIRECTORY / project_id / "status.json.lock")):
+    # Define the update of project data, to run with the status file locked.
+    def update_project_data() -> Dict[str, Any]:  # noqa: WPS430 (nested function)
+        """
+        Check project status, then request the modelization update task.
+
+        Returns:
+            Dict[str, Any]: The response, with the detail of the requested task.
+        """
+
         ###
         ### Load needed data.
         ###
 
         # Load status file.
-        with open(DATA_DIRECTORY / project_id / "status.json", "r") as status_fileobject:
-            project_status: Dict[str, Any] = json.load(status_fileobject)
+        project_status: Dict[str, Any] = load_json(DATA_DIRECTORY / project_id / "status.json", mutable=True)
 
         ###
         ### Check parameters.
@@ -3254,17 +4406,17 @@ async def prepare_modelization_update_task(
         ###
 
         # Store updated status in file.
-        with open(DATA_DIRECTORY / project_id / "status.json", "w") as status_fileobject_w:
-            json.dump(project_status, status_fileobject_w, indent=4)
+        store_project_status(project_id=project_id, project_status=project_status)
 
         ###
         ### Launch backgroundtask.
         ###
 
-        # Add the background task.
-        background_tasks.add_task(
-            func=backgroundtasks.run_modelization_update_task,
+        # Add the task in the workers pool queue.
+        workers.workers_pool.enqueue(
+            data_directory=DATA_DIRECTORY,
             project_id=project_id,
+            task_name="modelization_update",
         )
 
         # Return statement.
@@ -3275,6 +4427,9 @@ async def prepare_modelization_update_task(
             ),
         }
 
+    # Lock status file in order to check project status for this step, and update project data (in the I/O threads pool).
+    return await run_io_with_project_lock(project_directory=DATA_DIRECTORY / project_id, function=update_project_data)
+
 
 # ==============================================================================
 # DEFINE ROUTES FOR CONSTRAINTS SAMPLING
@@ -3316,7 +4471,7 @@ async def get_constraints_sampling_results(
     """
 
     # Check project id.
-    if project_id not in (await get_projects()):
+    if not projects_registry.exists(data_directory=DATA_DIRECTORY, project_id=project_id):
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="The project with id '{project_id_str}' doesn't exist.".format(
@@ -3325,12 +4480,10 @@ async def get_constraints_sampling_results(
         )
 
     # Load settings.
-    with open(DATA_DIRECTORY / project_id / "settings.json", "r") as settings_fileobject:
-        project_settings: Dict[str, Dict[str, Any]] = json.load(settings_fileobject)
+    project_settings: Dict[str, Dict[str, Any]] = await run_io(load_json, DATA_DIRECTORY / project_id / "settings.json")
 
     # Load status file.
-    with open(DATA_DIRECTORY / project_id / "status.json", "r") as status_fileobject:
-        project_status: Dict[str, Any] = json.load(status_fileobject)
+    project_status: Dict[str, Any] = await run_io(load_json, DATA_DIRECTORY / project_id / "status.json")
 
     # Get current iteration id if needed.
     if iteration_id is None:
@@ -3385,13 +4538,14 @@ async def get_constraints_sampling_results(
         )
 
     # Load the sampling results.
-    with open(DATA_DIRECTORY / project_id / "sampling.json", "r") as sampling_fileobject:
-        # Return the project sampling.
-        return {
-            "project_id": project_id,
-            "iteration_id": iteration_id,
-            "sampling": json.load(sampling_fileobject)[str(iteration_id)],
-        }
+    project_sampling: Dict[str, List[str]] = await run_io(load_json, DATA_DIRECTORY / project_id / "sampling.json")
+
+    # Return the project sampling.
+    return {
+        "project_id": project_id,
+        "iteration_id": iteration_id,
+        "sampling": project_sampling[str(iteration_id)],
+    }
 
 
 ###
@@ -3403,7 +4557,6 @@ async def get_constraints_sampling_results(
     status_code=status.HTTP_202_ACCEPTED,
 )
 async def prepare_constraints_sampling_task(
-    background_tasks: BackgroundTasks,
     project_id: str = Path(
         ...,
         description="The ID of the project.",
@@ -3413,7 +4566,6 @@ async def prepare_constraints_sampling_task(
     Prepare constraints sampling task.
 
     Args:
-        background_tasks (BackgroundTasks): A background task to run after the return statement.
         project_id (str): The ID of the project.
 
     Raises:
@@ -3425,7 +4577,7 @@ async def prepare_constraints_sampling_task(
     """
 
     # Check project id.
-    if project_id not in (await get_projects()):
+    if not projects_registry.exists(data_directory=DATA_DIRECTORY, project_id=project_id):
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="The project with id '{project_id_str}' doesn't exist.".format(
@@ -3433,11 +4585,14 @@ async def prepare_constraints_sampling_task(
             ),
         )
 
-    # Lock status file in order to check project status for this step.
-    with FileLock(str(DATA_DIRECTORY / project_id / "status.json.lock")):
+    # Define the update of project data, to run with the status file locked.
+    def update_project_data() -> None:  # noqa: WPS430 (nested function)
+        """
+        Check project status, then request the constraints sampling task.
+        """
+
         # Load status file.
-        with open(DATA_DIRECTORY / project_id / "status.json", "r") as status_fileobject:
-            project_status: Dict[str, Any] = json.load(status_fileobject)
+        project_status: Dict[str, Any] = load_json(DATA_DIRECTORY / project_id / "status.json", mutable=True)
 
         # Check status.
         if project_status["state"] != ICGUIStates.SAMPLING_TODO:
@@ -3467,19 +4622,22 @@ async def prepare_constraints_sampling_task(
         ###
 
         # Store updated status in file.
-        with open(DATA_DIRECTORY / project_id / "status.json", "w") as status_fileobject_w:
-            json.dump(project_status, status_fileobject_w, indent=4)
+        store_project_status(project_id=project_id, project_status=project_status)
 
         ###
         ### Launch backgroundtask.
         ###
 
-        # Add the background task.
-        background_tasks.add_task(
-            func=backgroundtasks.run_constraints_sampling_task,
+        # Add the task in the workers pool queue.
+        workers.workers_pool.enqueue(
+            data_directory=DATA_DIRECTORY,
             project_id=project_id,
+            task_name="constraints_sampling",
         )
 
+    # Lock status file in order to check project status for this step, and update project data (in the I/O threads pool).
+    await run_io_with_project_lock(project_directory=DATA_DIRECTORY / project_id, function=update_project_data)
+
     # Return statement.
     return {  # pragma: no cover (need radis and worder)
         "project_id": project_id,
@@ -3511,7 +4669,7 @@ async def get_constrained_clustering_results(
         None,
         description="The ID of project iteration. If `None`, get the current iteration. Defaults to `None`.",
     ),
-) -> Dict[str, Any]:
+) -> JSONResponse:
     """
     Get constrained clustering results.
 
@@ -3524,12 +4682,39 @@ async def get_constrained_clustering_results(
         HTTPException: Raises `HTTP_404_NOT_FOUND` if the iteration with id `iteration_id` doesn't exist.
         HTTPException: Raises `HTTP_403_FORBIDDEN` if the status of the project hasn't completed its clustering step.
 
+    Returns:
+        JSONResponse: A dictionary that contains clustering result.
+    """
+
+    # Return the project clustering (encoded in the I/O threads pool, as it can be large).
+    return await run_io(
+        JSONResponse,
+        content=await load_constrained_clustering_results(project_id=project_id, iteration_id=iteration_id),
+    )
+
+
+async def load_constrained_clustering_results(
+    project_id: str,
+    iteration_id: Optional[int] = None,
+) -> Dict[str, Any]:
+    """
+    Load constrained clustering results (used by `get_constrained_clustering_results` route and HTML pages).
+
+    Args:
+        project_id (str): The ID of the project.
+        iteration_id (Optional[int], optional): The ID of project iteration. If `None`, get the current iteration. Defaults to `None`.
+
+    Raises:
+        HTTPException: Raises `HTTP_404_NOT_FOUND` if the project with id `project_id` doesn't exist.
+        HTTPException: Raises `HTTP_404_NOT_FOUND` if the iteration with id `iteration_id` doesn't exist.
+        HTTPException: Raises `HTTP_403_FORBIDDEN` if the status of the project hasn't completed its clustering step.
+
     Returns:
         Dict[str, Any]: A dictionary that contains clustering result.
     """
 
     # Check project id.
-    if project_id not in (await get_projects()):
+    if not projects_registry.exists(data_directory=DATA_DIRECTORY, project_id=project_id):
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="The project with id '{project_id_str}' doesn't exist.".format(
@@ -3538,12 +4723,12 @@ async def get_constrained_clustering_results(
         )
 
     # Load status file.
-    with open(DATA_DIRECTORY / project_id / "status.json", "r") as status_fileobject:
-        project_status: Dict[str, Any] = json.load(status_fileobject)
+    project_status: Dict[str, Any] = await run_io(load_json, DATA_DIRECTORY / project_id / "status.json")
 
     # Load clustering.
-    with open(DATA_DIRECTORY / project_id / "clustering.json", "r") as clustering_fileobject:
-        project_clustering: Dict[str, Dict[str, Any]] = json.load(clustering_fileobject)
+    project_clustering: Dict[str, Dict[str, Any]] = await run_io(
+        load_json, DATA_DIRECTORY / project_id / "clustering.json"
+    )
 
     # Set iteration id if needed.
     if iteration_id is None:
@@ -3603,7 +4788,6 @@ async def get_constrained_clustering_results(
     status_code=status.HTTP_202_ACCEPTED,
 )
 async def prepare_constrained_clustering_task(
-    background_tasks: BackgroundTasks,
     project_id: str = Path(
         ...,
         description="The ID of the project.",
@@ -3613,7 +4797,6 @@ async def prepare_constrained_clustering_task(
     Prepare constrained clustering task.
 
     Args:
-        background_tasks (BackgroundTasks): A background task to run after the return statement.
         project_id (str): The ID of the project.
 
     Raises:
@@ -3626,7 +4809,7 @@ async def prepare_constrained_clustering_task(
     """
 
     # Check project id.
-    if project_id not in (await get_projects()):
+    if not projects_registry.exists(data_directory=DATA_DIRECTORY, project_id=project_id):
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="The project with id '{project_id_str}' doesn't exist.".format(
@@ -3634,15 +4817,18 @@ async def prepare_constrained_clustering_task(
             ),
         )
 
-    # Lock status file in order to check project status for this step.
-    with FileLock(str(DATA_DIRECTORY / project_id / "status.json.lock")):
+    # Define the update of project data, to run with the status file locked.
+    def update_project_data() -> None:  # noqa: WPS430 (nested function)
+        """
+        Check project status, then request the constrained clustering task.
+        """
+
         ###
         ### Load needed data.
         ###
 
         # Load status file.
-        with open(DATA_DIRECTORY / project_id / "status.json", "r") as status_fileobject:
-            project_status: Dict[str, Any] = json.load(status_fileobject)
+        project_status: Dict[str, Any] = load_json(DATA_DIRECTORY / project_id / "status.json", mutable=True)
 
         ###
         ### Check parameters.
@@ -3676,19 +4862,22 @@ async def prepare_constrained_clustering_task(
         ###
 
         # Store updated status in file.
-        with open(DATA_DIRECTORY / project_id / "status.json", "w") as status_fileobject_w:
-            json.dump(project_status, status_fileobject_w, indent=4)
+        store_project_status(project_id=project_id, project_status=project_status)
 
         ###
         ### Launch backgroundtask.
         ###
 
-        # Add the background task.
-        background_tasks.add_task(
-            func=backgroundtasks.run_constrained_clustering_task,
+        # Add the task in the workers pool queue.
+        workers.workers_pool.enqueue(
+            data_directory=DATA_DIRECTORY,
             project_id=project_id,
+            task_name="constrained_clustering",
         )
 
+    # Lock status file in order to check project status for this step, and update project data (in the I/O threads pool).
+    await run_io_with_project_lock(project_directory=DATA_DIRECTORY / project_id, function=update_project_data)
+
     # Return statement.
     return {  # pragma: no cover (need radis and worder)
         "project_id": project_id,
@@ -3696,3 +4885,241 @@ async def prepare_constrained_clustering_task(
             project_id_str=str(project_id),
         ),
     }
+
+
+###
+### ROUTE: Prepare sweep over numbers of clusters task.
+###
+@app.post(
+    "/api/projects/{project_id}/clustering/sweep",
+    tags=["Constrained clustering"],
+    status_code=status.HTTP_202_ACCEPTED,
+)
+async def prepare_clustering_sweep_task(
+    project_id: str = Path(
+        ...,
+        description="The ID of the project.",
+    ),
+    nb_clusters_min: int = Query(
+        2,
+        ge=2,
+        description="The smallest number of clusters of the sweep. Defaults to `2`.",
+    ),
+    nb_clusters_max: int = Query(
+        10,
+        ge=2,
+        description="The greatest number of clusters of the sweep. Defaults to `10`.",
+    ),
+) -> Dict[str, Any]:
+    """
+    Prepare sweep over numbers of clusters task.
+    The task runs the constrained clustering of the current iteration settings for each number of clusters (in parallel processes), in order to help to choose the number of clusters.
+    This task doesn't change the project state, and the previous sweep is replaced.
+
+    Args:
+        project_id (str): The ID of the project.
+        nb_clusters_min (int, optional): The smallest number of clusters of the sweep. Defaults to `2`.
+        nb_clusters_max (int, optional): The greatest number of clusters of the sweep. Defaults to `10`.
+
+    Raises:
+        HTTPException: Raises `HTTP_404_NOT_FOUND` if the project with id `project_id` doesn't exist.
+        HTTPException: Raises `HTTP_400_BAD_REQUEST` if `nb_clusters_max` is smaller than `nb_clusters_min`, or greater than the number of texts.
+        HTTPException: Raises `HTTP_400_BAD_REQUEST` if the sweep has more than `CLUSTERING_SWEEP_MAX_RUNS` numbers of clusters.
+        HTTPException: Raises `HTTP_403_FORBIDDEN` if the status of the project hasn't completed its modelization update step (or if a modelization update is in progress).
+
+    Returns:
+        Dict[str, Any]: A dictionary that contains the confirmation of the preparation of sweep over numbers of clusters task.
+    """
+
+    # Check project id.
+    if not projects_registry.exists(data_directory=DATA_DIRECTORY, project_id=project_id):
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="The project with id '{project_id_str}' doesn't exist.".format(
+                project_id_str=str(project_id),
+            ),
+        )
+
+    # Check numbers of clusters.
+    if nb_clusters_max < nb_clusters_min:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="The parameter `nb_clusters_max` ('{nb_clusters_max_str}') must be greater than or equal to `nb_clusters_min` ('{nb_clusters_min_str}').".format(
+                nb_clusters_max_str=str(nb_clusters_max),
+                nb_clusters_min_str=str(nb_clusters_min),
+            ),
+        )
+    if nb_clusters_max - nb_clusters_min + 1 > backgroundtasks.CLUSTERING_SWEEP_MAX_RUNS:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="The sweep from `nb_clusters_min` ('{nb_clusters_min_str}') to `nb_clusters_max` ('{nb_clusters_max_str}') must have at most {max_runs_str} numbers of clusters.".format(
+                nb_clusters_min_str=str(nb_clusters_min),
+                nb_clusters_max_str=str(nb_clusters_max),
+                max_runs_str=str(backgroundtasks.CLUSTERING_SWEEP_MAX_RUNS),
+            ),
+        )
+
+    # Define the update of project data, to run with the status file locked.
+    def update_project_data() -> None:  # noqa: WPS430 (nested function)
+        """
+        Check project status, then request the sweep over numbers of clusters task.
+        """
+
+        # Load status file.
+        project_status: Dict[str, Any] = load_json(DATA_DIRECTORY / project_id / "status.json")
+
+        # Check status: Case of modelization update in progress (constraints manager and vectors are being rewritten).
+        if (
+            project_status["state"] == ICGUIStates.ANNOTATION_WITH_PENDING_MODELIZATION_WITH_CONFLICTS  # noqa: WPS514
+            or project_status["state"] == ICGUIStates.ANNOTATION_WITH_WORKING_MODELIZATION_WITH_CONFLICTS
+            or project_status["state"] == ICGUIStates.ANNOTATION_WITH_PENDING_MODELIZATION_WITHOUT_CONFLICTS
+            or project_status["state"] == ICGUIStates.ANNOTATION_WITH_WORKING_MODELIZATION_WITHOUT_CONFLICTS
+        ):
+            raise HTTPException(
+                status_code=status.HTTP_403_FORBIDDEN,
+                detail="In project with id '{project_id_str}', a modelization update is in progress. Request the sweep over numbers of clusters once it is over.".format(
+                    project_id_str=str(project_id),
+                ),
+            )
+
+        # Check status.
+        if (
+            project_status["state"] != ICGUIStates.SAMPLING_TODO  # noqa: WPS514
+            and project_status["state"] != ICGUIStates.SAMPLING_PENDING
+            and project_status["state"] != ICGUIStates.SAMPLING_WORKING
+            and project_status["state"] != ICGUIStates.ANNOTATION_WITH_UPTODATE_MODELIZATION
+            and project_status["state"] != ICGUIStates.ANNOTATION_WITH_OUTDATED_MODELIZATION_WITHOUT_CONFLICTS
+            and project_status["state"] != ICGUIStates.ANNOTATION_WITH_OUTDATED_MODELIZATION_WITH_CONFLICTS
+            and project_status["state"] != ICGUIStates.CLUSTERING_TODO
+            and project_status["state"] != ICGUIStates.CLUSTERING_PENDING
+            and project_status["state"] != ICGUIStates.CLUSTERING_WORKING
+            and project_status["state"] != ICGUIStates.ITERATION_END
+        ):
+            raise HTTPException(
+                status_code=status.HTTP_403_FORBIDDEN,
+                detail="The project with id '{project_id_str}' hasn't completed its modelization update step.".format(
+                    project_id_str=str(project_id),
+                ),
+            )
+
+        # Check the greatest number of clusters (each cluster has at least one text).
+        project_storage: AbstractProjectStorage = storage_factory(project_directory=DATA_DIRECTORY / project_id)
+        nb_texts: int = project_storage.query_texts(without_deleted_texts=True, limit=0)[2]
+        if nb_clusters_max > nb_texts:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="The parameter `nb_clusters_max` ('{nb_clusters_max_str}') must be smaller than or equal to the number of texts ('{nb_texts_str}').".format(
+                    nb_clusters_max_str=str(nb_clusters_max),
+                    nb_texts_str=str(nb_texts),
+                ),
+            )
+
+        # Store the requested sweep (a running sweep task runs it once its current sweep is over).
+        store_json(
+            DATA_DIRECTORY / project_id / backgroundtasks.CLUSTERING_SWEEP_NAME,
+            {
+                "parameters": {
+                    "iteration_id": project_status["iteration_id"],
+                    "nb_clusters_min": nb_clusters_min,
+                    "nb_clusters_max": nb_clusters_max,
+                },
+                "task": {
+                    "progression": 1,
+                    "detail": "Waiting for background task allocation...",
+                },
+                "results": None,
+                "metrics": None,
+            },
+        )
+
+        # Add the task in the workers pool queue.
+        workers.workers_pool.enqueue(
+            data_directory=DATA_DIRECTORY,
+            project_id=project_id,
+            task_name="clustering_sweep",
+        )
+
+    # Lock status file in order to check project status for this step, and update project data (in the I/O threads pool).
+    await run_io_with_project_lock(project_directory=DATA_DIRECTORY / project_id, function=update_project_data)
+
+    # Return statement.
+    return {
+        "project_id": project_id,
+        "detail": "In project with id '{project_id_str}', the sweep over numbers of clusters task has been requested and is waiting for a background task.".format(
+            project_id_str=str(project_id),
+        ),
+    }
+
+
+###
+### ROUTE: Get sweep over numbers of clusters results.
+###
+@app.get(
+    "/api/projects/{project_id}/clustering/sweep",
+    tags=["Constrained clustering"],
+    status_code=status.HTTP_200_OK,
+)
+async def get_clustering_sweep_results(
+    response: Response,
+    project_id: str = Path(
+        ...,
+        description="The ID of the project.",
+    ),
+) -> Dict[str, Any]:
+    """
+    Get sweep over numbers of clusters results: silhouette coefficient, number of violated constraints and inertia for each number of clusters.
+
+    Args:
+        response (Response): The response, whose status code is set to `HTTP_202_ACCEPTED` while the sweep is computed.
+        project_id (str): The ID of the project.
+
+    Raises:
+        HTTPException: Raises `HTTP_404_NOT_FOUND` if the project with id `project_id` doesn't exist.
+        HTTPException: Raises `HTTP_404_NOT_FOUND` if no sweep over numbers of clusters has been requested (or if vectors have been updated since).
+        HTTPException: Raises `HTTP_500_INTERNAL_SERVER_ERROR` if the sweep over numbers of clusters task failed.
+
+    Returns:
+        Dict[str, Any]: A dictionary that contains the sweep parameters, the progression of the sweep task, and the sweep results.
+    """
+
+    # Check project id.
+    if not projects_registry.exists(data_directory=DATA_DIRECTORY, project_id=project_id):
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="The project with id '{project_id_str}' doesn't exist.".format(
+                project_id_str=str(project_id),
+            ),
+        )
+
+    # Load the sweep file.
+    try:
+        clustering_sweep: Dict[str, Any] = await run_io(
+            load_json, DATA_DIRECTORY / project_id / backgroundtasks.CLUSTERING_SWEEP_NAME
+        )
+    except FileNotFoundError:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="In project with id '{project_id_str}', no sweep over numbers of clusters has been requested.".format(
+                project_id_str=str(project_id),
+            ),
+        )
+
+    # Case of failed sweep task: return its error (the sweep can be requested again).
+    if "error" in clustering_sweep:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail="In project with id '{project_id_str}', the sweep over numbers of clusters failed ({error_str}). Request it again.".format(
+                project_id_str=str(project_id),
+                error_str=str(clustering_sweep["error"]),
+            ),
+        )
+
+    # Case of sweep not computed yet.
+    if clustering_sweep["task"] is not None:
+        response.status_code = status.HTTP_202_ACCEPTED
+
+    # Return the sweep.
+    return {
+        "project_id": project_id,
+        **clustering_sweep,
+    }
@@ -17,22 +17,48 @@ import json
 import os
 import pathlib
 import pickle  # noqa: S403
-from typing import Any, Dict, List, Optional, Tuple
+from multiprocessing.connection import Connection
+from typing import Any, Dict, List, Optional, Set, Tuple
 
 from filelock import FileLock
-from numpy import ndarray
-from scipy.sparse import csr_matrix, vstack
-from sklearn.manifold import TSNE
+from scipy.sparse import csr_matrix
 
-from cognitivefactory.interactive_clustering.clustering.abstract import AbstractConstrainedClustering
-from cognitivefactory.interactive_clustering.clustering.factory import clustering_factory
 from cognitivefactory.interactive_clustering.constraints.binary import BinaryConstraintsManager
 from cognitivefactory.interactive_clustering.sampling.abstract import AbstractConstraintsSampling
 from cognitivefactory.interactive_clustering.sampling.clusters_based import ClustersBasedConstraintsSampling
 from cognitivefactory.interactive_clustering.sampling.factory import sampling_factory
-from cognitivefactory.interactive_clustering.utils.preprocessing import preprocess
-from cognitivefactory.interactive_clustering.utils.vectorization import vectorize
+from cognitivefactory.interactive_clustering_gui.clustering import (
+    get_constraints_components,
+    run_clustering_with_several_random_seeds,
+    sweep_nb_clusters,
+)
+from cognitivefactory.interactive_clustering_gui.models.settings import ProjectionAlgorithm
 from cognitivefactory.interactive_clustering_gui.models.states import ICGUIStates
+from cognitivefactory.interactive_clustering_gui.projection import compute_projections
+from cognitivefactory.interactive_clustering_gui.sampling import NeighborsIndexConstraintsSampling
+from cognitivefactory.interactive_clustering_gui.storage.abstract import AbstractProjectStorage
+from cognitivefactory.interactive_clustering_gui.storage.constraints_journal import (
+    get_annotated_constraints,
+    update_constraints_manager,
+)
+from cognitivefactory.interactive_clustering_gui.storage.distances import Distances, get_distances, update_distances
+from cognitivefactory.interactive_clustering_gui.storage.factory import storage_factory
+from cognitivefactory.interactive_clustering_gui.storage.modelization import build_modelization
+from cognitivefactory.interactive_clustering_gui.storage.modelization_cache import (
+    preprocess_with_cache,
+    vectorize_with_cache,
+)
+from cognitivefactory.interactive_clustering_gui.storage.neighbors_index import (
+    NeighborsIndex,
+    get_neighbors_index,
+    update_neighbors_index,
+)
+from cognitivefactory.interactive_clustering_gui.storage.vectors import (
+    get_vectors_version,
+    load_vectors,
+    load_vectors_matrix,
+    store_vectors,
+)
 
 # ==============================================================================
 # CONFIGURE FASTAPI APPLICATION
@@ -43,6 +69,18 @@ from cognitivefactory.interactive_clustering_gui.models.states import ICGUIState
 DATA_DIRECTORY = pathlib.Path(os.environ.get("DATA_DIRECTORY", ".data"))
 DATA_DIRECTORY.mkdir(parents=True, exist_ok=True)
 
+# Name of the projection status file in the project directory.
+PROJECTION_STATUS_NAME: str = "projection_status.json"
+
+# Name of the file of the sweep over numbers of clusters in the project directory (with its parameters, progression and results).
+CLUSTERING_SWEEP_NAME: str = "clustering_sweep.json"
+
+# Maximum number of numbers of clusters of a sweep (each one runs a constrained clustering).
+CLUSTERING_SWEEP_MAX_RUNS: int = int(os.environ.get("CLUSTERING_SWEEP_MAX_RUNS", "50"))
+
+# Connection used to send status changes to the web server (set by the workers pool in the worker process).
+EVENTS_CONNECTION: Optional[Connection] = None
+
 
 # ==============================================================================
 # DEFINE COMMON METHODS
@@ -73,6 +111,7 @@ def update_project_status(
     task_progression: Optional[int],
     task_detail: Optional[str],
     state: Optional[ICGUIStates] = None,
+    task_metrics: Optional[Dict[str, float]] = None,
 ) -> None:
     """
     Update project status during task.
@@ -82,12 +121,17 @@ def update_project_status(
         task_progression (Optional[int]): The progression of the updated task.
         task_detail (Optional[str]): The detail of the updated task.
         state (Optional[ICGUIStates], optional): The state of the application. Unchanged if `None`. Defaults to `None`.
+        task_metrics (Optional[Dict[str, float]], optional): The metrics measured during the task (such as preprocessing throughput). They are kept until the end of the task. Defaults to `None`.
     """
 
     # Load status file.
     with open(DATA_DIRECTORY / project_id / "status.json", "r") as status_fileobject_r:
         project_status: Dict[str, Any] = json.load(status_fileobject_r)
 
+    # Get metrics of the task (previous ones are kept until the end of the task).
+    all_task_metrics: Dict[str, float] = dict((project_status.get("task") or {}).get("metrics", {}))
+    all_task_metrics.update(task_metrics or {})
+
     # Update status.
     project_status["task"] = (
         {
@@ -97,15 +141,141 @@ def update_project_status(
         if (task_progression is not None)
         else None
     )
+    if project_status["task"] is not None and len(all_task_metrics) != 0:  # noqa: WPS507
+        project_status["task"]["metrics"] = all_task_metrics
     project_status["state"] = project_status["state"] if (state is None) else state
 
-    # Store status.
-    with open(DATA_DIRECTORY / project_id / "status.json", "w") as status_fileobject_w:
+    # Store status (through a temporary file, to avoid a partial status if the worker is terminated).
+    with open(DATA_DIRECTORY / project_id / "status.json.tmp", "w") as status_fileobject_w:
         json.dump(
             project_status,
             status_fileobject_w,
             indent=4,
         )
+    os.replace(
+        DATA_DIRECTORY / project_id / "status.json.tmp",
+        DATA_DIRECTORY / project_id / "status.json",
+    )
+
+    # Send the new status to the web server, that pushes it to browsers.
+    if EVENTS_CONNECTION is not None:
+        try:
+            EVENTS_CONNECTION.send((project_id, project_status))
+        except OSError:
+            pass  # The web server doesn't listen anymore.
+
+
+###
+### UTILS: Update projection status during projection task.
+###
+def update_projection_status(
+    project_id: str,
+    task_progression: Optional[int],
+    task_detail: str,
+    task_error: Optional[str] = None,
+) -> None:
+    """
+    Update projection status during projection task.
+    The projection task doesn't lock the project, so its progression is stored apart from project status.
+
+    Args:
+        project_id (str): The ID of the project.
+        task_progression (Optional[int]): The progression of the projection task. `None` if the task failed.
+        task_detail (str): The detail of the projection task.
+        task_error (Optional[str], optional): The error raised by the projection task, if it failed. Defaults to `None`.
+    """
+
+    # Define status.
+    projection_status: Dict[str, Any] = {
+        "progression": task_progression,
+        "detail": task_detail,
+    }
+    if task_error is not None:
+        projection_status["error"] = task_error
+
+    # Store status (through a temporary file, to avoid a partial status).
+    with open(DATA_DIRECTORY / project_id / (PROJECTION_STATUS_NAME + ".tmp"), "w") as projection_status_fileobject_w:
+        json.dump(
+            projection_status,
+            projection_status_fileobject_w,
+            indent=4,
+        )
+    os.replace(
+        DATA_DIRECTORY / project_id / (PROJECTION_STATUS_NAME + ".tmp"),
+        DATA_DIRECTORY / project_id / PROJECTION_STATUS_NAME,
+    )
+
+
+###
+### UTILS: Update sweep over numbers of clusters during sweep task.
+###
+def update_clustering_sweep(
+    project_id: str,
+    parameters: Dict[str, Any],
+    task_progression: Optional[int],
+    task_detail: Optional[str],
+    results: Optional[Dict[str, Dict[str, Optional[float]]]] = None,
+    metrics: Optional[Dict[str, float]] = None,
+    task_error: Optional[str] = None,
+) -> bool:
+    """
+    Update the sweep over numbers of clusters during sweep task, if its parameters are still the requested ones.
+    The sweep task doesn't lock the project, so its progression and results are stored apart from project status.
+
+    Args:
+        project_id (str): The ID of the project.
+        parameters (Dict[str, Any]): The parameters of the sweep run by the task.
+        task_progression (Optional[int]): The progression of the sweep task. `None` at the end of the task.
+        task_detail (Optional[str]): The detail of the sweep task.
+        results (Optional[Dict[str, Dict[str, Optional[float]]]], optional): The curves of the sweep. Unchanged if `None`. Defaults to `None`.
+        metrics (Optional[Dict[str, float]], optional): The metrics of the sweep. Unchanged if `None`. Defaults to `None`.
+        task_error (Optional[str], optional): The error of a failed sweep task. Defaults to `None`.
+
+    Returns:
+        bool: `False` if the sweep has been removed or requested again with other parameters.
+    """
+
+    # Lock status file (the sweep file is also updated by the web server).
+    with FileLock(str(DATA_DIRECTORY / project_id / "status.json.lock")):
+        # Load sweep file.
+        try:
+            with open(DATA_DIRECTORY / project_id / CLUSTERING_SWEEP_NAME, "r") as clustering_sweep_fileobject_r:
+                clustering_sweep: Dict[str, Any] = json.load(clustering_sweep_fileobject_r)
+        except (OSError, ValueError):
+            return False
+
+        # Case of a sweep requested again with other parameters.
+        if clustering_sweep["parameters"] != parameters:
+            return False
+
+        # Update sweep.
+        clustering_sweep["task"] = (
+            {
+                "progression": task_progression,
+                "detail": task_detail,
+            }
+            if (task_progression is not None)
+            else None
+        )
+        if results is not None:
+            clustering_sweep["results"] = results
+        if metrics is not None:
+            clustering_sweep["metrics"] = metrics
+        if task_error is not None:
+            clustering_sweep["error"] = task_error
+
+        # Store sweep (through a temporary file, to avoid a partial file).
+        with open(DATA_DIRECTORY / project_id / (CLUSTERING_SWEEP_NAME + ".tmp"), "w") as clustering_sweep_fileobject_w:
+            json.dump(
+                clustering_sweep,
+                clustering_sweep_fileobject_w,
+                indent=4,
+            )
+        os.replace(
+            DATA_DIRECTORY / project_id / (CLUSTERING_SWEEP_NAME + ".tmp"),
+            DATA_DIRECTORY / project_id / CLUSTERING_SWEEP_NAME,
+        )
+    return True
 
 
 # ==============================================================================
@@ -205,8 +375,8 @@ def run_modelization_update_task(
         )
 
     # Load texts
-    with open(DATA_DIRECTORY / project_id / "texts.json", "r") as texts_fileobject_r:
-        texts: Dict[str, Any] = json.load(texts_fileobject_r)
+    project_storage: AbstractProjectStorage = storage_factory(project_directory=DATA_DIRECTORY / project_id)
+    texts: Dict[str, Any] = project_storage.get_texts()
 
     ###
     ### Texts preprocessing.
@@ -224,26 +394,31 @@ def run_modelization_update_task(
         for text_id_before_preprocessing, text_value_before_preprocessing in texts.items()
     }
 
-    # Preprocess all texts (even if text is deleted).
-    dict_of_preprocessed_texts: Dict[str, str] = preprocess(
+    # Preprocess all texts (even if text is deleted). Only new or renamed texts are computed (by batches), others come from cache.
+    preprocessing_metrics: Dict[str, float] = {}
+    dict_of_preprocessed_texts: Dict[str, str] = preprocess_with_cache(
+        project_directory=DATA_DIRECTORY / project_id,
         dict_of_texts=dict_of_unpreprocessed_texts,
         apply_stopwords_deletion=settings[str(iteration_id)]["preprocessing"]["apply_stopwords_deletion"],
         apply_parsing_filter=settings[str(iteration_id)]["preprocessing"]["apply_parsing_filter"],
         apply_lemmatization=settings[str(iteration_id)]["preprocessing"]["apply_lemmatization"],
         spacy_language_model=settings[str(iteration_id)]["preprocessing"]["spacy_language_model"],
+        task_metrics=preprocessing_metrics,
     )
 
+    # Get texts with updated preprocessed values.
+    texts_updates: Dict[str, Dict[str, Any]] = {
+        text_id_with_preprocessing: {"text_preprocessed": dict_of_preprocessed_texts[text_id_with_preprocessing]}
+        for text_id_with_preprocessing, text_value_with_preprocessing in texts.items()
+        if text_value_with_preprocessing["text_preprocessed"] != dict_of_preprocessed_texts[text_id_with_preprocessing]
+    }
+
     # Update texts with preprocessed values.
     for text_id_with_preprocessing in texts.keys():
         texts[text_id_with_preprocessing]["text_preprocessed"] = dict_of_preprocessed_texts[text_id_with_preprocessing]
 
     # Store texts.
-    with open(DATA_DIRECTORY / project_id / "texts.json", "w") as texts_fileobject_w:
-        json.dump(
-            texts,
-            texts_fileobject_w,
-            indent=4,
-        )
+    project_storage.update_texts(texts_updates=texts_updates)
 
     ###
     ### Texts vectorization.
@@ -253,6 +428,7 @@ def run_modelization_update_task(
             project_id=project_id,
             task_progression=35,
             task_detail="Vectorize texts.",
+            task_metrics=preprocessing_metrics,
         )
 
     # Get managed preprocessed texts.
@@ -262,92 +438,37 @@ def run_modelization_update_task(
         if text_value_before_vectorization["is_deleted"] is False
     }
 
-    # Vectorize texts (only if text is not deleted).
-    dict_of_managed_vectors: Dict[str, csr_matrix] = vectorize(
+    # Vectorize texts (only if text is not deleted). With spaCy vectorizer, only new or renamed texts are computed.
+    dict_of_managed_vectors: Dict[str, csr_matrix] = vectorize_with_cache(
+        project_directory=DATA_DIRECTORY / project_id,
         dict_of_texts=dict_of_managed_preprocessed_texts,
         vectorizer_type=settings[str(iteration_id)]["vectorization"]["vectorizer_type"],
         spacy_language_model=settings[str(iteration_id)]["vectorization"]["spacy_language_model"],
     )
 
-    # Store vectors.
-    with open(DATA_DIRECTORY / project_id / "vectors.pkl", "wb") as vectors_fileobject:
-        pickle.dump(
-            dict_of_managed_vectors,
-            vectors_fileobject,
-            pickle.HIGHEST_PROTOCOL,
-        )
-
-    # Convert vectors into matrix.
-    vectors_ND: csr_matrix = vstack(
-        dict_of_managed_vectors[text_id_with_ND] for text_id_with_ND in dict_of_managed_vectors.keys()
+    # Store vectors (as a single memory-mappable matrix with an ID index).
+    store_vectors(
+        project_directory=DATA_DIRECTORY / project_id,
+        dict_of_vectors=dict_of_managed_vectors,
     )
 
-    ###
-    ### Texts vectorization in 2D.
-    ###
-    with FileLock(str(DATA_DIRECTORY / project_id / "status.json.lock")):
-        update_project_status(
-            project_id=project_id,
-            task_progression=50,
-            task_detail="Reduce vectors to 2 dimensions.",
-        )
-
-    # Reduce vectors to 2 dimensions with TSNE.
-    vectors_2D: ndarray = TSNE(
-        n_components=2,
-        # learning_rate="auto",  # Error on "scikit-learn==0.24.1" !
-        init="random",
-        random_state=settings[str(iteration_id)]["vectorization"]["random_seed"],
-        perplexity=min(30.0, vectors_ND.shape[0] - 1),  # TSNE requirement.
-    ).fit_transform(vectors_ND)
+    # Build the neighbors index of vectors (only for large projects, used by distance restrictions of constraints sampling).
+    update_neighbors_index(project_directory=DATA_DIRECTORY / project_id)
 
-    # Store 2D vectors.
-    with open(DATA_DIRECTORY / project_id / "vectors_2D.json", "w") as vectors_2D_fileobject:
-        json.dump(
-            {
-                text_id_with_2D: {
-                    "x": float(vectors_2D[i_2D][0]),
-                    "y": float(vectors_2D[i_2D][1]),
-                }
-                for i_2D, text_id_with_2D in enumerate(dict_of_managed_vectors.keys())
-            },
-            vectors_2D_fileobject,
-            indent=4,
-        )
+    # Compute distances between vectors once (pairwise distances or kNN graph), reused by sampling and clustering of all iterations.
+    update_distances(project_directory=DATA_DIRECTORY / project_id)
 
-    ###
-    ### Texts vectorization in 3D.
-    ###
+    # Remove outdated projections and projection failure (they are lazily recomputed by the projection task when requested).
+    # The project is locked, so that a running projection task doesn't store projections or failure of previous vectors afterwards.
     with FileLock(str(DATA_DIRECTORY / project_id / "status.json.lock")):
-        update_project_status(
-            project_id=project_id,
-            task_progression=65,
-            task_detail="Reduce vectors to 3 dimensions.",
-        )
+        for projection_file_name in ("vectors_2D.json", "vectors_3D.json", PROJECTION_STATUS_NAME):
+            if (DATA_DIRECTORY / project_id / projection_file_name).exists():
+                os.remove(DATA_DIRECTORY / project_id / projection_file_name)
 
-    # Reduce vectors to 3 dimensions with TSNE.
-    vectors_3D: ndarray = TSNE(
-        n_components=3,
-        # learning_rate="auto",  # Error on "scikit-learn==0.24.1" !
-        init="random",
-        random_state=settings[str(iteration_id)]["vectorization"]["random_seed"],
-        perplexity=min(30.0, vectors_ND.shape[0] - 1),  # TSNE requirement.
-    ).fit_transform(vectors_ND)
-
-    # Store 3D vectors.
-    with open(DATA_DIRECTORY / project_id / "vectors_3D.json", "w") as vectors_3D_fileobject:
-        json.dump(
-            {
-                text_id_with_3D: {
-                    "x": float(vectors_3D[i_3D][0]),
-                    "y": float(vectors_3D[i_3D][1]),
-                    "z": float(vectors_3D[i_3D][2]),
-                }
-                for i_3D, text_id_with_3D in enumerate(dict_of_managed_vectors.keys())
-            },
-            vectors_3D_fileobject,
-            indent=4,
-        )
+    # Remove outdated sweep over numbers of clusters (computed on previous vectors).
+    with FileLock(str(DATA_DIRECTORY / project_id / "status.json.lock")):
+        if (DATA_DIRECTORY / project_id / CLUSTERING_SWEEP_NAME).exists():
+            os.remove(DATA_DIRECTORY / project_id / CLUSTERING_SWEEP_NAME)
 
     ###
     ### Constraints manager regeneration.
@@ -359,56 +480,29 @@ def run_modelization_update_task(
             task_detail="(Re)generate constraints manager.",
         )
 
-    # Initialize constraints manager with managed texts IDs.
-    new_constraints_manager: BinaryConstraintsManager = BinaryConstraintsManager(
-        list_of_data_IDs=list(dict_of_managed_preprocessed_texts.keys())
+    # Load annotated constraints.
+    constraints: Dict[str, Any] = project_storage.get_constraints()
+
+    # Update constraints manager with managed texts IDs and annotated constraints (incremental if possible).
+    new_constraints_manager, list_of_conflicts = update_constraints_manager(
+        project_directory=DATA_DIRECTORY / project_id,
+        list_of_data_IDs=list(dict_of_managed_preprocessed_texts.keys()),
+        constraints=constraints,
     )
 
-    # Load annotated constraints.
-    with open(DATA_DIRECTORY / project_id / "constraints.json", "r") as constraints_fileobject_r:
-        constraints: Dict[str, Any] = json.load(constraints_fileobject_r)
-
-    # First, reset `to_fix_conflict` status of all constraints.
-    for constraint_id in constraints.keys():
-        constraints[constraint_id]["to_fix_conflict"] = False
-
-    # Then, update constraints manager with "CANNOT_LINK" constraints.
-    for _, constraint_CL in constraints.items():
-        if constraint_CL["constraint_type"] == "CANNOT_LINK" and constraint_CL["is_hidden"] is False:
-            new_constraints_manager.add_constraint(
-                data_ID1=constraint_CL["data"]["id_1"],
-                data_ID2=constraint_CL["data"]["id_2"],
-                constraint_type="CANNOT_LINK",
-            )  # No conflict can append, at this step the constraints manager handle only constraints of same type.
-
-    # Initialize conflicts counter.
-    number_of_conflicts: int = 0
-
-    # Finaly, update constraints manager with "MUST_LINK" constraints.
-    for constraint_ML_id, constraint_ML in constraints.items():
-        if constraint_ML["constraint_type"] == "MUST_LINK" and constraint_ML["is_hidden"] is False:
-            try:
-                new_constraints_manager.add_constraint(
-                    data_ID1=constraint_ML["data"]["id_1"],
-                    data_ID2=constraint_ML["data"]["id_2"],
-                    constraint_type="MUST_LINK",
-                )  # Conflicts can append.
-            except ValueError:
-                # Update conflicts status.
-                constraints[constraint_ML_id]["to_fix_conflict"] = True
-                number_of_conflicts += 1
+    # Count conflicts.
+    number_of_conflicts: int = len(list_of_conflicts)
 
-    # Store new constraints manager.
-    with open(DATA_DIRECTORY / project_id / "constraints_manager.pkl", "wb") as constraints_manager_fileobject:
-        pickle.dump(
-            new_constraints_manager,
-            constraints_manager_fileobject,
-            pickle.HIGHEST_PROTOCOL,
-        )
+    # Update conflicts status.
+    set_of_conflicts: Set[str] = set(list_of_conflicts)
+    constraints_updates: Dict[str, Dict[str, Any]] = {
+        constraint_id: {"to_fix_conflict": constraint_id in set_of_conflicts}
+        for constraint_id, constraint_value in constraints.items()
+        if constraint_value["to_fix_conflict"] != (constraint_id in set_of_conflicts)
+    }
 
-    # Store updated constraints in file.
-    with open(DATA_DIRECTORY / project_id / "constraints.json", "w") as constraints_fileobject_w:
-        json.dump(constraints, constraints_fileobject_w, indent=4)
+    # Store updated constraints.
+    project_storage.update_constraints(constraints_updates=constraints_updates)
 
     ###
     ### Store modelization inference.
@@ -420,29 +514,30 @@ def run_modelization_update_task(
             task_detail="Store modelization inference results.",
         )
 
-    # Load modelization inference file.
-    with open(DATA_DIRECTORY / project_id / "modelization.json", "r") as modelization_fileobject_r:
-        modelization: Dict[str, Any] = json.load(modelization_fileobject_r)
-
-    # Get constraints transitivity.
-    constraints_transitivity: Dict[str, Dict[str, Dict[str, None]]] = (
-        new_constraints_manager._constraints_transitivity  # noqa: WPS437
+    # Get components of "MUST_LINK" constraints and their "CANNOT_LINK" links (constraints in conflict aren't in the manager).
+    components, cannot_links = get_constraints_components(
+        constraints_manager=new_constraints_manager,
+        list_of_constraints=[
+            (constraints[constraint_id]["data"]["id_1"], constraints[constraint_id]["data"]["id_2"], constraint_type)
+            for constraint_id, constraint_type in get_annotated_constraints(constraints=constraints).items()
+            if constraint_id not in set_of_conflicts
+        ],
     )
 
-    # Update modelization inference.
-    modelization = {}
-    for text_id_in_manager in new_constraints_manager.get_list_of_managed_data_IDs():
-        modelization[text_id_in_manager] = {
-            "MUST_LINK": list(constraints_transitivity[text_id_in_manager]["MUST_LINK"].keys()),
-            "CANNOT_LINK": list(constraints_transitivity[text_id_in_manager]["CANNOT_LINK"].keys()),
-        }
-    for component_id, component in enumerate(new_constraints_manager.get_connected_components()):
-        for text_id_in_component in component:
-            modelization[text_id_in_component]["COMPONENT"] = component_id
+    # Update modelization inference (compact: the component of each text, and the "CANNOT_LINK" adjacency of components).
+    modelization: Dict[str, Any] = build_modelization(
+        list_of_data_IDs=new_constraints_manager.get_list_of_managed_data_IDs(),
+        components=components,
+        cannot_links=cannot_links,
+    )
 
-    # Store updated modelization inference in file.
-    with open(DATA_DIRECTORY / project_id / "modelization.json", "w") as modelization_fileobject_w:
+    # Store updated modelization inference in file (through a temporary file, to avoid a partial file).
+    with open(DATA_DIRECTORY / project_id / "modelization.json.tmp", "w") as modelization_fileobject_w:
         json.dump(modelization, modelization_fileobject_w, indent=4)
+    os.replace(
+        DATA_DIRECTORY / project_id / "modelization.json.tmp",
+        DATA_DIRECTORY / project_id / "modelization.json",
+    )
 
     ###
     ### End of task.
@@ -490,6 +585,180 @@ def run_modelization_update_task(
         )
 
 
+# ==============================================================================
+# DEFINE BACKGROUND TASKS FOR PROJECTION
+# ==============================================================================
+
+
+###
+### BACKGROUND TASK: Run projection task.
+###
+def run_projection_task(
+    project_id: str,
+) -> None:
+    """
+    Background task route for projection.
+    It reduces the vectors of the last modelization update to 2 and 3 dimensions, only when they are requested.
+    This task doesn't change the project state, so it doesn't block other steps.
+
+    Args:
+        project_id (str): The ID of the project.
+    """
+
+    ###
+    ### Check parameters.
+    ###
+
+    # Check project id : Case of unknown.
+    if project_id not in get_projects():
+        return
+
+    # Check vectors : Case of project without modelization.
+    # Keep vectors version, in order to discard projections of vectors updated during the task.
+    vectors_version: Optional[int] = get_vectors_version(project_directory=DATA_DIRECTORY / project_id)
+    if vectors_version is None:
+        return
+
+    # Compute and store projections.
+    try:
+        compute_and_store_projections(project_id=project_id, vectors_version=vectors_version)
+
+    # Case of failure (such as a projection algorithm that can't handle a small project): store the error, so that
+    # the projection isn't requested again until next modelization update.
+    except Exception as projection_error:  # noqa: B902 (any error of projection algorithms)
+        with FileLock(str(DATA_DIRECTORY / project_id / "status.json.lock")):
+            # Case of vectors updated during the task: the failure concerns outdated vectors.
+            if get_vectors_version(project_directory=DATA_DIRECTORY / project_id) == vectors_version:
+                update_projection_status(
+                    project_id=project_id,
+                    task_progression=None,
+                    task_detail="The projection of vectors failed.",
+                    task_error="{error_type}: {error}".format(
+                        error_type=type(projection_error).__name__,
+                        error=str(projection_error),
+                    ),
+                )
+
+
+###
+### UTILS: Compute and store projections during projection task.
+###
+def compute_and_store_projections(
+    project_id: str,
+    vectors_version: int,
+) -> None:
+    """
+    Reduce the vectors of the last modelization update to 2 and 3 dimensions, and store them (used by the projection task).
+
+    Args:
+        project_id (str): The ID of the project.
+        vectors_version (int): The version of vectors to reduce. Projections are discarded if vectors are updated meanwhile.
+    """
+
+    ###
+    ### Settings and vectors loading.
+    ###
+    update_projection_status(
+        project_id=project_id,
+        task_progression=10,
+        task_detail="Load settings and vectors.",
+    )
+
+    # Load status file.
+    with open(DATA_DIRECTORY / project_id / "status.json", "r") as status_fileobject_r:
+        project_status: Dict[str, Any] = json.load(status_fileobject_r)
+
+    # Load settings file.
+    with open(DATA_DIRECTORY / project_id / "settings.json", "r") as settings_fileobject:
+        settings: Dict[str, Any] = json.load(settings_fileobject)
+
+    # Load vectors as a memory-mapped matrix.
+    list_of_text_ids_with_ND, vectors_ND = load_vectors_matrix(project_directory=DATA_DIRECTORY / project_id)
+
+    ###
+    ### Texts vectorization in 2D and 3D.
+    ###
+    update_projection_status(
+        project_id=project_id,
+        task_progression=30,
+        task_detail="Reduce vectors to 2 and 3 dimensions.",
+    )
+
+    # Reduce vectors to 2 and 3 dimensions with the projection algorithm (both projections are computed concurrently).
+    vectorization_settings: Dict[str, Any] = settings[str(project_status["iteration_id"])]["vectorization"]
+    vectors_2D, vectors_3D = compute_projections(
+        vectors_ND=vectors_ND,
+        projection_algorithm=vectorization_settings.get(
+            "projection_algorithm", ProjectionAlgorithm.TSNE
+        ),  # Settings of previous versions don't have a projection algorithm.
+        random_seed=vectorization_settings["random_seed"],
+    )
+
+    ###
+    ### Store projections.
+    ###
+
+    # Case of vectors updated during the task: discard outdated projections (checked again before publishing them).
+    if get_vectors_version(project_directory=DATA_DIRECTORY / project_id) != vectors_version:
+        return
+
+    update_projection_status(
+        project_id=project_id,
+        task_progression=90,
+        task_detail="Store projections.",
+    )
+
+    # Store 2D vectors (in a temporary file, published at the end of the task).
+    with open(DATA_DIRECTORY / project_id / "vectors_2D.json.tmp", "w") as vectors_2D_fileobject:
+        json.dump(
+            {
+                text_id_with_2D: {
+                    "x": float(vectors_2D[i_2D][0]),
+                    "y": float(vectors_2D[i_2D][1]),
+                }
+                for i_2D, text_id_with_2D in enumerate(list_of_text_ids_with_ND)
+            },
+            vectors_2D_fileobject,
+            indent=4,
+        )
+
+    # Store 3D vectors (in a temporary file, published at the end of the task).
+    with open(DATA_DIRECTORY / project_id / "vectors_3D.json.tmp", "w") as vectors_3D_fileobject:
+        json.dump(
+            {
+                text_id_with_3D: {
+                    "x": float(vectors_3D[i_3D][0]),
+                    "y": float(vectors_3D[i_3D][1]),
+                    "z": float(vectors_3D[i_3D][2]),
+                }
+                for i_3D, text_id_with_3D in enumerate(list_of_text_ids_with_ND)
+            },
+            vectors_3D_fileobject,
+            indent=4,
+        )
+
+    # Publish projections with the project locked (a modelization update removes projections with the project locked).
+    with FileLock(str(DATA_DIRECTORY / project_id / "status.json.lock")):
+        # Case of vectors updated during the task: discard outdated projections.
+        if get_vectors_version(project_directory=DATA_DIRECTORY / project_id) != vectors_version:
+            os.remove(DATA_DIRECTORY / project_id / "vectors_2D.json.tmp")
+            os.remove(DATA_DIRECTORY / project_id / "vectors_3D.json.tmp")
+            return
+
+        # Replace files (3D vectors first: projections are available once 2D vectors exist).
+        os.replace(
+            DATA_DIRECTORY / project_id / "vectors_3D.json.tmp",
+            DATA_DIRECTORY / project_id / "vectors_3D.json",
+        )
+        os.replace(
+            DATA_DIRECTORY / project_id / "vectors_2D.json.tmp",
+            DATA_DIRECTORY / project_id / "vectors_2D.json",
+        )
+
+        # Remove projection status (projections are available).
+        os.remove(DATA_DIRECTORY / project_id / PROJECTION_STATUS_NAME)
+
+
 # ==============================================================================
 # DEFINE BACKGROUND TASKS FOR CONSTRAINTS SAMPLING
 # ==============================================================================
@@ -597,11 +866,8 @@ def run_constraints_sampling_task(
             task_detail="Load vectors.",
         )
 
-    # Load vectors.
-    with open(DATA_DIRECTORY / project_id / "vectors.pkl", "rb") as vectors_fileobject:
-        dict_of_managed_vectors: Dict[str, csr_matrix] = pickle.load(  # noqa: S301  # Usage of Pickle
-            vectors_fileobject
-        )
+    # Load vectors (rows of the memory-mapped matrix).
+    dict_of_managed_vectors: Dict[str, csr_matrix] = load_vectors(project_directory=DATA_DIRECTORY / project_id)
 
     ###
     ### Constraints sampling initialization.
@@ -629,6 +895,20 @@ def run_constraints_sampling_task(
         )
     )
 
+    # With distance restriction, reuse distances computed during modelization (or candidate pairs of the neighbors index for large projects).
+    neighbors_index: Optional[NeighborsIndex] = None
+    distances: Optional[Distances] = None
+    if isinstance(sampler, ClustersBasedConstraintsSampling) and sampler.distance_restriction is not None:
+        sampler = NeighborsIndexConstraintsSampling(
+            random_seed=sampler.random_seed,
+            clusters_restriction=sampler.clusters_restriction,
+            distance_restriction=sampler.distance_restriction,
+            without_added_constraints=sampler.without_added_constraints,
+            without_inferred_constraints=sampler.without_inferred_constraints,
+        )
+        neighbors_index = get_neighbors_index(project_directory=DATA_DIRECTORY / project_id)
+        distances = get_distances(project_directory=DATA_DIRECTORY / project_id)
+
     ###
     ### Constraints sampling.
     ###
@@ -647,6 +927,8 @@ def run_constraints_sampling_task(
         nb_to_select=settings[str(iteration_id)]["sampling"]["nb_to_select"],
         clustering_result=clustering_results_for_previous_iteration,
         vectors=dict_of_managed_vectors,
+        neighbors_index=neighbors_index,
+        distances=distances,
     )
 
     # If needed: complete with some random pairs of data IDs.
@@ -685,9 +967,14 @@ def run_constraints_sampling_task(
     with open(DATA_DIRECTORY / project_id / "sampling.json", "r") as sampling_fileobject_r:
         sampling_results: Dict[str, List[str]] = json.load(sampling_fileobject_r)
 
-    # Load constraints file.
-    with open(DATA_DIRECTORY / project_id / "constraints.json", "r") as constraints_fileobject_r:
-        constraints: Dict[str, Dict[str, Any]] = json.load(constraints_fileobject_r)
+    # Load already known sampled constraints.
+    project_storage: AbstractProjectStorage = storage_factory(project_directory=DATA_DIRECTORY / project_id)
+    constraints: Dict[str, Dict[str, Any]] = project_storage.get_constraints(
+        constraint_ids=[
+            "({data_ID1_str},{data_ID2_str})".format(data_ID1_str=data_ID1, data_ID2_str=data_ID2)
+            for data_ID1, data_ID2 in sampling_result
+        ]
+    )
 
     # Initialize sampling result for this iteration.
     sampling_results[str(iteration_id)] = []
@@ -722,21 +1009,22 @@ def run_constraints_sampling_task(
             }
         constraints[constraint_id]["to_annotate"] = True
 
-    # Store sampling results.
-    with open(DATA_DIRECTORY / project_id / "sampling.json", "w") as sampling_fileobject_w:
+    # Store sampling results (through a temporary file, to avoid a partial file).
+    with open(DATA_DIRECTORY / project_id / "sampling.json.tmp", "w") as sampling_fileobject_w:
         json.dump(
             sampling_results,
             sampling_fileobject_w,
             indent=4,
         )
+    os.replace(
+        DATA_DIRECTORY / project_id / "sampling.json.tmp",
+        DATA_DIRECTORY / project_id / "sampling.json",
+    )
 
     # Store constraints results.
-    with open(DATA_DIRECTORY / project_id / "constraints.json", "w") as constraints_fileobject_w:
-        json.dump(
-            constraints,
-            constraints_fileobject_w,
-            indent=4,
-        )
+    project_storage.add_constraints(
+        constraints=constraints,
+    )
 
     ###
     ### End of task.
@@ -840,11 +1128,8 @@ def run_constrained_clustering_task(
             task_detail="Load vectors.",
         )
 
-    # Load vectors.
-    with open(DATA_DIRECTORY / project_id / "vectors.pkl", "rb") as vectors_fileobject:
-        dict_of_managed_vectors: Dict[str, csr_matrix] = pickle.load(  # noqa: S301  # Usage of Pickle
-            vectors_fileobject
-        )
+    # Load vectors (rows of the memory-mapped matrix).
+    dict_of_managed_vectors: Dict[str, csr_matrix] = load_vectors(project_directory=DATA_DIRECTORY / project_id)
 
     ###
     ### Clustering model initialization.
@@ -862,11 +1147,20 @@ def run_constrained_clustering_task(
         if (settings[str(iteration_id)]["clustering"]["init_kargs"] is not None)
         else {}
     )
-    clustering_model: AbstractConstrainedClustering = clustering_factory(
-        algorithm=settings[str(iteration_id)]["clustering"]["algorithm"],
-        random_seed=settings[str(iteration_id)]["clustering"]["random_seed"],
-        **kwargs_clustering_init,
-    )
+    # Load clustering result of previous iteration, if clustering is warm started from it.
+    previous_clustering_result: Optional[Dict[str, int]] = None
+    if settings[str(iteration_id)]["clustering"].get("warm_start", False) is True:
+        with open(DATA_DIRECTORY / project_id / "clustering.json", "r") as clustering_fileobject:
+            previous_clustering_result = json.load(clustering_fileobject).get(str(iteration_id - 1))
+
+    # Load annotated constraints, used to score clustering runs.
+    project_storage: AbstractProjectStorage = storage_factory(project_directory=DATA_DIRECTORY / project_id)
+    list_of_constraints: List[Tuple[str, str, str]] = [
+        (constraint_value["data"]["id_1"], constraint_value["data"]["id_2"], constraint_value["constraint_type"])
+        for constraint_value in project_storage.get_constraints().values()
+        if constraint_value["constraint_type"] in {"MUST_LINK", "CANNOT_LINK"}
+        and constraint_value["is_hidden"] is False
+    ]
 
     ###
     ### Constrained clustering.
@@ -878,11 +1172,25 @@ def run_constrained_clustering_task(
             task_detail="Run constrained clustering.",
         )
 
-    # Run constrained clustering.
-    clustering_result: Dict[str, int] = clustering_model.cluster(
+    # Run constrained clustering (with several random seeds in parallel, keeping the best run), reduced to `"MUST_LINK"` components.
+    clustering_result: Dict[str, int]
+    clustering_metrics: Dict[str, float]
+    clustering_result, clustering_metrics = run_clustering_with_several_random_seeds(
         constraints_manager=constraints_manager,
         vectors=dict_of_managed_vectors,
         nb_clusters=settings[str(iteration_id)]["clustering"]["nb_clusters"],
+        algorithm=settings[str(iteration_id)]["clustering"]["algorithm"],
+        random_seed=settings[str(iteration_id)]["clustering"]["random_seed"],
+        nb_seeds=settings[str(iteration_id)]["clustering"].get("nb_seeds", 1),
+        init_kargs=kwargs_clustering_init,
+        list_of_constraints=list_of_constraints,
+        reduce_components=True,
+        distances=(
+            get_distances(project_directory=DATA_DIRECTORY / project_id)
+            if settings[str(iteration_id)]["clustering"]["algorithm"] == "spectral"
+            else None
+        ),
+        previous_clustering_result=previous_clustering_result,
     )
 
     ###
@@ -893,6 +1201,7 @@ def run_constrained_clustering_task(
             project_id=project_id,
             task_progression=90,
             task_detail="Store clustering results.",
+            task_metrics=clustering_metrics,
         )
 
     # Load clustering results file.
@@ -902,13 +1211,17 @@ def run_constrained_clustering_task(
     # Update clustering results.
     history_of_clustering_results[str(iteration_id)] = clustering_result
 
-    # Store clustering results.
-    with open(DATA_DIRECTORY / project_id / "clustering.json", "w") as clustering_fileobject_w:
+    # Store clustering results (through a temporary file, to avoid a partial file).
+    with open(DATA_DIRECTORY / project_id / "clustering.json.tmp", "w") as clustering_fileobject_w:
         json.dump(
             history_of_clustering_results,
             clustering_fileobject_w,
             indent=4,
         )
+    os.replace(
+        DATA_DIRECTORY / project_id / "clustering.json.tmp",
+        DATA_DIRECTORY / project_id / "clustering.json",
+    )
 
     ###
     ### End of task.
@@ -922,3 +1235,163 @@ def run_constrained_clustering_task(
             task_detail=None,
             state=ICGUIStates.ITERATION_END,
         )
+
+
+# ==============================================================================
+# DEFINE BACKGROUND TASKS FOR SWEEP OVER NUMBERS OF CLUSTERS
+# ==============================================================================
+
+
+###
+### BACKGROUND TASK: Run sweep over numbers of clusters task.
+###
+def run_clustering_sweep_task(
+    project_id: str,
+) -> None:
+    """
+    Background task for sweep over numbers of clusters.
+    It runs the constrained clustering of the requested iteration settings for each requested number of clusters (in parallel processes),
+    and stores silhouette and constraints violations curves in order to help to choose the number of clusters.
+    This task doesn't change the project state, so it doesn't block other steps.
+    If the sweep is requested again with other parameters during the task, the task runs the new sweep.
+    If the sweep fails, its error is stored in place of its results.
+
+    Args:
+        project_id (str): The ID of the project.
+    """
+
+    ###
+    ### Check parameters.
+    ###
+
+    # Check project id : Case of unknown.
+    if project_id not in get_projects():
+        return
+
+    # Check vectors : Case of project without modelization.
+    if get_vectors_version(project_directory=DATA_DIRECTORY / project_id) is None:
+        return
+
+    # Run the last requested sweep.
+    while True:  # noqa: WPS457 (infinite loop)
+        # Load the requested sweep parameters.
+        with FileLock(str(DATA_DIRECTORY / project_id / "status.json.lock")):
+            try:
+                with open(DATA_DIRECTORY / project_id / CLUSTERING_SWEEP_NAME, "r") as clustering_sweep_fileobject:
+                    parameters: Dict[str, Any] = json.load(clustering_sweep_fileobject)["parameters"]
+            except (OSError, ValueError):
+                return  # The sweep has been removed.
+
+        # Run the sweep.
+        try:
+            if compute_and_store_clustering_sweep(project_id=project_id, parameters=parameters):
+                return
+
+        # Case of failure (such as a clustering algorithm that can't handle the requested numbers of clusters): store
+        # the error, so that the sweep isn't shown as running forever.
+        except Exception as sweep_error:  # noqa: B902 (any error of clustering algorithms)
+            if update_clustering_sweep(
+                project_id=project_id,
+                parameters=parameters,
+                task_progression=None,
+                task_detail=None,
+                task_error="{error_type}: {error}".format(
+                    error_type=type(sweep_error).__name__,
+                    error=str(sweep_error),
+                ),
+            ):
+                return
+
+
+###
+### UTILS: Compute and store sweep over numbers of clusters during sweep task.
+###
+def compute_and_store_clustering_sweep(
+    project_id: str,
+    parameters: Dict[str, Any],
+) -> bool:
+    """
+    Run the constrained clustering for each requested number of clusters, and store the sweep results (used by the sweep task).
+
+    Args:
+        project_id (str): The ID of the project.
+        parameters (Dict[str, Any]): The parameters of the sweep to run.
+
+    Returns:
+        bool: `False` if the sweep has been removed or requested again with other parameters.
+    """
+
+    ###
+    ### Settings, constraints manager and vectors loading.
+    ###
+    if not update_clustering_sweep(
+        project_id=project_id,
+        parameters=parameters,
+        task_progression=10,
+        task_detail="Load settings, constraints manager and vectors.",
+    ):
+        return False
+
+    # Load settings file.
+    with open(DATA_DIRECTORY / project_id / "settings.json", "r") as settings_fileobject:
+        clustering_settings: Dict[str, Any] = json.load(settings_fileobject)[str(parameters["iteration_id"])][
+            "clustering"
+        ]
+
+    # Load constraints manager.
+    with open(DATA_DIRECTORY / project_id / "constraints_manager.pkl", "rb") as constraints_manager_fileobject:
+        constraints_manager: BinaryConstraintsManager = pickle.load(  # noqa: S301  # Usage of Pickle
+            constraints_manager_fileobject
+        )
+
+    # Load vectors (rows of the memory-mapped matrix).
+    dict_of_managed_vectors: Dict[str, csr_matrix] = load_vectors(project_directory=DATA_DIRECTORY / project_id)
+
+    # Load annotated constraints, used to count violated constraints.
+    project_storage: AbstractProjectStorage = storage_factory(project_directory=DATA_DIRECTORY / project_id)
+    list_of_constraints: List[Tuple[str, str, str]] = [
+        (constraint_value["data"]["id_1"], constraint_value["data"]["id_2"], constraint_value["constraint_type"])
+        for constraint_value in project_storage.get_constraints().values()
+        if constraint_value["constraint_type"] in {"MUST_LINK", "CANNOT_LINK"}
+        and constraint_value["is_hidden"] is False
+    ]
+
+    ###
+    ### Sweep over numbers of clusters.
+    ###
+    if not update_clustering_sweep(
+        project_id=project_id,
+        parameters=parameters,
+        task_progression=30,
+        task_detail="Run constrained clustering for each number of clusters.",
+    ):
+        return False
+
+    # Run constrained clustering for each number of clusters (in parallel processes).
+    results, metrics = sweep_nb_clusters(
+        constraints_manager=constraints_manager,
+        vectors=dict_of_managed_vectors,
+        list_of_nb_clusters=list(range(parameters["nb_clusters_min"], parameters["nb_clusters_max"] + 1)),
+        algorithm=clustering_settings["algorithm"],
+        random_seed=clustering_settings["random_seed"],
+        init_kargs=clustering_settings["init_kargs"],
+        list_of_constraints=list_of_constraints,
+        reduce_components=True,
+        distances=(
+            get_distances(project_directory=DATA_DIRECTORY / project_id)
+            if clustering_settings["algorithm"] == "spectral"
+            else None
+        ),
+    )
+
+    ###
+    ### Store sweep results.
+    ###
+    return update_clustering_sweep(
+        project_id=project_id,
+        parameters=parameters,
+        task_progression=None,
+        task_detail=None,
+        results=results,
+        metrics=metrics,
+    )
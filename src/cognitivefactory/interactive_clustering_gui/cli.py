@@ -20,10 +20,14 @@ You might be tempted to import things from `__main__` later, but that will cause
 # ==============================================================================
 
 import argparse
+import os
+import pathlib
 from typing import List, Optional
 
 from uvicorn import Config, Server
 
+from cognitivefactory.interactive_clustering_gui.storage.factory import migrate_all_projects_storage
+
 
 # ==============================================================================
 # DEFINE CLI ARGUMENTS PARSER
@@ -59,6 +63,11 @@ def get_parser() -> argparse.ArgumentParser:
         default="info",
         help="The log level. Defaults to `info`.",
     )
+    parser.add_argument(
+        "--migrate-storage",
+        action="store_true",
+        help="Migrate legacy projects of `DATA_DIRECTORY` (`texts.json` and `constraints.json` files) into SQLite databases, then exit.",
+    )
     return parser
 
 
@@ -83,6 +92,17 @@ def main(args: Optional[List[str]] = None) -> int:
     parser = get_parser()
     opts = parser.parse_args(args=args)
 
+    # Case of storage migration.
+    if opts.migrate_storage:
+        data_directory: pathlib.Path = pathlib.Path(os.environ.get("DATA_DIRECTORY", ".data"))
+        nb_migrated_projects: int = (
+            migrate_all_projects_storage(data_directory=data_directory) if data_directory.is_dir() else 0
+        )
+        print(  # noqa: WPS421 (CLI output)
+            "{nb} project(s) migrated in '{directory}'.".format(nb=nb_migrated_projects, directory=str(data_directory))
+        )
+        return 0
+
     # Config the serveur.
     config = Config(  # pragma: nocover
         "cognitivefactory.interactive_clustering_gui.app:app",
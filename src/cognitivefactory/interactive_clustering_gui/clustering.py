@@ -0,0 +1,1239 @@
+# -*- coding: utf-8 -*-
+
+"""
+* Name:         cognitivefactory.interactive_clustering_gui.clustering
+* Description:  Constrained clustering reusing previous computations (distances computed once per modelization, results of previous iteration), mini-batch constrained clustering for large projects, and run in parallel (several random seeds, or a sweep over numbers of clusters).
+* Author:       Erwan Schild
+* Created:      18/10/2026
+* Licence:      CeCILL-C License v1.0 (https://cecill.info/licences.fr.html)
+"""
+
+# ==============================================================================
+# IMPORT PYTHON DEPENDENCIES
+# ==============================================================================
+
+import multiprocessing
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Callable, Dict, List, Optional, Set, Tuple, TypeVar
+
+import numpy as np
+from scipy.sparse import csr_matrix, vstack
+from scipy.sparse.csgraph import connected_components
+from sklearn.metrics import silhouette_score
+
+from cognitivefactory.interactive_clustering.clustering.abstract import (
+    AbstractConstrainedClustering,
+    rename_clusters_by_order,
+)
+from cognitivefactory.interactive_clustering.clustering.factory import clustering_factory
+from cognitivefactory.interactive_clustering.clustering.kmeans import KMeansConstrainedClustering
+from cognitivefactory.interactive_clustering.clustering.spectral import SpectralConstrainedClustering
+from cognitivefactory.interactive_clustering.constraints.abstract import AbstractConstraintsManager
+from cognitivefactory.interactive_clustering.constraints.binary import BinaryConstraintsManager
+from cognitivefactory.interactive_clustering_gui.storage.distances import Distances
+
+# ==============================================================================
+# CONFIGURATION
+# ==============================================================================
+
+# Maximum number of processes used to run clustering with several random seeds in a task.
+# Defaults to the share of CPUs of each worker (cf. `WORKERS_NUMBER` in `workers`, not imported to avoid circular imports), so that concurrent tasks don't oversubscribe the host.
+CLUSTERING_PROCESSES_NUMBER: int = int(
+    os.environ.get(
+        "CLUSTERING_PROCESSES_NUMBER",
+        str(max(1, (os.cpu_count() or 1) // max(1, int(os.environ.get("WORKERS_NUMBER", "2"))))),
+    )
+)
+
+# Start method of clustering processes: tasks run in single-threaded worker processes, so they can be forked (vectors are shared without being pickled).
+CLUSTERING_START_METHOD: str = "fork" if ("fork" in multiprocessing.get_all_start_methods()) else "spawn"
+
+# Maximum number of data IDs used to compute silhouette coefficients (quadratic in the number of data IDs).
+SILHOUETTE_SAMPLE_SIZE: int = 2000
+
+# Clustering algorithms whose problem is reduced to components of `"MUST_LINK"` constraints (see `ConstraintsComponentsReduction`):
+# KMeans centroids are weighted by sizes of components, hierarchical clustering already starts from components, and mini-batch KMeans reduces its problem itself.
+COMPONENTS_REDUCTION_ALGORITHMS: Set[str] = {"kmeans"}
+
+# Result type of clustering runs.
+T = TypeVar("T")  # noqa: WPS111 (too short name)
+
+# ==============================================================================
+# DISTANCES SPECTRAL CONSTRAINED CLUSTERING
+# ==============================================================================
+
+
+class DistancesSpectralConstrainedClustering(SpectralConstrainedClustering):
+    """
+    A spectral constrained clustering, whose affinity matrix is computed from stored pairwise distances (with the same results as `SpectralConstrainedClustering`).
+    Without pairwise distances, the affinity matrix of `SpectralConstrainedClustering` is computed from vectors.
+    """
+
+    def cluster(
+        self,
+        constraints_manager: AbstractConstraintsManager,
+        vectors: Dict[str, csr_matrix],
+        nb_clusters: Optional[int],
+        verbose: bool = False,
+        distances: Optional[Distances] = None,
+        **kargs,
+    ) -> Dict[str, int]:
+        """
+        The main method used to cluster data with the Spectral model.
+
+        Args:
+            constraints_manager (AbstractConstraintsManager): A constraints manager over data IDs that will force clustering to respect some conditions during computation.
+            vectors (Dict[str, csr_matrix]): The representation of data vectors.
+            nb_clusters (Optional[int]): The number of clusters to compute.
+            verbose (bool, optional): Enable verbose output. Defaults to `False`.
+            distances (Optional[Distances], optional): The distances between vectors. If `None` or without pairwise distances, the affinity matrix is computed from vectors. Defaults to `None`.
+            **kargs (dict): Other parameters that can be used in the clustering.
+
+        Raises:
+            ValueError: if `vectors` and `constraints_manager` are incompatible, or if some parameters are incorrectly set.
+
+        Returns:
+            Dict[str,int]: A dictionary that contains the predicted cluster for each data ID.
+        """
+
+        # Case without pairwise distances of managed data IDs: affinity matrix computed from vectors.
+        if (
+            distances is None
+            or distances.squared_distances is None
+            or not isinstance(constraints_manager, AbstractConstraintsManager)
+            or not isinstance(vectors, dict)
+            or len(vectors) == 0
+            or not set(constraints_manager.get_list_of_managed_data_IDs()).issubset(distances.list_of_data_IDs)
+        ):
+            return super().cluster(
+                constraints_manager=constraints_manager,
+                vectors=vectors,
+                nb_clusters=nb_clusters,
+                verbose=verbose,
+                **kargs,
+            )
+
+        ###
+        ### GET PARAMETERS
+        ###
+
+        # Store `self.constraints_manager` and `self.list_of_data_IDs`.
+        self.constraints_manager: AbstractConstraintsManager = constraints_manager
+        self.list_of_data_IDs: List[str] = self.constraints_manager.get_list_of_managed_data_IDs()
+
+        # Store `self.vectors`.
+        self.vectors: Dict[str, csr_matrix] = vectors
+
+        # Store `self.nb_clusters`.
+        if (nb_clusters is None) or (nb_clusters < 2):
+            raise ValueError("The `nb_clusters` '" + str(nb_clusters) + "' must be greater than or equal to 2.")
+        self.nb_clusters: int = min(nb_clusters, len(self.list_of_data_IDs))
+
+        # Define `self.current_nb_components`.
+        self.current_nb_components: int = (
+            self.nb_components
+            if ((self.nb_components is not None) and (self.nb_clusters < self.nb_components))
+            else self.nb_clusters
+        )
+
+        # Compute `self.pairwise_similarity_matrix` (RBF kernel with the default `gamma` of `sklearn`, i.e. `1 / nb_features`).
+        self.pairwise_similarity_matrix: csr_matrix = distances.get_rbf_kernel(
+            list_of_data_IDs=self.list_of_data_IDs,
+            gamma=1.0 / self.vectors[self.list_of_data_IDs[0]].shape[1],
+        )
+
+        ###
+        ### RUN SPECTRAL CONSTRAINED CLUSTERING
+        ###
+
+        # Initialize `self.dict_of_predicted_clusters`.
+        self.dict_of_predicted_clusters = None
+
+        # Case of `"SPEC"` spectral clustering.
+        self.dict_of_predicted_clusters = self.clustering_spectral_model_SPEC(verbose=verbose)
+
+        ###
+        ### RETURN PREDICTED CLUSTERS
+        ###
+
+        return self.dict_of_predicted_clusters
+
+
+# ==============================================================================
+# WARM START KMEANS CONSTRAINED CLUSTERING
+# ==============================================================================
+
+
+class WarmStartKMeansConstrainedClustering(KMeansConstrainedClustering):
+    """
+    A KMeans constrained clustering, whose centroids can be initialized from the clustering result of the previous iteration.
+    As only a few constraints change between iterations, KMeans starts close to its convergence and needs fewer iterations.
+    Without previous result, centroids are initialized as in `KMeansConstrainedClustering`.
+    Data can also be weighted (such as components of `"MUST_LINK"` constraints weighted by their sizes, see `ConstraintsComponentsReduction`).
+    """
+
+    def cluster(
+        self,
+        constraints_manager: AbstractConstraintsManager,
+        vectors: Dict[str, csr_matrix],
+        nb_clusters: Optional[int],
+        verbose: bool = False,
+        previous_clustering_result: Optional[Dict[str, int]] = None,
+        weights: Optional[Dict[str, float]] = None,
+        **kargs,
+    ) -> Dict[str, int]:
+        """
+        The main method used to cluster data with the KMeans model.
+
+        Args:
+            constraints_manager (AbstractConstraintsManager): A constraints manager over data IDs that will force clustering to respect some conditions during computation.
+            vectors (Dict[str, csr_matrix]): The representation of data vectors.
+            nb_clusters (Optional[int]): The number of clusters to compute.
+            verbose (bool, optional): Enable verbose output. Defaults to `False`.
+            previous_clustering_result (Optional[Dict[str, int]], optional): The clustering result of the previous iteration, used to initialize centroids. Defaults to `None`.
+            weights (Optional[Dict[str, float]], optional): The weight of each data ID in centroids. If `None`, data IDs have the same weight. Defaults to `None`.
+            **kargs (dict): Other parameters that can be used in the clustering.
+
+        Raises:
+            ValueError: if `vectors` and `constraints_manager` are incompatible, or if some parameters are incorrectly set.
+
+        Returns:
+            Dict[str,int]: A dictionary that contains the predicted cluster for each data ID.
+        """
+        self.previous_clustering_result: Optional[Dict[str, int]] = previous_clustering_result
+        self.weights: Optional[Dict[str, float]] = weights
+        return super().cluster(
+            constraints_manager=constraints_manager,
+            vectors=vectors,
+            nb_clusters=nb_clusters,
+            verbose=verbose,
+            **kargs,
+        )
+
+    def initialize_centroids(
+        self,
+    ) -> Dict[int, csr_matrix]:
+        """
+        Initialize the centroid of each cluster by the centroids of the previous clustering result (restricted to texts still managed).
+        Missing clusters are initialized as in `KMeansConstrainedClustering`, and the smallest previous clusters are ignored if they are too many.
+
+        Returns:
+            Dict[int, csr_matrix]: A dictionary which represent each cluster by a centroid.
+        """
+
+        # Case without previous clustering result.
+        if not self.previous_clustering_result:
+            return super().initialize_centroids()
+
+        # Get members of previous clusters that are still managed.
+        dict_of_previous_members: Dict[int, List[str]] = {}
+        for data_ID in self.list_of_data_IDs:
+            if data_ID in self.previous_clustering_result:
+                dict_of_previous_members.setdefault(self.previous_clustering_result[data_ID], []).append(data_ID)
+
+        # Keep the largest previous clusters.
+        list_of_previous_cluster_IDs: List[int] = sorted(
+            dict_of_previous_members.keys(),
+            key=lambda cluster_ID: (-len(dict_of_previous_members[cluster_ID]), cluster_ID),
+        )[: self.nb_clusters]
+
+        # Set initial centroids based on previous clusters, then complete with initial centroids of `KMeansConstrainedClustering`.
+        centroids: Dict[int, csr_matrix] = {
+            cluster_ID: self.compute_centroid(list_of_members=dict_of_previous_members[previous_cluster_ID])
+            for cluster_ID, previous_cluster_ID in enumerate(list_of_previous_cluster_IDs)
+        }
+        for cluster_ID, centroid in super().initialize_centroids().items():
+            if len(centroids) == self.nb_clusters:
+                break
+            centroids[len(centroids)] = centroid
+        return centroids
+
+    def compute_centroids(
+        self,
+        clusters: Dict[str, int],
+    ) -> Dict[int, csr_matrix]:
+        """
+        Compute the centroids of each cluster, weighted by weights of data IDs.
+        Without weights, centroids are computed as in `KMeansConstrainedClustering`.
+
+        Args:
+            clusters (Dict[str,int]): Current clusters assignation.
+
+        Returns:
+            Dict[int, csr_matrix]: A dictionary which represent each cluster by a centroid.
+        """
+
+        # Case without weights.
+        if not self.weights:
+            return super().compute_centroids(clusters=clusters)
+
+        # Compute weighted centroids of clusters members.
+        dict_of_members: Dict[int, List[str]] = {}
+        for data_ID in self.list_of_data_IDs:
+            dict_of_members.setdefault(clusters[data_ID], []).append(data_ID)
+        return {
+            cluster_ID: self.compute_centroid(list_of_members=list_of_members)
+            for cluster_ID, list_of_members in dict_of_members.items()
+        }
+
+    def compute_centroid(
+        self,
+        list_of_members: List[str],
+    ) -> csr_matrix:
+        """
+        Compute the centroid of some data IDs, weighted by their weights (if any).
+
+        Args:
+            list_of_members (List[str]): The data IDs.
+
+        Returns:
+            csr_matrix: The centroid of data IDs.
+        """
+        if not self.weights:
+            return sum(self.vectors[data_ID] for data_ID in list_of_members) / len(list_of_members)
+        return sum(self.weights[data_ID] * self.vectors[data_ID] for data_ID in list_of_members) / sum(
+            self.weights[data_ID] for data_ID in list_of_members
+        )
+
+
+# ==============================================================================
+# CONSTRAINTS COMPONENTS
+# ==============================================================================
+
+
+def get_constraints_components(
+    constraints_manager: AbstractConstraintsManager,
+    list_of_constraints: Optional[List[Tuple[str, str, str]]] = None,
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Get the components of `"MUST_LINK"` constraints over managed data IDs (the partition of `get_connected_components`), and the pairs of components linked by a `"CANNOT_LINK"` constraint.
+    With the annotated constraints, components are computed in linear time. Otherwise, they are computed from the constraints manager (in quadratic time).
+
+    Args:
+        constraints_manager (AbstractConstraintsManager): A constraints manager over data IDs.
+        list_of_constraints (Optional[List[Tuple[str, str, str]]], optional): The annotated constraints of the constraints manager, as `(data_ID1, data_ID2, constraint_type)`. Defaults to `None`.
+
+    Returns:
+        Tuple[np.ndarray, np.ndarray]: The component of each managed data ID (components are numbered in the order of their first data ID), and the pairs of components linked by a `"CANNOT_LINK"` constraint (an array of shape `(nb_pairs, 2)`, without duplicates).
+    """
+
+    # Get positions of managed data IDs.
+    list_of_data_IDs: List[str] = constraints_manager.get_list_of_managed_data_IDs()
+    dict_of_positions: Dict[str, int] = {data_ID: position for position, data_ID in enumerate(list_of_data_IDs)}
+    components: np.ndarray
+    cannot_links: np.ndarray
+
+    # Case without annotated constraints: get components and their constraints from the constraints manager.
+    if list_of_constraints is None:
+        list_of_connected_components: List[List[str]] = constraints_manager.get_connected_components()
+        components = np.zeros(len(list_of_data_IDs), dtype=np.int64)
+        for component_position, connected_component in enumerate(list_of_connected_components):
+            components[[dict_of_positions[data_ID] for data_ID in connected_component]] = component_position
+        cannot_links = np.array(
+            [
+                (component_position1, component_position2)
+                for component_position1 in range(len(list_of_connected_components))
+                for component_position2 in range(component_position1 + 1, len(list_of_connected_components))
+                if constraints_manager.get_inferred_constraint(
+                    data_ID1=list_of_connected_components[component_position1][0],
+                    data_ID2=list_of_connected_components[component_position2][0],
+                )
+                == "CANNOT_LINK"
+            ],
+            dtype=np.int64,
+        ).reshape(-1, 2)
+        return components, cannot_links
+
+    # Get pairs of positions of constrained data IDs (constraints on unmanaged data IDs are ignored).
+    dict_of_constrained_positions: Dict[str, List[Tuple[int, int]]] = {"MUST_LINK": [], "CANNOT_LINK": []}
+    for data_ID1, data_ID2, constraint_type in list_of_constraints:
+        if (
+            constraint_type in dict_of_constrained_positions
+            and data_ID1 in dict_of_positions
+            and data_ID2 in dict_of_positions
+        ):
+            dict_of_constrained_positions[constraint_type].append(
+                (dict_of_positions[data_ID1], dict_of_positions[data_ID2])
+            )
+
+    # Get connected components of the graph of `"MUST_LINK"` constraints, numbered in the order of their first data ID.
+    must_links: np.ndarray = np.array(dict_of_constrained_positions["MUST_LINK"], dtype=np.int64).reshape(-1, 2)
+    _, graph_components = connected_components(
+        csgraph=csr_matrix(
+            (np.ones(len(must_links)), (must_links[:, 0], must_links[:, 1])),
+            shape=(len(list_of_data_IDs), len(list_of_data_IDs)),
+        ),
+        directed=False,
+    )
+    _, first_positions, graph_components = np.unique(graph_components, return_index=True, return_inverse=True)
+    components = np.argsort(np.argsort(first_positions))[graph_components]
+
+    # Get pairs of components linked by `"CANNOT_LINK"` constraints (constraints inside a component are conflicts, and are ignored).
+    cannot_links = np.sort(
+        components[np.array(dict_of_constrained_positions["CANNOT_LINK"], dtype=np.int64).reshape(-1, 2)],
+        axis=1,
+    )
+    return components, np.unique(cannot_links[cannot_links[:, 0] != cannot_links[:, 1]], axis=0)
+
+
+class ConstraintsComponentsReduction:
+    """
+    The reduction of a constrained clustering problem to components of `"MUST_LINK"` constraints, which shrinks it in late iterations:
+    - each component is replaced by its first data ID (its representative), with the centroid of its vectors, weighted by its size ;
+    - `"CANNOT_LINK"` constraints between components are set between their representatives ;
+    - the clustering of representatives is then expanded to all data IDs of their components.
+    """
+
+    def __init__(
+        self,
+        constraints_manager: AbstractConstraintsManager,
+        vectors: Dict[str, csr_matrix],
+        list_of_constraints: Optional[List[Tuple[str, str, str]]] = None,
+    ) -> None:
+        """
+        Reduce a constrained clustering problem to components of `"MUST_LINK"` constraints.
+
+        Args:
+            constraints_manager (AbstractConstraintsManager): A constraints manager over data IDs.
+            vectors (Dict[str, csr_matrix]): The representation of data vectors.
+            list_of_constraints (Optional[List[Tuple[str, str, str]]], optional): The annotated constraints of the constraints manager, used to get components in linear time (see `get_constraints_components`). Defaults to `None`.
+        """
+
+        # Get components of `"MUST_LINK"` constraints and `"CANNOT_LINK"` constraints between them.
+        self.list_of_data_IDs: List[str] = constraints_manager.get_list_of_managed_data_IDs()
+        components, cannot_links = get_constraints_components(
+            constraints_manager=constraints_manager,
+            list_of_constraints=list_of_constraints,
+        )
+
+        # Get members of components (components are numbered in the order of their first data ID, i.e. their representative).
+        self.dict_of_members: Dict[str, List[str]] = {}
+        list_of_representatives: List[str] = []
+        for data_ID, component in zip(self.list_of_data_IDs, components.tolist()):
+            if component == len(list_of_representatives):
+                list_of_representatives.append(data_ID)
+            self.dict_of_members.setdefault(list_of_representatives[component], []).append(data_ID)
+
+        # Represent each component by the centroid of its vectors, weighted by its size.
+        self.weights: Dict[str, float] = {
+            representative: float(len(list_of_members))
+            for representative, list_of_members in self.dict_of_members.items()
+        }
+        self.vectors: Dict[str, csr_matrix] = {
+            representative: (
+                vectors[representative]
+                if (len(list_of_members) == 1)
+                else sum(vectors[data_ID] for data_ID in list_of_members) / len(list_of_members)
+            )
+            for representative, list_of_members in self.dict_of_members.items()
+        }
+
+        # Set `"CANNOT_LINK"` constraints between representatives.
+        self.list_of_constraints: List[Tuple[str, str, str]] = [
+            (list_of_representatives[component1], list_of_representatives[component2], "CANNOT_LINK")
+            for component1, component2 in cannot_links.tolist()
+        ]
+        self.constraints_manager: BinaryConstraintsManager = BinaryConstraintsManager(
+            list_of_data_IDs=list_of_representatives
+        )
+        for data_ID1, data_ID2, constraint_type in self.list_of_constraints:
+            self.constraints_manager.add_constraint(
+                data_ID1=data_ID1, data_ID2=data_ID2, constraint_type=constraint_type
+            )
+
+    def expand(
+        self,
+        clustering_result: Dict[str, int],
+    ) -> Dict[str, int]:
+        """
+        Expand the clustering result of representatives to all data IDs of their components.
+
+        Args:
+            clustering_result (Dict[str, int]): The predicted cluster for each representative.
+
+        Returns:
+            Dict[str, int]: The predicted cluster for each data ID (clusters are renamed by order of data IDs).
+        """
+        dict_of_representatives: Dict[str, str] = {
+            data_ID: representative
+            for representative, list_of_members in self.dict_of_members.items()
+            for data_ID in list_of_members
+        }
+        return rename_clusters_by_order(
+            clusters={data_ID: clustering_result[dict_of_representatives[data_ID]] for data_ID in self.list_of_data_IDs}
+        )
+
+
+# ==============================================================================
+# MINI-BATCH KMEANS CONSTRAINED CLUSTERING
+# ==============================================================================
+
+
+class MiniBatchKMeansConstrainedClustering(AbstractConstrainedClustering):
+    """
+    A mini-batch KMeans constrained clustering over the sparse matrix of vectors, for large projects (`KMeansConstrainedClustering` checks constraints of all data IDs at each iteration):
+    - data IDs linked by `"MUST_LINK"` constraints are collapsed into super-points (the centroid of their component, weighted by its size) ;
+    - centroids are initialized by KMeans++ on a sample of super-points, then updated on random mini-batches of super-points (each centroid is the running mean of super-points assigned to it) ;
+    - super-points are assigned to their closest centroid whose cluster doesn't contain a super-point linked by a `"CANNOT_LINK"` constraint (or to their closest centroid if all clusters are forbidden).
+    Distances are computed by chunks of `batch_size` super-points, so memory is bounded by the matrix of vectors and the dense centroids.
+    """
+
+    def __init__(
+        self,
+        batch_size: int = 1024,
+        max_iteration: int = 100,
+        tolerance: float = 1e-4,
+        random_seed: Optional[int] = None,
+        **kargs,
+    ) -> None:
+        """
+        The constructor for mini-batch KMeans constrained clustering class.
+
+        Args:
+            batch_size (int, optional): The number of super-points of each mini-batch. Defaults to `1024`.
+            max_iteration (int, optional): The maximum number of mini-batches for convergence. Defaults to `100`.
+            tolerance (float, optional): The tolerance for convergence computation (sum of centroids shifts after a mini-batch). Defaults to `1e-4`.
+            random_seed (Optional[int]): The random seed to use to redo the same clustering. Defaults to `None`.
+            **kargs (dict): Other parameters that can be used in the instantiation.
+
+        Raises:
+            ValueError: if some parameters are incorrectly set.
+        """
+
+        # Store `self.batch_size`.
+        if batch_size < 1:
+            raise ValueError("The `batch_size` must be greater than or equal to 1.")
+        self.batch_size: int = batch_size
+
+        # Store `self.max_iteration`.
+        if max_iteration < 1:
+            raise ValueError("The `max_iteration` must be greater than or equal to 1.")
+        self.max_iteration: int = max_iteration
+
+        # Store `self.tolerance`.
+        if tolerance < 0:
+            raise ValueError("The `tolerance` must be greater than 0.0.")
+        self.tolerance: float = tolerance
+
+        # Store `self.random_seed`.
+        self.random_seed: Optional[int] = random_seed
+
+        # Store `self.kargs` for kmeans clustering.
+        self.kargs = kargs
+
+    def cluster(
+        self,
+        constraints_manager: AbstractConstraintsManager,
+        vectors: Dict[str, csr_matrix],
+        nb_clusters: Optional[int],
+        verbose: bool = False,
+        list_of_constraints: Optional[List[Tuple[str, str, str]]] = None,
+        **kargs,
+    ) -> Dict[str, int]:
+        """
+        The main method used to cluster data with the mini-batch KMeans model.
+
+        Args:
+            constraints_manager (AbstractConstraintsManager): A constraints manager over data IDs that will force clustering to respect some conditions during computation.
+            vectors (Dict[str, csr_matrix]): The representation of data vectors.
+            nb_clusters (Optional[int]): The number of clusters to compute.
+            verbose (bool, optional): Enable verbose output. Defaults to `False`.
+            list_of_constraints (Optional[List[Tuple[str, str, str]]], optional): The annotated constraints of the constraints manager, used to get components in linear time (see `get_constraints_components`). Defaults to `None`.
+            **kargs (dict): Other parameters that can be used in the clustering.
+
+        Raises:
+            ValueError: if `vectors` and `constraints_manager` are incompatible, or if some parameters are incorrectly set.
+
+        Returns:
+            Dict[str,int]: A dictionary that contains the predicted cluster for each data ID.
+        """
+
+        ###
+        ### GET PARAMETERS
+        ###
+
+        # Store `self.constraints_manager` and `self.list_of_data_IDs`.
+        if not isinstance(constraints_manager, AbstractConstraintsManager):
+            raise ValueError("The `constraints_manager` parameter has to be a `AbstractConstraintsManager` type.")
+        self.constraints_manager: AbstractConstraintsManager = constraints_manager
+        self.list_of_data_IDs: List[str] = self.constraints_manager.get_list_of_managed_data_IDs()
+
+        # Store `self.vectors`.
+        if not isinstance(vectors, dict):
+            raise ValueError("The `vectors` parameter has to be a `dict` type.")
+        if not set(self.list_of_data_IDs).issubset(vectors.keys()):
+            raise ValueError("The `vectors` parameter has to contain the vector of each managed data ID.")
+        self.vectors: Dict[str, csr_matrix] = vectors
+
+        # Store `self.nb_clusters`.
+        if (nb_clusters is None) or (nb_clusters < 2):
+            raise ValueError("The `nb_clusters` '" + str(nb_clusters) + "' must be greater than or equal to 2.")
+
+        ###
+        ### COLLAPSE COMPONENTS INTO SUPER-POINTS
+        ###
+
+        # Get components of `"MUST_LINK"` constraints and `"CANNOT_LINK"` constraints between them.
+        self.components: np.ndarray
+        self.cannot_links: np.ndarray
+        self.components, self.cannot_links = get_constraints_components(
+            constraints_manager=self.constraints_manager,
+            list_of_constraints=list_of_constraints,
+        )
+        nb_components: int = int(self.components.max()) + 1 if (len(self.components) > 0) else 0
+        self.nb_clusters: int = min(nb_clusters, nb_components)
+
+        # Compute super-points: centroids of components, weighted by their sizes.
+        self.weights: np.ndarray = np.bincount(self.components, minlength=nb_components).astype(np.float64)
+        self.super_points: csr_matrix = csr_matrix(
+            (
+                1.0 / self.weights[self.components],
+                (self.components, np.arange(len(self.components))),
+            ),
+            shape=(nb_components, len(self.components)),
+        ).dot(vstack([self.vectors[data_ID] for data_ID in self.list_of_data_IDs]).tocsr())
+        self.squared_norms: np.ndarray = np.asarray(self.super_points.multiply(self.super_points).sum(axis=1)).ravel()
+
+        ###
+        ### RUN MINI-BATCH KMEANS CONSTRAINED CLUSTERING
+        ###
+
+        # Initialize the random state and the centroids.
+        random_state: np.random.RandomState = np.random.RandomState(self.random_seed)
+        self.centroids: np.ndarray = self.initialize_centroids(random_state=random_state)
+
+        # Update centroids with mini-batches of super-points.
+        counts: np.ndarray = np.zeros(self.nb_clusters)
+        for iteration in range(self.max_iteration):
+            batch: np.ndarray = random_state.choice(
+                nb_components,
+                size=min(self.batch_size, nb_components),
+                replace=False,
+            )
+            batch_clusters: np.ndarray = self.compute_squared_distances(positions=batch).argmin(axis=1)
+            batch_weights: np.ndarray = np.bincount(
+                batch_clusters, weights=self.weights[batch], minlength=self.nb_clusters
+            )
+            batch_sums: np.ndarray = (
+                csr_matrix(
+                    (self.weights[batch], (batch_clusters, np.arange(len(batch)))),
+                    shape=(self.nb_clusters, len(batch)),
+                )
+                .dot(self.super_points[batch])
+                .toarray()
+            )
+            counts += batch_weights
+            updated: np.ndarray = batch_weights > 0
+            new_centroids: np.ndarray = self.centroids.copy()
+            new_centroids[updated] += (
+                batch_sums[updated] - batch_weights[updated, None] * self.centroids[updated]
+            ) / counts[updated, None]
+            shift: float = float(np.sqrt(((new_centroids - self.centroids) ** 2).sum(axis=1)).sum())
+            self.centroids = new_centroids
+            if verbose:  # pragma: no cover
+                print("    CLUSTERING_ITERATION=" + str(iteration), ",", "shift=" + str(shift))
+            if shift < self.tolerance:
+                break
+
+        # Assign super-points to clusters, then data IDs to the cluster of their super-point.
+        self.clusters: np.ndarray = self.assign_super_points()
+        self.dict_of_predicted_clusters = rename_clusters_by_order(
+            clusters={
+                data_ID: int(self.clusters[self.components[position]])
+                for position, data_ID in enumerate(self.list_of_data_IDs)
+            }
+        )
+
+        ###
+        ### RETURN PREDICTED CLUSTERS
+        ###
+
+        return self.dict_of_predicted_clusters
+
+    def compute_squared_distances(
+        self,
+        positions: np.ndarray,
+    ) -> np.ndarray:
+        """
+        Compute squared euclidean distances between some super-points and centroids.
+
+        Args:
+            positions (np.ndarray): The positions of super-points.
+
+        Returns:
+            np.ndarray: The squared distances, of shape `(len(positions), nb_clusters)`.
+        """
+        return np.maximum(
+            self.squared_norms[positions, None]
+            - 2 * np.asarray(self.super_points[positions].dot(self.centroids.T))
+            + (self.centroids**2).sum(axis=1)[None, :],
+            0.0,
+        )
+
+    def initialize_centroids(
+        self,
+        random_state: np.random.RandomState,
+    ) -> np.ndarray:
+        """
+        Initialize the centroid of each cluster by KMeans++ on a random sample of super-points (`3 * batch_size` super-points, weighted by their sizes).
+
+        Args:
+            random_state (np.random.RandomState): The random state of the clustering.
+
+        Returns:
+            np.ndarray: The dense matrix of centroids, of shape `(nb_clusters, nb_features)`.
+        """
+
+        # Sample super-points.
+        nb_components: int = self.super_points.shape[0]
+        sample: np.ndarray = random_state.choice(
+            nb_components,
+            size=min(nb_components, max(3 * self.batch_size, self.nb_clusters)),
+            replace=False,
+        )
+
+        # Choose the first centroid, then each next centroid with a probability proportional to its weighted squared distance to chosen centroids.
+        list_of_chosen_positions: List[int] = [
+            int(sample[random_state.choice(len(sample), p=self.weights[sample] / self.weights[sample].sum())])
+        ]
+        self.centroids = self.super_points[list_of_chosen_positions].toarray()
+        closest_squared_distances: np.ndarray = self.compute_squared_distances(positions=sample)[:, 0]
+        while len(list_of_chosen_positions) < self.nb_clusters:
+            probabilities: np.ndarray = self.weights[sample] * closest_squared_distances
+            probabilities[np.isin(sample, list_of_chosen_positions)] = 0.0
+            if probabilities.sum() <= 0:
+                probabilities = (~np.isin(sample, list_of_chosen_positions)).astype(np.float64)
+            list_of_chosen_positions.append(
+                int(sample[random_state.choice(len(sample), p=probabilities / probabilities.sum())])
+            )
+            self.centroids = self.super_points[list_of_chosen_positions].toarray()
+            closest_squared_distances = np.minimum(
+                closest_squared_distances,
+                self.compute_squared_distances(positions=sample)[:, -1],
+            )
+        return self.centroids
+
+    def assign_super_points(
+        self,
+    ) -> np.ndarray:
+        """
+        Assign each super-point to its closest centroid, by chunks of `batch_size` super-points.
+        Super-points linked by `"CANNOT_LINK"` constraints are then assigned one by one (the most constrained first) to their closest centroid whose cluster doesn't contain a linked super-point.
+
+        Returns:
+            np.ndarray: The cluster of each super-point.
+        """
+
+        # Assign super-points to their closest centroid.
+        nb_components: int = self.super_points.shape[0]
+        clusters: np.ndarray = np.zeros(nb_components, dtype=np.int64)
+        for start in range(0, nb_components, self.batch_size):
+            positions: np.ndarray = np.arange(start, min(start + self.batch_size, nb_components))
+            clusters[positions] = self.compute_squared_distances(positions=positions).argmin(axis=1)
+
+        # Get super-points linked by `"CANNOT_LINK"` constraints.
+        dict_of_cannot_links: Dict[int, List[int]] = {}
+        for component1, component2 in self.cannot_links.tolist():
+            dict_of_cannot_links.setdefault(component1, []).append(component2)
+            dict_of_cannot_links.setdefault(component2, []).append(component1)
+        constrained_positions: np.ndarray = np.array(
+            sorted(
+                dict_of_cannot_links.keys(), key=lambda component: (-len(dict_of_cannot_links[component]), component)
+            ),
+            dtype=np.int64,
+        )
+
+        # Assign linked super-points to their closest allowed centroid.
+        dict_of_constrained_clusters: Dict[int, int] = {}
+        for start in range(0, len(constrained_positions), self.batch_size):
+            positions = constrained_positions[start : start + self.batch_size]
+            for component, clusters_order in zip(
+                positions.tolist(), self.compute_squared_distances(positions=positions).argsort(axis=1).tolist()
+            ):
+                forbidden_clusters: Set[int] = {
+                    dict_of_constrained_clusters[linked_component]
+                    for linked_component in dict_of_cannot_links[component]
+                    if linked_component in dict_of_constrained_clusters
+                }
+                dict_of_constrained_clusters[component] = next(
+                    (cluster for cluster in clusters_order if cluster not in forbidden_clusters),
+                    clusters_order[0],
+                )
+        for component, cluster in dict_of_constrained_clusters.items():
+            clusters[component] = cluster
+        return clusters
+
+
+# ==============================================================================
+# CLUSTERING MODEL FACTORY
+# ==============================================================================
+
+
+def create_clustering_model(
+    algorithm: str,
+    random_seed: int,
+    **kargs,
+) -> AbstractConstrainedClustering:
+    """
+    Create a clustering model, reusing previous computations when the algorithm allows it (see `DistancesSpectralConstrainedClustering` and `WarmStartKMeansConstrainedClustering`), or with a model of this module (see `MiniBatchKMeansConstrainedClustering`).
+
+    Args:
+        algorithm (str): The clustering algorithm to use.
+        random_seed (int): The random seed of the clustering model.
+        **kargs (dict): The initialization parameters of the clustering model.
+
+    Returns:
+        AbstractConstrainedClustering: An instance of clustering model.
+    """
+    if algorithm == "spectral":
+        return DistancesSpectralConstrainedClustering(random_seed=random_seed, **kargs)
+    if algorithm == "kmeans":
+        return WarmStartKMeansConstrainedClustering(random_seed=random_seed, **kargs)
+    if algorithm == "minibatch_kmeans":
+        return MiniBatchKMeansConstrainedClustering(random_seed=random_seed, **kargs)
+    return clustering_factory(algorithm=algorithm, random_seed=random_seed, **kargs)
+
+
+# ==============================================================================
+# CLUSTERING SCORE
+# ==============================================================================
+
+
+def compute_clustering_score(
+    clustering_result: Dict[str, int],
+    vectors: Dict[str, csr_matrix],
+    list_of_constraints: List[Tuple[str, str, str]],
+) -> Tuple[int, float]:
+    """
+    Score a clustering result, by its number of violated constraints, then by its inertia (the lower, the better).
+
+    Args:
+        clustering_result (Dict[str, int]): The predicted cluster for each data ID.
+        vectors (Dict[str, csr_matrix]): The representation of data vectors.
+        list_of_constraints (List[Tuple[str, str, str]]): The annotated constraints, as `(data_ID1, data_ID2, constraint_type)`.
+
+    Returns:
+        Tuple[int, float]: The number of violated constraints and the inertia (sum of squared distances of vectors to the centroid of their cluster).
+    """
+
+    # Count violated constraints (constraints on unclustered data IDs are ignored).
+    nb_violations: int = sum(
+        1
+        for data_ID1, data_ID2, constraint_type in list_of_constraints
+        if data_ID1 in clustering_result
+        and data_ID2 in clustering_result
+        and (clustering_result[data_ID1] == clustering_result[data_ID2]) != (constraint_type == "MUST_LINK")
+    )
+
+    # Compute inertia: for each cluster, sum of squared norms minus squared norm of the sum divided by the cluster size.
+    if len(clustering_result) == 0:
+        return nb_violations, 0.0
+    list_of_data_IDs: List[str] = list(clustering_result.keys())
+    matrix: csr_matrix = vstack([vectors[data_ID] for data_ID in list_of_data_IDs]).tocsr()
+    _, labels = np.unique([clustering_result[data_ID] for data_ID in list_of_data_IDs], return_inverse=True)
+    clusters_sizes: np.ndarray = np.bincount(labels)
+    clusters_sums: np.ndarray = np.asarray(
+        csr_matrix(
+            (np.ones(len(labels)), (labels, np.arange(len(labels)))),
+            shape=(len(clusters_sizes), len(labels)),
+        )
+        .dot(matrix)
+        .todense()
+    )
+    inertia: float = float(matrix.multiply(matrix).sum()) - float(
+        ((clusters_sums**2).sum(axis=1) / clusters_sizes).sum()
+    )
+    return nb_violations, max(inertia, 0.0)
+
+
+def compute_clustering_silhouette(
+    clustering_result: Dict[str, int],
+    vectors: Dict[str, csr_matrix],
+    random_seed: int = 42,
+) -> Optional[float]:
+    """
+    Compute the silhouette coefficient of a clustering result (the higher, the better), on a sample of `SILHOUETTE_SAMPLE_SIZE` data IDs for large projects.
+
+    Args:
+        clustering_result (Dict[str, int]): The predicted cluster for each data ID.
+        vectors (Dict[str, csr_matrix]): The representation of data vectors.
+        random_seed (int, optional): The random seed used to sample data IDs. Defaults to `42`.
+
+    Returns:
+        Optional[float]: The silhouette coefficient, or `None` if it is undefined (less than 2 clusters, or only one data ID per cluster).
+    """
+
+    # Case of undefined silhouette.
+    nb_clusters: int = len(set(clustering_result.values()))
+    if nb_clusters < 2 or nb_clusters >= len(clustering_result):
+        return None
+
+    # Compute silhouette.
+    list_of_data_IDs: List[str] = list(clustering_result.keys())
+    return float(
+        silhouette_score(
+            X=vstack([vectors[data_ID] for data_ID in list_of_data_IDs]).tocsr(),
+            labels=[clustering_result[data_ID] for data_ID in list_of_data_IDs],
+            sample_size=(SILHOUETTE_SAMPLE_SIZE if (len(list_of_data_IDs) > SILHOUETTE_SAMPLE_SIZE) else None),
+            random_state=random_seed,
+        )
+    )
+
+
+# ==============================================================================
+# CLUSTERING RUNS IN PARALLEL PROCESSES
+# ==============================================================================
+
+# Data shared by all clustering runs of a process (set once per process, to avoid sending vectors with each run).
+_CLUSTERING_PROCESS_DATA: Dict[str, Any] = {}
+
+
+def _initialize_clustering_process(
+    process_data: Dict[str, Any],
+) -> None:
+    """
+    Store data shared by all clustering runs of the current process.
+
+    Args:
+        process_data (Dict[str, Any]): The data shared by all clustering runs.
+    """
+    _CLUSTERING_PROCESS_DATA.clear()
+    _CLUSTERING_PROCESS_DATA.update(process_data)
+
+
+def _run_clustering(
+    random_seed: int,
+    nb_clusters: Optional[int],
+) -> Tuple[Dict[str, int], Tuple[int, float], float]:
+    """
+    Run and score a clustering, based on data shared by all clustering runs of the current process.
+    If the problem is reduced to components of `"MUST_LINK"` constraints, representatives are clustered, then the clustering is expanded to all data IDs.
+
+    Args:
+        random_seed (int): The random seed of the clustering model.
+        nb_clusters (Optional[int]): The number of clusters to compute.
+
+    Returns:
+        Tuple[Dict[str, int], Tuple[int, float], float]: The clustering result, its score (see `compute_clustering_score`) and the CPU time of the run (in seconds).
+    """
+    start_time: float = time.process_time()
+    clustering_model: AbstractConstrainedClustering = create_clustering_model(
+        algorithm=_CLUSTERING_PROCESS_DATA["algorithm"],
+        random_seed=random_seed,
+        **_CLUSTERING_PROCESS_DATA["init_kargs"],
+    )
+    reduction: Optional[ConstraintsComponentsReduction] = _CLUSTERING_PROCESS_DATA["reduction"]
+    clustering_result: Dict[str, int]
+    if reduction is None:
+        clustering_result = clustering_model.cluster(
+            constraints_manager=_CLUSTERING_PROCESS_DATA["constraints_manager"],
+            vectors=_CLUSTERING_PROCESS_DATA["vectors"],
+            nb_clusters=nb_clusters,
+            list_of_constraints=_CLUSTERING_PROCESS_DATA["list_of_constraints"],
+            **_CLUSTERING_PROCESS_DATA["cluster_kargs"],
+        )
+    else:
+        clustering_result = reduction.expand(
+            clustering_result=clustering_model.cluster(
+                constraints_manager=reduction.constraints_manager,
+                vectors=reduction.vectors,
+                nb_clusters=nb_clusters,
+                list_of_constraints=reduction.list_of_constraints,
+                weights=reduction.weights,
+                **_CLUSTERING_PROCESS_DATA["cluster_kargs"],
+            )
+        )
+    score: Tuple[int, float] = compute_clustering_score(
+        clustering_result=clustering_result,
+        vectors=_CLUSTERING_PROCESS_DATA["vectors"],
+        list_of_constraints=_CLUSTERING_PROCESS_DATA["list_of_constraints"] or [],
+    )
+    return clustering_result, score, time.process_time() - start_time
+
+
+def _run_clustering_with_random_seed(
+    random_seed: int,
+) -> Tuple[Dict[str, int], Tuple[int, float], float]:
+    """
+    Run and score a clustering with a random seed (and the shared number of clusters).
+
+    Args:
+        random_seed (int): The random seed of the clustering model.
+
+    Returns:
+        Tuple[Dict[str, int], Tuple[int, float], float]: The clustering result, its score and the CPU time of the run (in seconds).
+    """
+    return _run_clustering(random_seed=random_seed, nb_clusters=_CLUSTERING_PROCESS_DATA["nb_clusters"])
+
+
+def _run_clustering_with_nb_clusters(
+    nb_clusters: int,
+) -> Tuple[Tuple[int, float], Optional[float], float]:
+    """
+    Run and score a clustering with a number of clusters (and the shared random seed), with its silhouette coefficient.
+
+    Args:
+        nb_clusters (int): The number of clusters to compute.
+
+    Returns:
+        Tuple[Tuple[int, float], Optional[float], float]: The score of the clustering result, its silhouette coefficient and the CPU time of the run (in seconds).
+    """
+    clustering_result, score, duration = _run_clustering(
+        random_seed=_CLUSTERING_PROCESS_DATA["random_seed"],
+        nb_clusters=nb_clusters,
+    )
+    start_time: float = time.process_time()
+    silhouette: Optional[float] = compute_clustering_silhouette(
+        clustering_result=clustering_result,
+        vectors=_CLUSTERING_PROCESS_DATA["vectors"],
+        random_seed=_CLUSTERING_PROCESS_DATA["random_seed"],
+    )
+    return score, silhouette, duration + time.process_time() - start_time
+
+
+def _reduce_constraints_components(
+    algorithm: str,
+    constraints_manager: AbstractConstraintsManager,
+    vectors: Dict[str, csr_matrix],
+    list_of_constraints: Optional[List[Tuple[str, str, str]]],
+) -> Optional[ConstraintsComponentsReduction]:
+    """
+    Reduce a constrained clustering problem to components of `"MUST_LINK"` constraints, if the algorithm allows it and if it shrinks the problem.
+
+    Args:
+        algorithm (str): The clustering algorithm to use.
+        constraints_manager (AbstractConstraintsManager): A constraints manager over data IDs.
+        vectors (Dict[str, csr_matrix]): The representation of data vectors.
+        list_of_constraints (Optional[List[Tuple[str, str, str]]]): The annotated constraints of the constraints manager.
+
+    Returns:
+        Optional[ConstraintsComponentsReduction]: The reduction of the problem, or `None` if the problem is not reduced.
+    """
+    if algorithm not in COMPONENTS_REDUCTION_ALGORITHMS:
+        return None
+    reduction: ConstraintsComponentsReduction = ConstraintsComponentsReduction(
+        constraints_manager=constraints_manager,
+        vectors=vectors,
+        list_of_constraints=list_of_constraints,
+    )
+    return reduction if (len(reduction.dict_of_members) < len(reduction.list_of_data_IDs)) else None
+
+
+def _map_clustering_runs(
+    function: Callable[[int], T],
+    list_of_parameters: List[int],
+    process_data: Dict[str, Any],
+    processes_number: Optional[int] = None,
+) -> Tuple[List[T], float]:
+    """
+    Apply a clustering run on each parameter in parallel processes (or in the current process if there is only one process), with data shared by all runs.
+
+    Args:
+        function (Callable[[int], T]): The clustering run.
+        list_of_parameters (List[int]): The parameters of runs.
+        process_data (Dict[str, Any]): The data shared by all clustering runs.
+        processes_number (Optional[int], optional): The maximum number of processes. If `None`, `CLUSTERING_PROCESSES_NUMBER` is used. Defaults to `None`.
+
+    Returns:
+        Tuple[List[T], float]: The results of runs (in the order of parameters), and the wall-clock duration (in seconds).
+    """
+    max_workers: int = min(
+        len(list_of_parameters),
+        processes_number if (processes_number is not None) else CLUSTERING_PROCESSES_NUMBER,
+    )
+    start_time: float = time.perf_counter()
+    list_of_runs: List[T]
+    if max_workers <= 1:
+        _initialize_clustering_process(process_data=process_data)
+        try:
+            list_of_runs = [function(parameter) for parameter in list_of_parameters]
+        finally:
+            _CLUSTERING_PROCESS_DATA.clear()
+    else:
+        with ProcessPoolExecutor(
+            max_workers=max_workers,
+            mp_context=multiprocessing.get_context(CLUSTERING_START_METHOD),
+            initializer=_initialize_clustering_process,
+            initargs=(process_data,),
+        ) as executor:
+            list_of_runs = list(executor.map(function, list_of_parameters))
+    return list_of_runs, time.perf_counter() - start_time
+
+
+# ==============================================================================
+# CLUSTERING WITH SEVERAL RANDOM SEEDS
+# ==============================================================================
+
+
+def run_clustering_with_several_random_seeds(
+    constraints_manager: AbstractConstraintsManager,
+    vectors: Dict[str, csr_matrix],
+    nb_clusters: Optional[int],
+    algorithm: str,
+    random_seed: int,
+    nb_seeds: int = 1,
+    init_kargs: Optional[Dict[str, Any]] = None,
+    list_of_constraints: Optional[List[Tuple[str, str, str]]] = None,
+    processes_number: Optional[int] = None,
+    reduce_components: bool = False,
+    **kargs,
+) -> Tuple[Dict[str, int], Dict[str, float]]:
+    """
+    Run a constrained clustering with consecutive random seeds (from `random_seed` to `random_seed + nb_seeds - 1`) in parallel processes, and keep the best one.
+    Runs are compared by their number of violated constraints, then by their inertia, then by their random seed.
+
+    Args:
+        constraints_manager (AbstractConstraintsManager): A constraints manager over data IDs.
+        vectors (Dict[str, csr_matrix]): The representation of data vectors.
+        nb_clusters (Optional[int]): The number of clusters to compute.
+        algorithm (str): The clustering algorithm to use.
+        random_seed (int): The first random seed.
+        nb_seeds (int, optional): The number of random seeds to run. Defaults to `1`.
+        init_kargs (Optional[Dict[str, Any]], optional): The initialization parameters of the clustering model. Defaults to `None`.
+        list_of_constraints (Optional[List[Tuple[str, str, str]]], optional): The annotated constraints used to score runs (and to cluster, see `MiniBatchKMeansConstrainedClustering`), as `(data_ID1, data_ID2, constraint_type)`. Defaults to `None`.
+        processes_number (Optional[int], optional): The maximum number of processes. If `None`, `CLUSTERING_PROCESSES_NUMBER` is used. Defaults to `None`.
+        reduce_components (bool, optional): The option to reduce the problem to components of `"MUST_LINK"` constraints for algorithms of `COMPONENTS_REDUCTION_ALGORITHMS` (see `ConstraintsComponentsReduction`). Defaults to `False`.
+        **kargs (dict): Other parameters of the clustering (such as `distances` or `previous_clustering_result`).
+
+    Raises:
+        ValueError: if `nb_seeds` is incorrectly set.
+
+    Returns:
+        Tuple[Dict[str, int], Dict[str, float]]: The best clustering result, and the metrics of runs (best random seed and its score, wall-clock duration, and speedup versus sequential runs estimated by the CPU time of runs).
+    """
+
+    # Check `nb_seeds`.
+    if nb_seeds < 1:
+        raise ValueError("The `nb_seeds` '" + str(nb_seeds) + "' must be greater than or equal to 1.")
+
+    # Run clustering with each random seed.
+    list_of_random_seeds: List[int] = list(range(random_seed, random_seed + nb_seeds))
+    list_of_runs, duration = _map_clustering_runs(
+        function=_run_clustering_with_random_seed,
+        list_of_parameters=list_of_random_seeds,
+        process_data={
+            "algorithm": algorithm,
+            "init_kargs": init_kargs or {},
+            "constraints_manager": constraints_manager,
+            "vectors": vectors,
+            "nb_clusters": nb_clusters,
+            "cluster_kargs": kargs,
+            "list_of_constraints": list_of_constraints,
+            "reduction": (
+                _reduce_constraints_components(
+                    algorithm=algorithm,
+                    constraints_manager=constraints_manager,
+                    vectors=vectors,
+                    list_of_constraints=list_of_constraints,
+                )
+                if reduce_components
+                else None
+            ),
+        },
+        processes_number=processes_number,
+    )
+
+    # Keep the best run.
+    best_run_position: int = min(range(nb_seeds), key=lambda position: (list_of_runs[position][1], position))
+    best_clustering_result, best_score, _ = list_of_runs[best_run_position]
+    sequential_duration: float = sum(run_duration for _, _, run_duration in list_of_runs)
+    return best_clustering_result, {
+        "clustering_nb_seeds": nb_seeds,
+        "clustering_best_random_seed": list_of_random_seeds[best_run_position],
+        "clustering_constraints_violations": best_score[0],
+        "clustering_inertia": round(best_score[1], 6),
+        "clustering_duration": round(duration, 6),
+        "clustering_sequential_duration": round(sequential_duration, 6),
+        "clustering_speedup": round(sequential_duration / duration, 3) if (duration > 0) else 1.0,
+    }
+
+
+# ==============================================================================
+# SWEEP OVER NUMBERS OF CLUSTERS
+# ==============================================================================
+
+
+def sweep_nb_clusters(
+    constraints_manager: AbstractConstraintsManager,
+    vectors: Dict[str, csr_matrix],
+    list_of_nb_clusters: List[int],
+    algorithm: str,
+    random_seed: int,
+    init_kargs: Optional[Dict[str, Any]] = None,
+    list_of_constraints: Optional[List[Tuple[str, str, str]]] = None,
+    processes_number: Optional[int] = None,
+    reduce_components: bool = False,
+    **kargs,
+) -> Tuple[Dict[str, Dict[str, Optional[float]]], Dict[str, float]]:
+    """
+    Run a constrained clustering for each number of clusters in parallel processes (sharing vectors and constraints manager), in order to help to choose the number of clusters.
+
+    Args:
+        constraints_manager (AbstractConstraintsManager): A constraints manager over data IDs.
+        vectors (Dict[str, csr_matrix]): The representation of data vectors.
+        list_of_nb_clusters (List[int]): The numbers of clusters to compute.
+        algorithm (str): The clustering algorithm to use.
+        random_seed (int): The random seed of the clustering model.
+        init_kargs (Optional[Dict[str, Any]], optional): The initialization parameters of the clustering model. Defaults to `None`.
+        list_of_constraints (Optional[List[Tuple[str, str, str]]], optional): The annotated constraints used to score runs (and to cluster, see `MiniBatchKMeansConstrainedClustering`), as `(data_ID1, data_ID2, constraint_type)`. Defaults to `None`.
+        processes_number (Optional[int], optional): The maximum number of processes. If `None`, `CLUSTERING_PROCESSES_NUMBER` is used. Defaults to `None`.
+        reduce_components (bool, optional): The option to reduce the problem to components of `"MUST_LINK"` constraints for algorithms of `COMPONENTS_REDUCTION_ALGORITHMS` (see `ConstraintsComponentsReduction`). Defaults to `False`.
+        **kargs (dict): Other parameters of the clustering (such as `distances`).
+
+    Raises:
+        ValueError: if `list_of_nb_clusters` is incorrectly set.
+
+    Returns:
+        Tuple[Dict[str, Dict[str, Optional[float]]], Dict[str, float]]: The curves of the sweep (silhouette coefficient, number of violated constraints and inertia for each number of clusters), and the metrics of runs (wall-clock duration, and speedup versus sequential runs estimated by the CPU time of runs).
+    """
+
+    # Check `list_of_nb_clusters`.
+    if len(list_of_nb_clusters) == 0 or min(list_of_nb_clusters) < 2:
+        raise ValueError(
+            "The `list_of_nb_clusters` '"
+            + str(list_of_nb_clusters)
+            + "' must contain numbers of clusters greater than or equal to 2."
+        )
+
+    # Run clustering with each number of clusters.
+    list_of_runs, duration = _map_clustering_runs(
+        function=_run_clustering_with_nb_clusters,
+        list_of_parameters=list_of_nb_clusters,
+        process_data={
+            "algorithm": algorithm,
+            "init_kargs": init_kargs or {},
+            "constraints_manager": constraints_manager,
+            "vectors": vectors,
+            "random_seed": random_seed,
+            "cluster_kargs": kargs,
+            "list_of_constraints": list_of_constraints,
+            "reduction": (
+                _reduce_constraints_components(
+                    algorithm=algorithm,
+                    constraints_manager=constraints_manager,
+                    vectors=vectors,
+                    list_of_constraints=list_of_constraints,
+                )
+                if reduce_components
+                else None
+            ),
+        },
+        processes_number=processes_number,
+    )
+
+    # Get curves of the sweep.
+    sequential_duration: float = sum(run_duration for _, _, run_duration in list_of_runs)
+    return {
+        str(nb_clusters): {
+            "silhouette": round(silhouette, 6) if (silhouette is not None) else None,
+            "constraints_violations": score[0],
+            "inertia": round(score[1], 6),
+        }
+        for nb_clusters, (score, silhouette, _) in zip(list_of_nb_clusters, list_of_runs)
+    }, {
+        "sweep_duration": round(duration, 6),
+        "sweep_sequential_duration": round(sequential_duration, 6),
+        "sweep_speedup": round(sequential_duration / duration, 3) if (duration > 0) else 1.0,
+    }
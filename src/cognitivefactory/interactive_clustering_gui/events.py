@@ -0,0 +1,133 @@
+# -*- coding: utf-8 -*-
+
+"""
+* Name:         cognitivefactory.interactive_clustering_gui.events
+* Description:  In-process publish/subscribe of project events (status changes), used to push task progress to browsers.
+* Author:       Erwan Schild
+* Created:      18/10/2026
+* Licence:      CeCILL-C License v1.0 (https://cecill.info/licences.fr.html)
+"""
+
+# ==============================================================================
+# IMPORT PYTHON DEPENDENCIES
+# ==============================================================================
+
+import asyncio
+import contextlib
+import threading
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+# ==============================================================================
+# CONFIGURE EVENTS
+# ==============================================================================
+
+# Delay without event after which a stream of events checks the project status file and keeps the connection alive (in seconds).
+KEEPALIVE_DELAY: float = 15.0
+
+
+# ==============================================================================
+# PROJECT EVENTS BROKER
+# ==============================================================================
+
+
+class ProjectEventsBroker:
+    """
+    A broker of project events, between publishers (routes, workers pool, and background tasks through the workers pool)
+    and subscribers (streams of events opened by browsers).
+    An event is a dictionary with the ID of the project and its new status (`None` if the project has been deleted).
+    Events can be published from any thread, and are delivered in the event loop of each subscriber.
+    """
+
+    def __init__(self) -> None:
+        """
+        The constructor for `ProjectEventsBroker` class.
+        """
+        # Subscribers by project ID: their event loop and their queue of events.
+        self._subscribers: Dict[str, List[Tuple[asyncio.AbstractEventLoop, "asyncio.Queue[Dict[str, Any]]"]]] = {}
+        self._lock: threading.Lock = threading.Lock()
+
+    @contextlib.contextmanager
+    def subscribe(
+        self,
+        project_id: str,
+    ) -> Iterator["asyncio.Queue[Dict[str, Any]]"]:
+        """
+        Subscribe to the events of a project, until the context is exited (must be called in an event loop).
+
+        Args:
+            project_id (str): The ID of the project.
+
+        Yields:
+            asyncio.Queue[Dict[str, Any]]: The queue of events of the project.
+        """
+
+        # Register the subscriber.
+        subscriber: Tuple[asyncio.AbstractEventLoop, "asyncio.Queue[Dict[str, Any]]"] = (
+            asyncio.get_running_loop(),
+            asyncio.Queue(),
+        )
+        with self._lock:
+            self._subscribers.setdefault(project_id, []).append(subscriber)
+
+        # Unregister the subscriber when it leaves.
+        try:
+            yield subscriber[1]
+        finally:
+            with self._lock:
+                self._subscribers[project_id].remove(subscriber)
+                if len(self._subscribers[project_id]) == 0:
+                    del self._subscribers[project_id]
+
+    def publish(
+        self,
+        project_id: str,
+        project_status: Optional[Dict[str, Any]],
+    ) -> None:
+        """
+        Publish the new status of a project to its subscribers (can be called from any thread).
+
+        Args:
+            project_id (str): The ID of the project.
+            project_status (Optional[Dict[str, Any]]): The new status of the project, or `None` if the project has been deleted.
+        """
+
+        # Get the subscribers.
+        with self._lock:
+            subscribers: List[Tuple[asyncio.AbstractEventLoop, "asyncio.Queue[Dict[str, Any]]"]] = list(
+                self._subscribers.get(project_id, [])
+            )
+
+        # Deliver the event in the event loop of each subscriber.
+        event: Dict[str, Any] = {
+            "project_id": project_id,
+            "status": project_status,
+        }
+        for loop, queue in subscribers:
+            with contextlib.suppress(RuntimeError):  # The event loop is closed.
+                loop.call_soon_threadsafe(queue.put_nowait, event)
+
+    def get_subscribers_number(
+        self,
+        project_id: Optional[str] = None,
+    ) -> int:
+        """
+        Get the number of subscribers.
+
+        Args:
+            project_id (Optional[str], optional): The ID of the project. Defaults to `None` for all projects.
+
+        Returns:
+            int: The number of subscribers.
+        """
+        with self._lock:
+            if project_id is not None:
+                return len(self._subscribers.get(project_id, []))
+            return sum(len(subscribers) for subscribers in self._subscribers.values())
+
+
+# ==============================================================================
+# DEFINE EVENTS BROKER INSTANCE
+# ==============================================================================
+
+# The events broker used by the application.
+project_events: ProjectEventsBroker = ProjectEventsBroker()
@@ -21,7 +21,7 @@ window.addEventListener(
  * @param {str} constraintID: The current constraint id.
  * @param {dict} texts: Dictionary of texts.
  * @param {dict} constraints: Dictionary of constraints.
- * @param {dict} modelization: Dictionary of modelization.
+ * @param {dict} modelization: Dictionary of modelization of the texts of the constraint.
  */
 function plotLocalConstraintsGraph({
     projectID,
@@ -75,13 +75,16 @@ function plotLocalConstraintsGraph({
 
     /* SET GRAPH NODES */
 
-    // Get involved text ids.
+    // Get involved text ids, and their component.
     var involved_text_ids = [text_id1, text_id2];
-    if (Object.keys(modelization).includes(text_id1)) {
-        involved_text_ids = involved_text_ids.concat(modelization[text_id1].MUST_LINK);  // component of id 1.
-    }
-    if (Object.keys(modelization).includes(text_id2)) {
-        involved_text_ids = involved_text_ids.concat(modelization[text_id2].MUST_LINK);  // component of id 2.
+    var components = {};
+    for (var constraint_text_id of [text_id1, text_id2]) {
+        if (Object.keys(modelization).includes(constraint_text_id)) {
+            involved_text_ids = involved_text_ids.concat(modelization[constraint_text_id].MUST_LINK);  // component of the text.
+            for (var component_text_id of modelization[constraint_text_id].MUST_LINK) {
+                components[component_text_id] = modelization[constraint_text_id].COMPONENT;
+            }
+        }
     }
     involved_text_ids = new Set(involved_text_ids);
 
@@ -96,15 +99,15 @@ function plotLocalConstraintsGraph({
                 !texts[text_id].is_deleted
             ) ? String(texts[text_id].text) : "<strike>"+String(texts[text_id].text)+"</strike>",
             "component": (
-                !Object.keys(modelization).includes(text_id)
-            ) ? null : modelization[text_id].COMPONENT,
+                !Object.keys(components).includes(text_id)
+            ) ? null : components[text_id],
             "color": CONFIG["NODES"]["COLOR"][
                 (
-                    !Object.keys(modelization).includes(text_id)
+                    !Object.keys(components).includes(text_id)
                 ) ? "NOT_MODELIZED" : (
                     (
-                        Object.keys(modelization).includes(text_id1)
-                        && modelization[text_id].COMPONENT == modelization[text_id1].COMPONENT
+                        Object.keys(components).includes(text_id1)
+                        && components[text_id] == components[text_id1]
                     ) ? "COMPONENT_1" : "COMPONENT_2"
                 )
             ],
@@ -138,20 +141,20 @@ function plotLocalConstraintsGraph({
                         "target": nodes[target_text_id],
                         "color": CONFIG["EDGES"]["COLOR"][
                             (
-                                !Object.keys(modelization).includes(source_text_id)
-                                || !Object.keys(modelization).includes(target_text_id)
+                                !Object.keys(components).includes(source_text_id)
+                                || !Object.keys(components).includes(target_text_id)
                             ) ? "NOT_MODELIZED" : constraints[new_constraint_id].constraint_type
                         ],
                         "weight": CONFIG["EDGES"]["WEIGHT"][
                             (
-                                !Object.keys(modelization).includes(source_text_id)
-                                || !Object.keys(modelization).includes(target_text_id)
+                                !Object.keys(components).includes(source_text_id)
+                                || !Object.keys(components).includes(target_text_id)
                             ) ? "NOT_MODELIZED" : constraints[new_constraint_id].constraint_type
                         ],
                         "width": CONFIG["EDGES"]["WIDTH"][
                             (
-                                !Object.keys(modelization).includes(source_text_id)
-                                || !Object.keys(modelization).includes(target_text_id)
+                                !Object.keys(components).includes(source_text_id)
+                                || !Object.keys(components).includes(target_text_id)
                             ) ? "NOT_MODELIZED" : "ANNOTATED"
                         ],
                         "dasharray": CONFIG["EDGES"]["DASHARRAY"][
@@ -163,9 +166,9 @@ function plotLocalConstraintsGraph({
                 }
                 // Case of inferred constraint in a same component.
                 else if (
-                    Object.keys(modelization).includes(source_text_id)
-                    && Object.keys(modelization).includes(target_text_id)
-                    && modelization[source_text_id].COMPONENT == modelization[target_text_id].COMPONENT
+                    Object.keys(components).includes(source_text_id)
+                    && Object.keys(components).includes(target_text_id)
+                    && components[source_text_id] == components[target_text_id]
                 ) {
                     // Create the edge (if texts are in a same component).
                     edges[new_constraint_id] = {
@@ -31,13 +31,17 @@ function goToProjectHomePage({
  * @param {str} projectID: The ID of the project.
  * @param {str} sortedBy: The option to sort constraints.
  * @param {str} sortedReverse: The option to reverse constraints order.
+ * @param {int} offset: The number of constraints to skip.
+ * @param {int} limit: The number of constraints to display.
  */
 function goToConstraintsSummaryPage({
     projectID,
     sortedBy = "iteration_of_sampling",
     sortedReverse = true,
+    offset = 0,
+    limit = 100,
 }={}) {
-    location.href = "/gui/projects/"+String(projectID)+"/constraints"+"?sorted_by="+String(sortedBy)+"&sorted_reverse="+String(sortedReverse);
+    location.href = "/gui/projects/"+String(projectID)+"/constraints"+"?sorted_by="+String(sortedBy)+"&sorted_reverse="+String(sortedReverse)+"&offset="+String(offset)+"&limit="+String(limit);
 }
 
 /**
@@ -45,13 +49,19 @@ function goToConstraintsSummaryPage({
  * @param {str} projectID: The ID of the project.
  * @param {str} sortedBy: The option to sort texts.
  * @param {str} sortedReverse: The option to reverse texts order.
+ * @param {str} filterText: A substring that texts must contain (case insensitive).
+ * @param {int} offset: The number of texts to skip.
+ * @param {int} limit: The number of texts to display.
  */
 function goToTextsSummaryPage({
     projectID,
     sortedBy = "alphabetical",
     sortedReverse = false,
+    filterText = "",
+    offset = 0,
+    limit = 100,
 }={}) {
-    location.href = "/gui/projects/"+String(projectID)+"/texts"+"?sorted_by="+String(sortedBy)+"&sorted_reverse="+String(sortedReverse);
+    location.href = "/gui/projects/"+String(projectID)+"/texts"+"?sorted_by="+String(sortedBy)+"&sorted_reverse="+String(sortedReverse)+"&offset="+String(offset)+"&limit="+String(limit)+(filterText ? "&filter_text="+encodeURIComponent(filterText) : "");
 }
 
 /**
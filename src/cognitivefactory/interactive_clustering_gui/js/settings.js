@@ -185,6 +185,7 @@ function updateVectorizationSettings({
         "vectorization": {
             "vectorizer_type": document.getElementById("vectorization.vectorizer_type").children[1].children[0].value,
             "random_seed": parseInt(document.getElementById("vectorization.random_seed").children[1].children[0].value),
+            "projection_algorithm": document.getElementById("vectorization.projection_algorithm").children[1].children[0].value,
         }
     }
     if (settings["vectorization"]["vectorizer_type"] == "spacy") {
@@ -327,6 +328,10 @@ function updateClusteringSubmitButtonStatus () {
         document.getElementById("clustering.kmeans.model").classList.remove("hide");
         document.getElementById("clustering.kmeans.max_iteration").classList.remove("hide");
         document.getElementById("clustering.kmeans.tolerance").classList.remove("hide");
+        document.getElementById("clustering.warm_start").classList.remove("hide");
+        document.getElementById("clustering.minibatch_kmeans.batch_size").classList.add("hide");
+        document.getElementById("clustering.minibatch_kmeans.max_iteration").classList.add("hide");
+        document.getElementById("clustering.minibatch_kmeans.tolerance").classList.add("hide");
         document.getElementById("clustering.hierarchical.linkage").classList.add("hide");
         document.getElementById("clustering.spectral.model").classList.add("hide");
         document.getElementById("clustering.spectral.nb_components").classList.add("hide");
@@ -346,11 +351,48 @@ function updateClusteringSubmitButtonStatus () {
         } else {
             document.getElementById("clustering.kmeans.tolerance").children[1].children[0].value = Math.max(tolerance, 0.0);
         }
+    } else if (algorithm == "minibatch_kmeans") {
+        // Update hidden fileds.
+        document.getElementById("clustering.kmeans.model").classList.add("hide");
+        document.getElementById("clustering.kmeans.max_iteration").classList.add("hide");
+        document.getElementById("clustering.kmeans.tolerance").classList.add("hide");
+        document.getElementById("clustering.warm_start").classList.add("hide");
+        document.getElementById("clustering.minibatch_kmeans.batch_size").classList.remove("hide");
+        document.getElementById("clustering.minibatch_kmeans.max_iteration").classList.remove("hide");
+        document.getElementById("clustering.minibatch_kmeans.tolerance").classList.remove("hide");
+        document.getElementById("clustering.hierarchical.linkage").classList.add("hide");
+        document.getElementById("clustering.spectral.model").classList.add("hide");
+        document.getElementById("clustering.spectral.nb_components").classList.add("hide");
+        // Check `clustering.minibatch_kmeans.batch_size`.
+        var batch_size = parseInt(document.getElementById("clustering.minibatch_kmeans.batch_size").children[1].children[0].value);
+        if (isNaN(batch_size)) {
+            return;
+        } else {
+            document.getElementById("clustering.minibatch_kmeans.batch_size").children[1].children[0].value = Math.max(batch_size, 1);
+        }
+        // Check `clustering.minibatch_kmeans.max_iteration`.
+        var max_iteration = parseInt(document.getElementById("clustering.minibatch_kmeans.max_iteration").children[1].children[0].value);
+        if (isNaN(max_iteration)) {
+            return;
+        } else {
+            document.getElementById("clustering.minibatch_kmeans.max_iteration").children[1].children[0].value = Math.max(max_iteration, 1);
+        }
+        // Check `clustering.minibatch_kmeans.tolerance`.
+        var tolerance = parseFloat(document.getElementById("clustering.minibatch_kmeans.tolerance").children[1].children[0].value);
+        if (isNaN(tolerance)) {
+            return;
+        } else {
+            document.getElementById("clustering.minibatch_kmeans.tolerance").children[1].children[0].value = Math.max(tolerance, 0.0);
+        }
     } else if (algorithm == "hierarchical") {
         // Update hidden fileds.
         document.getElementById("clustering.kmeans.model").classList.add("hide");
         document.getElementById("clustering.kmeans.max_iteration").classList.add("hide");
         document.getElementById("clustering.kmeans.tolerance").classList.add("hide");
+        document.getElementById("clustering.warm_start").classList.add("hide");
+        document.getElementById("clustering.minibatch_kmeans.batch_size").classList.add("hide");
+        document.getElementById("clustering.minibatch_kmeans.max_iteration").classList.add("hide");
+        document.getElementById("clustering.minibatch_kmeans.tolerance").classList.add("hide");
         document.getElementById("clustering.hierarchical.linkage").classList.remove("hide");
         document.getElementById("clustering.spectral.model").classList.add("hide");
         document.getElementById("clustering.spectral.nb_components").classList.add("hide");
@@ -361,6 +403,10 @@ function updateClusteringSubmitButtonStatus () {
         document.getElementById("clustering.kmeans.model").classList.add("hide");
         document.getElementById("clustering.kmeans.max_iteration").classList.add("hide");
         document.getElementById("clustering.kmeans.tolerance").classList.add("hide");
+        document.getElementById("clustering.warm_start").classList.add("hide");
+        document.getElementById("clustering.minibatch_kmeans.batch_size").classList.add("hide");
+        document.getElementById("clustering.minibatch_kmeans.max_iteration").classList.add("hide");
+        document.getElementById("clustering.minibatch_kmeans.tolerance").classList.add("hide");
         document.getElementById("clustering.hierarchical.linkage").classList.add("hide");
         document.getElementById("clustering.spectral.model").classList.remove("hide");
         document.getElementById("clustering.spectral.nb_components").classList.remove("hide");
@@ -380,6 +426,13 @@ function updateClusteringSubmitButtonStatus () {
     } else {
         document.getElementById("clustering.random_seed").children[1].children[0].value = Math.max(random_seed, 0);
     }
+    // Check `clustering.nb_seeds`.
+    var nb_seeds = parseInt(document.getElementById("clustering.nb_seeds").children[1].children[0].value);
+    if (isNaN(nb_seeds)) {
+        return;
+    } else {
+        document.getElementById("clustering.nb_seeds").children[1].children[0].value = Math.max(nb_seeds, 1);
+    }
 
     // Conclusion: all check OK.
     document.getElementById("button_clustering_settings_submit").disabled = false;
@@ -418,6 +471,8 @@ function updateClusteringSettings({
             "algorithm": document.getElementById("clustering.algorithm").children[1].children[0].value,
             "nb_clusters": parseInt(document.getElementById("clustering.nb_clusters").children[1].children[0].value),
             "random_seed": parseInt(document.getElementById("clustering.random_seed").children[1].children[0].value),
+            "warm_start": document.getElementById("clustering.warm_start").children[1].children[0].children[0].checked,
+            "nb_seeds": parseInt(document.getElementById("clustering.nb_seeds").children[1].children[0].value),
         }
     }
     if (settings["clustering"]["algorithm"] == "kmeans") {
@@ -426,6 +481,12 @@ function updateClusteringSettings({
             "max_iteration": parseInt(document.getElementById("clustering.kmeans.max_iteration").children[1].children[0].value),
             "tolerance": parseFloat(document.getElementById("clustering.kmeans.tolerance").children[1].children[0].value)
         }
+    } else if (settings["clustering"]["algorithm"] == "minibatch_kmeans") {
+        settings["clustering"]["init_kargs"] = {
+            "batch_size": parseInt(document.getElementById("clustering.minibatch_kmeans.batch_size").children[1].children[0].value),
+            "max_iteration": parseInt(document.getElementById("clustering.minibatch_kmeans.max_iteration").children[1].children[0].value),
+            "tolerance": parseFloat(document.getElementById("clustering.minibatch_kmeans.tolerance").children[1].children[0].value)
+        }
     } else if (settings["clustering"]["algorithm"] == "hierarchical") {
         settings["clustering"]["init_kargs"] = {
             "linkage": document.getElementById("clustering.hierarchical.linkage").children[1].children[0].value,
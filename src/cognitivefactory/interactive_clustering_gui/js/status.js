@@ -216,697 +216,754 @@ function updateAllAccordingToProjectStatus({
             return;
         }
 
-        // Get status information.
-        var iteration_id = getProjectStatusResponse.status.iteration_id;
-        var state = getProjectStatusResponse.status.state;
-        var task = getProjectStatusResponse.status.task;
-        if (task === null) {
-            task = {
-                "progression": null,
-                "detail": null
-            }
-        }
+        // Update all fields of the window according to project status.
+        var redoUpdateAllAccordingToProjectStatus = updateAllAccordingToStatus({
+            projectStatus: getProjectStatusResponse.status,
+        });
 
-        // Boolean to determine if update need frequently new update.
-        var redoUpdateAllAccordingToProjectStatus = false;
-
-        /*** (1) CASE OF INITIALZE MODELIZATION. ***/
-        if (  // Case of INITIALIZATION/IMPORT in TODO.
-            [
-                "INITIALIZATION_WITHOUT_MODELIZATION",
-                "IMPORT_AT_SAMPLING_STEP_WITHOUT_MODELIZATION",
-                "IMPORT_AT_ANNOTATION_STEP_WITHOUT_MODELIZATION",
-                "IMPORT_AT_CLUSTERING_STEP_WITHOUT_MODELIZATION",
-                "IMPORT_AT_ITERATION_END_WITHOUT_MODELIZATION",
-            ].includes(state)
-        ) {
-            displayElement("row_step_initialize_modelization");
-            updateButtonStatus({
-                button_id: "button_run_initialize_modelization",
-                button_status: "todo",
-                button_disabled: false,
-            });
-            updateDetailsOpenStatus({
-                details_id: "details_step_initialize_modelization",
-                details_open: true,
-            });
-            hideElement("loadingbar_initialize_modelization");
-        } else if (  // Case of INITIALIZATION/IMPORT in PENDING/WORKING.
-            [
-                "INITIALIZATION_WITH_PENDING_MODELIZATION",
-                "INITIALIZATION_WITH_WORKING_MODELIZATION",
-                "IMPORT_AT_SAMPLING_STEP_WITH_PENDING_MODELIZATION",
-                "IMPORT_AT_SAMPLING_STEP_WITH_WORKING_MODELIZATION",
-                "IMPORT_AT_ANNOTATION_STEP_WITH_PENDING_MODELIZATION",
-                "IMPORT_AT_ANNOTATION_STEP_WITH_WORKING_MODELIZATION",
-                "IMPORT_AT_CLUSTERING_STEP_WITH_PENDING_MODELIZATION",
-                "IMPORT_AT_CLUSTERING_STEP_WITH_WORKING_MODELIZATION",
-                "IMPORT_AT_ITERATION_END_WITH_PENDING_MODELIZATION",
-                "IMPORT_AT_ITERATION_END_WITH_WORKING_MODELIZATION",
-            ].includes(state)
-        ) {
-            displayElement("row_step_initialize_modelization");
-            updateButtonStatus({
-                button_id: "button_run_initialize_modelization",
-                button_status: "wip",
-                button_disabled: true,
-            });
-            updateDetailsOpenStatus({
-                details_id: "details_step_initialize_modelization",
-                details_open: true,
-            });
-            displayElement("loadingbar_initialize_modelization");
-            updateLoadingBarStatus({
-                loadingbarID: "loadingbar_initialize_modelization",
-                task_status: "running",
-                task_progression: task.progression,
-                task_detail: task.detail,
+        // Need a new update ? Follow the changes of project status.
+        if (redoUpdateAllAccordingToProjectStatus == true) {
+            followProjectStatus({
+                projectID:projectID
             });
-            redoUpdateAllAccordingToProjectStatus = true;
-        } else if (  // Case of INITIALIZATION/IMPORT in ERRORS.
-            [
-                "INITIALIZATION_WITH_ERRORS",
-                "IMPORT_AT_SAMPLING_STEP_WITH_ERRORS",
-                "IMPORT_AT_ANNOTATION_STEP_WITH_ERRORS",
-                "IMPORT_AT_CLUSTERING_STEP_WITH_ERRORS",
-                "IMPORT_AT_ITERATION_END_WITH_ERRORS",
-            ].includes(state)
+        }
+    };
+
+    // Send request to get project status.
+    getProjectStatusRequest.send();
+}
+
+/**
+ * DESCRIPTION: Update all fields of the window according to a project status.
+ * @param {Object} projectStatus: The status of the project.
+ * @returns {bool} `true` if a task is running (i.e. if the status needs frequently new update).
+ */
+function updateAllAccordingToStatus({
+    projectStatus,
+}={}) {
+
+    // Get status information.
+    var iteration_id = projectStatus.iteration_id;
+    var state = projectStatus.state;
+    var task = projectStatus.task;
+    if (task === null) {
+        task = {
+            "progression": null,
+            "detail": null
+        }
+    }
+
+    // Boolean to determine if update need frequently new update.
+    var redoUpdateAllAccordingToProjectStatus = false;
+
+    /*** (1) CASE OF INITIALZE MODELIZATION. ***/
+    if (  // Case of INITIALIZATION/IMPORT in TODO.
+        [
+            "INITIALIZATION_WITHOUT_MODELIZATION",
+            "IMPORT_AT_SAMPLING_STEP_WITHOUT_MODELIZATION",
+            "IMPORT_AT_ANNOTATION_STEP_WITHOUT_MODELIZATION",
+            "IMPORT_AT_CLUSTERING_STEP_WITHOUT_MODELIZATION",
+            "IMPORT_AT_ITERATION_END_WITHOUT_MODELIZATION",
+        ].includes(state)
+    ) {
+        displayElement("row_step_initialize_modelization");
+        updateButtonStatus({
+            button_id: "button_run_initialize_modelization",
+            button_status: "todo",
+            button_disabled: false,
+        });
+        updateDetailsOpenStatus({
+            details_id: "details_step_initialize_modelization",
+            details_open: true,
+        });
+        hideElement("loadingbar_initialize_modelization");
+    } else if (  // Case of INITIALIZATION/IMPORT in PENDING/WORKING.
+        [
+            "INITIALIZATION_WITH_PENDING_MODELIZATION",
+            "INITIALIZATION_WITH_WORKING_MODELIZATION",
+            "IMPORT_AT_SAMPLING_STEP_WITH_PENDING_MODELIZATION",
+            "IMPORT_AT_SAMPLING_STEP_WITH_WORKING_MODELIZATION",
+            "IMPORT_AT_ANNOTATION_STEP_WITH_PENDING_MODELIZATION",
+            "IMPORT_AT_ANNOTATION_STEP_WITH_WORKING_MODELIZATION",
+            "IMPORT_AT_CLUSTERING_STEP_WITH_PENDING_MODELIZATION",
+            "IMPORT_AT_CLUSTERING_STEP_WITH_WORKING_MODELIZATION",
+            "IMPORT_AT_ITERATION_END_WITH_PENDING_MODELIZATION",
+            "IMPORT_AT_ITERATION_END_WITH_WORKING_MODELIZATION",
+        ].includes(state)
+    ) {
+        displayElement("row_step_initialize_modelization");
+        updateButtonStatus({
+            button_id: "button_run_initialize_modelization",
+            button_status: "wip",
+            button_disabled: true,
+        });
+        updateDetailsOpenStatus({
+            details_id: "details_step_initialize_modelization",
+            details_open: true,
+        });
+        displayElement("loadingbar_initialize_modelization");
+        updateLoadingBarStatus({
+            loadingbarID: "loadingbar_initialize_modelization",
+            task_status: "running",
+            task_progression: task.progression,
+            task_detail: task.detail,
+        });
+        redoUpdateAllAccordingToProjectStatus = true;
+    } else if (  // Case of INITIALIZATION/IMPORT in ERRORS.
+        [
+            "INITIALIZATION_WITH_ERRORS",
+            "IMPORT_AT_SAMPLING_STEP_WITH_ERRORS",
+            "IMPORT_AT_ANNOTATION_STEP_WITH_ERRORS",
+            "IMPORT_AT_CLUSTERING_STEP_WITH_ERRORS",
+            "IMPORT_AT_ITERATION_END_WITH_ERRORS",
+        ].includes(state)
+    ) {
+        displayElement("row_step_initialize_modelization");
+        updateButtonStatus({
+            button_id: "button_run_initialize_modelization",
+            button_status: "error",
+            button_disabled: true,
+        });
+        updateDetailsOpenStatus({
+            details_id: "details_step_initialize_modelization",
+            details_open: true,
+        });
+        displayElement("loadingbar_initialize_modelization");
+        updateLoadingBarStatus({
+            loadingbarID: "loadingbar_initialize_modelization",
+            task_status: "error",
+            task_progression: 100,
+            task_detail: "Modelization in error... :(",
+        });
+    } else {  // Case of INITIALIZATION/IMPORT in DONE.
+        updateDetailsOpenStatus({
+            details_id: "details_step_initialize_modelization",
+            details_open: false,
+        });
+        if (
+            document.getElementById("loadingbar_initialize_modelization") !== null
+            && !document.getElementById("loadingbar_initialize_modelization").classList.contains("hide")
         ) {
-            displayElement("row_step_initialize_modelization");
+            /*
             updateButtonStatus({
                 button_id: "button_run_initialize_modelization",
-                button_status: "error",
+                button_status: "done",
                 button_disabled: true,
             });
-            updateDetailsOpenStatus({
-                details_id: "details_step_initialize_modelization",
-                details_open: true,
-            });
-            displayElement("loadingbar_initialize_modelization");
             updateLoadingBarStatus({
                 loadingbarID: "loadingbar_initialize_modelization",
-                task_status: "error",
-                task_progression: 100,
-                task_detail: "Modelization in error... :(",
+                task_status: "done",
+                task_detail: "Modelization done !",
             });
-        } else {  // Case of INITIALIZATION/IMPORT in DONE.
-            updateDetailsOpenStatus({
-                details_id: "details_step_initialize_modelization",
-                details_open: false,
-            });
-            if (
-                document.getElementById("loadingbar_initialize_modelization") !== null
-                && !document.getElementById("loadingbar_initialize_modelization").classList.contains("hide")
-            ) {
-                /*
-                updateButtonStatus({
-                    button_id: "button_run_initialize_modelization",
-                    button_status: "done",
-                    button_disabled: true,
-                });
-                updateLoadingBarStatus({
-                    loadingbarID: "loadingbar_initialize_modelization",
-                    task_status: "done",
-                    task_detail: "Modelization done !",
-                });
-                */
-                // TODO: Reload the page.
-                location.reload();
-            }/* else {
-                hideElement("row_step_initialize_modelization");
-                hideElement("loadingbar_initialize_modelization");
-            }*/
-        }
+            */
+            // TODO: Reload the page.
+            location.reload();
+        }/* else {
+            hideElement("row_step_initialize_modelization");
+            hideElement("loadingbar_initialize_modelization");
+        }*/
+    }
 
-        /*** (2) CASE OF CONSTRAINTS SAMPLING. ***/
-        if (  // Case of INITIALIZATION/IMPORT steps.
-            [
-                "INITIALIZATION_WITHOUT_MODELIZATION",
-                "INITIALIZATION_WITH_PENDING_MODELIZATION",
-                "INITIALIZATION_WITH_WORKING_MODELIZATION",
-                "INITIALIZATION_WITH_ERRORS",
-                "IMPORT_AT_SAMPLING_STEP_WITHOUT_MODELIZATION",
-                "IMPORT_AT_SAMPLING_STEP_WITH_PENDING_MODELIZATION",
-                "IMPORT_AT_SAMPLING_STEP_WITH_WORKING_MODELIZATION",
-                "IMPORT_AT_SAMPLING_STEP_WITH_ERRORS",
-                "IMPORT_AT_ANNOTATION_STEP_WITHOUT_MODELIZATION",
-                "IMPORT_AT_ANNOTATION_STEP_WITH_PENDING_MODELIZATION",
-                "IMPORT_AT_ANNOTATION_STEP_WITH_WORKING_MODELIZATION",
-                "IMPORT_AT_ANNOTATION_STEP_WITH_ERRORS",
-                "IMPORT_AT_CLUSTERING_STEP_WITHOUT_MODELIZATION",
-                "IMPORT_AT_CLUSTERING_STEP_WITH_PENDING_MODELIZATION",
-                "IMPORT_AT_CLUSTERING_STEP_WITH_WORKING_MODELIZATION",
-                "IMPORT_AT_CLUSTERING_STEP_WITH_ERRORS",
-                "IMPORT_AT_ITERATION_END_WITHOUT_MODELIZATION",
-                "IMPORT_AT_ITERATION_END_WITH_PENDING_MODELIZATION",
-                "IMPORT_AT_ITERATION_END_WITH_WORKING_MODELIZATION",
-                "IMPORT_AT_ITERATION_END_WITH_ERRORS",
-            ].includes(state)
+    /*** (2) CASE OF CONSTRAINTS SAMPLING. ***/
+    if (  // Case of INITIALIZATION/IMPORT steps.
+        [
+            "INITIALIZATION_WITHOUT_MODELIZATION",
+            "INITIALIZATION_WITH_PENDING_MODELIZATION",
+            "INITIALIZATION_WITH_WORKING_MODELIZATION",
+            "INITIALIZATION_WITH_ERRORS",
+            "IMPORT_AT_SAMPLING_STEP_WITHOUT_MODELIZATION",
+            "IMPORT_AT_SAMPLING_STEP_WITH_PENDING_MODELIZATION",
+            "IMPORT_AT_SAMPLING_STEP_WITH_WORKING_MODELIZATION",
+            "IMPORT_AT_SAMPLING_STEP_WITH_ERRORS",
+            "IMPORT_AT_ANNOTATION_STEP_WITHOUT_MODELIZATION",
+            "IMPORT_AT_ANNOTATION_STEP_WITH_PENDING_MODELIZATION",
+            "IMPORT_AT_ANNOTATION_STEP_WITH_WORKING_MODELIZATION",
+            "IMPORT_AT_ANNOTATION_STEP_WITH_ERRORS",
+            "IMPORT_AT_CLUSTERING_STEP_WITHOUT_MODELIZATION",
+            "IMPORT_AT_CLUSTERING_STEP_WITH_PENDING_MODELIZATION",
+            "IMPORT_AT_CLUSTERING_STEP_WITH_WORKING_MODELIZATION",
+            "IMPORT_AT_CLUSTERING_STEP_WITH_ERRORS",
+            "IMPORT_AT_ITERATION_END_WITHOUT_MODELIZATION",
+            "IMPORT_AT_ITERATION_END_WITH_PENDING_MODELIZATION",
+            "IMPORT_AT_ITERATION_END_WITH_WORKING_MODELIZATION",
+            "IMPORT_AT_ITERATION_END_WITH_ERRORS",
+        ].includes(state)
+    ) {
+        hideElement("row_step_sampling");
+        hideElement("loadingbar_sampling");
+    } else if (  // Case of ITERATION 0.
+        iteration_id == 0
+    ) {
+        hideElement("row_step_sampling");
+        hideElement("loadingbar_sampling");
+    } else if (  // Case of SAMPLING in TODO.
+        [
+            "SAMPLING_TODO",
+        ].includes(state)
+    ) {
+        displayElement("row_step_sampling");
+        updateButtonStatus({
+            button_id: "button_run_constraints_sampling",
+            button_status: "todo",
+            button_disabled: false,
+        });
+        updateDetailsOpenStatus({
+            details_id: "details_step_sampling",
+            details_open: true,
+        });
+        hideElement("loadingbar_sampling");
+    } else if (  // Case of SAMPLING in PENDING/WORKING.
+        [
+            "SAMPLING_PENDING",
+            "SAMPLING_WORKING",
+        ].includes(state)
+    ) {
+        displayElement("row_step_sampling");
+        updateButtonStatus({
+            button_id: "button_run_constraints_sampling",
+            button_status: "wip",
+            button_disabled: true,
+        });
+        updateDetailsOpenStatus({
+            details_id: "details_step_sampling",
+            details_open: true,
+        });
+        displayElement("loadingbar_sampling");
+        updateLoadingBarStatus({
+            loadingbarID: "loadingbar_sampling",
+            task_status: "running",
+            task_progression: task.progression,
+            task_detail: task.detail,
+        });
+        redoUpdateAllAccordingToProjectStatus = true;
+    } else {  // Case of SAMPLING in DONE.
+        displayElement("row_step_sampling");
+        updateButtonStatus({
+            button_id: "button_run_constraints_sampling",
+            button_status: "done",
+            button_disabled: true,
+        });
+        updateDetailsOpenStatus({
+            details_id: "details_step_sampling",
+            details_open: false,
+        });
+        if (
+            document.getElementById("loadingbar_sampling") !== null
+            && !document.getElementById("loadingbar_sampling").classList.contains("hide")
         ) {
-            hideElement("row_step_sampling");
-            hideElement("loadingbar_sampling");
-        } else if (  // Case of ITERATION 0.
-            iteration_id == 0
-        ) {
-            hideElement("row_step_sampling");
-            hideElement("loadingbar_sampling");
-        } else if (  // Case of SAMPLING in TODO.
-            [
-                "SAMPLING_TODO",
-            ].includes(state)
-        ) {
-            displayElement("row_step_sampling");
-            updateButtonStatus({
-                button_id: "button_run_constraints_sampling",
-                button_status: "todo",
-                button_disabled: false,
-            });
-            updateDetailsOpenStatus({
-                details_id: "details_step_sampling",
-                details_open: true,
-            });
-            hideElement("loadingbar_sampling");
-        } else if (  // Case of SAMPLING in PENDING/WORKING.
-            [
-                "SAMPLING_PENDING",
-                "SAMPLING_WORKING",
-            ].includes(state)
-        ) {
-            displayElement("row_step_sampling");
-            updateButtonStatus({
-                button_id: "button_run_constraints_sampling",
-                button_status: "wip",
-                button_disabled: true,
-            });
-            updateDetailsOpenStatus({
-                details_id: "details_step_sampling",
-                details_open: true,
-            });
-            displayElement("loadingbar_sampling");
+            /*
             updateLoadingBarStatus({
                 loadingbarID: "loadingbar_sampling",
-                task_status: "running",
-                task_progression: task.progression,
-                task_detail: task.detail,
+                task_status: "done",
+                task_detail: "Constraints sampling done !",
             });
-            redoUpdateAllAccordingToProjectStatus = true;
-        } else {  // Case of SAMPLING in DONE.
-            displayElement("row_step_sampling");
-            updateButtonStatus({
-                button_id: "button_run_constraints_sampling",
-                button_status: "done",
-                button_disabled: true,
-            });
-            updateDetailsOpenStatus({
-                details_id: "details_step_sampling",
-                details_open: false,
-            });
-            if (
-                document.getElementById("loadingbar_sampling") !== null
-                && !document.getElementById("loadingbar_sampling").classList.contains("hide")
-            ) {
-                /*
-                updateLoadingBarStatus({
-                    loadingbarID: "loadingbar_sampling",
-                    task_status: "done",
-                    task_detail: "Constraints sampling done !",
-                });
-                */
-                // TODO: Reload the page.
-                location.reload();
-            }/* else {
-                hideElement("loadingbar_sampling");
-            }*/
-        }
+            */
+            // TODO: Reload the page.
+            location.reload();
+        }/* else {
+            hideElement("loadingbar_sampling");
+        }*/
+    }
 
-        /*** (3) CASE OF CONSTRAINTS ANNOTATION. ***/
-        if (  // Case of INITIALIZATION/IMPORT steps.
-            [
-                "INITIALIZATION_WITHOUT_MODELIZATION",
-                "INITIALIZATION_WITH_PENDING_MODELIZATION",
-                "INITIALIZATION_WITH_WORKING_MODELIZATION",
-                "INITIALIZATION_WITH_ERRORS",
-                "IMPORT_AT_SAMPLING_STEP_WITHOUT_MODELIZATION",
-                "IMPORT_AT_SAMPLING_STEP_WITH_PENDING_MODELIZATION",
-                "IMPORT_AT_SAMPLING_STEP_WITH_WORKING_MODELIZATION",
-                "IMPORT_AT_SAMPLING_STEP_WITH_ERRORS",
-                "IMPORT_AT_ANNOTATION_STEP_WITHOUT_MODELIZATION",
-                "IMPORT_AT_ANNOTATION_STEP_WITH_PENDING_MODELIZATION",
-                "IMPORT_AT_ANNOTATION_STEP_WITH_WORKING_MODELIZATION",
-                "IMPORT_AT_ANNOTATION_STEP_WITH_ERRORS",
-                "IMPORT_AT_CLUSTERING_STEP_WITHOUT_MODELIZATION",
-                "IMPORT_AT_CLUSTERING_STEP_WITH_PENDING_MODELIZATION",
-                "IMPORT_AT_CLUSTERING_STEP_WITH_WORKING_MODELIZATION",
-                "IMPORT_AT_CLUSTERING_STEP_WITH_ERRORS",
-                "IMPORT_AT_ITERATION_END_WITHOUT_MODELIZATION",
-                "IMPORT_AT_ITERATION_END_WITH_PENDING_MODELIZATION",
-                "IMPORT_AT_ITERATION_END_WITH_WORKING_MODELIZATION",
-                "IMPORT_AT_ITERATION_END_WITH_ERRORS",
-            ].includes(state)
-        ) {
-            hideElement("row_step_annotation_and_modelization");
-            hideElement("loadingbar_annotation_and_modelization");
-        } else if (  // Case of ITERATION 0.
-            iteration_id == 0
-        ) {
-            hideElement("row_step_annotation_and_modelization");
-            hideElement("loadingbar_annotation_and_modelization");
-        } else if (  // Case of ANNOTATION in NOT TODO.
-            [
-                "SAMPLING_TODO",
-                "SAMPLING_PENDING",
-                "SAMPLING_WORKING",
-            ].includes(state)
-        ) {
-            displayElement("row_step_annotation_and_modelization");
-            updateButtonStatus({
-                button_id: "button_go_to_annotations",
-                button_status: "todo",
-                button_disabled: true,
-            });
-            updateButtonStatus({
-                button_id: "button_run_modelization_update",
-                button_status: "done",
-                button_disabled: true,
-            });
-            updateButtonStatus({
-                button_id: "button_approve_annotations",
-                button_status: "todo",
-                button_disabled: true,
-            });
-            updateDetailsOpenStatus({
-                details_id: "details_annotation_and_modelization",
-                details_open: false,
-            });
-            hideElement("loadingbar_annotation_and_modelization");
-        } else if (  // Case of ANNOTATION in TODO UPTODATE.
-            [
-                "ANNOTATION_WITH_UPTODATE_MODELIZATION",
-            ].includes(state)
+    /*** (3) CASE OF CONSTRAINTS ANNOTATION. ***/
+    if (  // Case of INITIALIZATION/IMPORT steps.
+        [
+            "INITIALIZATION_WITHOUT_MODELIZATION",
+            "INITIALIZATION_WITH_PENDING_MODELIZATION",
+            "INITIALIZATION_WITH_WORKING_MODELIZATION",
+            "INITIALIZATION_WITH_ERRORS",
+            "IMPORT_AT_SAMPLING_STEP_WITHOUT_MODELIZATION",
+            "IMPORT_AT_SAMPLING_STEP_WITH_PENDING_MODELIZATION",
+            "IMPORT_AT_SAMPLING_STEP_WITH_WORKING_MODELIZATION",
+            "IMPORT_AT_SAMPLING_STEP_WITH_ERRORS",
+            "IMPORT_AT_ANNOTATION_STEP_WITHOUT_MODELIZATION",
+            "IMPORT_AT_ANNOTATION_STEP_WITH_PENDING_MODELIZATION",
+            "IMPORT_AT_ANNOTATION_STEP_WITH_WORKING_MODELIZATION",
+            "IMPORT_AT_ANNOTATION_STEP_WITH_ERRORS",
+            "IMPORT_AT_CLUSTERING_STEP_WITHOUT_MODELIZATION",
+            "IMPORT_AT_CLUSTERING_STEP_WITH_PENDING_MODELIZATION",
+            "IMPORT_AT_CLUSTERING_STEP_WITH_WORKING_MODELIZATION",
+            "IMPORT_AT_CLUSTERING_STEP_WITH_ERRORS",
+            "IMPORT_AT_ITERATION_END_WITHOUT_MODELIZATION",
+            "IMPORT_AT_ITERATION_END_WITH_PENDING_MODELIZATION",
+            "IMPORT_AT_ITERATION_END_WITH_WORKING_MODELIZATION",
+            "IMPORT_AT_ITERATION_END_WITH_ERRORS",
+        ].includes(state)
+    ) {
+        hideElement("row_step_annotation_and_modelization");
+        hideElement("loadingbar_annotation_and_modelization");
+    } else if (  // Case of ITERATION 0.
+        iteration_id == 0
+    ) {
+        hideElement("row_step_annotation_and_modelization");
+        hideElement("loadingbar_annotation_and_modelization");
+    } else if (  // Case of ANNOTATION in NOT TODO.
+        [
+            "SAMPLING_TODO",
+            "SAMPLING_PENDING",
+            "SAMPLING_WORKING",
+        ].includes(state)
+    ) {
+        displayElement("row_step_annotation_and_modelization");
+        updateButtonStatus({
+            button_id: "button_go_to_annotations",
+            button_status: "todo",
+            button_disabled: true,
+        });
+        updateButtonStatus({
+            button_id: "button_run_modelization_update",
+            button_status: "done",
+            button_disabled: true,
+        });
+        updateButtonStatus({
+            button_id: "button_approve_annotations",
+            button_status: "todo",
+            button_disabled: true,
+        });
+        updateDetailsOpenStatus({
+            details_id: "details_annotation_and_modelization",
+            details_open: false,
+        });
+        hideElement("loadingbar_annotation_and_modelization");
+    } else if (  // Case of ANNOTATION in TODO UPTODATE.
+        [
+            "ANNOTATION_WITH_UPTODATE_MODELIZATION",
+        ].includes(state)
+    ) {
+        displayElement("row_step_annotation_and_modelization");
+        updateButtonStatus({
+            button_id: "button_go_to_annotations",
+            button_status: "wip",
+            button_disabled: false,
+        });
+        updateButtonStatus({
+            button_id: "button_run_modelization_update",
+            button_status: "done",
+            button_disabled: true,
+        });
+        updateButtonStatus({
+            button_id: "button_approve_annotations",
+            button_status: "todo",
+            button_disabled: false,
+        });
+        updateDetailsOpenStatus({
+            details_id: "details_annotation_and_modelization",
+            details_open: true,
+        });
+        if (
+            document.getElementById("loadingbar_annotation_and_modelization") !== null
+            && !document.getElementById("loadingbar_annotation_and_modelization").classList.contains("hide")
         ) {
-            displayElement("row_step_annotation_and_modelization");
-            updateButtonStatus({
-                button_id: "button_go_to_annotations",
-                button_status: "wip",
-                button_disabled: false,
-            });
-            updateButtonStatus({
-                button_id: "button_run_modelization_update",
-                button_status: "done",
-                button_disabled: true,
-            });
-            updateButtonStatus({
-                button_id: "button_approve_annotations",
-                button_status: "todo",
-                button_disabled: false,
-            });
-            updateDetailsOpenStatus({
-                details_id: "details_annotation_and_modelization",
-                details_open: true,
-            });
-            if (
-                document.getElementById("loadingbar_annotation_and_modelization") !== null
-                && !document.getElementById("loadingbar_annotation_and_modelization").classList.contains("hide")
-            ) {
-                /*
-                updateLoadingBarStatus({
-                    loadingbarID: "loadingbar_annotation_and_modelization",
-                    task_status: "done",
-                    task_progression: 100,
-                    task_detail: "Modelization correctly up to date ! :D",
-                });
-                */
-                // TODO: Reload the page.
-                location.reload();
-            }/* else {
-                hideElement("loadingbar_annotation_and_modelization");
-            }*/
-        } else if (  // Case of ANNOTATION in TODO OUTDATED without conflicts.
-            [
-                "ANNOTATION_WITH_OUTDATED_MODELIZATION_WITHOUT_CONFLICTS",
-            ].includes(state)
-        ) {
-            displayElement("row_step_annotation_and_modelization");
-            updateButtonStatus({
-                button_id: "button_go_to_annotations",
-                button_status: "wip",
-                button_disabled: false,
-            });
-            updateButtonStatus({
-                button_id: "button_run_modelization_update",
-                button_status: "todo",
-                button_disabled: false,
-            });
-            updateButtonStatus({
-                button_id: "button_approve_annotations",
-                button_status: "todo",
-                button_disabled: true,
-            });
-            updateDetailsOpenStatus({
-                details_id: "details_annotation_and_modelization",
-                details_open: true,
+            /*
+            updateLoadingBarStatus({
+                loadingbarID: "loadingbar_annotation_and_modelization",
+                task_status: "done",
+                task_progression: 100,
+                task_detail: "Modelization correctly up to date ! :D",
             });
+            */
+            // TODO: Reload the page.
+            location.reload();
+        }/* else {
             hideElement("loadingbar_annotation_and_modelization");
-        } else if (  // Case of ANNOTATION in TODO OUTDATED with conflicts.
-            [
-                "ANNOTATION_WITH_OUTDATED_MODELIZATION_WITH_CONFLICTS",
-            ].includes(state)
-        ) {
-            displayElement("row_step_annotation_and_modelization");
-            updateButtonStatus({
-                button_id: "button_go_to_annotations",
-                button_status: "wip",
-                button_disabled: false,
-            });
-            updateButtonStatus({
-                button_id: "button_run_modelization_update",
-                button_status: "error",
-                button_disabled: false,
-            });
-            updateButtonStatus({
-                button_id: "button_approve_annotations",
-                button_status: "todo",
-                button_disabled: true,
-            });
-            updateDetailsOpenStatus({
-                details_id: "details_annotation_and_modelization",
-                details_open: true,
-            });
-            if (
-                document.getElementById("loadingbar_annotation_and_modelization") !== null
-                && !document.getElementById("loadingbar_annotation_and_modelization").classList.contains("hide")
-            ) {
-                /*
-                updateLoadingBarStatus({
-                    loadingbarID: "loadingbar_annotation_and_modelization",
-                    task_status: "error",
-                    task_progression: 100,
-                    task_detail: "Some conflicts discovered in the modelization... :(",
-                });
-                */
-                // TODO: Reload the page.
-                location.reload();
-            }/* else {
-                hideElement("loadingbar_annotation_and_modelization");
-            }*/
-        } else if (  // Case of ANNOTATION in PENDING/WORKING without conflicts.
-            [
-                "ANNOTATION_WITH_PENDING_MODELIZATION_WITHOUT_CONFLICTS",
-                "ANNOTATION_WITH_WORKING_MODELIZATION_WITHOUT_CONFLICTS",
-            ].includes(state)
+        }*/
+    } else if (  // Case of ANNOTATION in TODO OUTDATED without conflicts.
+        [
+            "ANNOTATION_WITH_OUTDATED_MODELIZATION_WITHOUT_CONFLICTS",
+        ].includes(state)
+    ) {
+        displayElement("row_step_annotation_and_modelization");
+        updateButtonStatus({
+            button_id: "button_go_to_annotations",
+            button_status: "wip",
+            button_disabled: false,
+        });
+        updateButtonStatus({
+            button_id: "button_run_modelization_update",
+            button_status: "todo",
+            button_disabled: false,
+        });
+        updateButtonStatus({
+            button_id: "button_approve_annotations",
+            button_status: "todo",
+            button_disabled: true,
+        });
+        updateDetailsOpenStatus({
+            details_id: "details_annotation_and_modelization",
+            details_open: true,
+        });
+        hideElement("loadingbar_annotation_and_modelization");
+    } else if (  // Case of ANNOTATION in TODO OUTDATED with conflicts.
+        [
+            "ANNOTATION_WITH_OUTDATED_MODELIZATION_WITH_CONFLICTS",
+        ].includes(state)
+    ) {
+        displayElement("row_step_annotation_and_modelization");
+        updateButtonStatus({
+            button_id: "button_go_to_annotations",
+            button_status: "wip",
+            button_disabled: false,
+        });
+        updateButtonStatus({
+            button_id: "button_run_modelization_update",
+            button_status: "error",
+            button_disabled: false,
+        });
+        updateButtonStatus({
+            button_id: "button_approve_annotations",
+            button_status: "todo",
+            button_disabled: true,
+        });
+        updateDetailsOpenStatus({
+            details_id: "details_annotation_and_modelization",
+            details_open: true,
+        });
+        if (
+            document.getElementById("loadingbar_annotation_and_modelization") !== null
+            && !document.getElementById("loadingbar_annotation_and_modelization").classList.contains("hide")
         ) {
-            displayElement("row_step_annotation_and_modelization");
-            updateButtonStatus({
-                button_id: "button_go_to_annotations",
-                button_status: "wip",
-                button_disabled: false,
-            });
-            updateButtonStatus({
-                button_id: "button_run_modelization_update",
-                button_status: "wip",
-                button_disabled: true,
-            });
-            updateButtonStatus({
-                button_id: "button_approve_annotations",
-                button_status: "todo",
-                button_disabled: true,
-            });
-            updateDetailsOpenStatus({
-                details_id: "details_annotation_and_modelization",
-                details_open: true,
-            });
-            displayElement("loadingbar_annotation_and_modelization");
+            /*
             updateLoadingBarStatus({
                 loadingbarID: "loadingbar_annotation_and_modelization",
-                task_status: "running",
-                task_progression: task.progression,
-                task_detail: task.detail,
+                task_status: "error",
+                task_progression: 100,
+                task_detail: "Some conflicts discovered in the modelization... :(",
             });
-            redoUpdateAllAccordingToProjectStatus = true;
-        } else if (  // Case of ANNOTATION in PENDING/WORKING with conflicts.
-            [
-                "ANNOTATION_WITH_PENDING_MODELIZATION_WITH_CONFLICTS",
-                "ANNOTATION_WITH_WORKING_MODELIZATION_WITH_CONFLICTS",
-            ].includes(state)
+            */
+            // TODO: Reload the page.
+            location.reload();
+        }/* else {
+            hideElement("loadingbar_annotation_and_modelization");
+        }*/
+    } else if (  // Case of ANNOTATION in PENDING/WORKING without conflicts.
+        [
+            "ANNOTATION_WITH_PENDING_MODELIZATION_WITHOUT_CONFLICTS",
+            "ANNOTATION_WITH_WORKING_MODELIZATION_WITHOUT_CONFLICTS",
+        ].includes(state)
+    ) {
+        displayElement("row_step_annotation_and_modelization");
+        updateButtonStatus({
+            button_id: "button_go_to_annotations",
+            button_status: "wip",
+            button_disabled: false,
+        });
+        updateButtonStatus({
+            button_id: "button_run_modelization_update",
+            button_status: "wip",
+            button_disabled: true,
+        });
+        updateButtonStatus({
+            button_id: "button_approve_annotations",
+            button_status: "todo",
+            button_disabled: true,
+        });
+        updateDetailsOpenStatus({
+            details_id: "details_annotation_and_modelization",
+            details_open: true,
+        });
+        displayElement("loadingbar_annotation_and_modelization");
+        updateLoadingBarStatus({
+            loadingbarID: "loadingbar_annotation_and_modelization",
+            task_status: "running",
+            task_progression: task.progression,
+            task_detail: task.detail,
+        });
+        redoUpdateAllAccordingToProjectStatus = true;
+    } else if (  // Case of ANNOTATION in PENDING/WORKING with conflicts.
+        [
+            "ANNOTATION_WITH_PENDING_MODELIZATION_WITH_CONFLICTS",
+            "ANNOTATION_WITH_WORKING_MODELIZATION_WITH_CONFLICTS",
+        ].includes(state)
+    ) {
+        displayElement("row_step_annotation_and_modelization");
+        updateButtonStatus({
+            button_id: "button_go_to_annotations",
+            button_status: "wip",
+            button_disabled: false,
+        });
+        updateButtonStatus({
+            button_id: "button_run_modelization_update",
+            button_status: "wip",
+            button_disabled: true,
+        });
+        updateButtonStatus({
+            button_id: "button_approve_annotations",
+            button_status: "todo",
+            button_disabled: true,
+        });
+        updateDetailsOpenStatus({
+            details_id: "details_annotation_and_modelization",
+            details_open: true,
+        });
+        displayElement("loadingbar_annotation_and_modelization");
+        updateLoadingBarStatus({
+            loadingbarID: "loadingbar_annotation_and_modelization",
+            task_status: "running",
+            task_progression: task.progression,
+            task_detail: task.detail,
+        });
+        redoUpdateAllAccordingToProjectStatus = true;
+    } else {  // Case of ANNOTATION in DONE.
+        displayElement("row_step_annotation_and_modelization");
+        updateButtonStatus({
+            button_id: "button_go_to_annotations",
+            button_status: "done",
+            button_disabled: true,
+        });
+        updateButtonStatus({
+            button_id: "button_run_modelization_update",
+            button_status: "done",
+            button_disabled: true,
+        });
+        updateButtonStatus({
+            button_id: "button_approve_annotations",
+            button_status: "done",
+            button_disabled: true,
+        });
+        updateDetailsOpenStatus({
+            details_id: "details_annotation_and_modelization",
+            details_open: false,
+        });
+        if (
+            document.getElementById("loadingbar_annotation_and_modelization") !== null
+            && !document.getElementById("loadingbar_annotation_and_modelization").classList.contains("hide")
         ) {
-            displayElement("row_step_annotation_and_modelization");
-            updateButtonStatus({
-                button_id: "button_go_to_annotations",
-                button_status: "wip",
-                button_disabled: false,
-            });
-            updateButtonStatus({
-                button_id: "button_run_modelization_update",
-                button_status: "wip",
-                button_disabled: true,
-            });
-            updateButtonStatus({
-                button_id: "button_approve_annotations",
-                button_status: "todo",
-                button_disabled: true,
-            });
-            updateDetailsOpenStatus({
-                details_id: "details_annotation_and_modelization",
-                details_open: true,
-            });
-            displayElement("loadingbar_annotation_and_modelization");
+            /*
             updateLoadingBarStatus({
                 loadingbarID: "loadingbar_annotation_and_modelization",
-                task_status: "running",
-                task_progression: task.progression,
-                task_detail: task.detail,
-            });
-            redoUpdateAllAccordingToProjectStatus = true;
-        } else {  // Case of ANNOTATION in DONE.
-            displayElement("row_step_annotation_and_modelization");
-            updateButtonStatus({
-                button_id: "button_go_to_annotations",
-                button_status: "done",
-                button_disabled: true,
-            });
-            updateButtonStatus({
-                button_id: "button_run_modelization_update",
-                button_status: "done",
-                button_disabled: true,
-            });
-            updateButtonStatus({
-                button_id: "button_approve_annotations",
-                button_status: "done",
-                button_disabled: true,
-            });
-            updateDetailsOpenStatus({
-                details_id: "details_annotation_and_modelization",
-                details_open: false,
+                task_status: "done",
+                task_progression: 100,
+                task_detail: "Modelization correctly up to date ! :D",
             });
-            if (
-                document.getElementById("loadingbar_annotation_and_modelization") !== null
-                && !document.getElementById("loadingbar_annotation_and_modelization").classList.contains("hide")
-            ) {
-                /*
-                updateLoadingBarStatus({
-                    loadingbarID: "loadingbar_annotation_and_modelization",
-                    task_status: "done",
-                    task_progression: 100,
-                    task_detail: "Modelization correctly up to date ! :D",
-                });
-                */
-                // TODO: Reload the page.
-                location.reload();
-            }/* else {
-                hideElement("loadingbar_annotation_and_modelization");
-            }*/
-        }
+            */
+            // TODO: Reload the page.
+            location.reload();
+        }/* else {
+            hideElement("loadingbar_annotation_and_modelization");
+        }*/
+    }
 
-        /*** (4) CASE OF CONSTRAINTS CLUSTERING. ***/
-        if (  // Case of INITIALIZATION/IMPORT steps.
-            [
-                "INITIALIZATION_WITHOUT_MODELIZATION",
-                "INITIALIZATION_WITH_PENDING_MODELIZATION",
-                "INITIALIZATION_WITH_WORKING_MODELIZATION",
-                "INITIALIZATION_WITH_ERRORS",
-                "IMPORT_AT_SAMPLING_STEP_WITHOUT_MODELIZATION",
-                "IMPORT_AT_SAMPLING_STEP_WITH_PENDING_MODELIZATION",
-                "IMPORT_AT_SAMPLING_STEP_WITH_WORKING_MODELIZATION",
-                "IMPORT_AT_SAMPLING_STEP_WITH_ERRORS",
-                "IMPORT_AT_ANNOTATION_STEP_WITHOUT_MODELIZATION",
-                "IMPORT_AT_ANNOTATION_STEP_WITH_PENDING_MODELIZATION",
-                "IMPORT_AT_ANNOTATION_STEP_WITH_WORKING_MODELIZATION",
-                "IMPORT_AT_ANNOTATION_STEP_WITH_ERRORS",
-                "IMPORT_AT_CLUSTERING_STEP_WITHOUT_MODELIZATION",
-                "IMPORT_AT_CLUSTERING_STEP_WITH_PENDING_MODELIZATION",
-                "IMPORT_AT_CLUSTERING_STEP_WITH_WORKING_MODELIZATION",
-                "IMPORT_AT_CLUSTERING_STEP_WITH_ERRORS",
-                "IMPORT_AT_ITERATION_END_WITHOUT_MODELIZATION",
-                "IMPORT_AT_ITERATION_END_WITH_PENDING_MODELIZATION",
-                "IMPORT_AT_ITERATION_END_WITH_WORKING_MODELIZATION",
-                "IMPORT_AT_ITERATION_END_WITH_ERRORS",
-            ].includes(state)
+    /*** (4) CASE OF CONSTRAINTS CLUSTERING. ***/
+    if (  // Case of INITIALIZATION/IMPORT steps.
+        [
+            "INITIALIZATION_WITHOUT_MODELIZATION",
+            "INITIALIZATION_WITH_PENDING_MODELIZATION",
+            "INITIALIZATION_WITH_WORKING_MODELIZATION",
+            "INITIALIZATION_WITH_ERRORS",
+            "IMPORT_AT_SAMPLING_STEP_WITHOUT_MODELIZATION",
+            "IMPORT_AT_SAMPLING_STEP_WITH_PENDING_MODELIZATION",
+            "IMPORT_AT_SAMPLING_STEP_WITH_WORKING_MODELIZATION",
+            "IMPORT_AT_SAMPLING_STEP_WITH_ERRORS",
+            "IMPORT_AT_ANNOTATION_STEP_WITHOUT_MODELIZATION",
+            "IMPORT_AT_ANNOTATION_STEP_WITH_PENDING_MODELIZATION",
+            "IMPORT_AT_ANNOTATION_STEP_WITH_WORKING_MODELIZATION",
+            "IMPORT_AT_ANNOTATION_STEP_WITH_ERRORS",
+            "IMPORT_AT_CLUSTERING_STEP_WITHOUT_MODELIZATION",
+            "IMPORT_AT_CLUSTERING_STEP_WITH_PENDING_MODELIZATION",
+            "IMPORT_AT_CLUSTERING_STEP_WITH_WORKING_MODELIZATION",
+            "IMPORT_AT_CLUSTERING_STEP_WITH_ERRORS",
+            "IMPORT_AT_ITERATION_END_WITHOUT_MODELIZATION",
+            "IMPORT_AT_ITERATION_END_WITH_PENDING_MODELIZATION",
+            "IMPORT_AT_ITERATION_END_WITH_WORKING_MODELIZATION",
+            "IMPORT_AT_ITERATION_END_WITH_ERRORS",
+        ].includes(state)
+    ) {
+        hideElement("row_step_clustering");
+        hideElement("loadingbar_clustering");
+    } else if (  // Case of CLUSTERING in NOT TODO.
+        [
+            "SAMPLING_TODO",
+            "SAMPLING_PENDING",
+            "SAMPLING_WORKING",
+            "ANNOTATION_WITH_UPTODATE_MODELIZATION",
+            "ANNOTATION_WITH_OUTDATED_MODELIZATION_WITHOUT_CONFLICTS",
+            "ANNOTATION_WITH_PENDING_MODELIZATION_WITHOUT_CONFLICTS",
+            "ANNOTATION_WITH_WORKING_MODELIZATION_WITHOUT_CONFLICTS",
+            "ANNOTATION_WITH_OUTDATED_MODELIZATION_WITH_CONFLICTS",
+            "ANNOTATION_WITH_PENDING_MODELIZATION_WITH_CONFLICTS",
+            "ANNOTATION_WITH_WORKING_MODELIZATION_WITH_CONFLICTS",
+        ].includes(state)
+    ) {
+        displayElement("row_step_clustering");
+        updateButtonStatus({
+            button_id: "button_run_constrained_clustering",
+            button_status: "todo",
+            button_disabled: true,
+        });
+        updateDetailsOpenStatus({
+            details_id: "details_step_clustering",
+            details_open: false,
+        });
+        hideElement("loadingbar_clustering");
+    } else if (  // Case of CLUSTERING in TODO.
+        [
+            "CLUSTERING_TODO",
+        ].includes(state)
+    ) {
+        displayElement("row_step_clustering");
+        updateButtonStatus({
+            button_id: "button_run_constrained_clustering",
+            button_status: "todo",
+            button_disabled: false,
+        });
+        updateDetailsOpenStatus({
+            details_id: "details_step_clustering",
+            details_open: true,
+        });
+        hideElement("loadingbar_clustering");
+    } else if (  // Case of CLUSTERING in PENDING/WORKING.
+        [
+            "CLUSTERING_PENDING",
+            "CLUSTERING_WORKING",
+        ].includes(state)
+    ) {
+        displayElement("row_step_clustering");
+        updateButtonStatus({
+            button_id: "button_run_constrained_clustering",
+            button_status: "wip",
+            button_disabled: true,
+        });
+        updateDetailsOpenStatus({
+            details_id: "details_step_clustering",
+            details_open: true,
+        });
+        displayElement("loadingbar_clustering");
+        updateLoadingBarStatus({
+            loadingbarID: "loadingbar_clustering",
+            task_status: "running",
+            task_progression: task.progression,
+            task_detail: task.detail,
+        });
+        redoUpdateAllAccordingToProjectStatus = true;
+    } else {  // Case of CLUSTERING in DONE.
+        displayElement("row_step_clustering");
+        updateButtonStatus({
+            button_id: "button_run_constrained_clustering",
+            button_status: "done",
+            button_disabled: true,
+        });
+        updateDetailsOpenStatus({
+            details_id: "details_step_clustering",
+            details_open: false,
+        });
+        if (
+            document.getElementById("loadingbar_clustering") !== null
+            && !document.getElementById("loadingbar_clustering").classList.contains("hide")
         ) {
-            hideElement("row_step_clustering");
-            hideElement("loadingbar_clustering");
-        } else if (  // Case of CLUSTERING in NOT TODO.
-            [
-                "SAMPLING_TODO",
-                "SAMPLING_PENDING",
-                "SAMPLING_WORKING",
-                "ANNOTATION_WITH_UPTODATE_MODELIZATION",
-                "ANNOTATION_WITH_OUTDATED_MODELIZATION_WITHOUT_CONFLICTS",
-                "ANNOTATION_WITH_PENDING_MODELIZATION_WITHOUT_CONFLICTS",
-                "ANNOTATION_WITH_WORKING_MODELIZATION_WITHOUT_CONFLICTS",
-                "ANNOTATION_WITH_OUTDATED_MODELIZATION_WITH_CONFLICTS",
-                "ANNOTATION_WITH_PENDING_MODELIZATION_WITH_CONFLICTS",
-                "ANNOTATION_WITH_WORKING_MODELIZATION_WITH_CONFLICTS",
-            ].includes(state)
-        ) {
-            displayElement("row_step_clustering");
-            updateButtonStatus({
-                button_id: "button_run_constrained_clustering",
-                button_status: "todo",
-                button_disabled: true,
-            });
-            updateDetailsOpenStatus({
-                details_id: "details_step_clustering",
-                details_open: false,
-            });
-            hideElement("loadingbar_clustering");
-        } else if (  // Case of CLUSTERING in TODO.
-            [
-                "CLUSTERING_TODO",
-            ].includes(state)
-        ) {
-            displayElement("row_step_clustering");
-            updateButtonStatus({
-                button_id: "button_run_constrained_clustering",
-                button_status: "todo",
-                button_disabled: false,
-            });
-            updateDetailsOpenStatus({
-                details_id: "details_step_clustering",
-                details_open: true,
-            });
-            hideElement("loadingbar_clustering");
-        } else if (  // Case of CLUSTERING in PENDING/WORKING.
-            [
-                "CLUSTERING_PENDING",
-                "CLUSTERING_WORKING",
-            ].includes(state)
-        ) {
-            displayElement("row_step_clustering");
-            updateButtonStatus({
-                button_id: "button_run_constrained_clustering",
-                button_status: "wip",
-                button_disabled: true,
-            });
-            updateDetailsOpenStatus({
-                details_id: "details_step_clustering",
-                details_open: true,
-            });
-            displayElement("loadingbar_clustering");
+            /*
             updateLoadingBarStatus({
                 loadingbarID: "loadingbar_clustering",
-                task_status: "running",
-                task_progression: task.progression,
-                task_detail: task.detail,
-            });
-            redoUpdateAllAccordingToProjectStatus = true;
-        } else {  // Case of CLUSTERING in DONE.
-            displayElement("row_step_clustering");
-            updateButtonStatus({
-                button_id: "button_run_constrained_clustering",
-                button_status: "done",
-                button_disabled: true,
+                task_status: "done",
+                task_detail: "Constrained clustering done !",
             });
-            updateDetailsOpenStatus({
-                details_id: "details_step_clustering",
-                details_open: false,
-            });
-            if (
-                document.getElementById("loadingbar_clustering") !== null
-                && !document.getElementById("loadingbar_clustering").classList.contains("hide")
-            ) {
-                /*
-                updateLoadingBarStatus({
-                    loadingbarID: "loadingbar_clustering",
-                    task_status: "done",
-                    task_detail: "Constrained clustering done !",
-                });
-                */
-                // TODO: Reload the page.
-                location.reload();
-            }/* else {
-                hideElement("loadingbar_clustering");
-            }*/
-        }
+            */
+            // TODO: Reload the page.
+            location.reload();
+        }/* else {
+            hideElement("loadingbar_clustering");
+        }*/
+    }
 
 
-        /*** (5) CASE OF ITERATION END. ***/
-        if (  // Case of INITIALIZATION/IMPORT steps.
-            [
-                "INITIALIZATION_WITHOUT_MODELIZATION",
-                "INITIALIZATION_WITH_PENDING_MODELIZATION",
-                "INITIALIZATION_WITH_WORKING_MODELIZATION",
-                "INITIALIZATION_WITH_ERRORS",
-                "IMPORT_AT_SAMPLING_STEP_WITHOUT_MODELIZATION",
-                "IMPORT_AT_SAMPLING_STEP_WITH_PENDING_MODELIZATION",
-                "IMPORT_AT_SAMPLING_STEP_WITH_WORKING_MODELIZATION",
-                "IMPORT_AT_SAMPLING_STEP_WITH_ERRORS",
-                "IMPORT_AT_ANNOTATION_STEP_WITHOUT_MODELIZATION",
-                "IMPORT_AT_ANNOTATION_STEP_WITH_PENDING_MODELIZATION",
-                "IMPORT_AT_ANNOTATION_STEP_WITH_WORKING_MODELIZATION",
-                "IMPORT_AT_ANNOTATION_STEP_WITH_ERRORS",
-                "IMPORT_AT_CLUSTERING_STEP_WITHOUT_MODELIZATION",
-                "IMPORT_AT_CLUSTERING_STEP_WITH_PENDING_MODELIZATION",
-                "IMPORT_AT_CLUSTERING_STEP_WITH_WORKING_MODELIZATION",
-                "IMPORT_AT_CLUSTERING_STEP_WITH_ERRORS",
-                "IMPORT_AT_ITERATION_END_WITHOUT_MODELIZATION",
-                "IMPORT_AT_ITERATION_END_WITH_PENDING_MODELIZATION",
-                "IMPORT_AT_ITERATION_END_WITH_WORKING_MODELIZATION",
-                "IMPORT_AT_ITERATION_END_WITH_ERRORS",
-            ].includes(state)
-        ) {
-            hideElement("row_next_iteration");
-        } else if (  // Case of ITERATION_END not in TODO.
-            state != "ITERATION_END"
-        ) {
-            displayElement("row_next_iteration");
-            updateButtonStatus({
-                button_id: "button_create_next_iteration",
-                button_status: "todo",
-                button_disabled: true,
-            });
-            updateDetailsOpenStatus({
-                details_id: "details_next_iteration",
-                details_open: false,
-            });
-        } else {  // Case of ITERATION_END not in TODO.
-            displayElement("row_next_iteration");
-            updateButtonStatus({
-                button_id: "button_create_next_iteration",
-                button_status: "todo",
-                button_disabled: false,
-            });
-            updateDetailsOpenStatus({
-                details_id: "details_next_iteration",
-                details_open: true,
-            });
-        }
+    /*** (5) CASE OF ITERATION END. ***/
+    if (  // Case of INITIALIZATION/IMPORT steps.
+        [
+            "INITIALIZATION_WITHOUT_MODELIZATION",
+            "INITIALIZATION_WITH_PENDING_MODELIZATION",
+            "INITIALIZATION_WITH_WORKING_MODELIZATION",
+            "INITIALIZATION_WITH_ERRORS",
+            "IMPORT_AT_SAMPLING_STEP_WITHOUT_MODELIZATION",
+            "IMPORT_AT_SAMPLING_STEP_WITH_PENDING_MODELIZATION",
+            "IMPORT_AT_SAMPLING_STEP_WITH_WORKING_MODELIZATION",
+            "IMPORT_AT_SAMPLING_STEP_WITH_ERRORS",
+            "IMPORT_AT_ANNOTATION_STEP_WITHOUT_MODELIZATION",
+            "IMPORT_AT_ANNOTATION_STEP_WITH_PENDING_MODELIZATION",
+            "IMPORT_AT_ANNOTATION_STEP_WITH_WORKING_MODELIZATION",
+            "IMPORT_AT_ANNOTATION_STEP_WITH_ERRORS",
+            "IMPORT_AT_CLUSTERING_STEP_WITHOUT_MODELIZATION",
+            "IMPORT_AT_CLUSTERING_STEP_WITH_PENDING_MODELIZATION",
+            "IMPORT_AT_CLUSTERING_STEP_WITH_WORKING_MODELIZATION",
+            "IMPORT_AT_CLUSTERING_STEP_WITH_ERRORS",
+            "IMPORT_AT_ITERATION_END_WITHOUT_MODELIZATION",
+            "IMPORT_AT_ITERATION_END_WITH_PENDING_MODELIZATION",
+            "IMPORT_AT_ITERATION_END_WITH_WORKING_MODELIZATION",
+            "IMPORT_AT_ITERATION_END_WITH_ERRORS",
+        ].includes(state)
+    ) {
+        hideElement("row_next_iteration");
+    } else if (  // Case of ITERATION_END not in TODO.
+        state != "ITERATION_END"
+    ) {
+        displayElement("row_next_iteration");
+        updateButtonStatus({
+            button_id: "button_create_next_iteration",
+            button_status: "todo",
+            button_disabled: true,
+        });
+        updateDetailsOpenStatus({
+            details_id: "details_next_iteration",
+            details_open: false,
+        });
+    } else {  // Case of ITERATION_END not in TODO.
+        displayElement("row_next_iteration");
+        updateButtonStatus({
+            button_id: "button_create_next_iteration",
+            button_status: "todo",
+            button_disabled: false,
+        });
+        updateDetailsOpenStatus({
+            details_id: "details_next_iteration",
+            details_open: true,
+        });
+    }
 
-        // Need a new update ?
-        if (redoUpdateAllAccordingToProjectStatus == true) {
+    // Tell if update need frequently new update.
+    return redoUpdateAllAccordingToProjectStatus;
+}
 
-            // Redo.
-            setTimeout(
-                function() {
-                    updateAllAccordingToProjectStatus({
-                        projectID:projectID
-                    });
-                },
-                1000,
-            );
+/**
+ * DESCRIPTION: Follow the changes of project status, pushed by the server while a task is running (Server-Sent Events).
+ * Browsers without Server-Sent Events get the project status again every second.
+ * @param {str} projectID: The ID of the project.
+ */
+var projectStatusEventSource = null;
+function followProjectStatus({
+    projectID,
+}={}) {
+
+    // Case of browsers without Server-Sent Events: get the project status again in one second.
+    if (typeof(EventSource) === "undefined") {
+        setTimeout(
+            function() {
+                updateAllAccordingToProjectStatus({
+                    projectID:projectID
+                });
+            },
+            1000,
+        );
+        return;
+    }
+
+    // Case of an already opened stream of project status.
+    if (projectStatusEventSource !== null) {
+        return;
+    }
 
+    // Open the stream of project status (one message per status change).
+    projectStatusEventSource = new EventSource(
+        "/api/projects/"+String(projectID)+"/status/stream",
+    );
+    projectStatusEventSource.onmessage = function(event) {
+
+        // Update all fields of the window according to project status.
+        var redoUpdateAllAccordingToProjectStatus = updateAllAccordingToStatus({
+            projectStatus: JSON.parse(event.data).status,
+        });
+
+        // Close the stream when no task is running anymore.
+        if (redoUpdateAllAccordingToProjectStatus == false) {
+            projectStatusEventSource.close();
+            projectStatusEventSource = null;
         }
     };
-
-    // Send request to get project status.
-    getProjectStatusRequest.send();
 }
@@ -12,7 +12,13 @@
 # IMPORT PYTHON DEPENDENCIES
 # ==============================================================================
 
+import base64
+import binascii
 import enum
+import json
+from typing import Any, Optional, Tuple
+
+from pydantic import BaseModel, validator
 
 # ==============================================================================
 # BASE MODEL FOR CONSTRAINTS ANNOTATION
@@ -26,6 +32,61 @@ class ConstraintsValues(str, enum.Enum):  # noqa: WPS600 (subclassing str)
     CANNOT_LINK: str = "CANNOT_LINK"
 
 
+class ConstraintsBulkOperationModel(BaseModel):
+    """
+    The body model for an operation of constraints bulk update.
+    The constraint is annotated only if `constraint_type` is given (`null` to annotate it without type, i.e. to skip it),
+    and its comment and review status are updated only if `comment` and `to_review` are not `null`.
+    """
+
+    # Parameters.
+    constraint_id: str
+    constraint_type: Optional[ConstraintsValues] = None
+    comment: Optional[str] = None
+    to_review: Optional[bool] = None
+
+    # Validators.
+    @validator("comment")
+    @classmethod
+    def validate_comment(cls, value: Optional[str]) -> Optional[str]:
+        """The validation of comment parameter.
+
+        Args:
+            value (Optional[str]): The value of comment parameter.
+
+        Raises:
+            ValueError: if `comment` is too long.
+
+        Returns:
+            Optional[str]: The value of comment parameter.
+        """
+        if value is not None and len(value) > 256:
+            raise ValueError("`comment` must have at most 256 characters.")
+        return value
+
+    # Check if the constraint has to be annotated.
+    def has_annotation(self) -> bool:
+        """Tell if the operation annotates the constraint (i.e. if `constraint_type` is given, even `null`).
+
+        Returns:
+            bool: `True` if the operation annotates the constraint.
+        """
+        return "constraint_type" in self.__fields_set__
+
+    # Config for schema.
+    class Config:  # noqa: WPS431 (nested class)
+        """Configuration for body model of constraints bulk operation."""
+
+        schema_extra = {
+            "example": {
+                "constraint_id": "(0,4)",
+                "constraint_type": ConstraintsValues.MUST_LINK,
+                "comment": "Same intent.",
+                "to_review": False,
+            }
+        }
+
+
 # ==============================================================================
 # BASE MODEL FOR CONSTRAINTS
 # ==============================================================================
@@ -44,6 +105,14 @@ class ConstraintsSortOptions(str, enum.Enum):  # noqa: WPS600 (subclassing str)
     TO_FIX_CONFLICT: str = "to_fix_conflict"
 
 
+class ConstraintsTypeFilters(str, enum.Enum):  # noqa: WPS600 (subclassing str)
+    """The enumeration of available options for constraints type filter (`SKIP` for constraints annotated without type)."""
+
+    MUST_LINK: str = "MUST_LINK"
+    CANNOT_LINK: str = "CANNOT_LINK"
+    SKIP: str = "SKIP"
+
+
 # ==============================================================================
 # BASE MODEL FOR TEXTS
 # ==============================================================================
@@ -55,3 +124,103 @@ class TextsSortOptions(str, enum.Enum):  # noqa: WPS600 (subclassing str)
     ID: str = "id"
     ALPHABETICAL: str = "alphabetical"
     IS_DELETED: str = "is_deleted"
+
+
+class TextsFields(str, enum.Enum):  # noqa: WPS600 (subclassing str)
+    """The enumeration of available fields for texts selection."""
+
+    TEXT_ORIGINAL: str = "text_original"
+    TEXT: str = "text"
+    TEXT_PREPROCESSED: str = "text_preprocessed"
+    IS_DELETED: str = "is_deleted"
+
+
+class TextsBulkOperationModel(BaseModel):
+    """
+    The body model for an operation of texts bulk update.
+    The text is deleted or undeleted only if `is_deleted` is not `null`, and renamed only if `text` is not `null`.
+    """
+
+    # Parameters.
+    text_id: str
+    is_deleted: Optional[bool] = None
+    text: Optional[str] = None
+
+    # Validators.
+    @validator("text")
+    @classmethod
+    def validate_text(cls, value: Optional[str]) -> Optional[str]:
+        """The validation of text parameter.
+
+        Args:
+            value (Optional[str]): The value of text parameter.
+
+        Raises:
+            ValueError: if `text` is too short or too long.
+
+        Returns:
+            Optional[str]: The value of text parameter.
+        """
+        if value is not None and not (3 <= len(value) <= 256):
+            raise ValueError("`text` must have between 3 and 256 characters.")
+        return value
+
+    # Config for schema.
+    class Config:  # noqa: WPS431 (nested class)
+        """Configuration for body model of texts bulk operation."""
+
+        schema_extra = {
+            "example": {
+                "text_id": "0",
+                "is_deleted": True,
+                "text": None,
+            }
+        }
+
+
+# ==============================================================================
+# BASE MODEL FOR PAGINATION
+# ==============================================================================
+
+
+def encode_cursor(position: Tuple[Any, int]) -> str:
+    """
+    Encode the position of the last returned item (its sort value and its insertion rank) into an opaque pagination cursor.
+
+    Args:
+        position (Tuple[Any, int]): The position of the last returned item.
+
+    Returns:
+        str: The pagination cursor.
+    """
+    return base64.urlsafe_b64encode(json.dumps(list(position)).encode("utf-8")).decode("ascii")
+
+
+def decode_cursor(cursor: str, nb_sort_values: int = 1) -> Tuple[Any, int]:
+    """
+    Decode a pagination cursor into the position of the last returned item.
+
+    Args:
+        cursor (str): The pagination cursor.
+        nb_sort_values (int, optional): The number of values used by the sort (if greater than 1, the sort value is a list). Defaults to `1`.
+
+    Raises:
+        ValueError: Raises error if the cursor is invalid.
+
+    Returns:
+        Tuple[Any, int]: The position of the last returned item (its sort value and its insertion rank).
+    """
+    try:
+        position: Any = json.loads(base64.urlsafe_b64decode(cursor.encode("ascii")).decode("utf-8"))
+    except (binascii.Error, UnicodeError, ValueError):
+        raise ValueError("The cursor '" + str(cursor) + "' is invalid.")
+    if not (isinstance(position, list) and len(position) == 2 and isinstance(position[1], int)):
+        raise ValueError("The cursor '" + str(cursor) + "' is invalid.")
+    sort_values: Any = position[0] if (nb_sort_values > 1) else [position[0]]
+    if not (
+        isinstance(sort_values, list)
+        and len(sort_values) == nb_sort_values
+        and all(isinstance(sort_value, (str, int, float)) for sort_value in sort_values)
+    ):
+        raise ValueError("The cursor '" + str(cursor) + "' is invalid.")
+    return position[0], position[1]
@@ -123,6 +123,15 @@ class VectorizationSpacyLanguageModel(str, enum.Enum):  # noqa: WPS600 (subclass
     FR_CORE_NEWS_MD: str = "fr_core_news_md"
 
 
+class ProjectionAlgorithm(str, enum.Enum):  # noqa: WPS600 (subclassing str)
+    """The enumeration of available projection algorithms (used to reduce vectors to 2 and 3 dimensions)."""
+
+    TSNE: str = "tsne"
+    TSNE_PCA_INIT: str = "tsne_pca_init"
+    SVD_TSNE: str = "svd_tsne"
+    SPECTRAL: str = "spectral"
+
+
 class VectorizationSettingsModel(BaseModel):
     """The body model for vectorization settings."""
 
@@ -130,6 +139,7 @@ class VectorizationSettingsModel(BaseModel):
     vectorizer_type: VectorizerType
     spacy_language_model: Optional[VectorizationSpacyLanguageModel]
     random_seed: int
+    projection_algorithm: ProjectionAlgorithm = ProjectionAlgorithm.TSNE
 
     @validator("random_seed")
     @classmethod
@@ -195,6 +205,7 @@ class VectorizationSettingsModel(BaseModel):
                 self.spacy_language_model.value if (self.spacy_language_model is not None) else None
             ),
             "random_seed": self.random_seed,
+            "projection_algorithm": self.projection_algorithm.value,
         }
 
     # Config for schema.
@@ -205,6 +216,13 @@ class VectorizationSettingsModel(BaseModel):
             "example": {
                 "vectorizer_type": VectorizerType.TFIDF + "|" + VectorizerType.SPACY,
                 "random_seed": 42,
+                "projection_algorithm": ProjectionAlgorithm.TSNE
+                + "|"
+                + ProjectionAlgorithm.TSNE_PCA_INIT
+                + "|"
+                + ProjectionAlgorithm.SVD_TSNE
+                + "|"
+                + ProjectionAlgorithm.SPECTRAL,
                 "!!!SPECIFIC: 'vectorizer_type'=='spacy'": {
                     "spacy_language_model": VectorizationSpacyLanguageModel.FR_CORE_NEWS_MD,
                 },
@@ -222,6 +240,7 @@ def default_VectorizationSettingsModel() -> VectorizationSettingsModel:
         vectorizer_type=VectorizerType.TFIDF,
         spacy_language_model=None,
         random_seed=42,
+        projection_algorithm=ProjectionAlgorithm.TSNE,
     )
 
 
@@ -429,6 +448,7 @@ class ClusteringAlgorithmEnum(str, enum.Enum):  # noqa: WPS600 (subclassing str)
     """The enumeration of available clustering algorithms."""
 
     KMEANS: str = "kmeans"
+    MINIBATCH_KMEANS: str = "minibatch_kmeans"
     HIERARCHICAL: str = "hierarchical"
     SPECTRAL: str = "spectral"
 
@@ -510,6 +530,96 @@ def default_KmeansInitSettingsModel() -> KmeansInitSettingsModel:
     )
 
 
+class MinibatchKmeansInitSettingsModel(BaseModel):
+    """The body submodel for mini-batch kmeans instantiation settings."""
+
+    # Parameters.
+    batch_size: int
+    max_iteration: int
+    tolerance: float
+
+    @validator("batch_size")
+    @classmethod
+    def validate_batch_size(cls, value: int) -> int:
+        """The validation of batch_size settings.
+
+        Args:
+            value (int): The value of batch_size setting.
+
+        Raises:
+            ValueError: if `batch_size` is incorrectly set.
+
+        Returns:
+            int: The value of batch_size setting.
+        """
+        if value < 1:
+            raise ValueError("`batch_size` must be greater than or equal to 1.")
+        return value
+
+    @validator("max_iteration")
+    @classmethod
+    def validate_max_iteration(cls, value: int) -> int:
+        """The validation of max_iteration settings.
+
+        Args:
+            value (int): The value of max_iteration setting.
+
+        Raises:
+            ValueError: if `max_iteration` is incorrectly set.
+
+        Returns:
+            int: The value of max_iteration setting.
+        """
+        if value < 1:
+            raise ValueError("`max_iteration` must be greater than or equal to 1.")
+        return value
+
+    @validator("tolerance")
+    @classmethod
+    def validate_tolerance(cls, value: float) -> float:
+        """The validation of tolerance settings.
+
+        Args:
+            value (float): The value of tolerance setting.
+
+        Raises:
+            ValueError: if `tolerance` is incorrectly set.
+
+        Returns:
+            float: The value of tolerance setting.
+        """
+        if value < 0:
+            raise ValueError("The `tolerance` must be greater than 0.0.")
+        return value
+
+    # Export method.
+    def to_dict(self) -> Dict[str, Any]:
+        """Export the model as a dictionary
+
+        Returns:
+            Dict[str, Any]: A dictionary that contains paramaters and their values.
+        """
+        return {
+            "batch_size": self.batch_size,
+            "max_iteration": self.max_iteration,
+            "tolerance": self.tolerance,
+        }
+
+
+# NEVER USE: KMeans is used as default clustering algorithm.
+#### def default_MinibatchKmeansInitSettingsModel() -> MinibatchKmeansInitSettingsModel:
+####    """Create a MinibatchKmeansInitSettingsModel instance with default values.
+####
+####    Returns:
+####        MinibatchKmeansInitSettingsModel: A MinibatchKmeansInitSettingsModel instance with default values.
+####    """
+####    return MinibatchKmeansInitSettingsModel(
+####        batch_size=1024,
+####        max_iteration=100,
+####        tolerance=0.0001,
+####    )
+
+
 class HierarchicalLinkageEnum(str, enum.Enum):  # noqa: WPS600 (subclassing str)
     """The enumeration of available hierarchical linkages."""
 
@@ -613,7 +723,15 @@ class ClusteringSettingsModel(BaseModel):
     algorithm: ClusteringAlgorithmEnum
     random_seed: int
     nb_clusters: int
-    init_kargs: Union[None, KmeansInitSettingsModel, HierarchicalInitSettingsModel, SpectralInitSettingsModel]
+    init_kargs: Union[  # The order matters: `SpectralInitSettingsModel` has only default values.
+        None,
+        KmeansInitSettingsModel,
+        MinibatchKmeansInitSettingsModel,
+        HierarchicalInitSettingsModel,
+        SpectralInitSettingsModel,
+    ]
+    warm_start: bool = False
+    nb_seeds: int = 1
 
     @validator("random_seed")
     @classmethod
@@ -633,6 +751,24 @@ class ClusteringSettingsModel(BaseModel):
             raise ValueError("`random_seed` must be greater than or equal to 0.")
         return value
 
+    @validator("nb_seeds")
+    @classmethod
+    def validate_nb_seeds(cls, value: int) -> int:
+        """The validation of nb_seeds settings.
+
+        Args:
+            value (int): The value of nb_seeds setting.
+
+        Raises:
+            ValueError: if `nb_seeds` is incorrectly set.
+
+        Returns:
+            int: The value of nb_seeds setting.
+        """
+        if value < 1:
+            raise ValueError("`nb_seeds` must be greater than or equal to 1.")
+        return value
+
     @validator("nb_clusters")
     @classmethod
     def validate_nb_clusters(cls, value: int) -> int:
@@ -683,6 +819,19 @@ class ClusteringSettingsModel(BaseModel):
                     "The dictionary of initialization (`init_kargs`) is incompatible with algorithm `kmeans`."
                 )
 
+        # Case of mini-batch kmeans clustering algorithm.
+        if values["algorithm"] == ClusteringAlgorithmEnum.MINIBATCH_KMEANS:
+            # Case of no init parameters.
+            if ("init_kargs" not in values.keys()) or (values["init_kargs"] is None):
+                raise ValueError(
+                    "A dictionary of initialization (`init_kargs`) is required when algorithm is `minibatch_kmeans`."
+                )
+            # Case of wrong type init parameters.
+            if not isinstance(values["init_kargs"], MinibatchKmeansInitSettingsModel):
+                raise ValueError(
+                    "The dictionary of initialization (`init_kargs`) is incompatible with algorithm `minibatch_kmeans`."
+                )
+
         # Case of hierarchical clustering algorithm.
         if values["algorithm"] == ClusteringAlgorithmEnum.HIERARCHICAL:
             # Case of no init parameters.
@@ -724,6 +873,8 @@ class ClusteringSettingsModel(BaseModel):
             "random_seed": self.random_seed,
             "nb_clusters": self.nb_clusters,
             "init_kargs": self.init_kargs.to_dict() if (self.init_kargs is not None) else {},
+            "warm_start": self.warm_start,
+            "nb_seeds": self.nb_seeds,
         }
 
     # Config for schema.
@@ -735,6 +886,8 @@ class ClusteringSettingsModel(BaseModel):
                 "algorithm": (
                     ClusteringAlgorithmEnum.KMEANS
                     + "|"
+                    + ClusteringAlgorithmEnum.MINIBATCH_KMEANS
+                    + "|"
                     + ClusteringAlgorithmEnum.HIERARCHICAL
                     + "|"
                     + ClusteringAlgorithmEnum.SPECTRAL
@@ -747,6 +900,11 @@ class ClusteringSettingsModel(BaseModel):
                         "max_iteration": 150,
                         "tolerance": 0.0001,
                     },
+                    "!!!SPECIFIC: 'algorithm'=='minibatch_kmeans'": {
+                        "batch_size": 1024,
+                        "max_iteration": 100,
+                        "tolerance": 0.0001,
+                    },
                     "!!!SPECIFIC: 'algorithm'=='hierarchical'": {
                         "linkage": (
                             HierarchicalLinkageEnum.WARD
@@ -763,6 +921,10 @@ class ClusteringSettingsModel(BaseModel):
                         "nb_components": None,
                     },
                 },
+                "!!!SPECIFIC: 'algorithm'=='kmeans'": {
+                    "warm_start": False,
+                },
+                "nb_seeds": 1,
             }
         }
 
@@ -778,4 +940,6 @@ def default_ClusteringSettingsModel() -> ClusteringSettingsModel:
         random_seed=42,
         nb_clusters=2,
         init_kargs=default_KmeansInitSettingsModel(),
+        warm_start=False,
+        nb_seeds=1,
     )
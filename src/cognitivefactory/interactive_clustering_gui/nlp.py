@@ -0,0 +1,296 @@
+# -*- coding: utf-8 -*-
+
+"""
+* Name:         cognitivefactory.interactive_clustering_gui.nlp
+* Description:  Batched NLP preprocessing and vectorization of texts, with spaCy pipelines kept loaded in the process.
+* Author:       Erwan Schild
+* Created:      18/10/2026
+* Licence:      CeCILL-C License v1.0 (https://cecill.info/licences.fr.html)
+"""
+
+# ==============================================================================
+# IMPORT PYTHON DEPENDENCIES
+# ==============================================================================
+
+import functools
+import os
+import unicodedata
+from typing import Dict, List
+
+import spacy
+from scipy.sparse import csr_matrix
+from spacy.language import Language
+
+from cognitivefactory.interactive_clustering.utils import vectorization
+
+# ==============================================================================
+# CONFIGURE NLP PIPELINES
+# ==============================================================================
+
+# Define `SPACY_BATCH_SIZE` (the number of texts sent at once through a spaCy pipeline).
+SPACY_BATCH_SIZE: int = int(os.environ.get("SPACY_BATCH_SIZE", "256"))
+
+# Define `SPACY_PROCESSES_NUMBER` (the number of processes used by a spaCy pipeline, `1` to stay in the current process).
+SPACY_PROCESSES_NUMBER: int = int(os.environ.get("SPACY_PROCESSES_NUMBER", "1"))
+
+# Maximum number of spaCy pipelines kept loaded in the process.
+SPACY_PIPELINES_CACHE_SIZE: int = 4
+
+# Define `SPACY_PRELOADED_MODELS` (the spaCy language models loaded before background tasks, comma-separated).
+SPACY_PRELOADED_MODELS: List[str] = [
+    spacy_language_model.strip()
+    for spacy_language_model in os.environ.get("SPACY_PRELOADED_MODELS", "fr_core_news_md").split(",")
+    if spacy_language_model.strip() != ""
+]
+
+# Components of spaCy pipelines never used by the application.
+SPACY_DISABLED_COMPONENTS: List[str] = ["ner"]
+
+# Components of spaCy pipelines not needed by vectorization.
+SPACY_VECTORIZATION_DISABLED_COMPONENTS: List[str] = ["morphologizer", "parser", "attribute_ruler", "lemmatizer"]
+
+# Translator of punctuations into spaces (as in `cognitivefactory.interactive_clustering.utils.preprocessing`).
+PUNCTUATION_TRANSLATOR: Dict[int, str] = str.maketrans(
+    {
+        punct: " "
+        for punct in (
+            ".",
+            ",",
+            ";",
+            ":",
+            "!",
+            "¡",
+            "?",
+            "¿",
+            "…",
+            "•",
+            "(",
+            ")",
+            "{",
+            "}",
+            "[",
+            "]",
+            "«",
+            "»",
+            "^",
+            "`",
+            "'",
+            '"',
+            "\\",
+            "/",
+            "|",
+            "-",
+            "_",
+            "#",
+            "&",
+            "~",
+            "@",
+        )
+    }
+)
+
+
+# ==============================================================================
+# SPACY PIPELINES
+# ==============================================================================
+
+
+@functools.lru_cache(maxsize=SPACY_PIPELINES_CACHE_SIZE)
+def load_spacy_pipeline(
+    spacy_language_model: str,
+) -> Language:
+    """
+    Load a spaCy pipeline, or get it from the pipelines already loaded in the process.
+    The pipeline is shared by preprocessing and vectorization, so a modelization update loads each model once.
+
+    Args:
+        spacy_language_model (str): The spaCy language model to load.
+
+    Raises:
+        ValueError: Raises error if the `spacy_language_model` is not installed.
+
+    Returns:
+        Language: The spaCy pipeline.
+    """
+    try:
+        return spacy.load(name=spacy_language_model, disable=SPACY_DISABLED_COMPONENTS)
+    except OSError as err:  # `spacy_language_model` is not installed.
+        raise ValueError("The `spacy_language_model` '" + str(spacy_language_model) + "' is not installed.") from err
+
+
+def preload_spacy_pipelines(
+    spacy_language_models: List[str],
+) -> List[str]:
+    """
+    Load spaCy pipelines before they are needed, in the pipelines kept loaded in the process.
+    Models that are not installed are skipped (tasks that need them fail as usual).
+
+    Args:
+        spacy_language_models (List[str]): The spaCy language models to load.
+
+    Returns:
+        List[str]: The spaCy language models loaded.
+    """
+    preloaded_models: List[str] = []
+    for spacy_language_model in spacy_language_models[:SPACY_PIPELINES_CACHE_SIZE]:
+        try:
+            load_spacy_pipeline(spacy_language_model=spacy_language_model)
+        except ValueError:
+            continue
+        preloaded_models.append(spacy_language_model)
+    return preloaded_models
+
+
+def get_processes_number(
+    nb_texts: int,
+    batch_size: int,
+    n_process: int,
+) -> int:
+    """
+    Get the number of processes worth using for some texts (starting processes is only worth it for several batches).
+
+    Args:
+        nb_texts (int): The number of texts.
+        batch_size (int): The number of texts in a batch.
+        n_process (int): The maximum number of processes.
+
+    Returns:
+        int: The number of processes.
+    """
+    return max(1, min(n_process, nb_texts // max(1, batch_size)))
+
+
+# ==============================================================================
+# NLP PREPROCESSING
+# ==============================================================================
+
+
+def preprocess(
+    dict_of_texts: Dict[str, str],
+    apply_stopwords_deletion: bool = False,
+    apply_parsing_filter: bool = False,
+    apply_lemmatization: bool = False,
+    spacy_language_model: str = "fr_core_news_md",
+    batch_size: int = SPACY_BATCH_SIZE,
+    n_process: int = SPACY_PROCESSES_NUMBER,
+) -> Dict[str, str]:
+    """
+    Preprocess texts, with the same results as `cognitivefactory.interactive_clustering.utils.preprocessing.preprocess`.
+    Texts are streamed through the spaCy pipeline by batches (and over several processes if `n_process` is greater than `1`),
+    and the pipeline stays loaded in the process for next calls.
+
+    Args:
+        dict_of_texts (Dict[str, str]): The texts to preprocess.
+        apply_stopwords_deletion (bool, optional): The option to delete stopwords. Defaults to `False`.
+        apply_parsing_filter (bool, optional): The option to filter tokens based on dependency parsing results. Defaults to `False`.
+        apply_lemmatization (bool, optional): The option to lemmatize tokens. Defaults to `False`.
+        spacy_language_model (str, optional): The spaCy language model to use. Defaults to `"fr_core_news_md"`.
+        batch_size (int, optional): The number of texts sent at once through the spaCy pipeline. Defaults to `SPACY_BATCH_SIZE`.
+        n_process (int, optional): The maximum number of processes used by the spaCy pipeline. Defaults to `SPACY_PROCESSES_NUMBER`.
+
+    Raises:
+        ValueError: Raises error if the `spacy_language_model` is not installed.
+
+    Returns:
+        Dict[str, str]: The preprocessed texts.
+    """
+
+    # Load spaCy pipeline.
+    spacy_nlp: Language = load_spacy_pipeline(spacy_language_model=spacy_language_model)
+
+    # Apply lowercasing and punctuation deletion (before tokenization).
+    list_of_text_ids: List[str] = list(dict_of_texts.keys())
+    list_of_texts: List[str] = [str(text).lower().translate(PUNCTUATION_TRANSLATOR) for text in dict_of_texts.values()]
+
+    # Apply tokenization and spaCy pipeline, by batches.
+    dict_of_preprocessed_texts: Dict[str, str] = {}
+    for text_id, doc in zip(
+        list_of_text_ids,
+        spacy_nlp.pipe(
+            list_of_texts,
+            batch_size=batch_size,
+            n_process=get_processes_number(nb_texts=len(list_of_texts), batch_size=batch_size, n_process=n_process),
+        ),
+    ):
+        # Filter tokens (spaces, punctuations, and if set stopwords and deep tokens in dependency tree).
+        tokens = [
+            token
+            for token in doc
+            if (not token.is_space)
+            and (not token.is_punct and not token.is_quote)
+            and ((not apply_stopwords_deletion) or (not token.is_stop))
+            and ((not apply_parsing_filter) or (len(list(token.ancestors)) <= 1))
+        ]
+
+        # Apply retokenization, with or without lemmatization.
+        preprocessed_text: str = " ".join(
+            [(token.lemma_ if apply_lemmatization else token.text).strip() for token in tokens]
+        )
+
+        # Apply accents deletion (after lemmatization).
+        dict_of_preprocessed_texts[text_id] = "".join(
+            [char for char in unicodedata.normalize("NFKD", preprocessed_text) if not unicodedata.combining(char)]
+        )
+
+    return dict_of_preprocessed_texts
+
+
+# ==============================================================================
+# NLP VECTORIZATION
+# ==============================================================================
+
+
+def vectorize(
+    dict_of_texts: Dict[str, str],
+    vectorizer_type: str = "tfidf",
+    spacy_language_model: str = "fr_core_news_md",
+    batch_size: int = SPACY_BATCH_SIZE,
+    n_process: int = SPACY_PROCESSES_NUMBER,
+) -> Dict[str, csr_matrix]:
+    """
+    Vectorize texts, with the same results as `cognitivefactory.interactive_clustering.utils.vectorization.vectorize`.
+    With `spacy` vectorizer, texts are streamed through the spaCy pipeline by batches, with only the components needed by vectors.
+
+    Args:
+        dict_of_texts (Dict[str, str]): The texts to vectorize.
+        vectorizer_type (str, optional): The vectorizer type. Can be `"tfidf"` or `"spacy"`. Defaults to `"tfidf"`.
+        spacy_language_model (str, optional): The spaCy language model to use if vectorizer is spacy. Defaults to `"fr_core_news_md"`.
+        batch_size (int, optional): The number of texts sent at once through the spaCy pipeline. Defaults to `SPACY_BATCH_SIZE`.
+        n_process (int, optional): The maximum number of processes used by the spaCy pipeline. Defaults to `SPACY_PROCESSES_NUMBER`.
+
+    Raises:
+        ValueError: Raises error if `vectorizer_type` is not implemented or if the `spacy_language_model` is not installed.
+
+    Returns:
+        Dict[str, csr_matrix]: The vectors of texts.
+    """
+
+    # Case of corpus dependent vectorization.
+    if vectorizer_type != "spacy":
+        return vectorization.vectorize(
+            dict_of_texts=dict_of_texts,
+            vectorizer_type=vectorizer_type,
+            spacy_language_model=spacy_language_model,
+        )
+
+    # Load spaCy pipeline.
+    spacy_nlp: Language = load_spacy_pipeline(spacy_language_model=spacy_language_model)
+
+    # Apply vectorization by batches, without components not needed by vectors.
+    list_of_texts: List[str] = [str(text) for text in dict_of_texts.values()]
+    with spacy_nlp.select_pipes(
+        disable=[name for name in SPACY_VECTORIZATION_DISABLED_COMPONENTS if name in spacy_nlp.pipe_names]
+    ):
+        return {
+            text_id: csr_matrix(doc.vector)
+            for text_id, doc in zip(
+                dict_of_texts.keys(),
+                spacy_nlp.pipe(
+                    list_of_texts,
+                    batch_size=batch_size,
+                    n_process=get_processes_number(
+                        nb_texts=len(list_of_texts), batch_size=batch_size, n_process=n_process
+                    ),
+                ),
+            )
+        }
@@ -0,0 +1,32 @@
+# -*- coding: utf-8 -*-
+
+"""
+* Name:         cognitivefactory.interactive_clustering_gui.preload
+* Description:  Dependencies of background tasks (modules and spaCy pipelines) loaded once in the server of worker processes.
+* Author:       Erwan Schild
+* Created:      18/10/2026
+* Licence:      CeCILL-C License v1.0 (https://cecill.info/licences.fr.html)
+
+This module is only imported by the "forkserver" process of the workers pool: worker processes are forked from it,
+so they share the preloaded modules and spaCy pipelines (copy-on-write) instead of loading them for each task.
+"""
+
+# ==============================================================================
+# IMPORT PYTHON DEPENDENCIES
+# ==============================================================================
+
+import gc
+from typing import List
+
+from cognitivefactory.interactive_clustering_gui import backgroundtasks  # noqa: F401 (preloaded module)
+from cognitivefactory.interactive_clustering_gui.nlp import SPACY_PRELOADED_MODELS, preload_spacy_pipelines
+
+# ==============================================================================
+# PRELOAD DEPENDENCIES
+# ==============================================================================
+
+# Load spaCy pipelines.
+PRELOADED_MODELS: List[str] = preload_spacy_pipelines(spacy_language_models=SPACY_PRELOADED_MODELS)
+
+# Exclude preloaded objects from garbage collections, so that collections in worker processes don't copy their memory pages.
+gc.freeze()
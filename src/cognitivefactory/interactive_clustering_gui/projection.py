@@ -0,0 +1,215 @@
+# -*- coding: utf-8 -*-
+
+"""
+* Name:         cognitivefactory.interactive_clustering_gui.projection
+* Description:  Reduction of texts vectors to 2 and 3 dimensions, used to display texts during modelization.
+* Author:       Erwan Schild
+* Created:      18/10/2026
+* Licence:      CeCILL-C License v1.0 (https://cecill.info/licences.fr.html)
+"""
+
+# ==============================================================================
+# IMPORT PYTHON DEPENDENCIES
+# ==============================================================================
+
+from concurrent.futures import ThreadPoolExecutor
+from typing import Optional, Tuple, Union
+
+from numpy import ndarray
+from scipy.sparse import csr_matrix
+from sklearn.decomposition import TruncatedSVD
+from sklearn.manifold import TSNE, SpectralEmbedding
+from sklearn.neighbors import kneighbors_graph
+
+from cognitivefactory.interactive_clustering_gui.models.settings import ProjectionAlgorithm
+
+# ==============================================================================
+# CONFIGURE PROJECTION
+# ==============================================================================
+
+# Number of dimensions kept by the truncated SVD before TSNE.
+SVD_NB_COMPONENTS: int = 50
+
+# Number of neighbors in the neighbor graph of the spectral projection.
+SPECTRAL_NB_NEIGHBORS: int = 15
+
+
+# ==============================================================================
+# TSNE UTILS
+# ==============================================================================
+
+
+def run_tsne(
+    vectors: Union[csr_matrix, ndarray],
+    n_components: int,
+    random_seed: int,
+    init: Union[str, ndarray] = "random",
+) -> ndarray:
+    """
+    Reduce vectors with TSNE.
+
+    Args:
+        vectors (Union[csr_matrix, ndarray]): The vectors to reduce.
+        n_components (int): The number of dimensions of the reduced vectors.
+        random_seed (int): The random seed of TSNE.
+        init (Union[str, ndarray], optional): The initialization of the embedding. Defaults to `"random"`.
+
+    Returns:
+        ndarray: The reduced vectors.
+    """
+    return TSNE(
+        n_components=n_components,
+        # learning_rate="auto",  # Error on "scikit-learn==0.24.1" !
+        init=init,
+        random_state=random_seed,
+        perplexity=min(30.0, vectors.shape[0] - 1),  # TSNE requirement.
+    ).fit_transform(vectors)
+
+
+def run_tsne_2D_and_3D(
+    vectors: Union[csr_matrix, ndarray],
+    random_seed: int,
+    init_3D: Optional[ndarray] = None,
+) -> Tuple[ndarray, ndarray]:
+    """
+    Reduce vectors to 2 and 3 dimensions with TSNE, by running both fits concurrently.
+
+    Args:
+        vectors (Union[csr_matrix, ndarray]): The vectors to reduce.
+        random_seed (int): The random seed of TSNE.
+        init_3D (Optional[ndarray], optional): The 3D initialization of the embedding (its 2 first dimensions are used for the 2D embedding). Defaults to `None` for a random initialization.
+
+    Returns:
+        Tuple[ndarray, ndarray]: The vectors reduced to 2 dimensions, and to 3 dimensions.
+    """
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        future_2D = executor.submit(
+            run_tsne,
+            vectors=vectors,
+            n_components=2,
+            random_seed=random_seed,
+            init=(init_3D[:, :2].copy() if (init_3D is not None) else "random"),
+        )
+        future_3D = executor.submit(
+            run_tsne,
+            vectors=vectors,
+            n_components=3,
+            random_seed=random_seed,
+            init=(init_3D if (init_3D is not None) else "random"),
+        )
+        return future_2D.result(), future_3D.result()
+
+
+def run_truncated_svd(
+    vectors: csr_matrix,
+    n_components: int,
+    random_seed: int,
+) -> Optional[ndarray]:
+    """
+    Reduce vectors with a truncated SVD (which handles sparse vectors, unlike PCA).
+
+    Args:
+        vectors (csr_matrix): The vectors to reduce.
+        n_components (int): The maximum number of dimensions of the reduced vectors.
+        random_seed (int): The random seed of the SVD.
+
+    Returns:
+        Optional[ndarray]: The reduced vectors, or `None` if vectors don't have enough dimensions to be reduced.
+    """
+
+    # Case of vectors with too few dimensions (the truncated SVD requires `n_components < n_features`).
+    n_components = min(n_components, vectors.shape[1] - 1)
+    if n_components < 3:
+        return None
+
+    # Reduce vectors.
+    return TruncatedSVD(
+        n_components=n_components,
+        random_state=random_seed,
+    ).fit_transform(vectors)
+
+
+# ==============================================================================
+# PROJECTION
+# ==============================================================================
+
+
+def compute_projections(
+    vectors_ND: csr_matrix,
+    projection_algorithm: str,
+    random_seed: int,
+) -> Tuple[ndarray, ndarray]:
+    """
+    Reduce vectors to 2 and 3 dimensions with the given projection algorithm.
+    The 2D and 3D projections are computed concurrently, or derived from a shared computation when possible:
+        - `tsne`: two TSNE fits with random initialization ;
+        - `tsne_pca_init`: two TSNE fits initialized with the 3 first components of a truncated SVD ;
+        - `svd_tsne`: two TSNE fits on vectors reduced to 50 dimensions by a truncated SVD (faster on large vocabularies) ;
+        - `spectral`: a spectral embedding of a shared neighbor graph, whose 2 first dimensions are the 2D projection (fastest, approximate).
+
+    Args:
+        vectors_ND (csr_matrix): The vectors to reduce.
+        projection_algorithm (str): The projection algorithm. Can be `"tsne"`, `"tsne_pca_init"`, `"svd_tsne"` or `"spectral"`.
+        random_seed (int): The random seed of projection algorithms.
+
+    Raises:
+        ValueError: Raises error if `projection_algorithm` is not implemented.
+
+    Returns:
+        Tuple[ndarray, ndarray]: The vectors reduced to 2 dimensions, and to 3 dimensions.
+    """
+
+    # Case of TSNE.
+    if projection_algorithm == ProjectionAlgorithm.TSNE:
+        return run_tsne_2D_and_3D(
+            vectors=vectors_ND,
+            random_seed=random_seed,
+        )
+
+    # Case of TSNE initialized with principal components.
+    if projection_algorithm == ProjectionAlgorithm.TSNE_PCA_INIT:
+        vectors_SVD: Optional[ndarray] = run_truncated_svd(
+            vectors=vectors_ND,
+            n_components=3,
+            random_seed=random_seed,
+        )
+        return run_tsne_2D_and_3D(
+            vectors=vectors_ND,
+            random_seed=random_seed,
+            init_3D=(
+                # Scale initialization as done by TSNE for its own PCA initialization.
+                (vectors_SVD / vectors_SVD[:, 0].std() * 1e-4)
+                if (vectors_SVD is not None and vectors_SVD[:, 0].std() > 0)
+                else None
+            ),
+        )
+
+    # Case of TSNE on vectors reduced by a truncated SVD.
+    if projection_algorithm == ProjectionAlgorithm.SVD_TSNE:
+        vectors_SVD = run_truncated_svd(
+            vectors=vectors_ND,
+            n_components=SVD_NB_COMPONENTS,
+            random_seed=random_seed,
+        )
+        return run_tsne_2D_and_3D(
+            vectors=(vectors_SVD if (vectors_SVD is not None) else vectors_ND),
+            random_seed=random_seed,
+        )
+
+    # Case of spectral embedding of a neighbor graph.
+    if projection_algorithm == ProjectionAlgorithm.SPECTRAL:
+        neighbor_graph: csr_matrix = kneighbors_graph(
+            vectors_ND,
+            n_neighbors=min(SPECTRAL_NB_NEIGHBORS, vectors_ND.shape[0] - 1),
+            mode="connectivity",
+            include_self=False,
+        )
+        vectors_3D: ndarray = SpectralEmbedding(
+            n_components=3,
+            affinity="precomputed",
+            random_state=random_seed,
+        ).fit_transform(0.5 * (neighbor_graph + neighbor_graph.T))
+        return vectors_3D[:, :2], vectors_3D
+
+    # Otherwise: not implemented.
+    raise ValueError("The `projection_algorithm` '" + str(projection_algorithm) + "' is not implemented.")
@@ -0,0 +1,187 @@
+# -*- coding: utf-8 -*-
+
+"""
+* Name:         cognitivefactory.interactive_clustering_gui.sampling
+* Description:  Constraints sampling with distance restrictions computed on stored distances or on candidates of a neighbors index.
+* Author:       Erwan Schild
+* Created:      18/10/2026
+* Licence:      CeCILL-C License v1.0 (https://cecill.info/licences.fr.html)
+"""
+
+# ==============================================================================
+# IMPORT PYTHON DEPENDENCIES
+# ==============================================================================
+
+from typing import Dict, List, Optional, Set, Tuple
+
+import numpy as np
+from scipy.sparse import csr_matrix, vstack
+
+from cognitivefactory.interactive_clustering.constraints.abstract import AbstractConstraintsManager
+from cognitivefactory.interactive_clustering.sampling.clusters_based import ClustersBasedConstraintsSampling
+from cognitivefactory.interactive_clustering_gui.storage.distances import Distances
+from cognitivefactory.interactive_clustering_gui.storage.neighbors_index import NeighborsIndex
+
+# ==============================================================================
+# NEIGHBORS INDEX CONSTRAINTS SAMPLING
+# ==============================================================================
+
+
+class NeighborsIndexConstraintsSampling(ClustersBasedConstraintsSampling):
+    """
+    A clusters based constraints sampling, whose distance restrictions reuse distances computed once per modelization:
+    - with pairwise distances (small projects), all pairs are sorted without computing distances again, with the same results as `ClustersBasedConstraintsSampling` ;
+    - with a kNN graph or a neighbors index (large projects), only candidate pairs are sorted.
+    Without them (or without distance restriction), the sampling of `ClustersBasedConstraintsSampling` is applied.
+    If candidates don't give enough pairs, only the pairs found are returned (a sampling over all pairs doesn't fit in memory for large projects).
+    """
+
+    def sample(
+        self,
+        constraints_manager: AbstractConstraintsManager,
+        nb_to_select: int,
+        clustering_result: Optional[Dict[str, int]] = None,
+        vectors: Optional[Dict[str, csr_matrix]] = None,
+        neighbors_index: Optional[NeighborsIndex] = None,
+        distances: Optional[Distances] = None,
+        **kargs,
+    ) -> List[Tuple[str, str]]:
+        """
+        The main method used to sample pairs of data IDs for constraints annotation.
+
+        Args:
+            constraints_manager (AbstractConstraintsManager): A constraints manager over data IDs.
+            nb_to_select (int): The number of pairs of data IDs to sample.
+            clustering_result (Optional[Dict[str,int]], optional): A dictionary that represents the predicted cluster for each data ID. Defaults to `None`.
+            vectors (Optional[Dict[str, csr_matrix]], optional): The representation of data vectors. Defaults to `None`.
+            neighbors_index (Optional[NeighborsIndex], optional): The neighbors index of vectors. Defaults to `None`.
+            distances (Optional[Distances], optional): The distances between vectors (pairwise distances or kNN graph). Defaults to `None`.
+            **kargs (dict): Other parameters that can be used in the sampling.
+
+        Raises:
+            ValueError: if some parameters are incorrectly set or incompatible.
+
+        Returns:
+            List[Tuple[str,str]]: A list of couple of data IDs.
+        """
+
+        # Get the list of indexed data IDs.
+        list_of_indexed_data_IDs: Optional[List[str]] = (
+            distances.list_of_data_IDs
+            if (distances is not None)
+            else (neighbors_index.list_of_data_IDs if (neighbors_index is not None) else None)
+        )
+
+        # Case without distance restriction, or without index of managed data IDs: sampling over all pairs.
+        list_of_managed_data_IDs: List[str] = (
+            constraints_manager.get_list_of_managed_data_IDs()
+            if isinstance(constraints_manager, AbstractConstraintsManager)
+            else []
+        )
+        if (
+            self.distance_restriction is None
+            or list_of_indexed_data_IDs is None
+            or not set(list_of_managed_data_IDs).issubset(list_of_indexed_data_IDs)
+            or not isinstance(nb_to_select, int)
+            or nb_to_select <= 0
+            or (self.clusters_restriction is not None and not isinstance(clustering_result, dict))
+            or not isinstance(vectors, dict)
+        ):
+            return super().sample(
+                constraints_manager=constraints_manager,
+                nb_to_select=nb_to_select,
+                clustering_result=clustering_result,
+                vectors=vectors,
+                **kargs,
+            )
+
+        # Get candidate pairs: all pairs with pairwise distances, otherwise pairs of the kNN graph or of the neighbors index.
+        groups: Optional[np.ndarray] = (
+            np.array([clustering_result[data_ID] for data_ID in list_of_indexed_data_IDs])  # type: ignore
+            if self.clusters_restriction == "same_cluster"
+            else None
+        )
+        all_pairs_are_candidates: bool = distances is not None and distances.squared_distances is not None
+        if distances is not None and (all_pairs_are_candidates or self.distance_restriction == "closest_neighbors"):
+            rows_1, rows_2, pairs_distances = (
+                distances.get_closest_candidates()
+                if self.distance_restriction == "closest_neighbors"
+                else distances.get_all_pairs(groups=groups)
+            )
+        elif neighbors_index is not None:
+            matrix: csr_matrix = vstack([vectors[data_ID] for data_ID in neighbors_index.list_of_data_IDs]).tocsr()
+            rows_1, rows_2, pairs_distances = (
+                neighbors_index.get_closest_candidates(matrix=matrix)
+                if self.distance_restriction == "closest_neighbors"
+                else neighbors_index.get_farthest_candidates(matrix=matrix, groups=groups)
+            )
+        else:
+            return super().sample(
+                constraints_manager=constraints_manager,
+                nb_to_select=nb_to_select,
+                clustering_result=clustering_result,
+                vectors=vectors,
+                **kargs,
+            )
+
+        # Sort candidate pairs by distance, then in the order pairs are listed by `ClustersBasedConstraintsSampling` (pairs of data IDs in managed order).
+        dict_of_managed_positions: Dict[str, int] = {
+            data_ID: position for position, data_ID in enumerate(list_of_managed_data_IDs)
+        }
+        indexed_positions: np.ndarray = np.array(
+            [
+                dict_of_managed_positions.get(data_ID, len(list_of_managed_data_IDs))
+                for data_ID in list_of_indexed_data_IDs
+            ],
+            dtype=np.int64,
+        )
+        indexed_ranks: np.ndarray = np.argsort(np.argsort(np.array(list_of_indexed_data_IDs), kind="stable"))
+        rows_are_ordered: np.ndarray = indexed_ranks[rows_1] < indexed_ranks[rows_2]
+        order: np.ndarray = np.lexsort(
+            (
+                indexed_positions[np.where(rows_are_ordered, rows_2, rows_1)],
+                indexed_positions[np.where(rows_are_ordered, rows_1, rows_2)],
+                pairs_distances if self.distance_restriction == "closest_neighbors" else -pairs_distances,
+            )
+        )
+
+        # Select candidate pairs that respect restrictions.
+        set_of_managed_data_IDs: Set[str] = set(list_of_managed_data_IDs)
+        list_of_selected_pairs_of_data_IDs: List[Tuple[str, str]] = []
+        for position in order:
+            data_ID1: str = list_of_indexed_data_IDs[rows_1[position]]
+            data_ID2: str = list_of_indexed_data_IDs[rows_2[position]]
+            if data_ID1 > data_ID2:
+                data_ID1, data_ID2 = data_ID2, data_ID1
+
+            # Check managed data IDs.
+            if data_ID1 not in set_of_managed_data_IDs or data_ID2 not in set_of_managed_data_IDs:
+                continue
+
+            # Check clusters restriction.
+            if (
+                self.clusters_restriction == "same_cluster"
+                and clustering_result[data_ID1] != clustering_result[data_ID2]  # type: ignore
+            ) or (
+                self.clusters_restriction == "different_clusters"
+                and clustering_result[data_ID1] == clustering_result[data_ID2]  # type: ignore
+            ):
+                continue
+
+            # Check known constraints.
+            if (
+                self.without_added_constraints is True
+                and constraints_manager.get_added_constraint(data_ID1=data_ID1, data_ID2=data_ID2) is not None
+            ) or (
+                self.without_inferred_constraints is True
+                and constraints_manager.get_inferred_constraint(data_ID1=data_ID1, data_ID2=data_ID2) is not None
+            ):
+                continue
+
+            # Add the pair of data IDs.
+            list_of_selected_pairs_of_data_IDs.append((data_ID1, data_ID2))
+            if len(list_of_selected_pairs_of_data_IDs) == nb_to_select:
+                return list_of_selected_pairs_of_data_IDs
+
+        # Case of not enough candidates: return the pairs found (all pairs can't be considered for large projects).
+        return list_of_selected_pairs_of_data_IDs
@@ -0,0 +1,25 @@
+# -*- coding: utf-8 -*-
+
+"""
+* Name:         cognitivefactory.interactive_clustering_gui.storage
+* Description:  Web application for Interactive Clustering methodology.
+* Author:       Erwan SCHILD
+* Created:      18/10/2026
+* Licence:      CeCILL (https://cecill.info/licences.fr.html)
+
+The storage module, that defines how project texts and constraints are persisted:
+
+- `abstract`: it defines the interface of a project storage (row-level reads and updates of texts and constraints). See [interactive_clustering_gui/storage/abstract](https://cognitivefactory.github.io/interactive-clustering-gui/reference/cognitivefactory/interactive_clustering_gui/storage/abstract/) documentation ;
+- `sqlite`: it defines the default project storage, an embedded SQLite database with indexed lookups. See [interactive_clustering_gui/storage/sqlite](https://cognitivefactory.github.io/interactive-clustering-gui/reference/cognitivefactory/interactive_clustering_gui/storage/sqlite/) documentation ;
+- `jsonfiles`: it defines the legacy project storage, based on `texts.json` and `constraints.json` files. See [interactive_clustering_gui/storage/jsonfiles](https://cognitivefactory.github.io/interactive-clustering-gui/reference/cognitivefactory/interactive_clustering_gui/storage/jsonfiles/) documentation ;
+- `modelization_cache`: it defines the content-hash keyed cache of preprocessed texts and vectors, used to only recompute new or renamed texts during modelization update. See [interactive_clustering_gui/storage/modelization_cache](https://cognitivefactory.github.io/interactive-clustering-gui/reference/cognitivefactory/interactive_clustering_gui/storage/modelization_cache/) documentation ;
+- `constraints_journal`: it defines the incremental update of the constraints manager, based on a journal of the constraints it contains. See [interactive_clustering_gui/storage/constraints_journal](https://cognitivefactory.github.io/interactive-clustering-gui/reference/cognitivefactory/interactive_clustering_gui/storage/constraints_journal/) documentation ;
+- `vectors`: it defines the columnar storage of texts vectors, as a single memory-mappable CSR matrix with an ID index. See [interactive_clustering_gui/storage/vectors](https://cognitivefactory.github.io/interactive-clustering-gui/reference/cognitivefactory/interactive_clustering_gui/storage/vectors/) documentation ;
+- `neighbors_index`: it defines the approximate neighbors index of texts vectors (random projections forest stored next to vectors), used by distance-based constraints sampling of large projects. See [interactive_clustering_gui/storage/neighbors_index](https://cognitivefactory.github.io/interactive-clustering-gui/reference/cognitivefactory/interactive_clustering_gui/storage/neighbors_index/) documentation ;
+- `distances`: it defines the distances between texts vectors (all pairwise distances for small projects, a kNN graph for large ones), computed once per modelization and reused by sampling and clustering of all iterations. See [interactive_clustering_gui/storage/distances](https://cognitivefactory.github.io/interactive-clustering-gui/reference/cognitivefactory/interactive_clustering_gui/storage/distances/) documentation ;
+- `modelization`: it defines the compact storage of modelization inference (the component of `"MUST_LINK"` constraints of each text, and the `"CANNOT_LINK"` adjacency of components), expanded on demand for a text. See [interactive_clustering_gui/storage/modelization](https://cognitivefactory.github.io/interactive-clustering-gui/reference/cognitivefactory/interactive_clustering_gui/storage/modelization/) documentation ;
+- `artifacts_cache`: it defines the process-level LRU cache of parsed project artifacts (JSON files like status, settings, modelization or clustering results), invalidated when files change. See [interactive_clustering_gui/storage/artifacts_cache](https://cognitivefactory.github.io/interactive-clustering-gui/reference/cognitivefactory/interactive_clustering_gui/storage/artifacts_cache/) documentation ;
+- `projects_registry`: it defines the process-level registry of existing projects and of their listing summary (metadata and status), updated when the data directory or project files change. See [interactive_clustering_gui/storage/projects_registry](https://cognitivefactory.github.io/interactive-clustering-gui/reference/cognitivefactory/interactive_clustering_gui/storage/projects_registry/) documentation ;
+- `executor`: it defines the bounded threads pool that runs blocking storage accesses (file I/O, JSON (de)serialization, SQLite queries, project locks) outside of the event loop. See [interactive_clustering_gui/storage/executor](https://cognitivefactory.github.io/interactive-clustering-gui/reference/cognitivefactory/interactive_clustering_gui/storage/executor/) documentation ;
+- `factory`: it defines the factory used to get the storage of a project, and the migration of legacy projects. See [interactive_clustering_gui/storage/factory](https://cognitivefactory.github.io/interactive-clustering-gui/reference/cognitivefactory/interactive_clustering_gui/storage/factory/) documentation.
+"""
@@ -0,0 +1,388 @@
+# -*- coding: utf-8 -*-
+
+"""
+* Name:         cognitivefactory.interactive_clustering_gui.storage.abstract
+* Description:  The abstract class used to define project storages.
+* Author:       Erwan Schild
+* Created:      18/10/2026
+* Licence:      CeCILL-C License v1.0 (https://cecill.info/licences.fr.html)
+"""
+
+# ==============================================================================
+# IMPORT PYTHON DEPENDENCIES
+# ==============================================================================
+
+import pathlib
+from abc import ABC, abstractmethod
+from typing import Any, ContextManager, Dict, List, Optional, Tuple
+
+# ==============================================================================
+# ABSTRACT PROJECT STORAGE
+# ==============================================================================
+
+
+class AbstractProjectStorage(ABC):
+    """
+    Abstract class that is used to define project storages.
+    A project storage handles the texts and the constraints of a project, with row-level reads and updates.
+    """
+
+    def __init__(
+        self,
+        project_directory: pathlib.Path,
+    ) -> None:
+        """
+        The constructor for project storage.
+
+        Args:
+            project_directory (pathlib.Path): The directory of the project.
+        """
+        self.project_directory: pathlib.Path = project_directory
+
+    # ==============================================================================
+    # ABSTRACT METHOD - TRANSACTION
+    # ==============================================================================
+    @abstractmethod
+    def transaction(self) -> ContextManager[None]:
+        """
+        (ABSTRACT METHOD)
+        Group several storage operations in one atomic transaction.
+
+        Returns:
+            ContextManager[None]: A context manager that commits on exit, or rollbacks on error.
+        """
+
+    # ==============================================================================
+    # ABSTRACT METHODS - TEXTS
+    # ==============================================================================
+    @abstractmethod
+    def get_texts(
+        self,
+        text_ids: Optional[List[str]] = None,
+    ) -> Dict[str, Dict[str, Any]]:
+        """
+        (ABSTRACT METHOD)
+        Get texts, in their insertion order.
+
+        Args:
+            text_ids (Optional[List[str]], optional): The IDs of texts to get. If `None`, get all texts. Defaults to `None`.
+
+        Returns:
+            Dict[str, Dict[str, Any]]: The requested texts.
+        """
+
+    @abstractmethod
+    def set_texts(
+        self,
+        texts: Dict[str, Dict[str, Any]],
+    ) -> None:
+        """
+        (ABSTRACT METHOD)
+        Replace all texts.
+
+        Args:
+            texts (Dict[str, Dict[str, Any]]): The new texts.
+        """
+
+    @abstractmethod
+    def update_texts(
+        self,
+        texts_updates: Dict[str, Dict[str, Any]],
+    ) -> None:
+        """
+        (ABSTRACT METHOD)
+        Update some fields of some texts.
+
+        Args:
+            texts_updates (Dict[str, Dict[str, Any]]): The fields to update for each text ID.
+        """
+
+    def get_text(
+        self,
+        text_id: str,
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Get a text.
+
+        Args:
+            text_id (str): The ID of the text to get.
+
+        Returns:
+            Optional[Dict[str, Any]]: The requested text, or `None` if it doesn't exist.
+        """
+        return self.get_texts(text_ids=[text_id]).get(text_id)
+
+    def query_texts(
+        self,
+        without_deleted_texts: bool = False,
+        filter_text: Optional[str] = None,
+        sorted_by: str = "id",
+        sorted_reverse: bool = False,
+        after_position: Optional[Tuple[Any, int]] = None,
+        offset: int = 0,
+        limit: Optional[int] = None,
+        fields: Optional[List[str]] = None,
+    ) -> Tuple[Dict[str, Dict[str, Any]], List[Tuple[Any, int]], int]:
+        """
+        Get a page of texts, filtered and sorted.
+        Texts are sorted by the requested field, then by insertion order (the sort is stable, even when reversed).
+        This default implementation loads all texts: storages with indexes should override it.
+
+        Args:
+            without_deleted_texts (bool, optional): The option to not return deleted texts. Defaults to `False`.
+            filter_text (Optional[str], optional): A substring that texts must contain (case insensitive). Defaults to `None`.
+            sorted_by (str, optional): The field to sort texts by. Can be `"id"`, `"alphabetical"` or `"is_deleted"`. Defaults to `"id"`.
+            sorted_reverse (bool, optional): The option to reverse texts order. Defaults to `False`.
+            after_position (Optional[Tuple[Any, int]], optional): The position (sort value and insertion rank) after which texts are returned. Defaults to `None`.
+            offset (int, optional): The number of texts to skip. Defaults to `0`.
+            limit (Optional[int], optional): The maximum number of texts to return. If `None`, return all texts. Defaults to `None`.
+            fields (Optional[List[str]], optional): The fields of texts to return. If `None`, return all fields. Defaults to `None`.
+
+        Returns:
+            Tuple[Dict[str, Dict[str, Any]], List[Tuple[Any, int]], int]: The requested texts, their positions, and the number of texts matching the filters.
+        """
+
+        # Filter texts, and compute their positions.
+        positioned_texts: List[Tuple[Tuple[Any, int], str, Dict[str, Any]]] = []
+        for rank, (text_id, text_value) in enumerate(self.get_texts().items()):
+            if without_deleted_texts and text_value["is_deleted"]:
+                continue
+            if filter_text is not None and filter_text.casefold() not in text_value["text"].casefold():
+                continue
+            sort_value: Any = (
+                text_id
+                if sorted_by == "id"
+                else (text_value["text_preprocessed"] if sorted_by == "alphabetical" else int(text_value["is_deleted"]))
+            )
+            positioned_texts.append(((sort_value, rank), text_id, text_value))
+        total: int = len(positioned_texts)
+
+        # Sort texts (a reversed sort keeps insertion order of equal values).
+        positioned_texts.sort(key=lambda positioned_text: positioned_text[0][1])
+        positioned_texts.sort(key=lambda positioned_text: positioned_text[0][0], reverse=sorted_reverse)
+
+        # Skip texts before the requested position.
+        if after_position is not None:
+            positioned_texts = [
+                positioned_text
+                for positioned_text in positioned_texts
+                if (
+                    (positioned_text[0][0] < after_position[0])
+                    if sorted_reverse
+                    else (positioned_text[0][0] > after_position[0])
+                )
+                or (positioned_text[0][0] == after_position[0] and positioned_text[0][1] > after_position[1])
+            ]
+
+        # Select the requested page and fields.
+        page: List[Tuple[Tuple[Any, int], str, Dict[str, Any]]] = positioned_texts[offset:][:limit]
+        return (
+            {
+                text_id: (
+                    text_value
+                    if fields is None
+                    else {field: field_value for field, field_value in text_value.items() if field in fields}
+                )
+                for _, text_id, text_value in page
+            },
+            [position for position, _, _ in page],
+            total,
+        )
+
+    # ==============================================================================
+    # ABSTRACT METHODS - CONSTRAINTS
+    # ==============================================================================
+    @abstractmethod
+    def get_constraints(
+        self,
+        constraint_ids: Optional[List[str]] = None,
+    ) -> Dict[str, Dict[str, Any]]:
+        """
+        (ABSTRACT METHOD)
+        Get constraints, in their insertion order.
+
+        Args:
+            constraint_ids (Optional[List[str]], optional): The IDs of constraints to get. If `None`, get all constraints. Defaults to `None`.
+
+        Returns:
+            Dict[str, Dict[str, Any]]: The requested constraints.
+        """
+
+    @abstractmethod
+    def get_constraints_of_texts(
+        self,
+        text_ids: List[str],
+    ) -> Dict[str, Dict[str, Any]]:
+        """
+        (ABSTRACT METHOD)
+        Get constraints involving at least one of the given texts.
+
+        Args:
+            text_ids (List[str]): The IDs of texts.
+
+        Returns:
+            Dict[str, Dict[str, Any]]: The constraints involving these texts.
+        """
+
+    @abstractmethod
+    def set_constraints(
+        self,
+        constraints: Dict[str, Dict[str, Any]],
+    ) -> None:
+        """
+        (ABSTRACT METHOD)
+        Replace all constraints.
+
+        Args:
+            constraints (Dict[str, Dict[str, Any]]): The new constraints.
+        """
+
+    @abstractmethod
+    def add_constraints(
+        self,
+        constraints: Dict[str, Dict[str, Any]],
+    ) -> None:
+        """
+        (ABSTRACT METHOD)
+        Add new constraints. Already known constraints are overwritten, but keep their position.
+
+        Args:
+            constraints (Dict[str, Dict[str, Any]]): The constraints to add.
+        """
+
+    @abstractmethod
+    def update_constraints(
+        self,
+        constraints_updates: Dict[str, Dict[str, Any]],
+    ) -> None:
+        """
+        (ABSTRACT METHOD)
+        Update some fields of some constraints.
+
+        Args:
+            constraints_updates (Dict[str, Dict[str, Any]]): The fields to update for each constraint ID.
+        """
+
+    def query_constraints(
+        self,
+        without_hidden_constraints: bool = False,
+        iteration_of_sampling: Optional[int] = None,
+        constraint_types: Optional[List[Optional[str]]] = None,
+        to_annotate: Optional[bool] = None,
+        to_review: Optional[bool] = None,
+        to_fix_conflict: Optional[bool] = None,
+        sorted_by: str = "id",
+        sorted_reverse: bool = False,
+        after_position: Optional[Tuple[Any, int]] = None,
+        offset: int = 0,
+        limit: Optional[int] = None,
+    ) -> Tuple[Dict[str, Dict[str, Any]], List[Tuple[Any, int]], int]:
+        """
+        Get a page of constraints, filtered and sorted.
+        Constraints are sorted by the requested option, then by insertion order (the sort is stable, even when reversed).
+        This default implementation loads all constraints and texts: storages with indexes should override it.
+
+        Args:
+            without_hidden_constraints (bool, optional): The option to not return hidden constraints. Defaults to `False`.
+            iteration_of_sampling (Optional[int], optional): The iteration of sampling of constraints to return. Defaults to `None`.
+            constraint_types (Optional[List[Optional[str]]], optional): The types of constraints to return (`None` for skipped constraints). Defaults to `None`.
+            to_annotate (Optional[bool], optional): The annotation status of constraints to return. Defaults to `None`.
+            to_review (Optional[bool], optional): The review status of constraints to return. Defaults to `None`.
+            to_fix_conflict (Optional[bool], optional): The conflict status of constraints to return. Defaults to `None`.
+            sorted_by (str, optional): The option to sort constraints by. Can be `"id"`, `"text"`, `"constraint_type"`, `"date_of_update"`, `"iteration_of_sampling"`, `"to_annotate"`, `"to_review"` or `"to_fix_conflict"`. Defaults to `"id"`.
+            sorted_reverse (bool, optional): The option to reverse constraints order. Defaults to `False`.
+            after_position (Optional[Tuple[Any, int]], optional): The position (sort value and insertion rank) after which constraints are returned. Defaults to `None`.
+            offset (int, optional): The number of constraints to skip. Defaults to `0`.
+            limit (Optional[int], optional): The maximum number of constraints to return. If `None`, return all constraints. Defaults to `None`.
+
+        Returns:
+            Tuple[Dict[str, Dict[str, Any]], List[Tuple[Any, int]], int]: The requested constraints, their positions, and the number of constraints matching the filters.
+        """
+
+        # Load texts, only if needed for the sort.
+        texts: Dict[str, Dict[str, Any]] = self.get_texts() if (sorted_by == "text") else {}
+
+        # Define the sort value of a constraint.
+        def get_sort_value(  # noqa: WPS430 (nested function)
+            constraint_id: str,
+            constraint_value: Dict[str, Any],
+        ) -> Any:
+            """Return the sort value of a constraint."""
+            if sorted_by == "text":
+                return [
+                    texts[constraint_value["data"]["id_1"]]["text"],
+                    texts[constraint_value["data"]["id_2"]]["text"],
+                ]
+            if sorted_by == "constraint_type":
+                return {"MUST_LINK": 0, "CANNOT_LINK": 1, None: 2}[constraint_value["constraint_type"]]
+            if sorted_by == "date_of_update":
+                return constraint_value["date_of_update"] if (constraint_value["date_of_update"] is not None) else 0
+            if sorted_by == "iteration_of_sampling":
+                return constraint_value["iteration_of_sampling"]
+            if sorted_by in {"to_annotate", "to_review", "to_fix_conflict"}:
+                return 1 - int(constraint_value[sorted_by])
+            return constraint_id
+
+        # Filter constraints, and compute their positions.
+        positioned_constraints: List[Tuple[Tuple[Any, int], str, Dict[str, Any]]] = []
+        for rank, (constraint_id, constraint_value) in enumerate(self.get_constraints().items()):
+            if (
+                (without_hidden_constraints and constraint_value["is_hidden"])
+                or (
+                    iteration_of_sampling is not None
+                    and constraint_value["iteration_of_sampling"] != iteration_of_sampling
+                )
+                or (constraint_types is not None and constraint_value["constraint_type"] not in constraint_types)
+                or (to_annotate is not None and constraint_value["to_annotate"] != to_annotate)
+                or (to_review is not None and constraint_value["to_review"] != to_review)
+                or (to_fix_conflict is not None and constraint_value["to_fix_conflict"] != to_fix_conflict)
+            ):
+                continue
+            positioned_constraints.append(
+                ((get_sort_value(constraint_id, constraint_value), rank), constraint_id, constraint_value)
+            )
+        total: int = len(positioned_constraints)
+
+        # Sort constraints (a reversed sort keeps insertion order of equal values).
+        positioned_constraints.sort(key=lambda positioned_constraint: positioned_constraint[0][1])
+        positioned_constraints.sort(
+            key=lambda positioned_constraint: positioned_constraint[0][0], reverse=sorted_reverse
+        )
+
+        # Skip constraints before the requested position.
+        if after_position is not None:
+            positioned_constraints = [
+                positioned_constraint
+                for positioned_constraint in positioned_constraints
+                if (
+                    (positioned_constraint[0][0] < after_position[0])
+                    if sorted_reverse
+                    else (positioned_constraint[0][0] > after_position[0])
+                )
+                or (
+                    positioned_constraint[0][0] == after_position[0] and positioned_constraint[0][1] > after_position[1]
+                )
+            ]
+
+        # Select the requested page.
+        page: List[Tuple[Tuple[Any, int], str, Dict[str, Any]]] = positioned_constraints[offset:][:limit]
+        return (
+            {constraint_id: constraint_value for _, constraint_id, constraint_value in page},
+            [position for position, _, _ in page],
+            total,
+        )
+
+    def get_constraint(
+        self,
+        constraint_id: str,
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Get a constraint.
+
+        Args:
+            constraint_id (str): The ID of the constraint to get.
+
+        Returns:
+            Optional[Dict[str, Any]]: The requested constraint, or `None` if it doesn't exist.
+        """
+        return self.get_constraints(constraint_ids=[constraint_id]).get(constraint_id)
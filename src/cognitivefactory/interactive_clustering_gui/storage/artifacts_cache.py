@@ -0,0 +1,300 @@
+# -*- coding: utf-8 -*-
+
+"""
+* Name:         cognitivefactory.interactive_clustering_gui.storage.artifacts_cache
+* Description:  Process-level LRU cache of parsed project artifacts (JSON files), invalidated on file change.
+* Author:       Erwan Schild
+* Created:      18/10/2026
+* Licence:      CeCILL-C License v1.0 (https://cecill.info/licences.fr.html)
+"""
+
+# ==============================================================================
+# IMPORT PYTHON DEPENDENCIES
+# ==============================================================================
+
+import copy
+import json
+import os
+import pathlib
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Optional, Tuple
+
+# ==============================================================================
+# CONFIGURE CACHE
+# ==============================================================================
+
+# Define `ARTIFACTS_CACHE_MAX_SIZE` (the memory budget of the cache, measured as the total size of cached JSON files, in bytes).
+# NB: parsed objects are several times larger than their JSON representation.
+ARTIFACTS_CACHE_MAX_SIZE: int = int(os.environ.get("ARTIFACTS_CACHE_MAX_SIZE", str(64 * 1024 * 1024)))
+
+# Delay under which a file modification is considered as too recent to trust the file version.
+# NB: modification times have the granularity of the system clock tick, so a file rewritten in the same tick
+# (with the same size) keeps its version. The content of such "racy" files is kept and compared on each access.
+RACY_DELAY_NS: int = 1_000_000_000
+
+
+# ==============================================================================
+# ARTIFACTS CACHE
+# ==============================================================================
+
+
+class ArtifactsCache:
+    """
+    A LRU cache of parsed JSON files, keyed by path and file version (modification time, size and inode).
+    A file modified by another process (a background task, a manual edit) gets a new version, so its outdated value is never served.
+    Cached values are shared between callers, and must not be modified (see `mutable` option of `load_json`).
+    """
+
+    def __init__(
+        self,
+        max_size: int,
+    ) -> None:
+        """
+        The constructor for `ArtifactsCache` class.
+
+        Args:
+            max_size (int): The memory budget of the cache, measured as the total size of cached JSON files, in bytes.
+        """
+        self.max_size: int = max_size
+        self.size: int = 0
+        self.hits: int = 0
+        self.misses: int = 0
+        # Entries by path: version, size, parsed content, and raw content of racy files (`None` once verified).
+        self._entries: "OrderedDict[str, Tuple[Tuple[int, int, int], int, Any, Optional[str]]]" = OrderedDict()
+        self._lock: threading.Lock = threading.Lock()
+
+    def _get(
+        self,
+        path_key: str,
+        version: Tuple[int, int, int],
+    ) -> Tuple[bool, Any]:
+        """
+        Get a cached value if its version is up to date, and mark it as the most recently used.
+        The value of a racy file is only returned if the file content is unchanged.
+
+        Args:
+            path_key (str): The path of the file.
+            version (Tuple[int, int, int]): The current version of the file.
+
+        Returns:
+            Tuple[bool, Any]: `True` and the cached value if it is up to date, `False` and `None` otherwise.
+        """
+
+        # Get the entry.
+        with self._lock:
+            entry: Optional[Tuple[Tuple[int, int, int], int, Any, Optional[str]]] = self._entries.get(path_key)
+            if entry is None or entry[0] != version:
+                self.misses += 1
+                return False, None
+            self._entries.move_to_end(path_key)
+
+        # Case of racy file: compare its content (cheaper than parsing), and trust its version once it is old enough.
+        if entry[3] is not None:
+            with open(path_key, "r") as fileobject:
+                is_unchanged: bool = fileobject.read() == entry[3]
+            with self._lock:
+                if not is_unchanged:
+                    self._pop(path_key=path_key)
+                    self.misses += 1
+                    return False, None
+                if time.time_ns() - version[0] > RACY_DELAY_NS and self._entries.get(path_key) is entry:
+                    self._entries[path_key] = (entry[0], entry[1], entry[2], None)
+
+        with self._lock:
+            self.hits += 1
+        return True, entry[2]
+
+    def _set(
+        self,
+        path_key: str,
+        version: Tuple[int, int, int],
+        value: Any,
+        content: str,
+    ) -> None:
+        """
+        Cache a value, and evict the least recently used values until the memory budget is respected.
+
+        Args:
+            path_key (str): The path of the file.
+            version (Tuple[int, int, int]): The version of the file.
+            value (Any): The parsed content of the file.
+            content (str): The raw content of the file (only kept if the file is racy).
+        """
+        with self._lock:
+            self._pop(path_key=path_key)
+
+            # Files larger than the memory budget are never cached.
+            size: int = version[1]
+            if size > self.max_size:
+                return
+            is_racy: bool = time.time_ns() - version[0] <= RACY_DELAY_NS
+            self._entries[path_key] = (version, size, value, (content if is_racy else None))
+            self.size += size
+
+            # Evict least recently used values.
+            while self.size > self.max_size:
+                self.size -= self._entries.popitem(last=False)[1][1]
+
+    def _pop(
+        self,
+        path_key: str,
+    ) -> None:
+        """
+        Remove a cached value, if any (the lock must be held).
+
+        Args:
+            path_key (str): The path of the file.
+        """
+        entry: Optional[Tuple[Tuple[int, int, int], int, Any, Optional[str]]] = self._entries.pop(path_key, None)
+        if entry is not None:
+            self.size -= entry[1]
+
+    def load_json(
+        self,
+        file_path: pathlib.Path,
+        mutable: bool = False,
+    ) -> Any:
+        """
+        Load a JSON file, from the cache if the file hasn't been modified since it was cached.
+
+        Args:
+            file_path (pathlib.Path): The path of the JSON file.
+            mutable (bool, optional): The option to get a copy of the content that can be modified. Defaults to `False`.
+
+        Raises:
+            FileNotFoundError: Raises error if the file doesn't exist.
+
+        Returns:
+            Any: The parsed content of the file.
+        """
+
+        # Get the current version of the file.
+        path_key: str = os.path.abspath(file_path)
+        file_stat: os.stat_result = os.stat(path_key)
+        version: Tuple[int, int, int] = (file_stat.st_mtime_ns, file_stat.st_size, file_stat.st_ino)
+
+        # Case of an up-to-date cached value.
+        is_cached, value = self._get(path_key=path_key, version=version)
+
+        # Otherwise parse the file (outside of the lock, to not block other files), and cache it.
+        if not is_cached:
+            with open(path_key, "r") as fileobject:
+                content: str = fileobject.read()
+            value = json.loads(content)
+            self._set(path_key=path_key, version=version, value=value, content=content)
+
+        return copy.deepcopy(value) if mutable else value
+
+    def store_json(
+        self,
+        file_path: pathlib.Path,
+        content: Any,
+    ) -> None:
+        """
+        Store a JSON file (through a temporary file, to never expose a partial file), and cache its content (write-through).
+
+        Args:
+            file_path (pathlib.Path): The path of the JSON file.
+            content (Any): The content to store.
+        """
+
+        # Serialize the content.
+        path_key: str = os.path.abspath(file_path)
+        serialized_content: str = json.dumps(content, indent=4)
+
+        # Write the file, and get its version before exposing it (a replacement keeps the modification time and inode).
+        with open(path_key + ".tmp", "w") as fileobject:
+            fileobject.write(serialized_content)
+            fileobject.flush()
+            file_stat: os.stat_result = os.fstat(fileobject.fileno())
+        os.replace(path_key + ".tmp", path_key)
+
+        # Cache the content as it would be loaded (JSON converts tuples into lists, and keys into strings).
+        self._set(
+            path_key=path_key,
+            version=(file_stat.st_mtime_ns, file_stat.st_size, file_stat.st_ino),
+            value=json.loads(serialized_content),
+            content=serialized_content,
+        )
+
+    def invalidate(
+        self,
+        directory_path: pathlib.Path,
+    ) -> None:
+        """
+        Remove all cached values of files in a directory (for example when a project is deleted).
+
+        Args:
+            directory_path (pathlib.Path): The path of the directory.
+        """
+        directory_prefix: str = os.path.join(os.path.abspath(directory_path), "")
+        with self._lock:
+            for path_key in [path_key for path_key in self._entries.keys() if path_key.startswith(directory_prefix)]:
+                self._pop(path_key=path_key)
+
+    def clear(self) -> None:
+        """
+        Remove all cached values, and reset statistics.
+        """
+        with self._lock:
+            self._entries.clear()
+            self.size = 0
+            self.hits = 0
+            self.misses = 0
+
+    def get_statistics(self) -> Dict[str, int]:
+        """
+        Get the statistics of the cache.
+
+        Returns:
+            Dict[str, int]: The number of cached files, their total size, and the numbers of hits and misses.
+        """
+        with self._lock:
+            return {
+                "entries": len(self._entries),
+                "size": self.size,
+                "max_size": self.max_size,
+                "hits": self.hits,
+                "misses": self.misses,
+            }
+
+
+# ==============================================================================
+# DEFAULT CACHE
+# ==============================================================================
+
+# The cache shared by the web server process.
+artifacts_cache: ArtifactsCache = ArtifactsCache(max_size=ARTIFACTS_CACHE_MAX_SIZE)
+
+
+def load_json(
+    file_path: pathlib.Path,
+    mutable: bool = False,
+) -> Any:
+    """
+    Load a JSON file through the default cache. See `ArtifactsCache.load_json`.
+
+    Args:
+        file_path (pathlib.Path): The path of the JSON file.
+        mutable (bool, optional): The option to get a copy of the content that can be modified. Defaults to `False`.
+
+    Returns:
+        Any: The parsed content of the file.
+    """
+    return artifacts_cache.load_json(file_path=file_path, mutable=mutable)
+
+
+def store_json(
+    file_path: pathlib.Path,
+    content: Any,
+) -> None:
+    """
+    Store a JSON file through the default cache. See `ArtifactsCache.store_json`.
+
+    Args:
+        file_path (pathlib.Path): The path of the JSON file.
+        content (Any): The content to store.
+    """
+    artifacts_cache.store_json(file_path=file_path, content=content)
@@ -0,0 +1,271 @@
+# -*- coding: utf-8 -*-
+
+"""
+* Name:         cognitivefactory.interactive_clustering_gui.storage.constraints_journal
+* Description:  Incremental update of the constraints manager, based on a journal of the constraints it contains.
+* Author:       Erwan Schild
+* Created:      18/10/2026
+* Licence:      CeCILL-C License v1.0 (https://cecill.info/licences.fr.html)
+"""
+
+# ==============================================================================
+# IMPORT PYTHON DEPENDENCIES
+# ==============================================================================
+
+import json
+import os
+import pathlib
+import pickle  # noqa: S403
+from typing import Any, Dict, List, Optional, Tuple
+
+from cognitivefactory.interactive_clustering.constraints.binary import BinaryConstraintsManager
+
+# ==============================================================================
+# JOURNAL FILES
+# ==============================================================================
+
+# Names of the constraints manager file and of its journal in the project directory.
+CONSTRAINTS_MANAGER_NAME: str = "constraints_manager.pkl"
+CONSTRAINTS_MANAGER_JOURNAL_NAME: str = "constraints_manager_journal.json"
+
+
+# ==============================================================================
+# ANNOTATED CONSTRAINTS
+# ==============================================================================
+
+
+def get_annotated_constraints(
+    constraints: Dict[str, Dict[str, Any]],
+) -> Dict[str, str]:
+    """
+    Get the constraints that have to be handled by the constraints manager (annotated and not hidden).
+
+    Args:
+        constraints (Dict[str, Dict[str, Any]]): The constraints of the project.
+
+    Returns:
+        Dict[str, str]: The type of each annotated constraint, by constraint ID.
+    """
+    return {
+        constraint_id: constraint_value["constraint_type"]
+        for constraint_id, constraint_value in constraints.items()
+        if constraint_value["constraint_type"] in {"MUST_LINK", "CANNOT_LINK"}
+        and constraint_value["is_hidden"] is False
+    }
+
+
+# ==============================================================================
+# FULL REBUILD
+# ==============================================================================
+
+
+def rebuild_constraints_manager(
+    list_of_data_IDs: List[str],
+    constraints: Dict[str, Dict[str, Any]],
+) -> Tuple[BinaryConstraintsManager, List[str]]:
+    """
+    Build a new constraints manager by replaying all annotated constraints ("CANNOT_LINK" first, then "MUST_LINK").
+
+    Args:
+        list_of_data_IDs (List[str]): The IDs of managed texts.
+        constraints (Dict[str, Dict[str, Any]]): The constraints of the project.
+
+    Returns:
+        Tuple[BinaryConstraintsManager, List[str]]: The new constraints manager, and the IDs of "MUST_LINK" constraints in conflict.
+    """
+
+    # Initialize constraints manager with managed texts IDs.
+    new_constraints_manager: BinaryConstraintsManager = BinaryConstraintsManager(list_of_data_IDs=list_of_data_IDs)
+
+    # Get annotated constraints.
+    annotated_constraints: Dict[str, str] = get_annotated_constraints(constraints=constraints)
+
+    # First, update constraints manager with "CANNOT_LINK" constraints.
+    for constraint_CL_id, constraint_CL_type in annotated_constraints.items():
+        if constraint_CL_type == "CANNOT_LINK":
+            new_constraints_manager.add_constraint(
+                data_ID1=constraints[constraint_CL_id]["data"]["id_1"],
+                data_ID2=constraints[constraint_CL_id]["data"]["id_2"],
+                constraint_type="CANNOT_LINK",
+            )  # No conflict can append, at this step the constraints manager handle only constraints of same type.
+
+    # Then, update constraints manager with "MUST_LINK" constraints.
+    list_of_conflicts: List[str] = []
+    for constraint_ML_id, constraint_ML_type in annotated_constraints.items():
+        if constraint_ML_type == "MUST_LINK":
+            try:
+                new_constraints_manager.add_constraint(
+                    data_ID1=constraints[constraint_ML_id]["data"]["id_1"],
+                    data_ID2=constraints[constraint_ML_id]["data"]["id_2"],
+                    constraint_type="MUST_LINK",
+                )  # Conflicts can append.
+            except ValueError:
+                list_of_conflicts.append(constraint_ML_id)
+
+    # Return the constraints manager and conflicts.
+    return new_constraints_manager, list_of_conflicts
+
+
+# ==============================================================================
+# INCREMENTAL UPDATE
+# ==============================================================================
+
+
+def _load_previous_constraints_manager(
+    project_directory: pathlib.Path,
+) -> Optional[Tuple[BinaryConstraintsManager, Dict[str, Any]]]:
+    """
+    Load the previous constraints manager and its journal.
+
+    Args:
+        project_directory (pathlib.Path): The directory of the project.
+
+    Returns:
+        Optional[Tuple[BinaryConstraintsManager, Dict[str, Any]]]: The previous constraints manager and its journal, or `None` if one of them is missing.
+    """
+
+    # Case of missing files.
+    if (
+        not (project_directory / CONSTRAINTS_MANAGER_NAME).exists()
+        or not (project_directory / CONSTRAINTS_MANAGER_JOURNAL_NAME).exists()
+    ):
+        return None
+
+    # Load files (unreadable files lead to a full rebuild).
+    try:
+        with open(project_directory / CONSTRAINTS_MANAGER_NAME, "rb") as constraints_manager_fileobject:
+            constraints_manager: BinaryConstraintsManager = pickle.load(  # noqa: S301  # Usage of Pickle
+                constraints_manager_fileobject
+            )
+        with open(project_directory / CONSTRAINTS_MANAGER_JOURNAL_NAME, "r") as journal_fileobject:
+            journal: Dict[str, Any] = json.load(journal_fileobject)
+    except Exception:
+        return None
+    return constraints_manager, journal
+
+
+def _apply_journal_additions(
+    constraints_manager: BinaryConstraintsManager,
+    journal: Dict[str, Any],
+    list_of_data_IDs: List[str],
+    constraints: Dict[str, Dict[str, Any]],
+) -> Optional[List[str]]:
+    """
+    Apply on the previous constraints manager the constraints annotated since its journal.
+    Only additions are applied: a retraction (deleted text, hidden or modified constraint) invalidates the transitivity,
+    and a new conflict depends on the order of constraints replay, so both require a full rebuild.
+
+    Args:
+        constraints_manager (BinaryConstraintsManager): The previous constraints manager (updated in place).
+        journal (Dict[str, Any]): The journal of the previous constraints manager.
+        list_of_data_IDs (List[str]): The IDs of managed texts.
+        constraints (Dict[str, Dict[str, Any]]): The constraints of the project.
+
+    Returns:
+        Optional[List[str]]: The IDs of "MUST_LINK" constraints in conflict, or `None` if a full rebuild is needed.
+    """
+
+    # Case of managed texts update (deleted or undeleted texts).
+    if journal["list_of_data_IDs"] != list_of_data_IDs:
+        return None
+
+    # Get annotated constraints, and check that no previous constraint has been retracted.
+    annotated_constraints: Dict[str, str] = get_annotated_constraints(constraints=constraints)
+    previous_constraints: Dict[str, str] = journal["constraints"]
+    for previous_constraint_id, previous_constraint_type in previous_constraints.items():
+        if annotated_constraints.get(previous_constraint_id) != previous_constraint_type:
+            return None
+
+    # Apply new constraints ("CANNOT_LINK" first, then "MUST_LINK", as in a full rebuild).
+    for constraint_type in ("CANNOT_LINK", "MUST_LINK"):
+        for constraint_id, annotated_constraint_type in annotated_constraints.items():
+            if constraint_id in previous_constraints.keys() or annotated_constraint_type != constraint_type:
+                continue
+            try:
+                constraints_manager.add_constraint(
+                    data_ID1=constraints[constraint_id]["data"]["id_1"],
+                    data_ID2=constraints[constraint_id]["data"]["id_2"],
+                    constraint_type=constraint_type,
+                )
+            except ValueError:
+                return None
+
+    # Previous conflicts are still in conflict, as constraints are only added.
+    return list(journal["conflicts"])
+
+
+def update_constraints_manager(
+    project_directory: pathlib.Path,
+    list_of_data_IDs: List[str],
+    constraints: Dict[str, Dict[str, Any]],
+) -> Tuple[BinaryConstraintsManager, List[str]]:
+    """
+    Update the constraints manager of a project with its annotated constraints, and store it with its journal.
+    The previous constraints manager is updated incrementally with constraints annotated since its journal,
+    and is fully rebuilt only when it is missing or when a retraction invalidates its transitivity.
+
+    Args:
+        project_directory (pathlib.Path): The directory of the project.
+        list_of_data_IDs (List[str]): The IDs of managed texts.
+        constraints (Dict[str, Dict[str, Any]]): The constraints of the project.
+
+    Returns:
+        Tuple[BinaryConstraintsManager, List[str]]: The updated constraints manager, and the IDs of "MUST_LINK" constraints in conflict.
+    """
+
+    # Try an incremental update.
+    constraints_manager: Optional[BinaryConstraintsManager] = None
+    list_of_conflicts: Optional[List[str]] = None
+    previous: Optional[Tuple[BinaryConstraintsManager, Dict[str, Any]]] = _load_previous_constraints_manager(
+        project_directory=project_directory
+    )
+    if previous is not None:
+        constraints_manager, journal = previous
+        list_of_conflicts = _apply_journal_additions(
+            constraints_manager=constraints_manager,
+            journal=journal,
+            list_of_data_IDs=list_of_data_IDs,
+            constraints=constraints,
+        )
+
+    # Otherwise, fully rebuild the constraints manager.
+    if constraints_manager is None or list_of_conflicts is None:
+        constraints_manager, list_of_conflicts = rebuild_constraints_manager(
+            list_of_data_IDs=list_of_data_IDs,
+            constraints=constraints,
+        )
+
+    # Remove the previous journal, that doesn't describe the constraints manager anymore.
+    if (project_directory / CONSTRAINTS_MANAGER_JOURNAL_NAME).exists():
+        os.remove(project_directory / CONSTRAINTS_MANAGER_JOURNAL_NAME)
+
+    # Store the constraints manager (through a temporary file, to avoid a partial constraints manager).
+    with open(project_directory / (CONSTRAINTS_MANAGER_NAME + ".tmp"), "wb") as constraints_manager_fileobject:
+        pickle.dump(
+            constraints_manager,
+            constraints_manager_fileobject,
+            pickle.HIGHEST_PROTOCOL,
+        )
+    os.replace(
+        project_directory / (CONSTRAINTS_MANAGER_NAME + ".tmp"),
+        project_directory / CONSTRAINTS_MANAGER_NAME,
+    )
+
+    # Store its journal (through a temporary file, to avoid a partial journal).
+    with open(project_directory / (CONSTRAINTS_MANAGER_JOURNAL_NAME + ".tmp"), "w") as journal_fileobject:
+        json.dump(
+            {
+                "list_of_data_IDs": list_of_data_IDs,
+                "constraints": get_annotated_constraints(constraints=constraints),
+                "conflicts": list_of_conflicts,
+            },
+            journal_fileobject,
+            indent=4,
+        )
+    os.replace(
+        project_directory / (CONSTRAINTS_MANAGER_JOURNAL_NAME + ".tmp"),
+        project_directory / CONSTRAINTS_MANAGER_JOURNAL_NAME,
+    )
+
+    # Return the constraints manager and conflicts.
+    return constraints_manager, list_of_conflicts
@@ -0,0 +1,368 @@
+# -*- coding: utf-8 -*-
+
+"""
+* Name:         cognitivefactory.interactive_clustering_gui.storage.distances
+* Description:  Distances between texts vectors (pairwise distances or kNN graph), computed once per modelization and shared by sampling and clustering.
+* Author:       Erwan Schild
+* Created:      18/10/2026
+* Licence:      CeCILL-C License v1.0 (https://cecill.info/licences.fr.html)
+"""
+
+# ==============================================================================
+# IMPORT PYTHON DEPENDENCIES
+# ==============================================================================
+
+import json
+import os
+import pathlib
+from typing import Any, Dict, List, Optional, Tuple
+
+import numpy as np
+from scipy.sparse import csr_matrix
+from sklearn.metrics.pairwise import euclidean_distances
+
+from cognitivefactory.interactive_clustering_gui.storage.neighbors_index import NeighborsIndex, get_neighbors_index
+from cognitivefactory.interactive_clustering_gui.storage.vectors import get_vectors_version, load_vectors_matrix
+
+# ==============================================================================
+# CONFIGURE DISTANCES
+# ==============================================================================
+
+# Define `PAIRWISE_DISTANCES_MAX_TEXTS` (the number of texts up to which all pairwise distances are stored, otherwise only a kNN graph).
+PAIRWISE_DISTANCES_MAX_TEXTS: int = int(os.environ.get("PAIRWISE_DISTANCES_MAX_TEXTS", "2000"))
+
+# Number of neighbors of each text in the kNN graph.
+KNN_GRAPH_NB_NEIGHBORS: int = 16
+
+# Names of the distances files (raw arrays, and the description file written last, so it marks complete distances).
+PAIRWISE_DISTANCES_NAME: str = "pairwise_distances.npy"
+KNN_GRAPH_NAME: str = "knn_graph.npz"
+DISTANCES_INDEX_NAME: str = "distances_index.json"
+
+
+# ==============================================================================
+# DISTANCES
+# ==============================================================================
+
+
+class Distances:
+    """
+    The euclidean distances between texts vectors, computed once per modelization:
+    - for small projects, all pairwise distances (stored squared, as computed by `sklearn`, so that results are unchanged) ;
+    - for large projects, a kNN graph (the closest candidates of the neighbors index of each text).
+    """
+
+    def __init__(
+        self,
+        list_of_data_IDs: List[str],
+        squared_distances: Optional[np.ndarray] = None,
+        knn_graph: Optional[Tuple[np.ndarray, np.ndarray, np.ndarray]] = None,
+    ) -> None:
+        """
+        The constructor for `Distances` class.
+
+        Args:
+            list_of_data_IDs (List[str]): The IDs of texts (in the order of vectors matrix rows).
+            squared_distances (Optional[np.ndarray], optional): The squared pairwise distances (small projects). Defaults to `None`.
+            knn_graph (Optional[Tuple[np.ndarray, np.ndarray, np.ndarray]], optional): The edges of the kNN graph, as rows of first and second texts (first row is the lowest) and their distances (large projects). Defaults to `None`.
+        """
+        self.list_of_data_IDs: List[str] = list_of_data_IDs
+        self.squared_distances: Optional[np.ndarray] = squared_distances
+        self.knn_graph: Optional[Tuple[np.ndarray, np.ndarray, np.ndarray]] = knn_graph
+
+    # ==============================================================================
+    # BUILD
+    # ==============================================================================
+    @classmethod
+    def build(
+        cls,
+        list_of_data_IDs: List[str],
+        matrix: csr_matrix,
+        neighbors_index: Optional[NeighborsIndex] = None,
+    ) -> "Distances":
+        """
+        Compute the distances between vectors.
+
+        Args:
+            list_of_data_IDs (List[str]): The IDs of texts (in the order of vectors matrix rows).
+            matrix (csr_matrix): The matrix of vectors.
+            neighbors_index (Optional[NeighborsIndex], optional): The neighbors index of vectors, used to build the kNN graph of large projects (built if `None`). Defaults to `None`.
+
+        Returns:
+            Distances: The distances.
+        """
+
+        # Case of small project: all pairwise distances.
+        if len(list_of_data_IDs) <= PAIRWISE_DISTANCES_MAX_TEXTS:
+            return cls(
+                list_of_data_IDs=list_of_data_IDs,
+                squared_distances=euclidean_distances(X=matrix, squared=True),
+            )
+
+        # Case of large project without stored neighbors index (cf. `NEIGHBORS_INDEX_MIN_TEXTS` greater than `PAIRWISE_DISTANCES_MAX_TEXTS`):
+        # build one, as pairwise distances don't fit in memory.
+        if neighbors_index is None:
+            neighbors_index = NeighborsIndex.build(list_of_data_IDs=list_of_data_IDs, matrix=matrix)
+
+        # Case of large project: keep the closest candidates of each text.
+        rows_1, rows_2, distances = neighbors_index.get_closest_candidates(matrix=matrix)
+        edges_rows: np.ndarray = np.concatenate([rows_1, rows_2])
+        edges_distances: np.ndarray = np.concatenate([distances, distances])
+        order: np.ndarray = np.lexsort((edges_distances, edges_rows))
+        ranks: np.ndarray = np.arange(len(order)) - np.searchsorted(edges_rows[order], edges_rows[order])
+        kept_edges: np.ndarray = np.zeros(len(rows_1), dtype=bool)
+        kept_edges[order[ranks < KNN_GRAPH_NB_NEIGHBORS] % len(rows_1)] = True
+        return cls(
+            list_of_data_IDs=list_of_data_IDs,
+            knn_graph=(rows_1[kept_edges], rows_2[kept_edges], distances[kept_edges]),
+        )
+
+    # ==============================================================================
+    # USAGES
+    # ==============================================================================
+    def get_closest_candidates(self) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Get candidate pairs of close texts: all pairs for small projects, edges of the kNN graph otherwise.
+
+        Returns:
+            Tuple[np.ndarray, np.ndarray, np.ndarray]: The rows of the first and second texts of candidate pairs (first row is the lowest), and their distances.
+        """
+        if self.knn_graph is not None:
+            return self.knn_graph
+        return self.get_all_pairs()
+
+    def get_all_pairs(
+        self,
+        groups: Optional[np.ndarray] = None,
+    ) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Get all pairs of texts and their distances (only for small projects).
+
+        Args:
+            groups (Optional[np.ndarray], optional): The group of each text (such as its cluster), to only get pairs in the same group. Defaults to `None`.
+
+        Raises:
+            ValueError: Raises error if pairwise distances aren't computed.
+
+        Returns:
+            Tuple[np.ndarray, np.ndarray, np.ndarray]: The rows of the first and second texts of pairs (first row is the lowest), and their distances.
+        """
+        if self.squared_distances is None:
+            raise ValueError(
+                "Pairwise distances are only computed for projects of at most `PAIRWISE_DISTANCES_MAX_TEXTS` texts."
+            )
+        rows_1, rows_2 = np.triu_indices(len(self.list_of_data_IDs), k=1)
+        if groups is not None:
+            rows_1, rows_2 = rows_1[groups[rows_1] == groups[rows_2]], rows_2[groups[rows_1] == groups[rows_2]]
+        return rows_1, rows_2, np.sqrt(self.squared_distances[rows_1, rows_2])
+
+    def get_euclidean_distances(
+        self,
+        list_of_data_IDs: List[str],
+    ) -> np.ndarray:
+        """
+        Get the pairwise euclidean distances of some texts (only for small projects), as computed by `sklearn.metrics.pairwise_distances`.
+
+        Args:
+            list_of_data_IDs (List[str]): The IDs of texts.
+
+        Returns:
+            np.ndarray: The pairwise euclidean distances, in the order of `list_of_data_IDs`.
+        """
+        return np.sqrt(self._get_squared_distances(list_of_data_IDs=list_of_data_IDs))
+
+    def get_rbf_kernel(
+        self,
+        list_of_data_IDs: List[str],
+        gamma: float,
+    ) -> np.ndarray:
+        """
+        Get the pairwise RBF kernel of some texts (only for small projects), as computed by `sklearn.metrics.pairwise_kernels`.
+
+        Args:
+            list_of_data_IDs (List[str]): The IDs of texts.
+            gamma (float): The coefficient of the RBF kernel (`sklearn` uses `1 / nb_features`).
+
+        Returns:
+            np.ndarray: The pairwise RBF kernel, in the order of `list_of_data_IDs`.
+        """
+        kernel: np.ndarray = self._get_squared_distances(list_of_data_IDs=list_of_data_IDs)
+        kernel *= -gamma
+        np.exp(kernel, kernel)
+        return kernel
+
+    def _get_squared_distances(
+        self,
+        list_of_data_IDs: List[str],
+    ) -> np.ndarray:
+        """
+        Get a copy of the squared pairwise distances of some texts.
+
+        Args:
+            list_of_data_IDs (List[str]): The IDs of texts.
+
+        Raises:
+            ValueError: Raises error if pairwise distances aren't computed.
+
+        Returns:
+            np.ndarray: The squared pairwise distances, in the order of `list_of_data_IDs`.
+        """
+        if self.squared_distances is None:
+            raise ValueError(
+                "Pairwise distances are only computed for projects of at most `PAIRWISE_DISTANCES_MAX_TEXTS` texts."
+            )
+        dict_of_rows: Dict[str, int] = {data_ID: row for row, data_ID in enumerate(self.list_of_data_IDs)}
+        rows: np.ndarray = np.array([dict_of_rows[data_ID] for data_ID in list_of_data_IDs], dtype=np.int64)
+        return np.array(self.squared_distances[np.ix_(rows, rows)], dtype=np.float64)
+
+    # ==============================================================================
+    # STORAGE
+    # ==============================================================================
+    def store(
+        self,
+        project_directory: pathlib.Path,
+        vectors_version: Optional[int],
+    ) -> None:
+        """
+        Store the distances next to the vectors they are computed from.
+
+        Args:
+            project_directory (pathlib.Path): The directory of the project.
+            vectors_version (Optional[int]): The version of vectors (see `get_vectors_version`).
+        """
+
+        # Remove the description first: incomplete distances are detected as missing.
+        remove_distances(project_directory=project_directory)
+
+        # Store arrays (through temporary files, to avoid partial arrays).
+        if self.squared_distances is not None:
+            with open(project_directory / (PAIRWISE_DISTANCES_NAME + ".tmp"), "wb") as distances_fileobject:
+                np.save(distances_fileobject, self.squared_distances, allow_pickle=False)
+            os.replace(
+                project_directory / (PAIRWISE_DISTANCES_NAME + ".tmp"), project_directory / PAIRWISE_DISTANCES_NAME
+            )
+        if self.knn_graph is not None:
+            with open(project_directory / (KNN_GRAPH_NAME + ".tmp"), "wb") as graph_fileobject:
+                np.savez(
+                    graph_fileobject, rows_1=self.knn_graph[0], rows_2=self.knn_graph[1], distances=self.knn_graph[2]
+                )
+            os.replace(project_directory / (KNN_GRAPH_NAME + ".tmp"), project_directory / KNN_GRAPH_NAME)
+
+        # Store description.
+        with open(project_directory / (DISTANCES_INDEX_NAME + ".tmp"), "w") as index_fileobject:
+            json.dump(
+                {
+                    "vectors_version": vectors_version,
+                    "list_of_data_IDs": self.list_of_data_IDs,
+                },
+                index_fileobject,
+            )
+        os.replace(project_directory / (DISTANCES_INDEX_NAME + ".tmp"), project_directory / DISTANCES_INDEX_NAME)
+
+    @classmethod
+    def load(
+        cls,
+        project_directory: pathlib.Path,
+        vectors_version: Optional[int],
+    ) -> Optional["Distances"]:
+        """
+        Load the distances of the project, if they are computed from the current vectors.
+        Pairwise distances are memory-mapped, so processes share them through the page cache.
+
+        Args:
+            project_directory (pathlib.Path): The directory of the project.
+            vectors_version (Optional[int]): The version of current vectors (see `get_vectors_version`).
+
+        Returns:
+            Optional[Distances]: The distances, or `None` if they are missing or outdated.
+        """
+
+        # Load description.
+        if not (project_directory / DISTANCES_INDEX_NAME).exists():
+            return None
+        with open(project_directory / DISTANCES_INDEX_NAME, "r") as index_fileobject:
+            index: Dict[str, Any] = json.load(index_fileobject)
+        if vectors_version is None or index["vectors_version"] != vectors_version:
+            return None
+
+        # Load arrays.
+        knn_graph: Optional[Tuple[np.ndarray, np.ndarray, np.ndarray]] = None
+        if (project_directory / KNN_GRAPH_NAME).exists():
+            with np.load(project_directory / KNN_GRAPH_NAME, allow_pickle=False) as graph_arrays:
+                knn_graph = (graph_arrays["rows_1"], graph_arrays["rows_2"], graph_arrays["distances"])
+        return cls(
+            list_of_data_IDs=index["list_of_data_IDs"],
+            squared_distances=(
+                np.load(project_directory / PAIRWISE_DISTANCES_NAME, mmap_mode="r", allow_pickle=False)
+                if (project_directory / PAIRWISE_DISTANCES_NAME).exists()
+                else None
+            ),
+            knn_graph=knn_graph,
+        )
+
+
+# ==============================================================================
+# DISTANCES OF A PROJECT
+# ==============================================================================
+
+
+def remove_distances(
+    project_directory: pathlib.Path,
+) -> None:
+    """
+    Remove the stored distances.
+
+    Args:
+        project_directory (pathlib.Path): The directory of the project.
+    """
+    for distances_file_name in (DISTANCES_INDEX_NAME, PAIRWISE_DISTANCES_NAME, KNN_GRAPH_NAME):
+        if (project_directory / distances_file_name).exists():
+            os.remove(project_directory / distances_file_name)
+
+
+def update_distances(
+    project_directory: pathlib.Path,
+) -> Distances:
+    """
+    Compute and store the distances of current vectors.
+
+    Args:
+        project_directory (pathlib.Path): The directory of the project.
+
+    Returns:
+        Distances: The distances.
+    """
+    vectors_version: Optional[int] = get_vectors_version(project_directory=project_directory)
+    list_of_data_IDs, matrix = load_vectors_matrix(project_directory=project_directory)
+    distances: Distances = Distances.build(
+        list_of_data_IDs=list_of_data_IDs,
+        matrix=matrix,
+        neighbors_index=(
+            get_neighbors_index(project_directory=project_directory)
+            if len(list_of_data_IDs) > PAIRWISE_DISTANCES_MAX_TEXTS
+            else None
+        ),
+    )
+    distances.store(project_directory=project_directory, vectors_version=vectors_version)
+    return distances
+
+
+def get_distances(
+    project_directory: pathlib.Path,
+) -> Distances:
+    """
+    Get the distances of current vectors (computed and stored if missing or outdated).
+
+    Args:
+        project_directory (pathlib.Path): The directory of the project.
+
+    Returns:
+        Distances: The distances.
+    """
+    distances: Optional[Distances] = Distances.load(
+        project_directory=project_directory,
+        vectors_version=get_vectors_version(project_directory=project_directory),
+    )
+    if distances is not None:
+        return distances
+    return update_distances(project_directory=project_directory)
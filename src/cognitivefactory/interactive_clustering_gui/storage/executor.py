@@ -0,0 +1,136 @@
+# -*- coding: utf-8 -*-
+
+"""
+* Name:         cognitivefactory.interactive_clustering_gui.storage.executor
+* Description:  Bounded threads pool that runs blocking storage accesses (file I/O, JSON (de)serialization, SQLite queries) outside of the event loop.
+* Author:       Erwan Schild
+* Created:      18/10/2026
+* Licence:      CeCILL-C License v1.0 (https://cecill.info/licences.fr.html)
+"""
+
+# ==============================================================================
+# IMPORT PYTHON DEPENDENCIES
+# ==============================================================================
+
+import asyncio
+import functools
+import os
+import pathlib
+import threading
+import weakref
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, TypeVar
+
+from filelock import FileLock
+
+# ==============================================================================
+# CONFIGURE EXECUTOR
+# ==============================================================================
+
+# Define `IO_WORKERS_NUMBER` (the maximum number of blocking storage accesses running at the same time).
+IO_WORKERS_NUMBER: int = int(os.environ.get("IO_WORKERS_NUMBER", "8"))
+
+# Name of the lock file that protects the status of a project (shared with the workers pool).
+PROJECT_LOCK_NAME: str = "status.json.lock"
+
+# The threads pool of storage accesses.
+io_executor: ThreadPoolExecutor = ThreadPoolExecutor(
+    max_workers=IO_WORKERS_NUMBER,
+    thread_name_prefix="storage-io",
+)
+
+# The threads pool of locked storage accesses (threads waiting for a project lock never delay other storage accesses).
+locked_io_executor: ThreadPoolExecutor = ThreadPoolExecutor(
+    max_workers=IO_WORKERS_NUMBER,
+    thread_name_prefix="storage-locked-io",
+)
+
+# Return type of functions run in the threads pool.
+T = TypeVar("T")  # noqa: WPS111 (too short name)
+
+
+# ==============================================================================
+# RUN BLOCKING STORAGE ACCESSES
+# ==============================================================================
+
+
+async def run_io(
+    function: Callable[..., T],
+    /,
+    *args: Any,
+    **kwargs: Any,
+) -> T:
+    """
+    Run a blocking function in the threads pool of storage accesses, without blocking the event loop.
+    Exceptions (such as `HTTPException`) are raised in the caller. The function is positional-only, so its own keyword arguments can be named `function`.
+
+    Args:
+        function (Callable[..., T]): The blocking function to run.
+        *args (Any): The positional arguments of the function.
+        **kwargs (Any): The keyword arguments of the function.
+
+    Returns:
+        T: The result of the function.
+    """
+    return await asyncio.get_running_loop().run_in_executor(
+        io_executor,
+        functools.partial(function, *args, **kwargs),
+    )
+
+
+# ==============================================================================
+# RUN LOCKED STORAGE ACCESSES
+# ==============================================================================
+
+# Locks of projects in the current process (a lock is forgotten once no thread uses it, such as after a project deletion).
+_project_thread_locks: "weakref.WeakValueDictionary[str, threading.Lock]" = weakref.WeakValueDictionary()
+_project_thread_locks_lock: threading.Lock = threading.Lock()
+
+
+def _run_with_project_lock(
+    project_directory: pathlib.Path,
+    function: Callable[[], T],
+) -> T:
+    """
+    Run a blocking function with the project locked, in the current thread.
+    Threads of the current process wait for their turn on a thread lock, then the status file is locked (this file lock is also used by background tasks of other processes).
+    Both locks are handed over between threads without going through the event loop, so that updates of a busy project are not slowed down by other requests.
+
+    Args:
+        project_directory (pathlib.Path): The directory of the project.
+        function (Callable[[], T]): The blocking function to run.
+
+    Returns:
+        T: The result of the function.
+    """
+
+    # Get the lock of the project in the current process.
+    lock_key: str = os.path.abspath(project_directory)
+    with _project_thread_locks_lock:
+        project_thread_lock: threading.Lock = _project_thread_locks.setdefault(lock_key, threading.Lock())
+
+    # Run the function with both locks.
+    with project_thread_lock:
+        with FileLock(str(project_directory / PROJECT_LOCK_NAME)):
+            return function()
+
+
+async def run_io_with_project_lock(
+    project_directory: pathlib.Path,
+    function: Callable[[], T],
+) -> T:
+    """
+    Run a blocking function in the threads pool of locked storage accesses, with the project locked.
+    Exceptions (such as `HTTPException`) are raised in the caller.
+
+    Args:
+        project_directory (pathlib.Path): The directory of the project.
+        function (Callable[[], T]): The blocking function to run.
+
+    Returns:
+        T: The result of the function.
+    """
+    return await asyncio.get_running_loop().run_in_executor(
+        locked_io_executor,
+        functools.partial(_run_with_project_lock, project_directory=project_directory, function=function),
+    )
@@ -0,0 +1,139 @@
+# -*- coding: utf-8 -*-
+
+"""
+* Name:         cognitivefactory.interactive_clustering_gui.storage.factory
+* Description:  The factory method used to get the storage of a project, and the migration of legacy projects.
+* Author:       Erwan Schild
+* Created:      18/10/2026
+* Licence:      CeCILL-C License v1.0 (https://cecill.info/licences.fr.html)
+"""
+
+# ==============================================================================
+# IMPORT PYTHON DEPENDENCIES
+# ==============================================================================
+
+import os
+import pathlib
+from typing import Optional
+
+from filelock import FileLock
+
+from cognitivefactory.interactive_clustering_gui.storage.abstract import AbstractProjectStorage
+from cognitivefactory.interactive_clustering_gui.storage.jsonfiles import JsonFilesProjectStorage
+from cognitivefactory.interactive_clustering_gui.storage.sqlite import SqliteProjectStorage
+
+# ==============================================================================
+# STORAGE BACKEND
+# ==============================================================================
+
+# Name of the storage backend to use (`sqlite` by default, `jsonfiles` for legacy behavior).
+STORAGE_BACKEND: str = os.environ.get("STORAGE_BACKEND", "sqlite")
+
+# ==============================================================================
+# STORAGE FACTORY
+# ==============================================================================
+
+
+def storage_factory(
+    project_directory: pathlib.Path,
+    backend: Optional[str] = None,
+) -> AbstractProjectStorage:
+    """
+    A factory to get the storage of a project.
+    With `sqlite` backend, a legacy project (with `texts.json` and `constraints.json` files) is migrated on first access.
+
+    Args:
+        project_directory (pathlib.Path): The directory of the project.
+        backend (Optional[str], optional): The storage backend. Can be `"sqlite"` or `"jsonfiles"`. If `None`, use `STORAGE_BACKEND` (environment variable, `"sqlite"` if not set). Defaults to `None`.
+
+    Raises:
+        ValueError: Raises error if `backend` is not implemented.
+
+    Returns:
+        AbstractProjectStorage: The storage of the project.
+    """
+
+    # Get default backend.
+    if backend is None:
+        backend = STORAGE_BACKEND
+
+    # Case of SQLite storage.
+    if backend == "sqlite":
+        migrate_project_storage(project_directory=project_directory)
+        return SqliteProjectStorage(project_directory=project_directory)
+
+    # Case of JSON files storage.
+    if backend == "jsonfiles":
+        return JsonFilesProjectStorage(project_directory=project_directory)
+
+    # Unknown case.
+    raise ValueError("The `backend` '" + str(backend) + "' is not implemented.")
+
+
+# ==============================================================================
+# STORAGE MIGRATION
+# ==============================================================================
+
+
+def migrate_project_storage(
+    project_directory: pathlib.Path,
+) -> bool:
+    """
+    Migrate a legacy project (with `texts.json` and `constraints.json` files) into a SQLite database, in place.
+    JSON files are removed once the database is written.
+
+    Args:
+        project_directory (pathlib.Path): The directory of the project.
+
+    Returns:
+        bool: `True` if the project has been migrated, `False` if there was nothing to migrate.
+    """
+
+    # Quick check without lock.
+    if not (project_directory / "texts.json").exists():
+        return False
+
+    # Migrate under lock to avoid concurrent migrations.
+    with FileLock(str(project_directory / "storage.lock")):
+        # Check again: another process may have migrated the project.
+        if not (project_directory / "texts.json").exists():
+            return False
+
+        # Load legacy files.
+        legacy_storage: JsonFilesProjectStorage = JsonFilesProjectStorage(project_directory=project_directory)
+        sqlite_storage: SqliteProjectStorage = SqliteProjectStorage(project_directory=project_directory)
+
+        # Write the database (from scratch, in case of a previous interrupted migration).
+        with sqlite_storage.transaction():
+            sqlite_storage.set_texts(texts=legacy_storage.get_texts())
+            sqlite_storage.set_constraints(
+                constraints=(
+                    legacy_storage.get_constraints() if (project_directory / "constraints.json").exists() else {}
+                )
+            )
+
+        # Remove legacy files (`texts.json` last, as it is the migration marker).
+        if (project_directory / "constraints.json").exists():
+            os.remove(project_directory / "constraints.json")
+        os.remove(project_directory / "texts.json")
+
+    return True
+
+
+def migrate_all_projects_storage(
+    data_directory: pathlib.Path,
+) -> int:
+    """
+    Migrate all legacy projects of a data directory into SQLite databases, in place.
+
+    Args:
+        data_directory (pathlib.Path): The directory that contains projects.
+
+    Returns:
+        int: The number of migrated projects.
+    """
+    return sum(
+        migrate_project_storage(project_directory=data_directory / project_id)
+        for project_id in sorted(os.listdir(data_directory))
+        if (data_directory / project_id).is_dir()
+    )
@@ -0,0 +1,283 @@
+# -*- coding: utf-8 -*-
+
+"""
+* Name:         cognitivefactory.interactive_clustering_gui.storage.jsonfiles
+* Description:  Definition of the legacy project storage, based on `texts.json` and `constraints.json` files.
+* Author:       Erwan Schild
+* Created:      18/10/2026
+* Licence:      CeCILL-C License v1.0 (https://cecill.info/licences.fr.html)
+"""
+
+# ==============================================================================
+# IMPORT PYTHON DEPENDENCIES
+# ==============================================================================
+
+import contextlib
+import json
+import pathlib
+from typing import Any, Dict, Iterator, List, Optional, Set, Tuple
+
+from cognitivefactory.interactive_clustering_gui.storage.abstract import AbstractProjectStorage
+
+# ==============================================================================
+# JSON FILES PROJECT STORAGE
+# ==============================================================================
+
+
+class JsonFilesProjectStorage(AbstractProjectStorage):
+    """
+    Project storage based on `texts.json` and `constraints.json` files.
+    Every update rewrites the whole file, so this storage is kept as import/export format and for legacy projects.
+    """
+
+    def __init__(
+        self,
+        project_directory: pathlib.Path,
+    ) -> None:
+        """
+        The constructor for JSON files project storage.
+
+        Args:
+            project_directory (pathlib.Path): The directory of the project.
+        """
+        super().__init__(project_directory=project_directory)
+
+        # Contents loaded during a transaction, and names of files modified during this transaction.
+        self._transaction_contents: Optional[Dict[str, Dict[str, Dict[str, Any]]]] = None
+        self._transaction_modified_files: Set[str] = set()
+
+        # Inverted index from text IDs to insertion ranks of their constraints, kept during a transaction (as constraints are loaded once).
+        self._transaction_constraints_index: Optional[Tuple[List[str], Dict[str, List[int]]]] = None
+
+    # ==============================================================================
+    # FILES HANDLING
+    # ==============================================================================
+    def _load(self, file_name: str) -> Dict[str, Dict[str, Any]]:
+        """
+        Load a JSON file (or get it from current transaction).
+
+        Args:
+            file_name (str): The name of the file to load.
+
+        Returns:
+            Dict[str, Dict[str, Any]]: The content of the file.
+        """
+
+        # Case of already loaded file in current transaction.
+        if self._transaction_contents is not None and file_name in self._transaction_contents:
+            return self._transaction_contents[file_name]
+
+        # Load the file.
+        with open(self.project_directory / file_name, "r") as fileobject_r:
+            content: Dict[str, Dict[str, Any]] = json.load(fileobject_r)
+
+        # Keep it for the current transaction.
+        if self._transaction_contents is not None:
+            self._transaction_contents[file_name] = content
+        return content
+
+    def _store(self, file_name: str, content: Dict[str, Dict[str, Any]]) -> None:
+        """
+        Store a JSON file (or delay it until the end of current transaction).
+
+        Args:
+            file_name (str): The name of the file to store.
+            content (Dict[str, Dict[str, Any]]): The content of the file.
+        """
+
+        # Case of current transaction: store at the end of the transaction.
+        if self._transaction_contents is not None:
+            self._transaction_contents[file_name] = content
+            self._transaction_modified_files.add(file_name)
+            return
+
+        # Store the file.
+        with open(self.project_directory / file_name, "w") as fileobject_w:
+            json.dump(content, fileobject_w, indent=4)
+
+    @contextlib.contextmanager
+    def transaction(self) -> Iterator[None]:
+        """
+        Group several storage operations: each file is loaded and stored at most once.
+
+        Yields:
+            None: Operations are stored when the context ends without error.
+        """
+
+        # Case of nested transaction.
+        if self._transaction_contents is not None:
+            yield
+            return
+
+        # Start the transaction.
+        self._transaction_contents = {}
+        self._transaction_modified_files = set()
+        try:
+            yield
+            contents: Dict[str, Dict[str, Dict[str, Any]]] = self._transaction_contents
+            modified_files: Set[str] = self._transaction_modified_files
+            self._transaction_contents = None
+            for file_name in sorted(modified_files):
+                self._store(file_name=file_name, content=contents[file_name])
+        finally:
+            self._transaction_contents = None
+            self._transaction_modified_files = set()
+            self._transaction_constraints_index = None
+
+    # ==============================================================================
+    # TEXTS
+    # ==============================================================================
+    def get_texts(
+        self,
+        text_ids: Optional[List[str]] = None,
+    ) -> Dict[str, Dict[str, Any]]:
+        """
+        Get texts, in their insertion order.
+
+        Args:
+            text_ids (Optional[List[str]], optional): The IDs of texts to get. If `None`, get all texts. Defaults to `None`.
+
+        Returns:
+            Dict[str, Dict[str, Any]]: The requested texts.
+        """
+        texts: Dict[str, Dict[str, Any]] = self._load(file_name="texts.json")
+        if text_ids is None:
+            return {text_id: dict(text_value) for text_id, text_value in texts.items()}
+        set_of_text_ids: Set[str] = set(text_ids)
+        return {text_id: dict(text_value) for text_id, text_value in texts.items() if text_id in set_of_text_ids}
+
+    def set_texts(
+        self,
+        texts: Dict[str, Dict[str, Any]],
+    ) -> None:
+        """
+        Replace all texts.
+
+        Args:
+            texts (Dict[str, Dict[str, Any]]): The new texts.
+        """
+        self._store(file_name="texts.json", content=texts)
+
+    def update_texts(
+        self,
+        texts_updates: Dict[str, Dict[str, Any]],
+    ) -> None:
+        """
+        Update some fields of some texts.
+
+        Args:
+            texts_updates (Dict[str, Dict[str, Any]]): The fields to update for each text ID.
+        """
+        texts: Dict[str, Dict[str, Any]] = self._load(file_name="texts.json")
+        for text_id, text_update in texts_updates.items():
+            texts[text_id].update(text_update)
+        self._store(file_name="texts.json", content=texts)
+
+    # ==============================================================================
+    # CONSTRAINTS
+    # ==============================================================================
+    def get_constraints(
+        self,
+        constraint_ids: Optional[List[str]] = None,
+    ) -> Dict[str, Dict[str, Any]]:
+        """
+        Get constraints, in their insertion order.
+
+        Args:
+            constraint_ids (Optional[List[str]], optional): The IDs of constraints to get. If `None`, get all constraints. Defaults to `None`.
+
+        Returns:
+            Dict[str, Dict[str, Any]]: The requested constraints.
+        """
+        constraints: Dict[str, Dict[str, Any]] = self._load(file_name="constraints.json")
+        if constraint_ids is None:
+            return {constraint_id: dict(constraint_value) for constraint_id, constraint_value in constraints.items()}
+        set_of_constraint_ids: Set[str] = set(constraint_ids)
+        return {
+            constraint_id: dict(constraint_value)
+            for constraint_id, constraint_value in constraints.items()
+            if constraint_id in set_of_constraint_ids
+        }
+
+    def get_constraints_of_texts(
+        self,
+        text_ids: List[str],
+    ) -> Dict[str, Dict[str, Any]]:
+        """
+        Get constraints involving at least one of the given texts.
+
+        Args:
+            text_ids (List[str]): The IDs of texts.
+
+        Returns:
+            Dict[str, Dict[str, Any]]: The constraints involving these texts.
+        """
+        constraints: Dict[str, Dict[str, Any]] = self._load(file_name="constraints.json")
+
+        # Case of no transaction: constraints are loaded for this lookup only, so scan them once.
+        if self._transaction_contents is None:
+            set_of_text_ids: Set[str] = set(text_ids)
+            return {
+                constraint_id: dict(constraint_value)
+                for constraint_id, constraint_value in constraints.items()
+                if (
+                    constraint_value["data"]["id_1"] in set_of_text_ids
+                    or constraint_value["data"]["id_2"] in set_of_text_ids
+                )
+            }
+
+        # Otherwise build the index of constraints by text once for the transaction.
+        if self._transaction_constraints_index is None:
+            ranks_by_text_id: Dict[str, List[int]] = {}
+            for rank, constraint_value in enumerate(constraints.values()):
+                ranks_by_text_id.setdefault(constraint_value["data"]["id_1"], []).append(rank)
+                ranks_by_text_id.setdefault(constraint_value["data"]["id_2"], []).append(rank)
+            self._transaction_constraints_index = (list(constraints.keys()), ranks_by_text_id)
+        constraint_ids, ranks_by_text_id = self._transaction_constraints_index
+        return {
+            constraint_ids[rank]: dict(constraints[constraint_ids[rank]])
+            for rank in sorted({rank for text_id in text_ids for rank in ranks_by_text_id.get(text_id, [])})
+        }
+
+    def set_constraints(
+        self,
+        constraints: Dict[str, Dict[str, Any]],
+    ) -> None:
+        """
+        Replace all constraints.
+
+        Args:
+            constraints (Dict[str, Dict[str, Any]]): The new constraints.
+        """
+        self._transaction_constraints_index = None
+        self._store(file_name="constraints.json", content=constraints)
+
+    def add_constraints(
+        self,
+        constraints: Dict[str, Dict[str, Any]],
+    ) -> None:
+        """
+        Add new constraints. Already known constraints are overwritten, but keep their position.
+
+        Args:
+            constraints (Dict[str, Dict[str, Any]]): The constraints to add.
+        """
+        all_constraints: Dict[str, Dict[str, Any]] = self._load(file_name="constraints.json")
+        all_constraints.update(constraints)
+        self._transaction_constraints_index = None
+        self._store(file_name="constraints.json", content=all_constraints)
+
+    def update_constraints(
+        self,
+        constraints_updates: Dict[str, Dict[str, Any]],
+    ) -> None:
+        """
+        Update some fields of some constraints.
+
+        Args:
+            constraints_updates (Dict[str, Dict[str, Any]]): The fields to update for each constraint ID.
+        """
+        constraints: Dict[str, Dict[str, Any]] = self._load(file_name="constraints.json")
+        for constraint_id, constraint_update in constraints_updates.items():
+            constraints[constraint_id].update(constraint_update)
+        self._store(file_name="constraints.json", content=constraints)
@@ -0,0 +1,187 @@
+# -*- coding: utf-8 -*-
+
+"""
+* Name:         cognitivefactory.interactive_clustering_gui.storage.modelization
+* Description:  Compact storage of modelization inference, as the component of each text and the "CANNOT_LINK" adjacency of components.
+* Author:       Erwan Schild
+* Created:      18/10/2026
+* Licence:      CeCILL-C License v1.0 (https://cecill.info/licences.fr.html)
+"""
+
+# ==============================================================================
+# IMPORT PYTHON DEPENDENCIES
+# ==============================================================================
+
+from typing import Any, Dict, List, Optional, Sequence, Set
+
+import numpy as np
+
+# ==============================================================================
+# BUILD MODELIZATION INFERENCE
+# ==============================================================================
+
+
+def build_modelization(
+    list_of_data_IDs: List[str],
+    components: Sequence[int],
+    cannot_links: Optional[np.ndarray] = None,
+) -> Dict[str, Any]:
+    """
+    Build the compact modelization inference (stored in `modelization.json`):
+    - `"COMPONENT"`: the component of `"MUST_LINK"` constraints of each managed text ;
+    - `"CANNOT_LINK"`: for each component linked by a `"CANNOT_LINK"` constraint, the sorted list of components it is linked with.
+    Its size is linear in the number of texts and of constraints, whereas lists of inferred constraints of each text are quadratic.
+
+    Args:
+        list_of_data_IDs (List[str]): The IDs of managed texts.
+        components (Sequence[int]): The component of each managed text (in the order of `list_of_data_IDs`).
+        cannot_links (Optional[np.ndarray], optional): The pairs of components linked by a `"CANNOT_LINK"` constraint (an array of shape `(nb_pairs, 2)`). Defaults to `None`.
+
+    Returns:
+        Dict[str, Any]: The compact modelization inference.
+    """
+
+    # Get the "CANNOT_LINK" adjacency of components.
+    dict_of_cannot_links: Dict[int, Set[int]] = {}
+    if cannot_links is not None:
+        for component1, component2 in cannot_links.tolist():
+            dict_of_cannot_links.setdefault(component1, set()).add(component2)
+            dict_of_cannot_links.setdefault(component2, set()).add(component1)
+
+    # Return the modelization inference.
+    return {
+        "COMPONENT": {data_ID: int(component) for data_ID, component in zip(list_of_data_IDs, components)},
+        "CANNOT_LINK": {
+            str(component): sorted(dict_of_cannot_links[component]) for component in sorted(dict_of_cannot_links)
+        },
+    }
+
+
+def compact_modelization(
+    modelization: Dict[str, Any],
+) -> Dict[str, Any]:
+    """
+    Get the compact modelization inference of a modelization inference file.
+    Legacy files (with the lists of inferred `"MUST_LINK"` and `"CANNOT_LINK"` constraints of each text) are converted.
+
+    Args:
+        modelization (Dict[str, Any]): The content of a modelization inference file.
+
+    Returns:
+        Dict[str, Any]: The compact modelization inference.
+    """
+
+    # Case of compact modelization inference.
+    if isinstance(modelization.get("COMPONENT"), dict) and isinstance(modelization.get("CANNOT_LINK"), dict):
+        return modelization
+
+    # Case of legacy modelization inference: "CANNOT_LINK" constraints are inferred between whole components.
+    dict_of_components: Dict[str, int] = {
+        data_ID: int(data_value["COMPONENT"]) for data_ID, data_value in modelization.items()
+    }
+    return build_modelization(
+        list_of_data_IDs=list(dict_of_components.keys()),
+        components=list(dict_of_components.values()),
+        cannot_links=np.array(
+            [
+                (dict_of_components[data_ID], dict_of_components[linked_data_ID])
+                for data_ID, data_value in modelization.items()
+                for linked_data_ID in data_value["CANNOT_LINK"]
+                if linked_data_ID in dict_of_components
+            ],
+            dtype=np.int64,
+        ).reshape(-1, 2),
+    )
+
+
+# ==============================================================================
+# CHECK MODELIZATION INFERENCE
+# ==============================================================================
+
+
+def is_compact_modelization(
+    modelization: Any,
+) -> bool:
+    """
+    Check that a modelization inference has the compact format (see `build_modelization`).
+
+    Args:
+        modelization (Any): The content of a modelization inference file.
+
+    Returns:
+        bool: `True` if the modelization inference is compact.
+    """
+    return (
+        isinstance(modelization, dict)
+        and isinstance(modelization.get("COMPONENT"), dict)
+        and isinstance(modelization.get("CANNOT_LINK"), dict)
+        and all(isinstance(component, int) for component in modelization["COMPONENT"].values())
+        and all(
+            isinstance(linked_components, list)
+            and all(isinstance(linked_component, int) for linked_component in linked_components)
+            for linked_components in modelization["CANNOT_LINK"].values()
+        )
+    )
+
+
+def is_legacy_modelization(
+    modelization: Any,
+) -> bool:
+    """
+    Check that a modelization inference has the legacy format (the lists of inferred constraints of each text).
+
+    Args:
+        modelization (Any): The content of a modelization inference file.
+
+    Returns:
+        bool: `True` if the modelization inference is a legacy one.
+    """
+    return isinstance(modelization, dict) and all(
+        isinstance(data_value, dict)
+        and isinstance(data_value.get("COMPONENT"), int)
+        and isinstance(data_value.get("MUST_LINK"), list)
+        and isinstance(data_value.get("CANNOT_LINK"), list)
+        for data_value in modelization.values()
+    )
+
+
+# ==============================================================================
+# QUERY MODELIZATION INFERENCE
+# ==============================================================================
+
+
+def expand_modelization(
+    modelization: Dict[str, Any],
+    data_ID: str,
+) -> Optional[Dict[str, Any]]:
+    """
+    Expand the modelization inference of a text: the texts inferred as `"MUST_LINK"` (its component) and as `"CANNOT_LINK"` (the components linked with its component).
+
+    Args:
+        modelization (Dict[str, Any]): The compact modelization inference.
+        data_ID (str): The ID of the text.
+
+    Returns:
+        Optional[Dict[str, Any]]: The texts inferred as `"MUST_LINK"` and `"CANNOT_LINK"` with the text, and its `"COMPONENT"`, or `None` if the text isn't modelized (cf. text deletion).
+    """
+
+    # Case of text not modelized.
+    component: Optional[int] = modelization["COMPONENT"].get(data_ID)
+    if component is None:
+        return None
+
+    # Expand the component and its "CANNOT_LINK" components.
+    set_of_cannot_link_components: Set[int] = set(modelization["CANNOT_LINK"].get(str(component), []))
+    return {
+        "MUST_LINK": [
+            other_data_ID
+            for other_data_ID, other_component in modelization["COMPONENT"].items()
+            if other_component == component
+        ],
+        "CANNOT_LINK": [
+            other_data_ID
+            for other_data_ID, other_component in modelization["COMPONENT"].items()
+            if other_component in set_of_cannot_link_components
+        ],
+        "COMPONENT": component,
+    }
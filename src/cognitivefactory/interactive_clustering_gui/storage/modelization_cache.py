@@ -0,0 +1,285 @@
+# -*- coding: utf-8 -*-
+
+"""
+* Name:         cognitivefactory.interactive_clustering_gui.storage.modelization_cache
+* Description:  Content-hash keyed cache of preprocessed texts and vectors, used during modelization update.
+* Author:       Erwan Schild
+* Created:      18/10/2026
+* Licence:      CeCILL-C License v1.0 (https://cecill.info/licences.fr.html)
+"""
+
+# ==============================================================================
+# IMPORT PYTHON DEPENDENCIES
+# ==============================================================================
+
+import hashlib
+import json
+import os
+import pathlib
+import pickle  # noqa: S403
+import time
+from typing import Any, Dict, Optional
+
+from scipy.sparse import csr_matrix
+
+from cognitivefactory.interactive_clustering_gui.nlp import preprocess, vectorize
+
+# ==============================================================================
+# CACHE FILES
+# ==============================================================================
+
+# Names of cache files in the project directory.
+PREPROCESSING_CACHE_NAME: str = "preprocessing_cache.pkl"
+VECTORIZATION_CACHE_NAME: str = "vectorization_cache.pkl"
+
+
+# ==============================================================================
+# HASH UTILS
+# ==============================================================================
+
+
+def get_settings_fingerprint(
+    settings: Dict[str, Any],
+) -> str:
+    """
+    Get the fingerprint of some settings (a hash of their JSON representation).
+
+    Args:
+        settings (Dict[str, Any]): The settings.
+
+    Returns:
+        str: The fingerprint of the settings.
+    """
+    return hashlib.sha256(json.dumps(settings, sort_keys=True).encode("utf-8")).hexdigest()
+
+
+def get_content_hash(
+    content: str,
+) -> str:
+    """
+    Get the hash of a text content.
+
+    Args:
+        content (str): The text content.
+
+    Returns:
+        str: The hash of the text content.
+    """
+    return hashlib.sha256(str(content).encode("utf-8")).hexdigest()
+
+
+# ==============================================================================
+# CACHE LOADING AND STORAGE
+# ==============================================================================
+
+
+def load_cache(
+    cache_path: pathlib.Path,
+    fingerprint: str,
+) -> Dict[str, Any]:
+    """
+    Load the values of a cache file if it has been computed with the given settings fingerprint.
+
+    Args:
+        cache_path (pathlib.Path): The path of the cache file.
+        fingerprint (str): The settings fingerprint.
+
+    Returns:
+        Dict[str, Any]: The cached values, by content hash (empty if the cache doesn't exist or is outdated).
+    """
+
+    # Case of missing cache.
+    if not cache_path.exists():
+        return {}
+
+    # Load the cache (an unreadable cache is ignored and will be rebuilt).
+    try:
+        with open(cache_path, "rb") as cache_fileobject_r:
+            cache: Dict[str, Any] = pickle.load(cache_fileobject_r)  # noqa: S301  # Usage of Pickle
+    except Exception:
+        return {}
+
+    # Case of outdated cache.
+    if cache.get("fingerprint") != fingerprint:
+        return {}
+    return cache["values"]
+
+
+def store_cache(
+    cache_path: pathlib.Path,
+    fingerprint: str,
+    values: Dict[str, Any],
+) -> None:
+    """
+    Store the values of a cache file, with their settings fingerprint.
+
+    Args:
+        cache_path (pathlib.Path): The path of the cache file.
+        fingerprint (str): The settings fingerprint.
+        values (Dict[str, Any]): The values to cache, by content hash.
+    """
+
+    # Write in a temporary file, then replace the cache file, to avoid a corrupted cache.
+    temporary_cache_path: pathlib.Path = cache_path.with_suffix(".tmp")
+    with open(temporary_cache_path, "wb") as cache_fileobject_w:
+        pickle.dump(
+            {"fingerprint": fingerprint, "values": values},
+            cache_fileobject_w,
+            pickle.HIGHEST_PROTOCOL,
+        )
+    os.replace(temporary_cache_path, cache_path)
+
+
+# ==============================================================================
+# CACHED PREPROCESSING
+# ==============================================================================
+
+
+def preprocess_with_cache(
+    project_directory: pathlib.Path,
+    dict_of_texts: Dict[str, str],
+    apply_stopwords_deletion: bool,
+    apply_parsing_filter: bool,
+    apply_lemmatization: bool,
+    spacy_language_model: str,
+    task_metrics: Optional[Dict[str, float]] = None,
+) -> Dict[str, str]:
+    """
+    Preprocess texts, by reusing cached results of texts already preprocessed with the same settings.
+    Only new or renamed texts are preprocessed, and the cache is updated with current texts.
+
+    Args:
+        project_directory (pathlib.Path): The directory of the project (where the cache is stored).
+        dict_of_texts (Dict[str, str]): The texts to preprocess.
+        apply_stopwords_deletion (bool): The option to delete stopwords.
+        apply_parsing_filter (bool): The option to filter tokens based on dependency parsing results.
+        apply_lemmatization (bool): The option to lemmatize tokens.
+        spacy_language_model (str): The spaCy language model to use.
+        task_metrics (Optional[Dict[str, float]], optional): If set, it is completed with the number of preprocessed texts (`preprocessed_texts`, cached texts excluded) and their throughput (`preprocessing_throughput`, in texts per second). Defaults to `None`.
+
+    Returns:
+        Dict[str, str]: The preprocessed texts.
+    """
+
+    # Get settings fingerprint and load cache.
+    fingerprint: str = get_settings_fingerprint(
+        settings={
+            "apply_stopwords_deletion": apply_stopwords_deletion,
+            "apply_parsing_filter": apply_parsing_filter,
+            "apply_lemmatization": apply_lemmatization,
+            "spacy_language_model": spacy_language_model,
+        }
+    )
+    cache_path: pathlib.Path = project_directory / PREPROCESSING_CACHE_NAME
+    cached_values: Dict[str, str] = load_cache(cache_path=cache_path, fingerprint=fingerprint)
+
+    # Get hashes of texts, and texts to preprocess (once per distinct content).
+    dict_of_hashes: Dict[str, str] = {text_id: get_content_hash(text) for text_id, text in dict_of_texts.items()}
+    dict_of_texts_to_preprocess: Dict[str, str] = {
+        text_hash: dict_of_texts[text_id]
+        for text_id, text_hash in dict_of_hashes.items()
+        if text_hash not in cached_values.keys()
+    }
+
+    # Preprocess missing texts.
+    if len(dict_of_texts_to_preprocess) != 0:  # noqa: WPS507
+        start: float = time.perf_counter()
+        cached_values.update(
+            preprocess(
+                dict_of_texts=dict_of_texts_to_preprocess,
+                apply_stopwords_deletion=apply_stopwords_deletion,
+                apply_parsing_filter=apply_parsing_filter,
+                apply_lemmatization=apply_lemmatization,
+                spacy_language_model=spacy_language_model,
+            )
+        )
+        duration: float = time.perf_counter() - start
+        if task_metrics is not None:
+            task_metrics["preprocessed_texts"] = len(dict_of_texts_to_preprocess)
+            task_metrics["preprocessing_throughput"] = round(len(dict_of_texts_to_preprocess) / max(duration, 1e-6), 1)
+
+    # Update cache with current texts only (if some texts have been added or removed).
+    current_values: Dict[str, Any] = {text_hash: cached_values[text_hash] for text_hash in set(dict_of_hashes.values())}
+    if len(dict_of_texts_to_preprocess) != 0 or len(current_values) != len(cached_values):  # noqa: WPS507
+        store_cache(
+            cache_path=cache_path,
+            fingerprint=fingerprint,
+            values=current_values,
+        )
+
+    # Return preprocessed texts.
+    return {text_id: cached_values[text_hash] for text_id, text_hash in dict_of_hashes.items()}
+
+
+# ==============================================================================
+# CACHED VECTORIZATION
+# ==============================================================================
+
+
+def vectorize_with_cache(
+    project_directory: pathlib.Path,
+    dict_of_texts: Dict[str, str],
+    vectorizer_type: str,
+    spacy_language_model: str,
+) -> Dict[str, csr_matrix]:
+    """
+    Vectorize texts, by reusing cached vectors of texts already vectorized with the same settings.
+    Only `spacy` vectors are cached: a `tfidf` vector depends on the whole corpus, so it is always recomputed.
+
+    Args:
+        project_directory (pathlib.Path): The directory of the project (where the cache is stored).
+        dict_of_texts (Dict[str, str]): The preprocessed texts to vectorize.
+        vectorizer_type (str): The vectorizer type. Can be `"tfidf"` or `"spacy"`.
+        spacy_language_model (str): The spaCy language model to use if vectorizer is spacy.
+
+    Returns:
+        Dict[str, csr_matrix]: The vectors of texts.
+    """
+
+    # Case of corpus dependent vectorization.
+    if vectorizer_type != "spacy":
+        return vectorize(
+            dict_of_texts=dict_of_texts,
+            vectorizer_type=vectorizer_type,
+            spacy_language_model=spacy_language_model,
+        )
+
+    # Get settings fingerprint and load cache.
+    fingerprint: str = get_settings_fingerprint(
+        settings={
+            "vectorizer_type": vectorizer_type,
+            "spacy_language_model": spacy_language_model,
+        }
+    )
+    cache_path: pathlib.Path = project_directory / VECTORIZATION_CACHE_NAME
+    cached_values: Dict[str, csr_matrix] = load_cache(cache_path=cache_path, fingerprint=fingerprint)
+
+    # Get hashes of texts, and texts to vectorize (once per distinct content).
+    dict_of_hashes: Dict[str, str] = {text_id: get_content_hash(text) for text_id, text in dict_of_texts.items()}
+    dict_of_texts_to_vectorize: Dict[str, str] = {
+        text_hash: dict_of_texts[text_id]
+        for text_id, text_hash in dict_of_hashes.items()
+        if text_hash not in cached_values.keys()
+    }
+
+    # Vectorize missing texts.
+    if len(dict_of_texts_to_vectorize) != 0:  # noqa: WPS507
+        cached_values.update(
+            vectorize(
+                dict_of_texts=dict_of_texts_to_vectorize,
+                vectorizer_type=vectorizer_type,
+                spacy_language_model=spacy_language_model,
+            )
+        )
+
+    # Update cache with current texts only (if some texts have been added or removed).
+    current_values: Dict[str, Any] = {text_hash: cached_values[text_hash] for text_hash in set(dict_of_hashes.values())}
+    if len(dict_of_texts_to_vectorize) != 0 or len(current_values) != len(cached_values):  # noqa: WPS507
+        store_cache(
+            cache_path=cache_path,
+            fingerprint=fingerprint,
+            values=current_values,
+        )
+
+    # Return vectors.
+    return {text_id: cached_values[text_hash] for text_id, text_hash in dict_of_hashes.items()}
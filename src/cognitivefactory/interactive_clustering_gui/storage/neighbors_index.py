@@ -0,0 +1,382 @@
+# -*- coding: utf-8 -*-
+
+"""
+* Name:         cognitivefactory.interactive_clustering_gui.storage.neighbors_index
+* Description:  Approximate neighbors index of texts vectors (random projections forest), used by distance-based constraints sampling.
+* Author:       Erwan Schild
+* Created:      18/10/2026
+* Licence:      CeCILL-C License v1.0 (https://cecill.info/licences.fr.html)
+"""
+
+# ==============================================================================
+# IMPORT PYTHON DEPENDENCIES
+# ==============================================================================
+
+import json
+import os
+import pathlib
+from typing import Any, Dict, List, Optional, Tuple
+
+import numpy as np
+from scipy.sparse import csr_matrix
+
+from cognitivefactory.interactive_clustering_gui.storage.vectors import get_vectors_version, load_vectors_matrix
+
+# ==============================================================================
+# CONFIGURE NEIGHBORS INDEX
+# ==============================================================================
+
+# Define `NEIGHBORS_INDEX_MIN_TEXTS` (the number of texts from which distance-based sampling uses the neighbors index instead of all pairwise distances).
+NEIGHBORS_INDEX_MIN_TEXTS: int = int(os.environ.get("NEIGHBORS_INDEX_MIN_TEXTS", "1000"))
+
+# Number of random directions on which vectors are projected.
+NB_PROJECTIONS: int = 32
+
+# Number of random projections trees.
+NB_TREES: int = 8
+
+# Maximum number of texts in a leaf of a random projections tree.
+LEAF_SIZE: int = 32
+
+# Number of texts with extreme projections kept on each side of each direction, to find farthest pairs of texts.
+NB_EXTREMES: int = 16
+
+# Number of candidate pairs whose distances are computed at once.
+PAIRS_CHUNK_SIZE: int = 65536
+
+# Names of the index files (raw `.npy` arrays, and the description file written last, so it marks a complete index).
+NEIGHBORS_PROJECTIONS_NAME: str = "neighbors_projections.npy"
+NEIGHBORS_LEAVES_NAME: str = "neighbors_leaves.npy"
+NEIGHBORS_INDEX_NAME: str = "neighbors_index.json"
+
+
+# ==============================================================================
+# NEIGHBORS INDEX
+# ==============================================================================
+
+
+class NeighborsIndex:
+    """
+    An approximate neighbors index of texts vectors, that gives candidate pairs of texts in sub-quadratic time.
+    Vectors are projected on random directions, then:
+    - close texts are candidates found in the same leaf of random projections trees (each node splits its texts at the median of a direction) ;
+    - far texts are candidates found at opposite extremes of a direction.
+    Distances of candidate pairs are exact: only the set of pairs considered is approximated.
+    """
+
+    def __init__(
+        self,
+        list_of_data_IDs: List[str],
+        projections: np.ndarray,
+        leaves: np.ndarray,
+    ) -> None:
+        """
+        The constructor for `NeighborsIndex` class.
+
+        Args:
+            list_of_data_IDs (List[str]): The IDs of texts (in the order of vectors matrix rows).
+            projections (np.ndarray): The projections of vectors on random directions (one row per text).
+            leaves (np.ndarray): The leaf of each text in each random projections tree (one row per text).
+        """
+        self.list_of_data_IDs: List[str] = list_of_data_IDs
+        self.projections: np.ndarray = projections
+        self.leaves: np.ndarray = leaves
+
+    # ==============================================================================
+    # BUILD
+    # ==============================================================================
+    @classmethod
+    def build(
+        cls,
+        list_of_data_IDs: List[str],
+        matrix: csr_matrix,
+        random_seed: int = 42,
+    ) -> "NeighborsIndex":
+        """
+        Build the neighbors index of vectors.
+
+        Args:
+            list_of_data_IDs (List[str]): The IDs of texts (in the order of vectors matrix rows).
+            matrix (csr_matrix): The matrix of vectors.
+            random_seed (int, optional): The random seed of directions and trees. Defaults to `42`.
+
+        Returns:
+            NeighborsIndex: The neighbors index.
+        """
+        rng: np.random.Generator = np.random.default_rng(random_seed)
+
+        # Project vectors on random directions.
+        directions: np.ndarray = rng.standard_normal(size=(matrix.shape[1], NB_PROJECTIONS)).astype(np.float32)
+        projections: np.ndarray = np.asarray(matrix @ directions, dtype=np.float32)
+
+        # Build random projections trees, and keep the leaf of each text.
+        leaves: np.ndarray = np.zeros((matrix.shape[0], NB_TREES), dtype=np.int32)
+        for tree in range(NB_TREES):
+            nb_leaves: int = 0
+            nodes: List[np.ndarray] = [np.arange(matrix.shape[0])]
+            while len(nodes) != 0:  # noqa: WPS507
+                rows: np.ndarray = nodes.pop()
+
+                # Case of a leaf.
+                if len(rows) <= LEAF_SIZE:
+                    leaves[rows, tree] = nb_leaves
+                    nb_leaves += 1
+                    continue
+
+                # Otherwise split texts at the median of a random direction.
+                order: np.ndarray = np.argpartition(projections[rows, rng.integers(NB_PROJECTIONS)], len(rows) // 2)
+                nodes.append(rows[order[: len(rows) // 2]])
+                nodes.append(rows[order[len(rows) // 2 :]])
+
+        return cls(list_of_data_IDs=list_of_data_IDs, projections=projections, leaves=leaves)
+
+    # ==============================================================================
+    # CANDIDATES
+    # ==============================================================================
+    def get_closest_candidates(
+        self,
+        matrix: csr_matrix,
+    ) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Get candidate pairs of close texts: pairs of texts in the same leaf of at least one tree.
+
+        Args:
+            matrix (csr_matrix): The matrix of vectors (rows in the order of the index).
+
+        Returns:
+            Tuple[np.ndarray, np.ndarray, np.ndarray]: The rows of the first and second texts of candidate pairs, and their distances.
+        """
+        blocks: List[Tuple[np.ndarray, np.ndarray]] = []
+        for tree in range(self.leaves.shape[1]):
+            order: np.ndarray = np.argsort(self.leaves[:, tree], kind="stable")
+            boundaries: np.ndarray = np.flatnonzero(np.diff(self.leaves[order, tree])) + 1
+            for rows in np.split(order, boundaries):
+                blocks.append((rows, rows))
+        return _get_pairs_distances(matrix=matrix, blocks=blocks)
+
+    def get_farthest_candidates(
+        self,
+        matrix: csr_matrix,
+        groups: Optional[np.ndarray] = None,
+        nb_extremes: int = NB_EXTREMES,
+    ) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Get candidate pairs of far texts: pairs of texts at opposite extremes of at least one direction (in the same group if groups are given).
+
+        Args:
+            matrix (csr_matrix): The matrix of vectors (rows in the order of the index).
+            groups (Optional[np.ndarray], optional): The group of each text (such as its cluster), to only get pairs in the same group. Defaults to `None`.
+            nb_extremes (int, optional): The number of texts kept on each side of each direction. Defaults to `NB_EXTREMES`.
+
+        Returns:
+            Tuple[np.ndarray, np.ndarray, np.ndarray]: The rows of the first and second texts of candidate pairs, and their distances.
+        """
+
+        # Get texts of each group.
+        if groups is None:
+            groups = np.zeros(matrix.shape[0], dtype=np.int64)
+        order: np.ndarray = np.argsort(groups, kind="stable")
+        boundaries: np.ndarray = np.flatnonzero(np.diff(groups[order])) + 1
+
+        # Get pairs of extremes of each direction in each group (or all pairs of small groups).
+        blocks: List[Tuple[np.ndarray, np.ndarray]] = []
+        for rows in np.split(order, boundaries):
+            if len(rows) <= 2 * nb_extremes:
+                blocks.append((rows, rows))
+                continue
+            for direction in range(self.projections.shape[1]):
+                ranks: np.ndarray = np.argsort(self.projections[rows, direction], kind="stable")
+                blocks.append((rows[ranks[:nb_extremes]], rows[ranks[-nb_extremes:]]))
+        return _get_pairs_distances(matrix=matrix, blocks=blocks)
+
+    # ==============================================================================
+    # STORAGE
+    # ==============================================================================
+    def store(
+        self,
+        project_directory: pathlib.Path,
+        vectors_version: Optional[int],
+    ) -> None:
+        """
+        Store the neighbors index next to the vectors it indexes.
+
+        Args:
+            project_directory (pathlib.Path): The directory of the project.
+            vectors_version (Optional[int]): The version of indexed vectors (see `get_vectors_version`).
+        """
+
+        # Remove the description first: an incomplete index is detected as missing.
+        remove_neighbors_index(project_directory=project_directory)
+
+        # Store arrays (through temporary files, to avoid partial arrays).
+        for array_name, array in (
+            (NEIGHBORS_PROJECTIONS_NAME, self.projections),
+            (NEIGHBORS_LEAVES_NAME, self.leaves),
+        ):
+            with open(project_directory / (array_name + ".tmp"), "wb") as array_fileobject:
+                np.save(array_fileobject, array, allow_pickle=False)
+            os.replace(project_directory / (array_name + ".tmp"), project_directory / array_name)
+
+        # Store description.
+        with open(project_directory / (NEIGHBORS_INDEX_NAME + ".tmp"), "w") as index_fileobject:
+            json.dump(
+                {
+                    "vectors_version": vectors_version,
+                    "list_of_data_IDs": self.list_of_data_IDs,
+                },
+                index_fileobject,
+            )
+        os.replace(project_directory / (NEIGHBORS_INDEX_NAME + ".tmp"), project_directory / NEIGHBORS_INDEX_NAME)
+
+    @classmethod
+    def load(
+        cls,
+        project_directory: pathlib.Path,
+        vectors_version: Optional[int],
+    ) -> Optional["NeighborsIndex"]:
+        """
+        Load the neighbors index of the project, if it indexes the current vectors.
+
+        Args:
+            project_directory (pathlib.Path): The directory of the project.
+            vectors_version (Optional[int]): The version of current vectors (see `get_vectors_version`).
+
+        Returns:
+            Optional[NeighborsIndex]: The neighbors index, or `None` if it is missing or outdated.
+        """
+
+        # Load description.
+        if not (project_directory / NEIGHBORS_INDEX_NAME).exists():
+            return None
+        with open(project_directory / NEIGHBORS_INDEX_NAME, "r") as index_fileobject:
+            index: Dict[str, Any] = json.load(index_fileobject)
+        if vectors_version is None or index["vectors_version"] != vectors_version:
+            return None
+
+        # Load arrays.
+        return cls(
+            list_of_data_IDs=index["list_of_data_IDs"],
+            projections=np.load(project_directory / NEIGHBORS_PROJECTIONS_NAME, allow_pickle=False),
+            leaves=np.load(project_directory / NEIGHBORS_LEAVES_NAME, allow_pickle=False),
+        )
+
+
+# ==============================================================================
+# PAIRS DISTANCES UTILS
+# ==============================================================================
+
+
+def _get_pairs_distances(
+    matrix: csr_matrix,
+    blocks: List[Tuple[np.ndarray, np.ndarray]],
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Get the distances of pairs of texts between rows of blocks (each pair once, and without pairs of a text with itself).
+
+    Args:
+        matrix (csr_matrix): The matrix of vectors.
+        blocks (List[Tuple[np.ndarray, np.ndarray]]): The blocks of rows (all pairs between the first and the second rows of a block are computed).
+
+    Returns:
+        Tuple[np.ndarray, np.ndarray, np.ndarray]: The rows of the first and second texts of pairs (first row is the lowest), and their distances.
+    """
+    if len(blocks) == 0:  # noqa: WPS507
+        return np.zeros(0, dtype=np.int64), np.zeros(0, dtype=np.int64), np.zeros(0)
+
+    # Get pairs of rows of blocks.
+    list_of_rows_1: List[np.ndarray] = []
+    list_of_rows_2: List[np.ndarray] = []
+    for rows_1, rows_2 in blocks:
+        grid_1, grid_2 = np.meshgrid(rows_1, rows_2, indexing="ij")
+        list_of_rows_1.append(np.minimum(grid_1, grid_2).ravel())
+        list_of_rows_2.append(np.maximum(grid_1, grid_2).ravel())
+
+    # Remove pairs of a text with itself and duplicated pairs.
+    pairs_keys: np.ndarray = np.unique(
+        np.concatenate(list_of_rows_1).astype(np.int64) * matrix.shape[0] + np.concatenate(list_of_rows_2)
+    )
+    all_rows_1: np.ndarray = pairs_keys // matrix.shape[0]
+    all_rows_2: np.ndarray = pairs_keys % matrix.shape[0]
+    all_rows_1, all_rows_2 = all_rows_1[all_rows_1 != all_rows_2], all_rows_2[all_rows_1 != all_rows_2]
+
+    # Compute euclidean distances of pairs, by chunks (`|a-b|² = |a|² + |b|² - 2 a.b`).
+    squared_norms: np.ndarray = np.asarray(matrix.multiply(matrix).sum(axis=1), dtype=np.float64).ravel()
+    all_distances: np.ndarray = np.zeros(len(all_rows_1), dtype=np.float64)
+    for start in range(0, len(all_rows_1), PAIRS_CHUNK_SIZE):
+        chunk_rows_1: np.ndarray = all_rows_1[start : start + PAIRS_CHUNK_SIZE]
+        chunk_rows_2: np.ndarray = all_rows_2[start : start + PAIRS_CHUNK_SIZE]
+        dot_products: np.ndarray = np.asarray(
+            matrix[chunk_rows_1].multiply(matrix[chunk_rows_2]).sum(axis=1), dtype=np.float64
+        ).ravel()
+        all_distances[start : start + PAIRS_CHUNK_SIZE] = np.sqrt(
+            np.maximum(squared_norms[chunk_rows_1] + squared_norms[chunk_rows_2] - 2 * dot_products, 0)
+        )
+    return all_rows_1, all_rows_2, all_distances
+
+
+# ==============================================================================
+# NEIGHBORS INDEX OF A PROJECT
+# ==============================================================================
+
+
+def remove_neighbors_index(
+    project_directory: pathlib.Path,
+) -> None:
+    """
+    Remove the stored neighbors index.
+
+    Args:
+        project_directory (pathlib.Path): The directory of the project.
+    """
+    for index_file_name in (NEIGHBORS_INDEX_NAME, NEIGHBORS_PROJECTIONS_NAME, NEIGHBORS_LEAVES_NAME):
+        if (project_directory / index_file_name).exists():
+            os.remove(project_directory / index_file_name)
+
+
+def update_neighbors_index(
+    project_directory: pathlib.Path,
+) -> Optional[NeighborsIndex]:
+    """
+    Build and store the neighbors index of current vectors, if the project is large enough to need it (otherwise remove it).
+
+    Args:
+        project_directory (pathlib.Path): The directory of the project.
+
+    Returns:
+        Optional[NeighborsIndex]: The neighbors index, or `None` if the project has less than `NEIGHBORS_INDEX_MIN_TEXTS` texts.
+    """
+
+    # Load vectors.
+    vectors_version: Optional[int] = get_vectors_version(project_directory=project_directory)
+    list_of_data_IDs, matrix = load_vectors_matrix(project_directory=project_directory)
+
+    # Case of small project: all pairwise distances are computed.
+    if len(list_of_data_IDs) < NEIGHBORS_INDEX_MIN_TEXTS:
+        remove_neighbors_index(project_directory=project_directory)
+        return None
+
+    # Build and store the index.
+    neighbors_index: NeighborsIndex = NeighborsIndex.build(list_of_data_IDs=list_of_data_IDs, matrix=matrix)
+    neighbors_index.store(project_directory=project_directory, vectors_version=vectors_version)
+    return neighbors_index
+
+
+def get_neighbors_index(
+    project_directory: pathlib.Path,
+) -> Optional[NeighborsIndex]:
+    """
+    Get the neighbors index of current vectors (built and stored if missing or outdated).
+
+    Args:
+        project_directory (pathlib.Path): The directory of the project.
+
+    Returns:
+        Optional[NeighborsIndex]: The neighbors index, or `None` if the project has less than `NEIGHBORS_INDEX_MIN_TEXTS` texts.
+    """
+    neighbors_index: Optional[NeighborsIndex] = NeighborsIndex.load(
+        project_directory=project_directory,
+        vectors_version=get_vectors_version(project_directory=project_directory),
+    )
+    if neighbors_index is not None:
+        return neighbors_index
+    return update_neighbors_index(project_directory=project_directory)
@@ -0,0 +1,242 @@
+# -*- coding: utf-8 -*-
+
+"""
+* Name:         cognitivefactory.interactive_clustering_gui.storage.projects_registry
+* Description:  Process-level registry of existing projects, with their listing summary (metadata and status).
+* Author:       Erwan Schild
+* Created:      18/10/2026
+* Licence:      CeCILL-C License v1.0 (https://cecill.info/licences.fr.html)
+"""
+
+# ==============================================================================
+# IMPORT PYTHON DEPENDENCIES
+# ==============================================================================
+
+import json
+import os
+import pathlib
+import threading
+import time
+from typing import Any, Dict, List, Optional, Tuple
+
+# ==============================================================================
+# CONFIGURE REGISTRY
+# ==============================================================================
+
+# Delay under which a modification of the data directory is considered as too recent to trust its version.
+# NB: modification times have the granularity of the system clock tick, so a project added in the same tick as
+# the last listing doesn't change the version of the data directory. Such a "racy" listing is done again on each access.
+RACY_DELAY_NS: int = 1_000_000_000
+
+# Files that describe a project in the listing summary.
+SUMMARY_FILES: Tuple[str, ...] = ("metadata.json", "status.json")
+
+
+# ==============================================================================
+# PROJECTS REGISTRY
+# ==============================================================================
+
+
+class ProjectsRegistry:
+    """
+    A registry of existing projects (a project is represented by a subfolder in the data directory).
+    The listing of the data directory is kept in memory, and done again only when the directory is modified
+    (a project created, imported or deleted by the application, or copied into the data directory by hand),
+    so existence checks cost one `stat` call instead of a listing of the data directory.
+    The listing summary of each project (its metadata and status) is also kept until its files are modified.
+    """
+
+    def __init__(self) -> None:
+        """
+        The constructor for `ProjectsRegistry` class.
+        """
+        # Listing of the data directory: its path, its version (modification time and inode), and its project IDs.
+        self._data_directory_key: Optional[str] = None
+        self._data_directory_version: Optional[Tuple[int, int]] = None
+        self._project_ids: Dict[str, None] = {}
+        # Listing summaries by project ID: versions of summary files, and summary.
+        self._summaries: Dict[str, Tuple[Tuple[Tuple[int, int, int], ...], Dict[str, Any]]] = {}
+        self.listings: int = 0
+        self._lock: threading.Lock = threading.Lock()
+
+    def _refresh(
+        self,
+        data_directory: pathlib.Path,
+    ) -> Dict[str, None]:
+        """
+        List the data directory again if it has been modified since the last listing (the lock must be held).
+
+        Args:
+            data_directory (pathlib.Path): The path of the data directory.
+
+        Returns:
+            Dict[str, None]: The project IDs (as an ordered set).
+        """
+
+        # Get the current version of the data directory.
+        data_directory_key: str = os.path.abspath(data_directory)
+        directory_stat: os.stat_result = os.stat(data_directory_key)
+        version: Tuple[int, int] = (directory_stat.st_mtime_ns, directory_stat.st_ino)
+
+        # Case of an up-to-date listing.
+        if (
+            data_directory_key == self._data_directory_key
+            and version == self._data_directory_version
+            and time.time_ns() - version[0] > RACY_DELAY_NS
+        ):
+            return self._project_ids
+
+        # Otherwise list the data directory (`scandir` gets the type of entries without calling `stat` on most systems).
+        with os.scandir(data_directory_key) as entries:
+            self._project_ids = {entry.name: None for entry in entries if entry.is_dir()}
+        if data_directory_key != self._data_directory_key:
+            self._summaries = {}
+        self._data_directory_key = data_directory_key
+        self._data_directory_version = version
+        self.listings += 1
+
+        # Forget summaries of deleted projects.
+        for project_id in [project_id for project_id in self._summaries.keys() if project_id not in self._project_ids]:
+            self._summaries.pop(project_id)
+
+        return self._project_ids
+
+    def get_project_ids(
+        self,
+        data_directory: pathlib.Path,
+    ) -> List[str]:
+        """
+        Get the list of existing project IDs.
+
+        Args:
+            data_directory (pathlib.Path): The path of the data directory.
+
+        Returns:
+            List[str]: The list of existing project IDs.
+        """
+        with self._lock:
+            return list(self._refresh(data_directory=data_directory).keys())
+
+    def exists(
+        self,
+        data_directory: pathlib.Path,
+        project_id: str,
+    ) -> bool:
+        """
+        Check that a project exists.
+
+        Args:
+            data_directory (pathlib.Path): The path of the data directory.
+            project_id (str): The ID of the project.
+
+        Returns:
+            bool: `True` if the project exists.
+        """
+        with self._lock:
+            return project_id in self._refresh(data_directory=data_directory)
+
+    def add(
+        self,
+        data_directory: pathlib.Path,
+        project_id: str,
+    ) -> None:
+        """
+        Register a project created or imported by the application (its directory must already exist).
+
+        Args:
+            data_directory (pathlib.Path): The path of the data directory.
+            project_id (str): The ID of the project.
+        """
+        with self._lock:
+            self._refresh(data_directory=data_directory)[project_id] = None
+
+    def remove(
+        self,
+        data_directory: pathlib.Path,
+        project_id: str,
+    ) -> None:
+        """
+        Unregister a project deleted by the application (before its directory is removed).
+
+        Args:
+            data_directory (pathlib.Path): The path of the data directory.
+            project_id (str): The ID of the project.
+        """
+        with self._lock:
+            self._refresh(data_directory=data_directory).pop(project_id, None)
+            self._summaries.pop(project_id, None)
+
+    def get_summaries(
+        self,
+        data_directory: pathlib.Path,
+    ) -> Dict[str, Dict[str, Any]]:
+        """
+        Get the listing summary of existing projects (their metadata and status).
+        Summaries are parsed again only for projects whose files have been modified.
+        Projects whose files don't exist (a project being created or deleted) are ignored.
+
+        Args:
+            data_directory (pathlib.Path): The path of the data directory.
+
+        Returns:
+            Dict[str, Dict[str, Any]]: The metadata and status of each project, by project ID.
+        """
+
+        # Get the project IDs.
+        with self._lock:
+            project_ids: List[str] = list(self._refresh(data_directory=data_directory).keys())
+            summaries: Dict[str, Tuple[Tuple[Tuple[int, int, int], ...], Dict[str, Any]]] = dict(self._summaries)
+
+        # Get the summary of each project (files are read outside of the lock).
+        projects_summaries: Dict[str, Dict[str, Any]] = {}
+        for project_id in project_ids:
+            try:
+                # Get the current version of summary files.
+                file_stats: List[os.stat_result] = [
+                    os.stat(pathlib.Path(data_directory) / project_id / file_name) for file_name in SUMMARY_FILES
+                ]
+                versions: Tuple[Tuple[int, int, int], ...] = tuple(
+                    (file_stat.st_mtime_ns, file_stat.st_size, file_stat.st_ino) for file_stat in file_stats
+                )
+
+                # Parse summary files if they have been modified (or if they are too recent to trust their version).
+                cached_summary: Optional[Tuple[Tuple[Tuple[int, int, int], ...], Dict[str, Any]]] = summaries.get(
+                    project_id
+                )
+                if (
+                    cached_summary is None
+                    or cached_summary[0] != versions
+                    or any(time.time_ns() - version[0] <= RACY_DELAY_NS for version in versions)
+                ):
+                    summary: Dict[str, Any] = {}
+                    for file_name in SUMMARY_FILES:
+                        with open(pathlib.Path(data_directory) / project_id / file_name, "r") as fileobject:
+                            summary[file_name[: -len(".json")]] = json.load(fileobject)
+                    cached_summary = (versions, summary)
+                    with self._lock:
+                        if project_id in self._project_ids:
+                            self._summaries[project_id] = cached_summary
+                projects_summaries[project_id] = cached_summary[1]
+
+            except (OSError, ValueError):
+                continue  # The project is being created or deleted.
+
+        return projects_summaries
+
+    def clear(self) -> None:
+        """
+        Forget the listing of the data directory and the summaries of projects.
+        """
+        with self._lock:
+            self._data_directory_key = None
+            self._data_directory_version = None
+            self._project_ids = {}
+            self._summaries = {}
+
+
+# ==============================================================================
+# DEFAULT REGISTRY
+# ==============================================================================
+
+# The registry shared by the web server process.
+projects_registry: ProjectsRegistry = ProjectsRegistry()
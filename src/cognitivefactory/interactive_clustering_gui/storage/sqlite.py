@@ -0,0 +1,911 @@
+# -*- coding: utf-8 -*-
+
+"""
+* Name:         cognitivefactory.interactive_clustering_gui.storage.sqlite
+* Description:  Definition of the default project storage, based on an embedded SQLite database.
+* Author:       Erwan Schild
+* Created:      18/10/2026
+* Licence:      CeCILL-C License v1.0 (https://cecill.info/licences.fr.html)
+"""
+
+# ==============================================================================
+# IMPORT PYTHON DEPENDENCIES
+# ==============================================================================
+
+import contextlib
+import json
+import os
+import pathlib
+import sqlite3
+from typing import Any, Dict, Iterator, List, Optional, Set, Tuple
+
+from cognitivefactory.interactive_clustering_gui.storage.abstract import AbstractProjectStorage
+
+# ==============================================================================
+# DATABASE SCHEMA
+# ==============================================================================
+
+# Name of the database file in the project directory.
+SQLITE_DATABASE_NAME: str = "project.db"
+
+# Schema of the database (texts and constraints tables, with indexes for lookups by text ID).
+SQLITE_SCHEMA: str = """
+CREATE TABLE IF NOT EXISTS texts (
+    text_id TEXT PRIMARY KEY,
+    text_original TEXT NOT NULL,
+    text TEXT NOT NULL,
+    text_preprocessed TEXT NOT NULL,
+    is_deleted INTEGER NOT NULL
+);
+CREATE TABLE IF NOT EXISTS constraints (
+    constraint_id TEXT PRIMARY KEY,
+    id_1 TEXT NOT NULL,
+    id_2 TEXT NOT NULL,
+    constraint_type TEXT,
+    constraint_type_previous TEXT NOT NULL,
+    is_hidden INTEGER NOT NULL,
+    to_annotate INTEGER NOT NULL,
+    to_review INTEGER NOT NULL,
+    to_fix_conflict INTEGER NOT NULL,
+    comment TEXT NOT NULL,
+    date_of_update REAL,
+    iteration_of_sampling INTEGER NOT NULL
+);
+CREATE INDEX IF NOT EXISTS constraints_id_1 ON constraints (id_1);
+CREATE INDEX IF NOT EXISTS constraints_id_2 ON constraints (id_2);
+"""
+
+# Version of the database schema (stored in `user_version` pragma).
+SQLITE_SCHEMA_VERSION: int = 1
+
+# Migrations of the database schema (statements to apply to reach each version).
+SQLITE_MIGRATIONS: Dict[int, Tuple[str, ...]] = {
+    # Version 1: texts of constraints are copied in constraints table, in order to sort constraints by texts with an index.
+    1: (
+        "ALTER TABLE constraints ADD COLUMN text_1 TEXT",
+        "ALTER TABLE constraints ADD COLUMN text_2 TEXT",
+        "UPDATE constraints SET text_1 = (SELECT text FROM texts WHERE text_id = id_1), text_2 = (SELECT text FROM texts WHERE text_id = id_2)",
+    ),
+}
+
+# Expressions used to sort texts and constraints, for each sort option (each of them is indexed).
+TEXTS_SORT_EXPRESSIONS: Dict[str, Tuple[str, ...]] = {
+    "id": ("text_id",),
+    "alphabetical": ("text_preprocessed",),
+    "is_deleted": ("is_deleted",),
+}
+CONSTRAINTS_SORT_EXPRESSIONS: Dict[str, Tuple[str, ...]] = {
+    "id": ("constraint_id",),
+    "text": ("text_1", "text_2"),
+    "constraint_type": (
+        "(CASE WHEN constraint_type IS NULL THEN 2 WHEN constraint_type = 'CANNOT_LINK' THEN 1 ELSE 0 END)",
+    ),
+    "date_of_update": ("COALESCE(date_of_update, 0)",),
+    "iteration_of_sampling": ("iteration_of_sampling",),
+    "to_annotate": ("(1 - to_annotate)",),
+    "to_review": ("(1 - to_review)",),
+    "to_fix_conflict": ("(1 - to_fix_conflict)",),
+}
+
+# Sort options with numeric expressions, whose reversed sort uses an index of negated expressions.
+# NB: a reversed sort keeps the insertion order of equal values, so an index scanned backward would need an additional sort.
+NUMERIC_SORT_OPTIONS: Tuple[str, ...] = (
+    "is_deleted",
+    "constraint_type",
+    "date_of_update",
+    "iteration_of_sampling",
+    "to_annotate",
+    "to_review",
+    "to_fix_conflict",
+)
+
+
+def _get_sort_expressions(
+    sort_expressions: Tuple[str, ...],
+    numeric: bool,
+    sorted_reverse: bool,
+) -> Tuple[Tuple[str, ...], bool]:
+    """
+    Get the expressions and the direction of a sort (numeric reversed sorts are done by ascending negated expressions).
+
+    Args:
+        sort_expressions (Tuple[str, ...]): The expressions of the sort option.
+        numeric (bool): The option to indicate that sort expressions are numeric.
+        sorted_reverse (bool): The option to reverse the sort.
+
+    Returns:
+        Tuple[Tuple[str, ...], bool]: The expressions to sort by, and `True` if they are sorted in descending order.
+    """
+    if numeric and sorted_reverse:
+        return tuple("(-{expression})".format(expression=expression) for expression in sort_expressions), False
+    return sort_expressions, sorted_reverse
+
+
+# Sort indexes of texts and constraints, and triggers that keep texts of constraints up to date on each write.
+SQLITE_SORT_INDEXES: str = (
+    "".join(
+        "CREATE INDEX IF NOT EXISTS {table}_sort_{sort_option}{suffix} ON {table} ({expressions});\n".format(
+            table=table,
+            sort_option=sort_option,
+            suffix=("_reversed" if sorted_reverse else ""),
+            expressions=", ".join(
+                _get_sort_expressions(
+                    sort_expressions=sort_expressions,
+                    numeric=(sort_option in NUMERIC_SORT_OPTIONS),
+                    sorted_reverse=sorted_reverse,
+                )[0]
+            ),
+        )
+        for table, table_sort_expressions in (
+            ("texts", TEXTS_SORT_EXPRESSIONS),
+            ("constraints", CONSTRAINTS_SORT_EXPRESSIONS),
+        )
+        for sort_option, sort_expressions in table_sort_expressions.items()
+        for sorted_reverse in ((False, True) if (sort_option in NUMERIC_SORT_OPTIONS) else (False,))
+        if sort_option != "id"  # Already indexed as primary key.
+    )
+    + """
+CREATE TRIGGER IF NOT EXISTS texts_after_insert AFTER INSERT ON texts BEGIN
+    UPDATE constraints SET text_1 = NEW.text WHERE id_1 = NEW.text_id;
+    UPDATE constraints SET text_2 = NEW.text WHERE id_2 = NEW.text_id;
+END;
+CREATE TRIGGER IF NOT EXISTS texts_after_update AFTER UPDATE OF text ON texts BEGIN
+    UPDATE constraints SET text_1 = NEW.text WHERE id_1 = NEW.text_id;
+    UPDATE constraints SET text_2 = NEW.text WHERE id_2 = NEW.text_id;
+END;
+CREATE TRIGGER IF NOT EXISTS constraints_after_insert AFTER INSERT ON constraints BEGIN
+    UPDATE constraints SET
+        text_1 = (SELECT text FROM texts WHERE text_id = NEW.id_1),
+        text_2 = (SELECT text FROM texts WHERE text_id = NEW.id_2)
+    WHERE rowid = NEW.rowid;
+END;
+CREATE TRIGGER IF NOT EXISTS constraints_after_update AFTER UPDATE OF id_1, id_2 ON constraints BEGIN
+    UPDATE constraints SET
+        text_1 = (SELECT text FROM texts WHERE text_id = NEW.id_1),
+        text_2 = (SELECT text FROM texts WHERE text_id = NEW.id_2)
+    WHERE rowid = NEW.rowid;
+END;
+"""
+)
+
+# Columns of tables (in `SELECT` order).
+TEXTS_COLUMNS: Tuple[str, ...] = ("text_id", "text_original", "text", "text_preprocessed", "is_deleted")
+CONSTRAINTS_COLUMNS: Tuple[str, ...] = (
+    "constraint_id",
+    "id_1",
+    "id_2",
+    "constraint_type",
+    "constraint_type_previous",
+    "is_hidden",
+    "to_annotate",
+    "to_review",
+    "to_fix_conflict",
+    "comment",
+    "date_of_update",
+    "iteration_of_sampling",
+)
+
+# Databases whose schema is up to date, by path and inode (in the current process, a replaced database file gets a new inode).
+# NB: a connection to such a database skips the schema creation, which costs about thirty statements.
+_INITIALIZED_DATABASES: Set[Tuple[str, int]] = set()
+
+# Maximum number of variables in a query (SQLite default limit is 999).
+SQLITE_MAX_VARIABLES: int = 900
+
+
+# ==============================================================================
+# ROWS CONVERSION
+# ==============================================================================
+
+
+def _text_to_row(text_id: str, text_value: Dict[str, Any]) -> Tuple[Any, ...]:
+    """
+    Convert a text into a database row.
+
+    Args:
+        text_id (str): The ID of the text.
+        text_value (Dict[str, Any]): The text.
+
+    Returns:
+        Tuple[Any, ...]: The database row.
+    """
+    return (
+        text_id,
+        text_value["text_original"],
+        text_value["text"],
+        text_value["text_preprocessed"],
+        int(text_value["is_deleted"]),
+    )
+
+
+def _row_to_text(row: Tuple[Any, ...]) -> Dict[str, Any]:
+    """
+    Convert a database row into a text.
+
+    Args:
+        row (Tuple[Any, ...]): The database row (without text ID).
+
+    Returns:
+        Dict[str, Any]: The text.
+    """
+    return {
+        "text_original": row[0],
+        "text": row[1],
+        "text_preprocessed": row[2],
+        "is_deleted": bool(row[3]),
+    }
+
+
+def _constraint_to_row(constraint_id: str, constraint_value: Dict[str, Any]) -> Tuple[Any, ...]:
+    """
+    Convert a constraint into a database row.
+
+    Args:
+        constraint_id (str): The ID of the constraint.
+        constraint_value (Dict[str, Any]): The constraint.
+
+    Returns:
+        Tuple[Any, ...]: The database row.
+    """
+    return (
+        constraint_id,
+        constraint_value["data"]["id_1"],
+        constraint_value["data"]["id_2"],
+        constraint_value["constraint_type"],
+        json.dumps(constraint_value["constraint_type_previous"]),
+        int(constraint_value["is_hidden"]),
+        int(constraint_value["to_annotate"]),
+        int(constraint_value["to_review"]),
+        int(constraint_value["to_fix_conflict"]),
+        constraint_value["comment"],
+        constraint_value["date_of_update"],
+        constraint_value["iteration_of_sampling"],
+    )
+
+
+def _row_to_constraint(row: Tuple[Any, ...]) -> Dict[str, Any]:
+    """
+    Convert a database row into a constraint.
+
+    Args:
+        row (Tuple[Any, ...]): The database row (without constraint ID).
+
+    Returns:
+        Dict[str, Any]: The constraint.
+    """
+    return {
+        "data": {
+            "id_1": row[0],
+            "id_2": row[1],
+        },
+        "constraint_type": row[2],
+        "constraint_type_previous": json.loads(row[3]),
+        "is_hidden": bool(row[4]),
+        "to_annotate": bool(row[5]),
+        "to_review": bool(row[6]),
+        "to_fix_conflict": bool(row[7]),
+        "comment": row[8],
+        "date_of_update": row[9],
+        "iteration_of_sampling": row[10],
+    }
+
+
+def _field_to_columns(field_name: str, field_value: Any) -> Dict[str, Any]:
+    """
+    Convert an updated field of a text or a constraint into database columns values.
+
+    Args:
+        field_name (str): The name of the updated field.
+        field_value (Any): The new value of the field.
+
+    Returns:
+        Dict[str, Any]: The columns values to update.
+    """
+    if field_name == "data":
+        return {"id_1": field_value["id_1"], "id_2": field_value["id_2"]}
+    if field_name == "constraint_type_previous":
+        return {field_name: json.dumps(field_value)}
+    if isinstance(field_value, bool):
+        return {field_name: int(field_value)}
+    return {field_name: field_value}
+
+
+# ==============================================================================
+# SQLITE PROJECT STORAGE
+# ==============================================================================
+
+
+class SqliteProjectStorage(AbstractProjectStorage):
+    """
+    Project storage based on an embedded SQLite database (`project.db`).
+    Texts and constraints are stored as rows, so an update only writes the modified rows.
+    """
+
+    def __init__(
+        self,
+        project_directory: pathlib.Path,
+    ) -> None:
+        """
+        The constructor for SQLite project storage.
+
+        Args:
+            project_directory (pathlib.Path): The directory of the project.
+        """
+        super().__init__(project_directory=project_directory)
+
+        # Connection of the current transaction.
+        self._transaction_connection: Optional[sqlite3.Connection] = None
+
+    # ==============================================================================
+    # CONNECTION HANDLING
+    # ==============================================================================
+    def _connect(self) -> sqlite3.Connection:
+        """
+        Open a connection to the project database (and create its schema if it hasn't been done by the current process).
+
+        Returns:
+            sqlite3.Connection: A connection to the project database.
+        """
+        database_path: str = os.path.abspath(self.project_directory / SQLITE_DATABASE_NAME)
+        connection: sqlite3.Connection = sqlite3.connect(database_path, timeout=30)
+        database_key: Tuple[str, int] = (database_path, os.stat(database_path).st_ino)
+        if database_key not in _INITIALIZED_DATABASES:
+            connection.executescript(SQLITE_SCHEMA)
+            self._migrate(connection=connection)
+            connection.executescript(SQLITE_SORT_INDEXES)
+            _INITIALIZED_DATABASES.add(database_key)
+        connection.create_function("casefold", 1, str.casefold, deterministic=True)
+        return connection
+
+    def _migrate(self, connection: sqlite3.Connection) -> None:
+        """
+        Migrate the database schema to the current version (in an exclusive transaction, to avoid concurrent migrations).
+
+        Args:
+            connection (sqlite3.Connection): A connection to the project database.
+        """
+
+        # Quick check without lock.
+        if connection.execute("PRAGMA user_version").fetchone()[0] >= SQLITE_SCHEMA_VERSION:
+            return
+
+        # Migrate under lock, and check again: another connection may have migrated the database.
+        connection.execute("BEGIN IMMEDIATE")
+        try:
+            schema_version: int = connection.execute("PRAGMA user_version").fetchone()[0]
+            for migration_version in range(schema_version + 1, SQLITE_SCHEMA_VERSION + 1):
+                for statement in SQLITE_MIGRATIONS[migration_version]:
+                    connection.execute(statement)
+            connection.execute(
+                "PRAGMA user_version = {version}".format(version=max(schema_version, SQLITE_SCHEMA_VERSION))
+            )
+            connection.commit()
+        except Exception:
+            connection.rollback()
+            raise
+
+    @contextlib.contextmanager
+    def _connection(self) -> Iterator[sqlite3.Connection]:
+        """
+        Get the connection of the current transaction, or a new connection committed at the end of the context.
+
+        Yields:
+            sqlite3.Connection: A connection to the project database.
+        """
+
+        # Case of current transaction.
+        if self._transaction_connection is not None:
+            yield self._transaction_connection
+            return
+
+        # Otherwise, use a short connection.
+        connection: sqlite3.Connection = self._connect()
+        try:
+            with connection:  # Commit or rollback.
+                yield connection
+        finally:
+            connection.close()
+
+    @contextlib.contextmanager
+    def transaction(self) -> Iterator[None]:
+        """
+        Group several storage operations in one atomic SQLite transaction.
+
+        Yields:
+            None: Operations are committed when the context ends without error, and rollbacked otherwise.
+        """
+
+        # Case of nested transaction.
+        if self._transaction_connection is not None:
+            yield
+            return
+
+        # Start the transaction.
+        self._transaction_connection = self._connect()
+        try:
+            with self._transaction_connection:  # Commit or rollback.
+                yield
+        finally:
+            self._transaction_connection.close()
+            self._transaction_connection = None
+
+    # ==============================================================================
+    # GENERIC QUERIES
+    # ==============================================================================
+    def _select(
+        self,
+        table: str,
+        columns: Tuple[str, ...],
+        where_columns: Tuple[str, ...] = (),
+        where_values: Optional[List[str]] = None,
+    ) -> List[Tuple[Any, ...]]:
+        """
+        Select rows of a table, in their insertion order.
+
+        Args:
+            table (str): The name of the table.
+            columns (Tuple[str, ...]): The columns to select.
+            where_columns (Tuple[str, ...], optional): The columns to filter (with a `OR`). Defaults to `()`.
+            where_values (Optional[List[str]], optional): The values to keep for filtered columns. If `None`, get all rows. Defaults to `None`.
+
+        Returns:
+            List[Tuple[Any, ...]]: The selected rows.
+        """
+        with self._connection() as connection:
+            # Case of all rows.
+            if where_values is None:
+                return connection.execute(
+                    "SELECT {columns} FROM {table} ORDER BY rowid".format(  # noqa: S608 (no user input)
+                        columns=", ".join(columns),
+                        table=table,
+                    )
+                ).fetchall()
+
+            # Case of filtered rows: split the query to respect SQLite variables limit.
+            rows: Dict[int, Tuple[Any, ...]] = {}
+            for start in range(0, len(where_values), SQLITE_MAX_VARIABLES // max(1, len(where_columns))):
+                chunk: List[str] = where_values[start : start + SQLITE_MAX_VARIABLES // max(1, len(where_columns))]
+                placeholders: str = ", ".join("?" for _ in chunk)
+                for row in connection.execute(
+                    "SELECT rowid, {columns} FROM {table} WHERE {conditions}".format(  # noqa: S608 (no user input)
+                        columns=", ".join(columns),
+                        table=table,
+                        conditions=" OR ".join(
+                            "{column} IN ({placeholders})".format(column=column, placeholders=placeholders)
+                            for column in where_columns
+                        ),
+                    ),
+                    [value for _ in where_columns for value in chunk],
+                ):
+                    rows[row[0]] = row[1:]
+            return [rows[rowid] for rowid in sorted(rows.keys())]
+
+    def _update(
+        self,
+        table: str,
+        id_column: str,
+        updates: Dict[str, Dict[str, Any]],
+    ) -> None:
+        """
+        Update some columns of some rows of a table.
+
+        Args:
+            table (str): The name of the table.
+            id_column (str): The primary key column.
+            updates (Dict[str, Dict[str, Any]]): The fields to update for each row ID.
+        """
+
+        # Group rows by updated columns (bulk updates often update the same columns of many rows).
+        rows_values_by_columns: Dict[Tuple[str, ...], List[List[Any]]] = {}
+        for row_id, row_update in updates.items():
+            columns_values: Dict[str, Any] = {}
+            for field_name, field_value in row_update.items():
+                columns_values.update(_field_to_columns(field_name=field_name, field_value=field_value))
+            if len(columns_values) == 0:  # noqa: WPS507
+                continue
+            rows_values_by_columns.setdefault(tuple(columns_values.keys()), []).append(
+                [*columns_values.values(), row_id]
+            )
+
+        # Run one statement per group of rows.
+        with self._connection() as connection:
+            for columns, rows_values in rows_values_by_columns.items():
+                connection.executemany(
+                    "UPDATE {table} SET {assignments} WHERE {id_column} = ?".format(  # noqa: S608 (no user input)
+                        table=table,
+                        assignments=", ".join("{column} = ?".format(column=column) for column in columns),
+                        id_column=id_column,
+                    ),
+                    rows_values,
+                )
+
+    def _select_page(
+        self,
+        table: str,
+        columns: Tuple[str, ...],
+        sort_expressions: Tuple[str, ...],
+        numeric: bool,
+        sorted_reverse: bool,
+        conditions: List[str],
+        values: List[Any],
+        after_position: Optional[Tuple[Any, int]],
+        offset: int,
+        limit: Optional[int],
+    ) -> Tuple[List[Tuple[Any, ...]], List[Tuple[Any, int]], int]:
+        """
+        Select a page of rows of a table, filtered and sorted by indexed expressions, then by insertion order (`rowid`).
+
+        Args:
+            table (str): The name of the table.
+            columns (Tuple[str, ...]): The columns to select.
+            sort_expressions (Tuple[str, ...]): The expressions to sort by.
+            numeric (bool): The option to indicate that sort expressions are numeric.
+            sorted_reverse (bool): The option to reverse the sort (insertion order of equal values is kept).
+            conditions (List[str]): The conditions on rows to select (with a `AND`).
+            values (List[Any]): The values of conditions placeholders.
+            after_position (Optional[Tuple[Any, int]]): The position (sort values and `rowid`) after which rows are selected.
+            offset (int): The number of rows to skip.
+            limit (Optional[int]): The maximum number of rows to select. If `None`, select all rows.
+
+        Returns:
+            Tuple[List[Tuple[Any, ...]], List[Tuple[Any, int]], int]: The selected rows, their positions, and the number of rows matching the conditions.
+        """
+
+        # Define sort (with a single value, positions don't use a list).
+        expressions, descending = _get_sort_expressions(
+            sort_expressions=sort_expressions,
+            numeric=numeric,
+            sorted_reverse=sorted_reverse,
+        )
+        conditions = ["1", *conditions]
+        values = list(values)
+
+        with self._connection() as connection:
+            # Count rows matching the conditions.
+            total: int = connection.execute(
+                "SELECT COUNT(*) FROM {table} WHERE {conditions}".format(  # noqa: S608 (no user input)
+                    table=table,
+                    conditions=" AND ".join(conditions),
+                ),
+                values,
+            ).fetchone()[0]
+
+            # Skip rows before the requested position (with row values comparisons).
+            if after_position is not None:
+                sort_values: List[Any] = list(after_position[0]) if (len(expressions) > 1) else [after_position[0]]
+                conditions.append(
+                    "(({expressions}) {operator} ({placeholders}) OR (({expressions}) = ({placeholders}) AND rowid > ?))".format(
+                        expressions=", ".join(expressions),
+                        operator=("<" if descending else ">"),
+                        placeholders=", ".join("?" for _ in expressions),
+                    )
+                )
+                values.extend([*sort_values, *sort_values, after_position[1]])
+
+            # Get the requested page.
+            rows: List[Tuple[Any, ...]] = connection.execute(
+                "SELECT {expressions}, rowid, {columns} FROM {table} WHERE {conditions} ORDER BY {order}, rowid ASC LIMIT ? OFFSET ?".format(  # noqa: S608 (no user input)
+                    expressions=", ".join(expressions),
+                    columns=", ".join(columns),
+                    table=table,
+                    conditions=" AND ".join(conditions),
+                    order=", ".join(
+                        "{expression} {direction}".format(
+                            expression=expression,
+                            direction=("DESC" if descending else "ASC"),
+                        )
+                        for expression in expressions
+                    ),
+                ),
+                [*values, (-1 if limit is None else limit), offset],
+            ).fetchall()
+
+        # Split rows into positions and selected columns.
+        nb_expressions: int = len(expressions)
+        return (
+            [row[nb_expressions + 1 :] for row in rows],
+            [((list(row[:nb_expressions]) if nb_expressions > 1 else row[0]), row[nb_expressions]) for row in rows],
+            total,
+        )
+
+    # ==============================================================================
+    # TEXTS
+    # ==============================================================================
+    def get_texts(
+        self,
+        text_ids: Optional[List[str]] = None,
+    ) -> Dict[str, Dict[str, Any]]:
+        """
+        Get texts, in their insertion order.
+
+        Args:
+            text_ids (Optional[List[str]], optional): The IDs of texts to get. If `None`, get all texts. Defaults to `None`.
+
+        Returns:
+            Dict[str, Dict[str, Any]]: The requested texts.
+        """
+        return {
+            row[0]: _row_to_text(row[1:])
+            for row in self._select(
+                table="texts",
+                columns=TEXTS_COLUMNS,
+                where_columns=("text_id",),
+                where_values=text_ids,
+            )
+        }
+
+    def set_texts(
+        self,
+        texts: Dict[str, Dict[str, Any]],
+    ) -> None:
+        """
+        Replace all texts.
+
+        Args:
+            texts (Dict[str, Dict[str, Any]]): The new texts.
+        """
+        with self._connection() as connection:
+            connection.execute("DELETE FROM texts")
+            connection.executemany(
+                "INSERT INTO texts ({columns}) VALUES ({placeholders})".format(
+                    columns=", ".join(TEXTS_COLUMNS),
+                    placeholders=", ".join("?" for _ in TEXTS_COLUMNS),
+                ),
+                (_text_to_row(text_id=text_id, text_value=text_value) for text_id, text_value in texts.items()),
+            )
+
+    def update_texts(
+        self,
+        texts_updates: Dict[str, Dict[str, Any]],
+    ) -> None:
+        """
+        Update some fields of some texts.
+
+        Args:
+            texts_updates (Dict[str, Dict[str, Any]]): The fields to update for each text ID.
+        """
+        self._update(table="texts", id_column="text_id", updates=texts_updates)
+
+    def query_texts(
+        self,
+        without_deleted_texts: bool = False,
+        filter_text: Optional[str] = None,
+        sorted_by: str = "id",
+        sorted_reverse: bool = False,
+        after_position: Optional[Tuple[Any, int]] = None,
+        offset: int = 0,
+        limit: Optional[int] = None,
+        fields: Optional[List[str]] = None,
+    ) -> Tuple[Dict[str, Dict[str, Any]], List[Tuple[Any, int]], int]:
+        """
+        Get a page of texts, filtered and sorted (the sort uses the indexes of texts table, and `rowid` is the insertion rank).
+
+        Args:
+            without_deleted_texts (bool, optional): The option to not return deleted texts. Defaults to `False`.
+            filter_text (Optional[str], optional): A substring that texts must contain (case insensitive). Defaults to `None`.
+            sorted_by (str, optional): The field to sort texts by. Can be `"id"`, `"alphabetical"` or `"is_deleted"`. Defaults to `"id"`.
+            sorted_reverse (bool, optional): The option to reverse texts order. Defaults to `False`.
+            after_position (Optional[Tuple[Any, int]], optional): The position (sort value and insertion rank) after which texts are returned. Defaults to `None`.
+            offset (int, optional): The number of texts to skip. Defaults to `0`.
+            limit (Optional[int], optional): The maximum number of texts to return. If `None`, return all texts. Defaults to `None`.
+            fields (Optional[List[str]], optional): The fields of texts to return. If `None`, return all fields. Defaults to `None`.
+
+        Returns:
+            Tuple[Dict[str, Dict[str, Any]], List[Tuple[Any, int]], int]: The requested texts, their positions, and the number of texts matching the filters.
+        """
+
+        # Define selected columns.
+        fields_columns: List[str] = [column for column in TEXTS_COLUMNS[1:] if (fields is None or column in fields)]
+
+        # Define filters.
+        conditions: List[str] = []
+        values: List[Any] = []
+        if without_deleted_texts:
+            conditions.append("is_deleted = 0")
+        if filter_text is not None:
+            conditions.append("instr(casefold(text), ?) > 0")
+            values.append(filter_text.casefold())
+
+        # Get the requested page.
+        rows, positions, total = self._select_page(
+            table="texts",
+            columns=("text_id", *fields_columns),
+            sort_expressions=TEXTS_SORT_EXPRESSIONS[sorted_by],
+            numeric=(sorted_by in NUMERIC_SORT_OPTIONS),
+            sorted_reverse=sorted_reverse,
+            conditions=conditions,
+            values=values,
+            after_position=after_position,
+            offset=offset,
+            limit=limit,
+        )
+        return (
+            {
+                row[0]: {
+                    column: (bool(column_value) if column == "is_deleted" else column_value)
+                    for column, column_value in zip(fields_columns, row[1:])
+                }
+                for row in rows
+            },
+            positions,
+            total,
+        )
+
+    # ==============================================================================
+    # CONSTRAINTS
+    # ==============================================================================
+    def get_constraints(
+        self,
+        constraint_ids: Optional[List[str]] = None,
+    ) -> Dict[str, Dict[str, Any]]:
+        """
+        Get constraints, in their insertion order.
+
+        Args:
+            constraint_ids (Optional[List[str]], optional): The IDs of constraints to get. If `None`, get all constraints. Defaults to `None`.
+
+        Returns:
+            Dict[str, Dict[str, Any]]: The requested constraints.
+        """
+        return {
+            row[0]: _row_to_constraint(row[1:])
+            for row in self._select(
+                table="constraints",
+                columns=CONSTRAINTS_COLUMNS,
+                where_columns=("constraint_id",),
+                where_values=constraint_ids,
+            )
+        }
+
+    def get_constraints_of_texts(
+        self,
+        text_ids: List[str],
+    ) -> Dict[str, Dict[str, Any]]:
+        """
+        Get constraints involving at least one of the given texts (indexed lookup).
+
+        Args:
+            text_ids (List[str]): The IDs of texts.
+
+        Returns:
+            Dict[str, Dict[str, Any]]: The constraints involving these texts.
+        """
+        return {
+            row[0]: _row_to_constraint(row[1:])
+            for row in self._select(
+                table="constraints",
+                columns=CONSTRAINTS_COLUMNS,
+                where_columns=("id_1", "id_2"),
+                where_values=text_ids,
+            )
+        }
+
+    def query_constraints(
+        self,
+        without_hidden_constraints: bool = False,
+        iteration_of_sampling: Optional[int] = None,
+        constraint_types: Optional[List[Optional[str]]] = None,
+        to_annotate: Optional[bool] = None,
+        to_review: Optional[bool] = None,
+        to_fix_conflict: Optional[bool] = None,
+        sorted_by: str = "id",
+        sorted_reverse: bool = False,
+        after_position: Optional[Tuple[Any, int]] = None,
+        offset: int = 0,
+        limit: Optional[int] = None,
+    ) -> Tuple[Dict[str, Dict[str, Any]], List[Tuple[Any, int]], int]:
+        """
+        Get a page of constraints, filtered and sorted (the sort uses the expression indexes of constraints table, and `rowid` is the insertion rank).
+
+        Args:
+            without_hidden_constraints (bool, optional): The option to not return hidden constraints. Defaults to `False`.
+            iteration_of_sampling (Optional[int], optional): The iteration of sampling of constraints to return. Defaults to `None`.
+            constraint_types (Optional[List[Optional[str]]], optional): The types of constraints to return (`None` for skipped constraints). Defaults to `None`.
+            to_annotate (Optional[bool], optional): The annotation status of constraints to return. Defaults to `None`.
+            to_review (Optional[bool], optional): The review status of constraints to return. Defaults to `None`.
+            to_fix_conflict (Optional[bool], optional): The conflict status of constraints to return. Defaults to `None`.
+            sorted_by (str, optional): The option to sort constraints by (a key of `CONSTRAINTS_SORT_EXPRESSIONS`). Defaults to `"id"`.
+            sorted_reverse (bool, optional): The option to reverse constraints order. Defaults to `False`.
+            after_position (Optional[Tuple[Any, int]], optional): The position (sort value and insertion rank) after which constraints are returned. Defaults to `None`.
+            offset (int, optional): The number of constraints to skip. Defaults to `0`.
+            limit (Optional[int], optional): The maximum number of constraints to return. If `None`, return all constraints. Defaults to `None`.
+
+        Returns:
+            Tuple[Dict[str, Dict[str, Any]], List[Tuple[Any, int]], int]: The requested constraints, their positions, and the number of constraints matching the filters.
+        """
+
+        # Define filters.
+        conditions: List[str] = []
+        values: List[Any] = []
+        if without_hidden_constraints:
+            conditions.append("is_hidden = 0")
+        for column, column_value in (
+            ("iteration_of_sampling", iteration_of_sampling),
+            ("to_annotate", to_annotate),
+            ("to_review", to_review),
+            ("to_fix_conflict", to_fix_conflict),
+        ):
+            if column_value is not None:
+                conditions.append("{column} = ?".format(column=column))
+                values.append(int(column_value))
+        if constraint_types is not None:
+            conditions.append(
+                "({type_conditions})".format(
+                    type_conditions=" OR ".join(
+                        ["0"]
+                        + ["constraint_type = ?" for constraint_type in constraint_types if constraint_type is not None]
+                        + ["constraint_type IS NULL" for constraint_type in constraint_types if constraint_type is None]
+                    ),
+                )
+            )
+            values.extend(constraint_type for constraint_type in constraint_types if constraint_type is not None)
+
+        # Get the requested page.
+        rows, positions, total = self._select_page(
+            table="constraints",
+            columns=CONSTRAINTS_COLUMNS,
+            sort_expressions=CONSTRAINTS_SORT_EXPRESSIONS[sorted_by],
+            numeric=(sorted_by in NUMERIC_SORT_OPTIONS),
+            sorted_reverse=sorted_reverse,
+            conditions=conditions,
+            values=values,
+            after_position=after_position,
+            offset=offset,
+            limit=limit,
+        )
+        return (
+            {row[0]: _row_to_constraint(row[1:]) for row in rows},
+            positions,
+            total,
+        )
+
+    def set_constraints(
+        self,
+        constraints: Dict[str, Dict[str, Any]],
+    ) -> None:
+        """
+        Replace all constraints.
+
+        Args:
+            constraints (Dict[str, Dict[str, Any]]): The new constraints.
+        """
+        with self._connection() as connection:
+            connection.execute("DELETE FROM constraints")
+        self.add_constraints(constraints=constraints)
+
+    def add_constraints(
+        self,
+        constraints: Dict[str, Dict[str, Any]],
+    ) -> None:
+        """
+        Add new constraints. Already known constraints are overwritten, but keep their position.
+
+        Args:
+            constraints (Dict[str, Dict[str, Any]]): The constraints to add.
+        """
+        with self._connection() as connection:
+            connection.executemany(
+                "INSERT INTO constraints ({columns}) VALUES ({placeholders}) ON CONFLICT (constraint_id) DO UPDATE SET {assignments}".format(
+                    columns=", ".join(CONSTRAINTS_COLUMNS),
+                    placeholders=", ".join("?" for _ in CONSTRAINTS_COLUMNS),
+                    assignments=", ".join(
+                        "{column} = excluded.{column}".format(column=column) for column in CONSTRAINTS_COLUMNS[1:]
+                    ),
+                ),
+                (
+                    _constraint_to_row(constraint_id=constraint_id, constraint_value=constraint_value)
+                    for constraint_id, constraint_value in constraints.items()
+                ),
+            )
+
+    def update_constraints(
+        self,
+        constraints_updates: Dict[str, Dict[str, Any]],
+    ) -> None:
+        """
+        Update some fields of some constraints.
+
+        Args:
+            constraints_updates (Dict[str, Dict[str, Any]]): The fields to update for each constraint ID.
+        """
+        self._update(table="constraints", id_column="constraint_id", updates=constraints_updates)
@@ -0,0 +1,212 @@
+# -*- coding: utf-8 -*-
+
+"""
+* Name:         cognitivefactory.interactive_clustering_gui.storage.vectors
+* Description:  Columnar storage of texts vectors, as a single memory-mappable CSR matrix with an ID index.
+* Author:       Erwan Schild
+* Created:      18/10/2026
+* Licence:      CeCILL-C License v1.0 (https://cecill.info/licences.fr.html)
+"""
+
+# ==============================================================================
+# IMPORT PYTHON DEPENDENCIES
+# ==============================================================================
+
+import copy
+import json
+import os
+import pathlib
+import pickle  # noqa: S403
+from typing import Any, Dict, List, Optional, Tuple
+
+import numpy as np
+from scipy.sparse import csr_matrix, vstack
+
+# ==============================================================================
+# VECTORS FILES
+# ==============================================================================
+
+# Names of the CSR components files (raw `.npy` arrays, that can be memory-mapped).
+VECTORS_DATA_NAME: str = "vectors_data.npy"
+VECTORS_INDICES_NAME: str = "vectors_indices.npy"
+VECTORS_INDPTR_NAME: str = "vectors_indptr.npy"
+
+# Name of the ID index file (written last, so it marks a complete storage).
+VECTORS_INDEX_NAME: str = "vectors_index.json"
+
+# Name of the legacy vectors file (a pickled dictionary of one-row CSR matrices).
+LEGACY_VECTORS_NAME: str = "vectors.pkl"
+
+
+# ==============================================================================
+# VECTORS STORAGE
+# ==============================================================================
+
+
+def store_vectors(
+    project_directory: pathlib.Path,
+    dict_of_vectors: Dict[str, csr_matrix],
+) -> None:
+    """
+    Store texts vectors as a single CSR matrix (one `.npy` file per component) and its ID index.
+
+    Args:
+        project_directory (pathlib.Path): The directory of the project.
+        dict_of_vectors (Dict[str, csr_matrix]): The vectors of texts.
+    """
+
+    # Convert vectors into a canonical matrix (sorted indices without duplicates, so loaded rows are never modified).
+    list_of_data_IDs: List[str] = list(dict_of_vectors.keys())
+    matrix: csr_matrix = csr_matrix(vstack([dict_of_vectors[data_ID] for data_ID in list_of_data_IDs], format="csr"))
+    matrix.sum_duplicates()
+    matrix.sort_indices()
+
+    # Remove the index first: an incomplete storage is detected as missing.
+    if (project_directory / VECTORS_INDEX_NAME).exists():
+        os.remove(project_directory / VECTORS_INDEX_NAME)
+
+    # Store CSR components (through temporary files, to avoid partial arrays).
+    for component_name, component_array in (
+        (VECTORS_DATA_NAME, matrix.data),
+        (VECTORS_INDICES_NAME, matrix.indices),
+        (VECTORS_INDPTR_NAME, matrix.indptr),
+    ):
+        with open(project_directory / (component_name + ".tmp"), "wb") as component_fileobject:
+            np.save(component_fileobject, component_array, allow_pickle=False)
+        os.replace(project_directory / (component_name + ".tmp"), project_directory / component_name)
+
+    # Store ID index.
+    with open(project_directory / (VECTORS_INDEX_NAME + ".tmp"), "w") as index_fileobject:
+        json.dump(
+            {
+                "list_of_data_IDs": list_of_data_IDs,
+                "shape": list(matrix.shape),
+            },
+            index_fileobject,
+        )
+    os.replace(project_directory / (VECTORS_INDEX_NAME + ".tmp"), project_directory / VECTORS_INDEX_NAME)
+
+    # Remove legacy vectors.
+    if (project_directory / LEGACY_VECTORS_NAME).exists():
+        os.remove(project_directory / LEGACY_VECTORS_NAME)
+
+
+def remove_vectors(
+    project_directory: pathlib.Path,
+) -> None:
+    """
+    Remove stored texts vectors.
+
+    Args:
+        project_directory (pathlib.Path): The directory of the project.
+    """
+    for vectors_file_name in (
+        VECTORS_INDEX_NAME,
+        VECTORS_DATA_NAME,
+        VECTORS_INDICES_NAME,
+        VECTORS_INDPTR_NAME,
+        LEGACY_VECTORS_NAME,
+    ):
+        if (project_directory / vectors_file_name).exists():
+            os.remove(project_directory / vectors_file_name)
+
+
+# ==============================================================================
+# VECTORS LOADING
+# ==============================================================================
+
+
+def get_vectors_version(
+    project_directory: pathlib.Path,
+) -> Optional[int]:
+    """
+    Get the version of stored texts vectors (the modification time of the file that marks a complete storage).
+
+    Args:
+        project_directory (pathlib.Path): The directory of the project.
+
+    Returns:
+        Optional[int]: The version of stored vectors, or `None` if there are no vectors.
+    """
+    for vectors_file_name in (VECTORS_INDEX_NAME, LEGACY_VECTORS_NAME):
+        if (project_directory / vectors_file_name).exists():
+            return os.stat(project_directory / vectors_file_name).st_mtime_ns
+    return None
+
+
+def load_vectors_matrix(
+    project_directory: pathlib.Path,
+) -> Tuple[List[str], csr_matrix]:
+    """
+    Load texts vectors as a single CSR matrix, whose components are memory-mapped (no copy, no deserialization).
+    Arrays are mapped in copy-on-write mode: an in-place modification never alters stored vectors.
+    Legacy projects (with a pickled dictionary of vectors) are supported.
+
+    Args:
+        project_directory (pathlib.Path): The directory of the project.
+
+    Raises:
+        FileNotFoundError: Raises error if the project has no vectors.
+
+    Returns:
+        Tuple[List[str], csr_matrix]: The IDs of texts (in the order of matrix rows), and the matrix of vectors.
+    """
+
+    # Case of legacy vectors.
+    if not (project_directory / VECTORS_INDEX_NAME).exists():
+        with open(project_directory / LEGACY_VECTORS_NAME, "rb") as legacy_vectors_fileobject:
+            dict_of_vectors: Dict[str, csr_matrix] = pickle.load(  # noqa: S301  # Usage of Pickle
+                legacy_vectors_fileobject
+            )
+        return list(dict_of_vectors.keys()), csr_matrix(vstack(list(dict_of_vectors.values()), format="csr"))
+
+    # Load ID index.
+    with open(project_directory / VECTORS_INDEX_NAME, "r") as index_fileobject:
+        index: Dict[str, Any] = json.load(index_fileobject)
+
+    # Map CSR components.
+    matrix: csr_matrix = csr_matrix(
+        (
+            np.load(project_directory / VECTORS_DATA_NAME, mmap_mode="c", allow_pickle=False),
+            np.load(project_directory / VECTORS_INDICES_NAME, mmap_mode="c", allow_pickle=False),
+            np.load(project_directory / VECTORS_INDPTR_NAME, mmap_mode="c", allow_pickle=False),
+        ),
+        shape=tuple(index["shape"]),
+        copy=False,
+    )
+    return index["list_of_data_IDs"], matrix
+
+
+def load_vectors(
+    project_directory: pathlib.Path,
+) -> Dict[str, csr_matrix]:
+    """
+    Load texts vectors as a dictionary of one-row CSR matrices (the format expected by sampling and clustering algorithms).
+    Rows share the memory-mapped components of the matrix: vector data is neither copied nor deserialized.
+
+    Args:
+        project_directory (pathlib.Path): The directory of the project.
+
+    Returns:
+        Dict[str, csr_matrix]: The vectors of texts.
+    """
+
+    # Load the matrix.
+    list_of_data_IDs, matrix = load_vectors_matrix(project_directory=project_directory)
+
+    # Define an empty row, cloned for each vector.
+    # NB: the `csr_matrix` constructor copies small slices of large arrays (when checking its format),
+    # so rows are built like unpickled matrices: a shallow copy of a row, whose components are then replaced.
+    empty_row: csr_matrix = csr_matrix((1, matrix.shape[1]), dtype=matrix.dtype)
+
+    # Split the matrix into rows, by slicing its components (slices of arrays are views).
+    dict_of_vectors: Dict[str, csr_matrix] = {}
+    for row, data_ID in enumerate(list_of_data_IDs):
+        row_start: int = int(matrix.indptr[row])
+        row_end: int = int(matrix.indptr[row + 1])
+        row_vector: csr_matrix = copy.copy(empty_row)
+        row_vector.data = matrix.data[row_start:row_end]
+        row_vector.indices = matrix.indices[row_start:row_end]
+        row_vector.indptr = np.array([0, row_end - row_start], dtype=matrix.indptr.dtype)
+        dict_of_vectors[data_ID] = row_vector
+    return dict_of_vectors
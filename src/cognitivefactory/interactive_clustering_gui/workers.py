@@ -0,0 +1,620 @@
+# -*- coding: utf-8 -*-
+
+"""
+* Name:         cognitivefactory.interactive_clustering_gui.workers
+* Description:  Definition of the workers pool that runs background tasks outside of the web server process.
+* Author:       Erwan Schild
+* Created:      18/10/2026
+* Licence:      CeCILL-C License v1.0 (https://cecill.info/licences.fr.html)
+"""
+
+# ==============================================================================
+# IMPORT PYTHON DEPENDENCIES
+# ==============================================================================
+
+import atexit
+import json
+import multiprocessing
+import os
+import pathlib
+import sys
+import threading
+from datetime import datetime
+from multiprocessing.connection import Connection, wait
+from typing import Any, Callable, Dict, List, Optional, Set, Tuple
+
+from filelock import FileLock
+
+from cognitivefactory.interactive_clustering_gui import backgroundtasks
+from cognitivefactory.interactive_clustering_gui.events import project_events
+from cognitivefactory.interactive_clustering_gui.models.states import ICGUIStates
+
+# ==============================================================================
+# CONFIGURE WORKERS
+# ==============================================================================
+
+# Define `WORKERS_NUMBER` (the maximum number of background tasks running at the same time).
+WORKERS_NUMBER: int = int(os.environ.get("WORKERS_NUMBER", "2"))
+
+# Name of the job file that persists a queued or running task in the project directory.
+JOB_FILE_NAME: str = "job.json"
+
+# Start method of worker processes: forked from a "forkserver" process that preloads dependencies of tasks if available,
+# or spawned otherwise (forking a multi-threaded web server is unsafe).
+START_METHOD: str = "forkserver" if ("forkserver" in multiprocessing.get_all_start_methods()) else "spawn"
+
+# Modules imported once by the "forkserver" process, and shared with worker processes (modules and spaCy pipelines).
+PRELOADED_MODULE: str = "cognitivefactory.interactive_clustering_gui.preload"
+
+# Available tasks.
+TASKS: Dict[str, Callable[..., None]] = {
+    "modelization_update": backgroundtasks.run_modelization_update_task,
+    "constraints_sampling": backgroundtasks.run_constraints_sampling_task,
+    "constrained_clustering": backgroundtasks.run_constrained_clustering_task,
+    "projection": backgroundtasks.run_projection_task,
+    "clustering_sweep": backgroundtasks.run_clustering_sweep_task,
+}
+
+# Tasks that lock the project state: they are persisted in the job file, and the project state is restored if they fail.
+STATE_TASKS: Set[str] = {
+    "modelization_update",
+    "constraints_sampling",
+    "constrained_clustering",
+}
+
+# Task to run for each "pending" state.
+PENDING_STATES_TASKS: Dict[ICGUIStates, str] = {
+    ICGUIStates.INITIALIZATION_WITH_PENDING_MODELIZATION: "modelization_update",
+    ICGUIStates.IMPORT_AT_SAMPLING_STEP_WITH_PENDING_MODELIZATION: "modelization_update",
+    ICGUIStates.IMPORT_AT_ANNOTATION_STEP_WITH_PENDING_MODELIZATION: "modelization_update",
+    ICGUIStates.IMPORT_AT_CLUSTERING_STEP_WITH_PENDING_MODELIZATION: "modelization_update",
+    ICGUIStates.IMPORT_AT_ITERATION_END_WITH_PENDING_MODELIZATION: "modelization_update",
+    ICGUIStates.ANNOTATION_WITH_PENDING_MODELIZATION_WITHOUT_CONFLICTS: "modelization_update",
+    ICGUIStates.ANNOTATION_WITH_PENDING_MODELIZATION_WITH_CONFLICTS: "modelization_update",
+    ICGUIStates.SAMPLING_PENDING: "constraints_sampling",
+    ICGUIStates.CLUSTERING_PENDING: "constrained_clustering",
+}
+
+# "Pending" state to restore for each "working" state, in order to requeue a task interrupted by a server stop.
+INTERRUPTED_STATES: Dict[ICGUIStates, ICGUIStates] = {
+    ICGUIStates.INITIALIZATION_WITH_WORKING_MODELIZATION: ICGUIStates.INITIALIZATION_WITH_PENDING_MODELIZATION,
+    ICGUIStates.IMPORT_AT_SAMPLING_STEP_WITH_WORKING_MODELIZATION: ICGUIStates.IMPORT_AT_SAMPLING_STEP_WITH_PENDING_MODELIZATION,
+    ICGUIStates.IMPORT_AT_ANNOTATION_STEP_WITH_WORKING_MODELIZATION: ICGUIStates.IMPORT_AT_ANNOTATION_STEP_WITH_PENDING_MODELIZATION,
+    ICGUIStates.IMPORT_AT_CLUSTERING_STEP_WITH_WORKING_MODELIZATION: ICGUIStates.IMPORT_AT_CLUSTERING_STEP_WITH_PENDING_MODELIZATION,
+    ICGUIStates.IMPORT_AT_ITERATION_END_WITH_WORKING_MODELIZATION: ICGUIStates.IMPORT_AT_ITERATION_END_WITH_PENDING_MODELIZATION,
+    ICGUIStates.ANNOTATION_WITH_WORKING_MODELIZATION_WITHOUT_CONFLICTS: ICGUIStates.ANNOTATION_WITH_PENDING_MODELIZATION_WITHOUT_CONFLICTS,
+    ICGUIStates.ANNOTATION_WITH_WORKING_MODELIZATION_WITH_CONFLICTS: ICGUIStates.ANNOTATION_WITH_PENDING_MODELIZATION_WITH_CONFLICTS,
+    ICGUIStates.SAMPLING_WORKING: ICGUIStates.SAMPLING_PENDING,
+    ICGUIStates.CLUSTERING_WORKING: ICGUIStates.CLUSTERING_PENDING,
+}
+
+# State to restore for each "pending" or "working" state, when a task is cancelled or fails.
+CANCELLED_STATES: Dict[ICGUIStates, ICGUIStates] = {
+    ICGUIStates.INITIALIZATION_WITH_PENDING_MODELIZATION: ICGUIStates.INITIALIZATION_WITHOUT_MODELIZATION,
+    ICGUIStates.INITIALIZATION_WITH_WORKING_MODELIZATION: ICGUIStates.INITIALIZATION_WITHOUT_MODELIZATION,
+    ICGUIStates.IMPORT_AT_SAMPLING_STEP_WITH_PENDING_MODELIZATION: ICGUIStates.IMPORT_AT_SAMPLING_STEP_WITHOUT_MODELIZATION,
+    ICGUIStates.IMPORT_AT_SAMPLING_STEP_WITH_WORKING_MODELIZATION: ICGUIStates.IMPORT_AT_SAMPLING_STEP_WITHOUT_MODELIZATION,
+    ICGUIStates.IMPORT_AT_ANNOTATION_STEP_WITH_PENDING_MODELIZATION: ICGUIStates.IMPORT_AT_ANNOTATION_STEP_WITHOUT_MODELIZATION,
+    ICGUIStates.IMPORT_AT_ANNOTATION_STEP_WITH_WORKING_MODELIZATION: ICGUIStates.IMPORT_AT_ANNOTATION_STEP_WITHOUT_MODELIZATION,
+    ICGUIStates.IMPORT_AT_CLUSTERING_STEP_WITH_PENDING_MODELIZATION: ICGUIStates.IMPORT_AT_CLUSTERING_STEP_WITHOUT_MODELIZATION,
+    ICGUIStates.IMPORT_AT_CLUSTERING_STEP_WITH_WORKING_MODELIZATION: ICGUIStates.IMPORT_AT_CLUSTERING_STEP_WITHOUT_MODELIZATION,
+    ICGUIStates.IMPORT_AT_ITERATION_END_WITH_PENDING_MODELIZATION: ICGUIStates.IMPORT_AT_ITERATION_END_WITHOUT_MODELIZATION,
+    ICGUIStates.IMPORT_AT_ITERATION_END_WITH_WORKING_MODELIZATION: ICGUIStates.IMPORT_AT_ITERATION_END_WITHOUT_MODELIZATION,
+    ICGUIStates.ANNOTATION_WITH_PENDING_MODELIZATION_WITHOUT_CONFLICTS: ICGUIStates.ANNOTATION_WITH_OUTDATED_MODELIZATION_WITHOUT_CONFLICTS,
+    ICGUIStates.ANNOTATION_WITH_WORKING_MODELIZATION_WITHOUT_CONFLICTS: ICGUIStates.ANNOTATION_WITH_OUTDATED_MODELIZATION_WITHOUT_CONFLICTS,
+    ICGUIStates.ANNOTATION_WITH_PENDING_MODELIZATION_WITH_CONFLICTS: ICGUIStates.ANNOTATION_WITH_OUTDATED_MODELIZATION_WITH_CONFLICTS,
+    ICGUIStates.ANNOTATION_WITH_WORKING_MODELIZATION_WITH_CONFLICTS: ICGUIStates.ANNOTATION_WITH_OUTDATED_MODELIZATION_WITH_CONFLICTS,
+    ICGUIStates.SAMPLING_PENDING: ICGUIStates.SAMPLING_TODO,
+    ICGUIStates.SAMPLING_WORKING: ICGUIStates.SAMPLING_TODO,
+    ICGUIStates.CLUSTERING_PENDING: ICGUIStates.CLUSTERING_TODO,
+    ICGUIStates.CLUSTERING_WORKING: ICGUIStates.CLUSTERING_TODO,
+}
+
+
+# ==============================================================================
+# DEFINE JOB EXECUTION
+# ==============================================================================
+
+
+def run_job(
+    data_directory: pathlib.Path,
+    project_id: str,
+    task_name: str,
+    events_connection: Optional[Connection] = None,
+) -> None:
+    """
+    Run a background task in a worker process.
+
+    Args:
+        data_directory (pathlib.Path): The directory where projects are stored.
+        project_id (str): The ID of the project.
+        task_name (str): The name of the task to run (see `TASKS`).
+        events_connection (Optional[Connection], optional): The connection used to send status changes to the web server. Defaults to `None`.
+    """
+
+    # Use the data directory of the web server (the worker process doesn't inherit runtime configuration).
+    backgroundtasks.DATA_DIRECTORY = data_directory
+    backgroundtasks.EVENTS_CONNECTION = events_connection
+
+    # Run the task.
+    TASKS[task_name](project_id=project_id)
+
+
+def report_preloaded_models(
+    connection: Connection,
+) -> None:
+    """
+    Send the spaCy language models preloaded in a worker process (the ones of the "forkserver" process it comes from).
+
+    Args:
+        connection (Connection): The connection used to send the list of preloaded models.
+    """
+    preload_module: Any = sys.modules.get(PRELOADED_MODULE)
+    connection.send(list(preload_module.PRELOADED_MODELS) if (preload_module is not None) else [])
+    connection.close()
+
+
+# ==============================================================================
+# DEFINE WORKERS POOL
+# ==============================================================================
+
+
+class WorkersPool:
+    """
+    A pool of worker processes that runs background tasks outside of the web server process.
+    Tasks that lock the project state are persisted in a job file of their project directory, so they can be recovered after a server stop.
+    Each worker process sends the status changes of its task through a pipe, and they are published to the project events broker.
+    """
+
+    def __init__(
+        self,
+        workers_number: int = WORKERS_NUMBER,
+    ) -> None:
+        """
+        The constructor for the workers pool.
+
+        Args:
+            workers_number (int, optional): The maximum number of tasks running at the same time. Defaults to `WORKERS_NUMBER`.
+        """
+
+        # Maximum number of running tasks.
+        self.workers_number: int = max(1, workers_number)
+
+        # Queued tasks and running tasks, identified by data directory, project ID and task name.
+        self._queue: List[Tuple[pathlib.Path, str, str]] = []
+        self._running: Dict[Tuple[pathlib.Path, str, str], multiprocessing.process.BaseProcess] = {}
+
+        # Supervisor thread that starts queued tasks and reaps finished ones.
+        self._lock: threading.RLock = threading.RLock()
+        self._wakeup: threading.Event = threading.Event()
+        self._supervisor: Optional[threading.Thread] = None
+        self._stopping: bool = False
+
+        # Relay thread that publishes the status changes sent by worker processes (through the reading end of their pipe).
+        self._events_readers: List[Connection] = []
+        self._relay: Optional[threading.Thread] = None
+
+        # Worker processes are forked from a "forkserver" process that preloads dependencies of tasks (or spawned).
+        self._context = multiprocessing.get_context(START_METHOD)
+        if START_METHOD == "forkserver":
+            self._context.set_forkserver_preload([PRELOADED_MODULE])
+
+        # Stop running tasks with the server (they will be recovered at next startup).
+        atexit.register(self.shutdown)
+
+    # ==============================================================================
+    # QUEUE MANAGEMENT
+    # ==============================================================================
+    def enqueue(
+        self,
+        data_directory: pathlib.Path,
+        project_id: str,
+        task_name: str,
+    ) -> None:
+        """
+        Add a task in the queue, and persist it in the job file of the project if it locks the project state.
+
+        Args:
+            data_directory (pathlib.Path): The directory where projects are stored.
+            project_id (str): The ID of the project.
+            task_name (str): The name of the task to run (see `TASKS`).
+
+        Raises:
+            ValueError: Raises error if `task_name` is not implemented.
+        """
+
+        # Check task name.
+        if task_name not in TASKS.keys():
+            raise ValueError("The `task_name` '" + str(task_name) + "' is not implemented.")
+
+        with self._lock:
+            # Case of task already queued or running for this project.
+            if (data_directory, project_id, task_name) in self._running.keys() or (
+                (data_directory, project_id, task_name) in self._queue
+            ):
+                return
+
+            # Persist the job (through a temporary file, to never expose a partial job).
+            if task_name in STATE_TASKS:
+                with open(data_directory / project_id / (JOB_FILE_NAME + ".tmp"), "w") as job_fileobject:
+                    json.dump(
+                        {
+                            "task_name": task_name,
+                            "enqueue_timestamp": datetime.now().timestamp(),
+                        },
+                        job_fileobject,
+                        indent=4,
+                    )
+                os.replace(
+                    data_directory / project_id / (JOB_FILE_NAME + ".tmp"),
+                    data_directory / project_id / JOB_FILE_NAME,
+                )
+
+            # Queue the task.
+            self._queue.append((data_directory, project_id, task_name))
+
+        # Wake up the supervisor.
+        self._start_supervisor()
+        self._wakeup.set()
+
+    def cancel(
+        self,
+        data_directory: pathlib.Path,
+        project_id: str,
+        task_names: Optional[Set[str]] = None,
+    ) -> bool:
+        """
+        Cancel the queued or running tasks of a project, and restore the project state before the task request if a cancelled task locks it.
+
+        Args:
+            data_directory (pathlib.Path): The directory where projects are stored.
+            project_id (str): The ID of the project.
+            task_names (Optional[Set[str]], optional): The names of tasks to cancel. Defaults to `None` for all tasks.
+
+        Returns:
+            bool: `True` if a task has been cancelled.
+        """
+
+        # Define tasks to cancel.
+        tasks_to_cancel: Set[Tuple[pathlib.Path, str, str]] = {
+            (data_directory, project_id, task_name)
+            for task_name in (task_names if (task_names is not None) else TASKS.keys())
+        }
+
+        with self._lock:
+            # Remove the tasks from the queue.
+            queue_length: int = len(self._queue)
+            self._queue = [queued_task for queued_task in self._queue if queued_task not in tasks_to_cancel]
+            cancelled: bool = len(self._queue) != queue_length
+
+            # Forget the running tasks.
+            processes_to_stop: List[multiprocessing.process.BaseProcess] = [
+                self._running.pop(task_to_cancel)
+                for task_to_cancel in tasks_to_cancel
+                if task_to_cancel in self._running.keys()
+            ]
+
+            # Remove the job file.
+            locks_state: bool = any(task_name in STATE_TASKS for _, _, task_name in tasks_to_cancel)
+            if locks_state:
+                remove_job_file(data_directory=data_directory, project_id=project_id)
+
+        # Stop the running tasks (without blocking the supervisor and the relay).
+        for process in processes_to_stop:
+            process.terminate()
+            process.join()
+        cancelled = cancelled or len(processes_to_stop) != 0
+
+        # Restore the project state.
+        if not locks_state:
+            return cancelled
+        return restore_project_state(data_directory=data_directory, project_id=project_id) or cancelled
+
+    def recover(
+        self,
+        data_directory: pathlib.Path,
+    ) -> List[str]:
+        """
+        Requeue tasks of projects that were pending or working when the server stopped (in the order of their requests),
+        then sweeps over numbers of clusters that were not computed (they don't lock the project state, so they have no job file).
+
+        Args:
+            data_directory (pathlib.Path): The directory where projects are stored.
+
+        Returns:
+            List[str]: The IDs of projects whose task has been requeued.
+        """
+
+        # Find interrupted tasks.
+        interrupted_tasks: List[Tuple[float, str, str]] = []
+        interrupted_sweeps: List[str] = []
+        for project_id in sorted(os.listdir(data_directory)):
+            if (
+                not os.path.isdir(data_directory / project_id)
+                or not (data_directory / project_id / "status.json").exists()
+            ):
+                continue
+
+            with FileLock(str(data_directory / project_id / "status.json.lock")):
+                # Load status file.
+                with open(data_directory / project_id / "status.json", "r") as status_fileobject_r:
+                    project_status: Dict[str, Any] = json.load(status_fileobject_r)
+
+                # Case of interrupted "working" task: go back to "pending" state.
+                if project_status["state"] in INTERRUPTED_STATES.keys():
+                    project_status["state"] = INTERRUPTED_STATES[project_status["state"]]
+                    project_status["task"] = {
+                        "progression": 1,
+                        "detail": "Waiting for background task allocation...",
+                    }
+                    store_project_status(
+                        data_directory=data_directory, project_id=project_id, project_status=project_status
+                    )
+                    project_events.publish(project_id=project_id, project_status=project_status)
+
+            # Case of "pending" task: requeue it.
+            if project_status["state"] in PENDING_STATES_TASKS.keys():
+                interrupted_tasks.append(
+                    (
+                        load_job_file(data_directory=data_directory, project_id=project_id).get(
+                            "enqueue_timestamp", 0.0
+                        ),
+                        project_id,
+                        PENDING_STATES_TASKS[project_status["state"]],
+                    )
+                )
+
+            # Otherwise, remove outdated job file.
+            else:
+                remove_job_file(data_directory=data_directory, project_id=project_id)
+
+            # Case of sweep over numbers of clusters not computed: requeue it.
+            try:
+                with open(
+                    data_directory / project_id / backgroundtasks.CLUSTERING_SWEEP_NAME, "r"
+                ) as clustering_sweep_fileobject:
+                    if json.load(clustering_sweep_fileobject)["task"] is not None:
+                        interrupted_sweeps.append(project_id)
+            except (OSError, ValueError, KeyError):
+                pass  # No sweep has been requested.
+
+        # Requeue tasks in the order of their requests.
+        for _, project_id_to_requeue, task_name in sorted(interrupted_tasks):
+            self.enqueue(data_directory=data_directory, project_id=project_id_to_requeue, task_name=task_name)
+        for project_id_to_requeue in interrupted_sweeps:
+            self.enqueue(data_directory=data_directory, project_id=project_id_to_requeue, task_name="clustering_sweep")
+        return [project_id_requeued for _, project_id_requeued, _ in sorted(interrupted_tasks)] + interrupted_sweeps
+
+    def warm_up(self) -> List[str]:
+        """
+        Start the server of worker processes and wait for its preloading (blocking), so that next tasks start without loading delay.
+
+        Returns:
+            List[str]: The spaCy language models preloaded for worker processes.
+        """
+        reader, writer = self._context.Pipe(duplex=False)
+        process: multiprocessing.process.BaseProcess = self._context.Process(
+            target=report_preloaded_models,
+            kwargs={"connection": writer},
+            name="warm-up",
+        )
+        process.start()
+        writer.close()
+        try:
+            preloaded_models: List[str] = reader.recv()
+        except EOFError:  # The preloading failed.
+            preloaded_models = []
+        reader.close()
+        process.join()
+        return preloaded_models
+
+    def shutdown(self) -> None:
+        """
+        Stop the supervisor and the running tasks (they will be recovered at next startup).
+        """
+
+        # Stop the supervisor.
+        self._stopping = True
+        self._wakeup.set()
+
+        # Forget queued and running tasks.
+        with self._lock:
+            processes_to_stop: List[multiprocessing.process.BaseProcess] = list(self._running.values())
+            self._running = {}
+            self._queue = []
+
+        # Stop running tasks (without blocking the relay).
+        for process in processes_to_stop:
+            process.terminate()
+            process.join()
+
+    # ==============================================================================
+    # SUPERVISION
+    # ==============================================================================
+    def _start_supervisor(self) -> None:
+        """
+        Start the supervisor thread if needed.
+        """
+        with self._lock:
+            self._stopping = False
+            if self._supervisor is None or not self._supervisor.is_alive():
+                self._supervisor = threading.Thread(
+                    target=self._supervise,
+                    name="workers-pool-supervisor",
+                    daemon=True,
+                )
+                self._supervisor.start()
+            if self._relay is None or not self._relay.is_alive():
+                self._relay = threading.Thread(
+                    target=self._relay_events,
+                    name="workers-pool-events-relay",
+                    daemon=True,
+                )
+                self._relay.start()
+
+    def _supervise(self) -> None:
+        """
+        Supervisor loop: reap finished tasks and start queued tasks when a worker is available.
+        """
+        while not self._stopping:
+            with self._lock:
+                # Reap finished tasks.
+                for (data_directory, project_id, task_name), process in list(self._running.items()):
+                    if process.is_alive():
+                        continue
+                    process.join()
+                    del self._running[(data_directory, project_id, task_name)]
+                    if task_name not in STATE_TASKS:
+                        continue
+                    remove_job_file(data_directory=data_directory, project_id=project_id)
+
+                    # Case of failed task: restore the project state before the task request.
+                    if process.exitcode != 0:
+                        restore_project_state(data_directory=data_directory, project_id=project_id)
+
+                # Start queued tasks.
+                while len(self._queue) != 0 and len(self._running) < self.workers_number:  # noqa: WPS507
+                    data_directory, project_id, task_name = self._queue.pop(0)
+                    events_reader, events_writer = self._context.Pipe(duplex=False)
+                    process = self._context.Process(
+                        target=run_job,
+                        kwargs={
+                            "data_directory": data_directory,
+                            "project_id": project_id,
+                            "task_name": task_name,
+                            "events_connection": events_writer,
+                        },
+                        name="{task_name}-{project_id}".format(task_name=task_name, project_id=project_id),
+                    )
+                    process.start()
+                    events_writer.close()  # The pipe is closed when the worker process ends.
+                    self._events_readers.append(events_reader)
+                    self._running[(data_directory, project_id, task_name)] = process
+
+            # Wait for a new task or a finished task.
+            self._wakeup.wait(timeout=0.5)
+            self._wakeup.clear()
+
+    def _relay_events(self) -> None:
+        """
+        Relay loop: publish the status changes sent by worker processes, and forget the pipes of ended processes.
+        """
+        while not self._stopping:
+            with self._lock:
+                events_readers: List[Connection] = list(self._events_readers)
+
+            # Wait for status changes (new worker processes are listened at the next iteration).
+            for events_reader in wait(events_readers, timeout=0.2):
+                try:
+                    project_id, project_status = events_reader.recv()
+                except (EOFError, OSError):
+                    with self._lock:
+                        self._events_readers.remove(events_reader)
+                    events_reader.close()
+                    continue
+                project_events.publish(project_id=project_id, project_status=project_status)
+
+
+# ==============================================================================
+# DEFINE COMMON METHODS
+# ==============================================================================
+
+
+def load_job_file(
+    data_directory: pathlib.Path,
+    project_id: str,
+) -> Dict[str, Any]:
+    """
+    Load the job file of a project.
+
+    Args:
+        data_directory (pathlib.Path): The directory where projects are stored.
+        project_id (str): The ID of the project.
+
+    Returns:
+        Dict[str, Any]: The job description, or an empty dictionary if there is no (readable) job file.
+    """
+    try:
+        with open(data_directory / project_id / JOB_FILE_NAME, "r") as job_fileobject:
+            return json.load(job_fileobject)
+    except (OSError, ValueError):
+        return {}
+
+
+def remove_job_file(
+    data_directory: pathlib.Path,
+    project_id: str,
+) -> None:
+    """
+    Remove the job file of a project.
+
+    Args:
+        data_directory (pathlib.Path): The directory where projects are stored.
+        project_id (str): The ID of the project.
+    """
+    if (data_directory / project_id / JOB_FILE_NAME).exists():
+        os.remove(data_directory / project_id / JOB_FILE_NAME)
+
+
+def store_project_status(
+    data_directory: pathlib.Path,
+    project_id: str,
+    project_status: Dict[str, Any],
+) -> None:
+    """
+    Store the status file of a project, through a temporary file (to never expose a partial status).
+    The project lock has to be acquired.
+
+    Args:
+        data_directory (pathlib.Path): The directory where projects are stored.
+        project_id (str): The ID of the project.
+        project_status (Dict[str, Any]): The status of the project.
+    """
+    with open(data_directory / project_id / "status.json.tmp", "w") as status_fileobject_w:
+        json.dump(project_status, status_fileobject_w, indent=4)
+    os.replace(data_directory / project_id / "status.json.tmp", data_directory / project_id / "status.json")
+
+
+def restore_project_state(
+    data_directory: pathlib.Path,
+    project_id: str,
+) -> bool:
+    """
+    Restore the project state before a task request (used when a task is cancelled or fails).
+
+    Args:
+        data_directory (pathlib.Path): The directory where projects are stored.
+        project_id (str): The ID of the project.
+
+    Returns:
+        bool: `True` if the project state has been restored.
+    """
+
+    # Case of deleted project.
+    if not (data_directory / project_id / "status.json").exists():
+        return False
+
+    with FileLock(str(data_directory / project_id / "status.json.lock")):
+        # Load status file.
+        with open(data_directory / project_id / "status.json", "r") as status_fileobject_r:
+            project_status: Dict[str, Any] = json.load(status_fileobject_r)
+
+        # Case of project without pending or working task.
+        if project_status["state"] not in CANCELLED_STATES.keys():
+            return False
+
+        # Restore state.
+        project_status["state"] = CANCELLED_STATES[project_status["state"]]
+        project_status["task"] = None
+        store_project_status(data_directory=data_directory, project_id=project_id, project_status=project_status)
+        project_events.publish(project_id=project_id, project_status=project_status)
+
+    return True
+
+
+# ==============================================================================
+# DEFINE WORKERS POOL INSTANCE
+# ==============================================================================
+
+# The workers pool used by the application.
+workers_pool: WorkersPool = WorkersPool()
@@ -19,7 +19,7 @@ from pathlib import Path
 import pytest
 from httpx import AsyncClient
 
-from cognitivefactory.interactive_clustering_gui import app, backgroundtasks
+from cognitivefactory.interactive_clustering_gui import app, backgroundtasks, workers
 
 
 # ==============================================================================
@@ -39,9 +39,13 @@ async def async_client(tmp_path: Path, monkeypatch):
     """
     # Replace app.DATA_DIRECTORY with a temporary directory for the test.
     monkeypatch.setattr(app, "DATA_DIRECTORY", tmp_path)
-    monkeypatch.setattr(app.backgroundtasks, "DATA_DIRECTORY", tmp_path)
+    monkeypatch.setattr(backgroundtasks, "DATA_DIRECTORY", tmp_path)
     print(">> PYTEST TEMPORARY PATH:", tmp_path)
 
+    # Replace the workers pool with a dedicated one for the test.
+    workers_pool = workers.WorkersPool(workers_number=1)
+    monkeypatch.setattr(workers, "workers_pool", workers_pool)
+
     # Instanciate the application.
     # lifespan = LifespanManager(app)  # To call startup events.
     httpx_client = AsyncClient(
@@ -54,6 +58,9 @@ async def async_client(tmp_path: Path, monkeypatch):
     async with httpx_client as client:  # noqa: WPS316
         yield client
 
+    # Stop the background tasks of the test.
+    workers_pool.shutdown()
+
 
 # ==============================================================================
 # set_fake_backgroundtasks
@@ -0,0 +1,514 @@
+# -*- coding: utf-8 -*-
+
+"""
+* Name:         interactive-clustering-gui/tests/test_clustering.py
+* Description:  Unittests for the `clustering` module.
+* Author:       Erwan Schild
+* Created:      18/10/2026
+* Licence:      CeCILL (https://cecill.info/licences.fr.html)
+"""
+
+# ==============================================================================
+# IMPORT PYTHON DEPENDENCIES
+# ==============================================================================
+
+import numpy as np
+import pytest
+from scipy.sparse import csr_matrix, vstack
+
+from cognitivefactory.interactive_clustering.clustering.factory import clustering_factory
+from cognitivefactory.interactive_clustering.clustering.kmeans import KMeansConstrainedClustering
+from cognitivefactory.interactive_clustering.clustering.spectral import SpectralConstrainedClustering
+from cognitivefactory.interactive_clustering.constraints.binary import BinaryConstraintsManager
+from cognitivefactory.interactive_clustering_gui.clustering import (
+    ConstraintsComponentsReduction,
+    DistancesSpectralConstrainedClustering,
+    MiniBatchKMeansConstrainedClustering,
+    WarmStartKMeansConstrainedClustering,
+    compute_clustering_score,
+    compute_clustering_silhouette,
+    get_constraints_components,
+    run_clustering_with_several_random_seeds,
+    sweep_nb_clusters,
+)
+from cognitivefactory.interactive_clustering_gui.storage.distances import Distances
+
+# ==============================================================================
+# test_distances_spectral_clustering
+# ==============================================================================
+
+
+def test_distances_spectral_clustering():
+    """
+    Test that spectral clustering on stored pairwise distances gives the same results as spectral clustering on vectors.
+    """
+    rng = np.random.default_rng(0)
+    dict_of_vectors = {
+        str(i): csr_matrix(rng.normal(loc=(i % 3) * 2.0, size=(1, 6))) for i in range(40)  # noqa: WPS221
+    }
+    distances = Distances.build(
+        list_of_data_IDs=list(dict_of_vectors.keys()),
+        matrix=vstack(dict_of_vectors.values()),
+    )
+    constraints_manager = BinaryConstraintsManager(list_of_data_IDs=sorted(dict_of_vectors.keys())[5:])
+    constraints_manager.add_constraint(data_ID1="20", data_ID2="21", constraint_type="MUST_LINK")
+    constraints_manager.add_constraint(data_ID1="22", data_ID2="25", constraint_type="CANNOT_LINK")
+    dict_of_managed_vectors = {
+        data_ID: dict_of_vectors[data_ID] for data_ID in constraints_manager.get_list_of_managed_data_IDs()
+    }
+
+    # Cluster with and without stored distances.
+    expected_results = SpectralConstrainedClustering(random_seed=1).cluster(
+        constraints_manager=constraints_manager,
+        vectors=dict_of_managed_vectors,
+        nb_clusters=3,
+    )
+    assert (
+        DistancesSpectralConstrainedClustering(random_seed=1).cluster(
+            constraints_manager=constraints_manager,
+            vectors=dict_of_managed_vectors,
+            nb_clusters=3,
+            distances=distances,
+        )
+        == expected_results
+    )
+    assert (
+        DistancesSpectralConstrainedClustering(random_seed=1).cluster(
+            constraints_manager=constraints_manager,
+            vectors=dict_of_managed_vectors,
+            nb_clusters=3,
+        )
+        == expected_results
+    )
+
+
+# ==============================================================================
+# test_warm_start_kmeans_clustering
+# ==============================================================================
+
+
+def test_warm_start_kmeans_clustering():
+    """
+    Test that KMeans warm started from a previous clustering result keeps it when it is already converged, and respects new constraints.
+    """
+    rng = np.random.default_rng(0)
+    dict_of_vectors = {
+        str(i): csr_matrix(rng.normal(loc=(i % 3) * 5.0, size=(1, 4))) for i in range(30)  # noqa: WPS221
+    }
+    constraints_manager = BinaryConstraintsManager(list_of_data_IDs=list(dict_of_vectors.keys()))
+
+    # Without previous result: same results as KMeans.
+    previous_clustering_result = KMeansConstrainedClustering(random_seed=1).cluster(
+        constraints_manager=constraints_manager,
+        vectors=dict_of_vectors,
+        nb_clusters=3,
+    )
+    assert (
+        WarmStartKMeansConstrainedClustering(random_seed=1).cluster(
+            constraints_manager=constraints_manager,
+            vectors=dict_of_vectors,
+            nb_clusters=3,
+        )
+        == previous_clustering_result
+    )
+
+    # With previous result (and a new text): the converged clustering is kept.
+    constraints_manager.add_data_ID(data_ID="new")
+    dict_of_vectors["new"] = csr_matrix(rng.normal(loc=0.0, size=(1, 4)))
+    clustering_model = WarmStartKMeansConstrainedClustering(random_seed=1, max_iteration=2)
+    clustering_result = clustering_model.cluster(
+        constraints_manager=constraints_manager,
+        vectors=dict_of_vectors,
+        nb_clusters=3,
+        previous_clustering_result=previous_clustering_result,
+    )
+    assert {data_ID: clustering_result[data_ID] for data_ID in previous_clustering_result} == previous_clustering_result
+    assert clustering_result["new"] == clustering_result["0"]
+
+    # With new constraints: they are respected.
+    constraints_manager.add_constraint(data_ID1="0", data_ID2="3", constraint_type="CANNOT_LINK")
+    clustering_result = WarmStartKMeansConstrainedClustering(random_seed=1).cluster(
+        constraints_manager=constraints_manager,
+        vectors=dict_of_vectors,
+        nb_clusters=3,
+        previous_clustering_result=previous_clustering_result,
+    )
+    assert clustering_result["0"] != clustering_result["3"]
+
+
+# ==============================================================================
+# test_get_constraints_components
+# ==============================================================================
+
+
+def test_get_constraints_components():
+    """
+    Test that components computed from annotated constraints are the same as components computed from the constraints manager.
+    """
+    constraints_manager = BinaryConstraintsManager(list_of_data_IDs=[str(i) for i in range(8)])
+    list_of_constraints = [
+        ("1", "3", "MUST_LINK"),
+        ("3", "6", "MUST_LINK"),
+        ("4", "5", "MUST_LINK"),
+        ("0", "6", "CANNOT_LINK"),
+        ("1", "5", "CANNOT_LINK"),
+        ("3", "4", "CANNOT_LINK"),
+        ("2", "unknown", "MUST_LINK"),
+    ]
+    for data_ID1, data_ID2, constraint_type in list_of_constraints[:-1]:
+        constraints_manager.add_constraint(data_ID1=data_ID1, data_ID2=data_ID2, constraint_type=constraint_type)
+
+    # Components are numbered in the order of their first data ID, and constraints on unmanaged data IDs are ignored.
+    components, cannot_links = get_constraints_components(
+        constraints_manager=constraints_manager,
+        list_of_constraints=list_of_constraints,
+    )
+    assert components.tolist() == [0, 1, 2, 1, 3, 3, 1, 4]
+    assert cannot_links.tolist() == [[0, 1], [1, 3]]
+
+    # Same results from the constraints manager.
+    components_from_manager, cannot_links_from_manager = get_constraints_components(
+        constraints_manager=constraints_manager,
+    )
+    assert components_from_manager.tolist() == components.tolist()
+    assert cannot_links_from_manager.tolist() == cannot_links.tolist()
+
+
+# ==============================================================================
+# test_constraints_components_reduction
+# ==============================================================================
+
+
+def test_constraints_components_reduction():
+    """
+    Test that a constrained clustering problem is reduced to weighted components of `"MUST_LINK"` constraints, and that the clustering of components is expanded to all data IDs.
+    """
+    dict_of_vectors = {str(i): csr_matrix([float(i), 1.0]) for i in range(6)}
+    constraints_manager = BinaryConstraintsManager(list_of_data_IDs=list(dict_of_vectors.keys()))
+    list_of_constraints = [
+        ("1", "3", "MUST_LINK"),
+        ("3", "5", "MUST_LINK"),
+        ("0", "5", "CANNOT_LINK"),
+        ("2", "3", "CANNOT_LINK"),
+    ]
+    for data_ID1, data_ID2, constraint_type in list_of_constraints:
+        constraints_manager.add_constraint(data_ID1=data_ID1, data_ID2=data_ID2, constraint_type=constraint_type)
+
+    # Reduce the problem: each component is represented by its first data ID.
+    reduction = ConstraintsComponentsReduction(
+        constraints_manager=constraints_manager,
+        vectors=dict_of_vectors,
+        list_of_constraints=list_of_constraints,
+    )
+    assert reduction.constraints_manager.get_list_of_managed_data_IDs() == ["0", "1", "2", "4"]
+    assert reduction.weights == {"0": 1.0, "1": 3.0, "2": 1.0, "4": 1.0}
+    assert reduction.vectors["1"].toarray().tolist() == [[3.0, 1.0]]
+    assert reduction.vectors["4"] is dict_of_vectors["4"]
+    assert reduction.list_of_constraints == [("0", "1", "CANNOT_LINK"), ("1", "2", "CANNOT_LINK")]
+    assert reduction.constraints_manager.get_inferred_constraint(data_ID1="0", data_ID2="1") == "CANNOT_LINK"
+
+    # Expand a clustering of representatives (clusters are renamed by order of data IDs).
+    assert reduction.expand(clustering_result={"0": 1, "1": 0, "2": 1, "4": 2}) == {
+        "0": 0,
+        "1": 1,
+        "2": 0,
+        "3": 1,
+        "4": 2,
+        "5": 1,
+    }
+
+    # Weighted KMeans centroids of representatives are centroids of all data IDs.
+    clustering_model = WarmStartKMeansConstrainedClustering(random_seed=1)
+    clustering_model.cluster(
+        constraints_manager=reduction.constraints_manager,
+        vectors=reduction.vectors,
+        nb_clusters=2,
+        weights=reduction.weights,
+    )
+    assert clustering_model.compute_centroids(clusters={"0": 0, "1": 1, "2": 0, "4": 1})[1].toarray().tolist() == [
+        [3.25, 1.0]
+    ]
+
+
+# ==============================================================================
+# test_minibatch_kmeans_clustering
+# ==============================================================================
+
+
+def test_minibatch_kmeans_clustering():
+    """
+    Test that mini-batch KMeans finds well separated clusters, and respects constraints.
+    """
+    rng = np.random.default_rng(0)
+    dict_of_vectors = {
+        str(i): csr_matrix(rng.normal(loc=(i % 3) * 5.0, size=(1, 4))) for i in range(60)  # noqa: WPS221
+    }
+    constraints_manager = BinaryConstraintsManager(list_of_data_IDs=list(dict_of_vectors.keys()))
+
+    # Check parameters.
+    with pytest.raises(ValueError, match="`batch_size`"):
+        MiniBatchKMeansConstrainedClustering(batch_size=0)
+    with pytest.raises(ValueError, match="`max_iteration`"):
+        MiniBatchKMeansConstrainedClustering(max_iteration=0)
+    with pytest.raises(ValueError, match="`tolerance`"):
+        MiniBatchKMeansConstrainedClustering(tolerance=-1)
+    with pytest.raises(ValueError, match="`nb_clusters`"):
+        MiniBatchKMeansConstrainedClustering().cluster(
+            constraints_manager=constraints_manager,
+            vectors=dict_of_vectors,
+            nb_clusters=1,
+        )
+
+    # Without constraints: well separated clusters are found, with mini-batches smaller than data.
+    clustering_result = MiniBatchKMeansConstrainedClustering(batch_size=16, random_seed=1).cluster(
+        constraints_manager=constraints_manager,
+        vectors=dict_of_vectors,
+        nb_clusters=3,
+    )
+    assert all(clustering_result[str(i)] == clustering_result[str(i % 3)] for i in range(60))
+    assert len(set(clustering_result.values())) == 3
+
+    # With constraints: they are respected, with the same results from annotated constraints or constraints manager.
+    list_of_constraints = [
+        ("0", "1", "MUST_LINK"),
+        ("0", "3", "CANNOT_LINK"),
+        ("2", "5", "CANNOT_LINK"),
+    ]
+    for data_ID1, data_ID2, constraint_type in list_of_constraints:
+        constraints_manager.add_constraint(data_ID1=data_ID1, data_ID2=data_ID2, constraint_type=constraint_type)
+    clustering_result = MiniBatchKMeansConstrainedClustering(batch_size=16, random_seed=1).cluster(
+        constraints_manager=constraints_manager,
+        vectors=dict_of_vectors,
+        nb_clusters=3,
+        list_of_constraints=list_of_constraints,
+    )
+    assert clustering_result["0"] == clustering_result["1"]
+    assert clustering_result["0"] != clustering_result["3"]
+    assert clustering_result["2"] != clustering_result["5"]
+    assert (
+        MiniBatchKMeansConstrainedClustering(batch_size=16, random_seed=1).cluster(
+            constraints_manager=constraints_manager,
+            vectors=dict_of_vectors,
+            nb_clusters=3,
+        )
+        == clustering_result
+    )
+
+
+# ==============================================================================
+# test_compute_clustering_score
+# ==============================================================================
+
+
+def test_compute_clustering_score():
+    """
+    Test that a clustering result is scored by its violated constraints and its inertia.
+    """
+    dict_of_vectors = {
+        "0": csr_matrix([[0.0, 0.0]]),
+        "1": csr_matrix([[2.0, 0.0]]),
+        "2": csr_matrix([[10.0, 1.0]]),
+        "3": csr_matrix([[10.0, 3.0]]),
+    }
+    list_of_constraints = [
+        ("0", "1", "MUST_LINK"),
+        ("1", "2", "CANNOT_LINK"),
+        ("2", "3", "CANNOT_LINK"),
+        ("0", "99", "MUST_LINK"),
+    ]
+
+    # Inertia: (1 + 1) + (1 + 1).
+    assert compute_clustering_score(
+        clustering_result={"0": 0, "1": 0, "2": 1, "3": 1},
+        vectors=dict_of_vectors,
+        list_of_constraints=list_of_constraints,
+    ) == (1, pytest.approx(4.0))
+    assert (
+        compute_clustering_score(
+            clustering_result={"0": 5, "1": 3, "2": 3, "3": 3},
+            vectors=dict_of_vectors,
+            list_of_constraints=list_of_constraints,
+        )[0]
+        == 3
+    )
+    assert compute_clustering_score(clustering_result={}, vectors=dict_of_vectors, list_of_constraints=[]) == (0, 0.0)
+
+
+# ==============================================================================
+# test_run_clustering_with_several_random_seeds
+# ==============================================================================
+
+
+def test_run_clustering_with_several_random_seeds():
+    """
+    Test that clustering with several random seeds keeps the best run, in parallel as in sequential.
+    """
+    rng = np.random.default_rng(0)
+    dict_of_vectors = {
+        str(i): csr_matrix(rng.normal(loc=(i % 4) * 3.0, size=(1, 4))) for i in range(40)  # noqa: WPS221
+    }
+    constraints_manager = BinaryConstraintsManager(list_of_data_IDs=list(dict_of_vectors.keys()))
+    constraints_manager.add_constraint(data_ID1="0", data_ID2="4", constraint_type="MUST_LINK")
+    list_of_constraints = [("0", "4", "MUST_LINK")]
+
+    # With several seeds in parallel: the best run is kept.
+    clustering_result, metrics = run_clustering_with_several_random_seeds(
+        constraints_manager=constraints_manager,
+        vectors=dict_of_vectors,
+        nb_clusters=4,
+        algorithm="kmeans",
+        random_seed=10,
+        nb_seeds=4,
+        init_kargs={"model": "COP", "max_iteration": 50},
+        list_of_constraints=list_of_constraints,
+        processes_number=2,
+    )
+    list_of_scores = [
+        compute_clustering_score(
+            clustering_result=KMeansConstrainedClustering(random_seed=seed, max_iteration=50).cluster(
+                constraints_manager=constraints_manager,
+                vectors=dict_of_vectors,
+                nb_clusters=4,
+            ),
+            vectors=dict_of_vectors,
+            list_of_constraints=list_of_constraints,
+        )
+        for seed in range(10, 14)
+    ]
+    assert 10 <= metrics["clustering_best_random_seed"] < 14
+    assert list_of_scores[metrics["clustering_best_random_seed"] - 10] == min(list_of_scores)
+    assert metrics["clustering_nb_seeds"] == 4
+    assert metrics["clustering_constraints_violations"] == 0
+    assert metrics["clustering_inertia"] == pytest.approx(min(list_of_scores)[1], abs=1e-5)
+    assert metrics["clustering_speedup"] > 0
+    assert clustering_result["0"] == clustering_result["4"]
+
+    # In sequential: same results.
+    assert (
+        run_clustering_with_several_random_seeds(
+            constraints_manager=constraints_manager,
+            vectors=dict_of_vectors,
+            nb_clusters=4,
+            algorithm="kmeans",
+            random_seed=10,
+            nb_seeds=4,
+            init_kargs={"model": "COP", "max_iteration": 50},
+            list_of_constraints=list_of_constraints,
+            processes_number=1,
+        )[0]
+        == clustering_result
+    )
+
+    # With reduction to components of `"MUST_LINK"` constraints: constraints are respected, and runs are scored on all data IDs.
+    clustering_result_reduced, metrics_reduced = run_clustering_with_several_random_seeds(
+        constraints_manager=constraints_manager,
+        vectors=dict_of_vectors,
+        nb_clusters=4,
+        algorithm="kmeans",
+        random_seed=10,
+        nb_seeds=4,
+        init_kargs={"model": "COP", "max_iteration": 50},
+        list_of_constraints=list_of_constraints,
+        processes_number=1,
+        reduce_components=True,
+    )
+    assert sorted(clustering_result_reduced.keys()) == sorted(dict_of_vectors.keys())
+    assert clustering_result_reduced["0"] == clustering_result_reduced["4"]
+    assert metrics_reduced["clustering_constraints_violations"] == 0
+    assert metrics_reduced["clustering_inertia"] == pytest.approx(
+        compute_clustering_score(
+            clustering_result=clustering_result_reduced,
+            vectors=dict_of_vectors,
+            list_of_constraints=list_of_constraints,
+        )[1],
+        abs=1e-5,
+    )
+
+    # With one seed: same results as the clustering model.
+    assert run_clustering_with_several_random_seeds(
+        constraints_manager=constraints_manager,
+        vectors=dict_of_vectors,
+        nb_clusters=4,
+        algorithm="hierarchical",
+        random_seed=10,
+        init_kargs={"linkage": "ward"},
+    )[0] == clustering_factory(algorithm="hierarchical", random_seed=10, linkage="ward").cluster(
+        constraints_manager=constraints_manager,
+        vectors=dict_of_vectors,
+        nb_clusters=4,
+    )
+
+    # With no seed: error.
+    with pytest.raises(ValueError, match="`nb_seeds`"):
+        run_clustering_with_several_random_seeds(
+            constraints_manager=constraints_manager,
+            vectors=dict_of_vectors,
+            nb_clusters=4,
+            algorithm="kmeans",
+            random_seed=10,
+            nb_seeds=0,
+        )
+
+
+# ==============================================================================
+# test_sweep_nb_clusters
+# ==============================================================================
+
+
+def test_sweep_nb_clusters():
+    """
+    Test that the sweep over numbers of clusters gives silhouette and constraints violations curves, in parallel as in sequential.
+    """
+    rng = np.random.default_rng(0)
+    dict_of_vectors = {
+        str(i): csr_matrix(rng.normal(loc=(i % 3) * 10.0, size=(1, 4))) for i in range(30)  # noqa: WPS221
+    }
+    constraints_manager = BinaryConstraintsManager(list_of_data_IDs=list(dict_of_vectors.keys()))
+    constraints_manager.add_constraint(data_ID1="0", data_ID2="1", constraint_type="CANNOT_LINK")
+    list_of_constraints = [("0", "1", "CANNOT_LINK")]
+
+    # Sweep in parallel.
+    results, metrics = sweep_nb_clusters(
+        constraints_manager=constraints_manager,
+        vectors=dict_of_vectors,
+        list_of_nb_clusters=[2, 3, 4],
+        algorithm="kmeans",
+        random_seed=1,
+        init_kargs={"model": "COP"},
+        list_of_constraints=list_of_constraints,
+        processes_number=2,
+    )
+    assert list(results.keys()) == ["2", "3", "4"]
+    assert max(results.keys(), key=lambda nb_clusters: results[nb_clusters]["silhouette"]) == "3"
+    assert all(results[nb_clusters]["constraints_violations"] == 0 for nb_clusters in results)
+    assert results["2"]["inertia"] > results["3"]["inertia"] > results["4"]["inertia"]
+    assert metrics["sweep_speedup"] > 0
+
+    # Sweep in sequential: same results.
+    assert (
+        sweep_nb_clusters(
+            constraints_manager=constraints_manager,
+            vectors=dict_of_vectors,
+            list_of_nb_clusters=[2, 3, 4],
+            algorithm="kmeans",
+            random_seed=1,
+            init_kargs={"model": "COP"},
+            list_of_constraints=list_of_constraints,
+            processes_number=1,
+        )[0]
+        == results
+    )
+
+    # Undefined silhouette.
+    assert compute_clustering_silhouette(clustering_result={"0": 0, "1": 0}, vectors=dict_of_vectors) is None
+    assert compute_clustering_silhouette(clustering_result={"0": 0, "1": 1}, vectors=dict_of_vectors) is None
+
+    # Without numbers of clusters: error.
+    with pytest.raises(ValueError, match="`list_of_nb_clusters`"):
+        sweep_nb_clusters(
+            constraints_manager=constraints_manager,
+            vectors=dict_of_vectors,
+            list_of_nb_clusters=[1, 2],
+            algorithm="kmeans",
+            random_seed=1,
+        )
@@ -0,0 +1,184 @@
+# -*- coding: utf-8 -*-
+
+"""
+* Name:         interactive-clustering-gui/tests/test_get_api_projects_clustering_sweep.py
+* Description:  Unittests for `app` module on the `GET /api/projects/{project_id}/clustering/sweep` route.
+* Author:       Erwan Schild
+* Created:      18/10/2026
+* Licence:      CeCILL (https://cecill.info/licences.fr.html)
+"""
+
+# ==============================================================================
+# IMPORT PYTHON DEPENDENCIES
+# ==============================================================================
+
+import json
+
+import pytest
+
+from cognitivefactory.interactive_clustering_gui import backgroundtasks
+from tests.dummies_utils import create_dummy_projects
+
+# ==============================================================================
+# test_ko_not_found
+# ==============================================================================
+
+
+@pytest.mark.asyncio()
+async def test_ko_not_found(async_client):
+    """
+    Test the `GET /api/projects/{project_id}/clustering/sweep` route with not existing project.
+
+    Arguments:
+        async_client: Fixture providing an HTTP client, declared in `conftest.py`.
+    """
+    # Assert HTTP client is created.
+    assert async_client
+
+    # Assert route `GET /api/projects/{project_id}/clustering/sweep` works.
+    response_get = await async_client.get(url="/api/projects/UNKNOWN_PROJECT/clustering/sweep")
+    assert response_get.status_code == 404
+    assert response_get.json() == {
+        "detail": "The project with id 'UNKNOWN_PROJECT' doesn't exist.",
+    }
+
+
+# ==============================================================================
+# test_ko_not_requested
+# ==============================================================================
+
+
+@pytest.mark.asyncio()
+async def test_ko_not_requested(async_client, tmp_path):
+    """
+    Test the `GET /api/projects/{project_id}/clustering/sweep` route without requested sweep.
+
+    Arguments:
+        async_client: Fixture providing an HTTP client, declared in `conftest.py`.
+        tmp_path: The temporary path given for this test, declared in `conftest.py`.
+    """
+    # Assert HTTP client is created.
+    assert async_client
+
+    # Create dummy projects.
+    create_dummy_projects(
+        tmp_path=tmp_path,
+        list_of_dummy_project_ids=[
+            "1l_ANNOTATION_WITH_UPTODATE_MODELIZATION",
+        ],
+    )
+
+    # Assert route `GET /api/projects/{project_id}/clustering/sweep` works.
+    response_get = await async_client.get(url="/api/projects/1l_ANNOTATION_WITH_UPTODATE_MODELIZATION/clustering/sweep")
+    assert response_get.status_code == 404
+    assert response_get.json() == {
+        "detail": "In project with id '1l_ANNOTATION_WITH_UPTODATE_MODELIZATION', no sweep over numbers of clusters has been requested.",
+    }
+
+
+# ==============================================================================
+# test_ko_sweep_error
+# ==============================================================================
+
+
+@pytest.mark.asyncio()
+async def test_ko_sweep_error(async_client, tmp_path):
+    """
+    Test the `GET /api/projects/{project_id}/clustering/sweep` route with a failed sweep.
+
+    Arguments:
+        async_client: Fixture providing an HTTP client, declared in `conftest.py`.
+        tmp_path: The temporary path given for this test, declared in `conftest.py`.
+    """
+    # Assert HTTP client is created.
+    assert async_client
+
+    # Create dummy projects, with a failed sweep.
+    create_dummy_projects(
+        tmp_path=tmp_path,
+        list_of_dummy_project_ids=[
+            "1l_ANNOTATION_WITH_UPTODATE_MODELIZATION",
+        ],
+    )
+    with open(
+        tmp_path / "1l_ANNOTATION_WITH_UPTODATE_MODELIZATION" / backgroundtasks.CLUSTERING_SWEEP_NAME, "w"
+    ) as clustering_sweep_fileobject:
+        json.dump(
+            {
+                "parameters": {"iteration_id": 1, "nb_clusters_min": 2, "nb_clusters_max": 3},
+                "task": None,
+                "results": None,
+                "metrics": None,
+                "error": "ValueError: n_samples=23 should be >= n_clusters=30.",
+            },
+            clustering_sweep_fileobject,
+        )
+
+    # Assert route `GET /api/projects/{project_id}/clustering/sweep` works.
+    response_get = await async_client.get(url="/api/projects/1l_ANNOTATION_WITH_UPTODATE_MODELIZATION/clustering/sweep")
+    assert response_get.status_code == 500
+    assert response_get.json() == {
+        "detail": "In project with id '1l_ANNOTATION_WITH_UPTODATE_MODELIZATION', the sweep over numbers of clusters failed (ValueError: n_samples=23 should be >= n_clusters=30.). Request it again.",
+    }
+
+
+# ==============================================================================
+# test_ok
+# ==============================================================================
+
+
+@pytest.mark.asyncio()
+async def test_ok(async_client, tmp_path):
+    """
+    Test the `GET /api/projects/{project_id}/clustering/sweep` route with a running sweep, then with a computed sweep.
+
+    Arguments:
+        async_client: Fixture providing an HTTP client, declared in `conftest.py`.
+        tmp_path: The temporary path given for this test, declared in `conftest.py`.
+    """
+    # Assert HTTP client is created.
+    assert async_client
+
+    # Create dummy projects, with a running sweep.
+    create_dummy_projects(
+        tmp_path=tmp_path,
+        list_of_dummy_project_ids=[
+            "1l_ANNOTATION_WITH_UPTODATE_MODELIZATION",
+        ],
+    )
+    clustering_sweep = {
+        "parameters": {"iteration_id": 1, "nb_clusters_min": 2, "nb_clusters_max": 3},
+        "task": {"progression": 30, "detail": "Run constrained clustering for each number of clusters."},
+        "results": None,
+        "metrics": None,
+    }
+    with open(
+        tmp_path / "1l_ANNOTATION_WITH_UPTODATE_MODELIZATION" / backgroundtasks.CLUSTERING_SWEEP_NAME, "w"
+    ) as clustering_sweep_fileobject_1:
+        json.dump(clustering_sweep, clustering_sweep_fileobject_1)
+
+    # Assert route `GET /api/projects/{project_id}/clustering/sweep` works.
+    response_get_1 = await async_client.get(
+        url="/api/projects/1l_ANNOTATION_WITH_UPTODATE_MODELIZATION/clustering/sweep"
+    )
+    assert response_get_1.status_code == 202
+    assert response_get_1.json() == {"project_id": "1l_ANNOTATION_WITH_UPTODATE_MODELIZATION", **clustering_sweep}
+
+    # Set a computed sweep.
+    clustering_sweep["task"] = None
+    clustering_sweep["results"] = {
+        "2": {"silhouette": 0.1, "constraints_violations": 1, "inertia": 20.0},
+        "3": {"silhouette": 0.2, "constraints_violations": 0, "inertia": 15.0},
+    }
+    clustering_sweep["metrics"] = {"sweep_duration": 1.0, "sweep_sequential_duration": 1.0, "sweep_speedup": 1.0}
+    with open(
+        tmp_path / "1l_ANNOTATION_WITH_UPTODATE_MODELIZATION" / backgroundtasks.CLUSTERING_SWEEP_NAME, "w"
+    ) as clustering_sweep_fileobject_2:
+        json.dump(clustering_sweep, clustering_sweep_fileobject_2)
+
+    # Assert route `GET /api/projects/{project_id}/clustering/sweep` works.
+    response_get_2 = await async_client.get(
+        url="/api/projects/1l_ANNOTATION_WITH_UPTODATE_MODELIZATION/clustering/sweep"
+    )
+    assert response_get_2.status_code == 200
+    assert response_get_2.json() == {"project_id": "1l_ANNOTATION_WITH_UPTODATE_MODELIZATION", **clustering_sweep}
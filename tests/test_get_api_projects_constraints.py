@@ -367,6 +367,18 @@ async def test_ok_default(async_client, tmp_path):
             "without_hidden_constraints": True,
             "sorted_by": "id",
             "sorted_reverse": False,
+            "iteration_of_sampling": None,
+            "constraint_type": None,
+            "to_annotate": None,
+            "to_review": None,
+            "to_fix_conflict": None,
+            "offset": 0,
+            "limit": None,
+            "cursor": None,
+        },
+        "pagination": {
+            "total": 23,
+            "next_cursor": None,
         },
     }
 
@@ -724,6 +736,18 @@ async def test_ok_with_hidden(async_client, tmp_path):
             "without_hidden_constraints": False,
             "sorted_by": "id",
             "sorted_reverse": False,
+            "iteration_of_sampling": None,
+            "constraint_type": None,
+            "to_annotate": None,
+            "to_review": None,
+            "to_fix_conflict": None,
+            "offset": 0,
+            "limit": None,
+            "cursor": None,
+        },
+        "pagination": {
+            "total": 25,
+            "next_cursor": None,
         },
     }
 
@@ -1059,6 +1083,18 @@ async def test_ok_by_id(async_client, tmp_path):
             "without_hidden_constraints": True,
             "sorted_by": "id",
             "sorted_reverse": False,
+            "iteration_of_sampling": None,
+            "constraint_type": None,
+            "to_annotate": None,
+            "to_review": None,
+            "to_fix_conflict": None,
+            "offset": 0,
+            "limit": None,
+            "cursor": None,
+        },
+        "pagination": {
+            "total": 23,
+            "next_cursor": None,
         },
     }
 
@@ -1392,6 +1428,18 @@ async def test_ok_by_text(async_client, tmp_path):
             "without_hidden_constraints": True,
             "sorted_by": "text",
             "sorted_reverse": False,
+            "iteration_of_sampling": None,
+            "constraint_type": None,
+            "to_annotate": None,
+            "to_review": None,
+            "to_fix_conflict": None,
+            "offset": 0,
+            "limit": None,
+            "cursor": None,
+        },
+        "pagination": {
+            "total": 23,
+            "next_cursor": None,
         },
     }
 
@@ -1730,6 +1778,18 @@ async def test_ok_by_constraint_type(async_client, tmp_path):
             "without_hidden_constraints": True,
             "sorted_by": "constraint_type",
             "sorted_reverse": False,
+            "iteration_of_sampling": None,
+            "constraint_type": None,
+            "to_annotate": None,
+            "to_review": None,
+            "to_fix_conflict": None,
+            "offset": 0,
+            "limit": None,
+            "cursor": None,
+        },
+        "pagination": {
+            "total": 23,
+            "next_cursor": None,
         },
     }
 
@@ -2063,6 +2123,18 @@ async def test_ok_by_date_of_update(async_client, tmp_path):
             "without_hidden_constraints": True,
             "sorted_by": "date_of_update",
             "sorted_reverse": False,
+            "iteration_of_sampling": None,
+            "constraint_type": None,
+            "to_annotate": None,
+            "to_review": None,
+            "to_fix_conflict": None,
+            "offset": 0,
+            "limit": None,
+            "cursor": None,
+        },
+        "pagination": {
+            "total": 23,
+            "next_cursor": None,
         },
     }
 
@@ -3996,6 +4068,18 @@ async def test_ok_by_iteration_of_sampling(async_client, tmp_path):
             "without_hidden_constraints": True,
             "sorted_by": "iteration_of_sampling",
             "sorted_reverse": False,
+            "iteration_of_sampling": None,
+            "constraint_type": None,
+            "to_annotate": None,
+            "to_review": None,
+            "to_fix_conflict": None,
+            "offset": 0,
+            "limit": None,
+            "cursor": None,
+        },
+        "pagination": {
+            "total": 156,
+            "next_cursor": None,
         },
     }
 
@@ -4333,6 +4417,18 @@ async def test_ok_by_to_annotate(async_client, tmp_path):
             "without_hidden_constraints": True,
             "sorted_by": "to_annotate",
             "sorted_reverse": False,
+            "iteration_of_sampling": None,
+            "constraint_type": None,
+            "to_annotate": None,
+            "to_review": None,
+            "to_fix_conflict": None,
+            "offset": 0,
+            "limit": None,
+            "cursor": None,
+        },
+        "pagination": {
+            "total": 23,
+            "next_cursor": None,
         },
     }
 
@@ -4670,6 +4766,18 @@ async def test_ok_by_to_review(async_client, tmp_path):
             "without_hidden_constraints": True,
             "sorted_by": "to_review",
             "sorted_reverse": False,
+            "iteration_of_sampling": None,
+            "constraint_type": None,
+            "to_annotate": None,
+            "to_review": None,
+            "to_fix_conflict": None,
+            "offset": 0,
+            "limit": None,
+            "cursor": None,
+        },
+        "pagination": {
+            "total": 23,
+            "next_cursor": None,
         },
     }
 
@@ -5008,6 +5116,18 @@ async def test_ok_by_to_fix_conflict(async_client, tmp_path):
             "without_hidden_constraints": True,
             "sorted_by": "to_fix_conflict",
             "sorted_reverse": False,
+            "iteration_of_sampling": None,
+            "constraint_type": None,
+            "to_annotate": None,
+            "to_review": None,
+            "to_fix_conflict": None,
+            "offset": 0,
+            "limit": None,
+            "cursor": None,
+        },
+        "pagination": {
+            "total": 23,
+            "next_cursor": None,
         },
     }
 
@@ -5341,5 +5461,177 @@ async def test_ok_by_sorted_reverse(async_client, tmp_path):
             "without_hidden_constraints": True,
             "sorted_by": "id",
             "sorted_reverse": True,
+            "iteration_of_sampling": None,
+            "constraint_type": None,
+            "to_annotate": None,
+            "to_review": None,
+            "to_fix_conflict": None,
+            "offset": 0,
+            "limit": None,
+            "cursor": None,
         },
+        "pagination": {
+            "total": 23,
+            "next_cursor": None,
+        },
+    }
+
+
+# ==============================================================================
+# test_ko_invalid_cursor
+# ==============================================================================
+
+
+@pytest.mark.asyncio()
+async def test_ko_invalid_cursor(async_client, tmp_path):
+    """
+    Test the `GET /api/projects/{project_id}/constraints` route with invalid cursor.
+
+    Arguments:
+        async_client: Fixture providing an HTTP client, declared in `conftest.py`.
+        tmp_path: The temporary path given for this test, declared in `conftest.py`.
+    """
+    # Assert HTTP client is created.
+    assert async_client
+
+    # Create dummy projects.
+    create_dummy_projects(
+        tmp_path=tmp_path,
+        list_of_dummy_project_ids=[
+            "1l_ANNOTATION_WITH_UPTODATE_MODELIZATION",
+        ],
+    )
+
+    # Get a cursor for constraints sorted by id.
+    response_get = await async_client.get(
+        url="/api/projects/1l_ANNOTATION_WITH_UPTODATE_MODELIZATION/constraints?sorted_by=id&limit=5"
+    )
+    assert response_get.status_code == 200
+    cursor = response_get.json()["pagination"]["next_cursor"]
+
+    # Assert route `GET /api/projects/{project_id}/constraints` rejects a cursor of another sort.
+    response_get = await async_client.get(
+        url="/api/projects/1l_ANNOTATION_WITH_UPTODATE_MODELIZATION/constraints?sorted_by=text&limit=5&cursor=" + cursor
+    )
+    assert response_get.status_code == 400
+    assert response_get.json() == {
+        "detail": "The cursor '" + cursor + "' is invalid.",
+    }
+
+
+# ==============================================================================
+# test_ok_filters
+# ==============================================================================
+
+
+@pytest.mark.asyncio()
+async def test_ok_filters(async_client, tmp_path):
+    """
+    Test the `GET /api/projects/{project_id}/constraints` route with filters.
+
+    Arguments:
+        async_client: Fixture providing an HTTP client, declared in `conftest.py`.
+        tmp_path: The temporary path given for this test, declared in `conftest.py`.
+    """
+    # Assert HTTP client is created.
+    assert async_client
+
+    # Create dummy projects.
+    create_dummy_projects(
+        tmp_path=tmp_path,
+        list_of_dummy_project_ids=[
+            "1l_ANNOTATION_WITH_UPTODATE_MODELIZATION",
+        ],
+    )
+    url = "/api/projects/1l_ANNOTATION_WITH_UPTODATE_MODELIZATION/constraints?without_hidden_constraints=false"
+
+    # Assert filters on constraint type.
+    response_get = await async_client.get(url=url + "&constraint_type=CANNOT_LINK&constraint_type=SKIP")
+    assert response_get.status_code == 200
+    assert response_get.json()["pagination"]["total"] == 7
+    assert {constraint["constraint_type"] for constraint in response_get.json()["constraints"].values()} == {
+        "CANNOT_LINK",
+        None,
     }
+    assert response_get.json()["parameters"]["constraint_type"] == ["CANNOT_LINK", "SKIP"]
+
+    # Assert filters on statuses and iteration.
+    response_get = await async_client.get(url=url + "&to_review=true&to_annotate=false&iteration_of_sampling=1")
+    assert response_get.status_code == 200
+    assert response_get.json()["pagination"]["total"] == 4
+    assert all(constraint["to_review"] for constraint in response_get.json()["constraints"].values())
+    response_get = await async_client.get(url=url + "&to_annotate=true")
+    assert response_get.status_code == 200
+    assert response_get.json()["pagination"]["total"] == 2
+    response_get = await async_client.get(url=url + "&iteration_of_sampling=2")
+    assert response_get.status_code == 200
+    assert response_get.json()["constraints"] == {}
+    assert response_get.json()["pagination"]["total"] == 0
+
+
+# ==============================================================================
+# test_ok_pagination
+# ==============================================================================
+
+
+@pytest.mark.parametrize(
+    "sorted_by,sorted_reverse",
+    [
+        ("id", False),
+        ("text", False),
+        ("text", True),
+        ("constraint_type", True),
+        ("date_of_update", False),
+        ("to_review", False),
+    ],
+)
+@pytest.mark.asyncio()
+async def test_ok_pagination(async_client, tmp_path, sorted_by, sorted_reverse):
+    """
+    Test the `GET /api/projects/{project_id}/constraints` route with offset, limit and cursor.
+
+    Arguments:
+        async_client: Fixture providing an HTTP client, declared in `conftest.py`.
+        tmp_path: The temporary path given for this test, declared in `conftest.py`.
+        sorted_by: The option to sort constraints.
+        sorted_reverse: The option to reverse constraints order.
+    """
+    # Assert HTTP client is created.
+    assert async_client
+
+    # Create dummy projects.
+    create_dummy_projects(
+        tmp_path=tmp_path,
+        list_of_dummy_project_ids=[
+            "1l_ANNOTATION_WITH_UPTODATE_MODELIZATION",
+        ],
+    )
+    url = "/api/projects/1l_ANNOTATION_WITH_UPTODATE_MODELIZATION/constraints?without_hidden_constraints=false&sorted_by={sorted_by}&sorted_reverse={sorted_reverse}".format(
+        sorted_by=sorted_by,
+        sorted_reverse=str(sorted_reverse).lower(),
+    )
+
+    # Get all constraints.
+    response_get_all = await async_client.get(url=url)
+    assert response_get_all.status_code == 200
+    list_of_all_constraint_ids = list(response_get_all.json()["constraints"].keys())
+    assert len(list_of_all_constraint_ids) == 25
+
+    # Assert pages with offset and limit are slices of all constraints.
+    response_get_offset = await async_client.get(url=url + "&offset=4&limit=8")
+    assert response_get_offset.status_code == 200
+    assert list(response_get_offset.json()["constraints"].keys()) == list_of_all_constraint_ids[4:12]
+    assert response_get_offset.json()["pagination"]["total"] == 25
+
+    # Assert pages with cursor cover all constraints, in the same order.
+    list_of_paginated_constraint_ids = []
+    cursor = None
+    for _ in range(3):
+        response_get_page = await async_client.get(
+            url=url + "&limit=10" + ("&cursor=" + cursor if cursor is not None else "")
+        )
+        assert response_get_page.status_code == 200
+        list_of_paginated_constraint_ids.extend(response_get_page.json()["constraints"].keys())
+        cursor = response_get_page.json()["pagination"]["next_cursor"]
+    assert cursor is None
+    assert list_of_paginated_constraint_ids == list_of_all_constraint_ids
@@ -12,13 +12,16 @@
 # IMPORT PYTHON DEPENDENCIES
 # ==============================================================================
 
+import io
+import json
+import zipfile
+
 import pytest
 
+from cognitivefactory.interactive_clustering_gui.app import ARCHIVE_FORMAT_VERSION
+from cognitivefactory.interactive_clustering_gui.storage.modelization import compact_modelization
 from tests.dummies_utils import create_dummy_projects
 
-# from zipp import zipfile
-
-
 # ==============================================================================
 # test_ko_not_found
 # ==============================================================================
@@ -109,6 +112,31 @@ async def test_ok_with_modelization(async_client, tmp_path):
     assert response_get.headers["content-type"] == "application/x-zip-compressed"
     assert response_get.headers["content-disposition"] == 'attachment; filename="archive-1c_SAMPLING_WORKING.zip"'
 
-    # TODO: explore content
-    # with zipfile.ZipFile(import_archive_path, "r") as import_archive_file:
-    # import_archive_file.namelist()
+    # Assert archive has a format version, and a compact modelization inference.
+    with open(tmp_path / "1c_SAMPLING_WORKING" / "modelization.json", "r") as modelization_fileobject:
+        legacy_modelization = json.load(modelization_fileobject)
+    with zipfile.ZipFile(io.BytesIO(response_get.content), "r") as archive_file:
+        with archive_file.open("metadata.json") as metadata_fileobject:
+            assert json.load(metadata_fileobject)["archive_format_version"] == ARCHIVE_FORMAT_VERSION
+        with archive_file.open("modelization.json") as archive_modelization_fileobject:
+            assert json.load(archive_modelization_fileobject) == compact_modelization(legacy_modelization)
+
+    # Assert the archive can be imported, with the same modelization inference.
+    response_put = await async_client.put(
+        url="/api/projects",
+        files={
+            "project_archive": (
+                "archive-1c_SAMPLING_WORKING.zip",
+                response_get.content,
+                "application/x-zip-compressed",
+            ),
+        },
+    )
+    assert response_put.status_code == 201
+    imported_project_id: str = response_put.json()["project_id"]
+    response_get_metadata = await async_client.get(url="/api/projects/" + imported_project_id + "/metadata")
+    assert response_get_metadata.status_code == 200
+    assert "archive_format_version" not in response_get_metadata.json()["metadata"]
+    response_get_modelization = await async_client.get(url="/api/projects/" + imported_project_id + "/modelization")
+    assert response_get_modelization.status_code == 200
+    assert response_get_modelization.json()["modelization"] == compact_modelization(legacy_modelization)
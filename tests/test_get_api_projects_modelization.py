@@ -16,6 +16,7 @@ import json
 
 import pytest
 
+from cognitivefactory.interactive_clustering_gui.storage.modelization import compact_modelization
 from tests.dummies_utils import create_dummy_projects
 
 # ==============================================================================
@@ -74,38 +75,41 @@ async def test_ok_1(async_client, tmp_path):
     assert response_get.json() == {
         "project_id": "0a_INITIALIZATION_WITHOUT_MODELIZATION",
         "modelization": {
-            "0": {"MUST_LINK": ["0"], "CANNOT_LINK": [], "COMPONENT": 0},
-            "1": {"MUST_LINK": ["1"], "CANNOT_LINK": [], "COMPONENT": 1},
-            "2": {"MUST_LINK": ["2"], "CANNOT_LINK": [], "COMPONENT": 2},
-            "3": {"MUST_LINK": ["3"], "CANNOT_LINK": [], "COMPONENT": 3},
-            "4": {"MUST_LINK": ["4"], "CANNOT_LINK": [], "COMPONENT": 4},
-            "5": {"MUST_LINK": ["5"], "CANNOT_LINK": [], "COMPONENT": 5},
-            "6": {"MUST_LINK": ["6"], "CANNOT_LINK": [], "COMPONENT": 6},
-            "7": {"MUST_LINK": ["7"], "CANNOT_LINK": [], "COMPONENT": 7},
-            "8": {"MUST_LINK": ["8"], "CANNOT_LINK": [], "COMPONENT": 8},
-            "9": {"MUST_LINK": ["9"], "CANNOT_LINK": [], "COMPONENT": 9},
-            "10": {"MUST_LINK": ["10"], "CANNOT_LINK": [], "COMPONENT": 10},
-            "11": {"MUST_LINK": ["11"], "CANNOT_LINK": [], "COMPONENT": 11},
-            "12": {"MUST_LINK": ["12"], "CANNOT_LINK": [], "COMPONENT": 12},
-            "13": {"MUST_LINK": ["13"], "CANNOT_LINK": [], "COMPONENT": 13},
-            "14": {"MUST_LINK": ["14"], "CANNOT_LINK": [], "COMPONENT": 14},
-            "15": {"MUST_LINK": ["15"], "CANNOT_LINK": [], "COMPONENT": 15},
-            "16": {"MUST_LINK": ["16"], "CANNOT_LINK": [], "COMPONENT": 16},
-            "17": {"MUST_LINK": ["17"], "CANNOT_LINK": [], "COMPONENT": 17},
-            "18": {"MUST_LINK": ["18"], "CANNOT_LINK": [], "COMPONENT": 18},
-            "19": {"MUST_LINK": ["19"], "CANNOT_LINK": [], "COMPONENT": 19},
-            "20": {"MUST_LINK": ["20"], "CANNOT_LINK": [], "COMPONENT": 20},
-            "21": {"MUST_LINK": ["21"], "CANNOT_LINK": [], "COMPONENT": 21},
-            "22": {"MUST_LINK": ["22"], "CANNOT_LINK": [], "COMPONENT": 22},
-            "23": {"MUST_LINK": ["23"], "CANNOT_LINK": [], "COMPONENT": 23},
+            "COMPONENT": {
+                "0": 0,
+                "1": 1,
+                "2": 2,
+                "3": 3,
+                "4": 4,
+                "5": 5,
+                "6": 6,
+                "7": 7,
+                "8": 8,
+                "9": 9,
+                "10": 10,
+                "11": 11,
+                "12": 12,
+                "13": 13,
+                "14": 14,
+                "15": 15,
+                "16": 16,
+                "17": 17,
+                "18": 18,
+                "19": 19,
+                "20": 20,
+                "21": 21,
+                "22": 22,
+                "23": 23,
+            },
+            "CANNOT_LINK": {},
         },
     }
 
-    # Assert file content is the same.
+    # Assert file content (legacy modelization inference) is compacted.
     with open(
         tmp_path / "0a_INITIALIZATION_WITHOUT_MODELIZATION" / "modelization.json", "r"
     ) as modelization_fileobject:
-        assert response_get.json()["modelization"] == json.load(modelization_fileobject)
+        assert response_get.json()["modelization"] == compact_modelization(json.load(modelization_fileobject))
 
 
 # ==============================================================================
@@ -140,106 +144,37 @@ async def test_ok_2(async_client, tmp_path):
     assert response_get.json() == {
         "project_id": "1l_ANNOTATION_WITH_UPTODATE_MODELIZATION",
         "modelization": {
-            "0": {
-                "MUST_LINK": ["1", "2", "3", "6", "0", "4", "7"],
-                "CANNOT_LINK": ["22", "20", "21", "17", "19", "18"],
-                "COMPONENT": 0,
-            },
-            "1": {
-                "MUST_LINK": ["1", "2", "3", "6", "0", "4", "7"],
-                "CANNOT_LINK": ["22", "20", "21", "17", "19", "18"],
-                "COMPONENT": 0,
-            },
-            "2": {
-                "MUST_LINK": ["1", "2", "3", "6", "0", "4", "7"],
-                "CANNOT_LINK": ["22", "20", "21", "17", "19", "18"],
-                "COMPONENT": 0,
-            },
-            "3": {
-                "MUST_LINK": ["1", "2", "3", "6", "0", "4", "7"],
-                "CANNOT_LINK": ["22", "20", "21", "17", "19", "18"],
-                "COMPONENT": 0,
-            },
-            "4": {
-                "MUST_LINK": ["1", "2", "3", "6", "0", "4", "7"],
-                "CANNOT_LINK": ["22", "20", "21", "17", "19", "18"],
-                "COMPONENT": 0,
-            },
-            "5": {"MUST_LINK": ["5"], "CANNOT_LINK": [], "COMPONENT": 1},
-            "6": {
-                "MUST_LINK": ["1", "2", "3", "6", "0", "4", "7"],
-                "CANNOT_LINK": ["22", "20", "21", "17", "19", "18"],
-                "COMPONENT": 0,
-            },
-            "7": {
-                "MUST_LINK": ["1", "2", "3", "6", "0", "4", "7"],
-                "CANNOT_LINK": ["22", "20", "21", "17", "19", "18"],
-                "COMPONENT": 0,
-            },
-            "8": {
-                "MUST_LINK": ["8", "11", "10", "12", "9"],
-                "CANNOT_LINK": ["22", "18", "20", "21", "17", "19"],
-                "COMPONENT": 2,
-            },
-            "9": {
-                "MUST_LINK": ["8", "11", "10", "12", "9"],
-                "CANNOT_LINK": ["22", "18", "20", "21", "17", "19"],
-                "COMPONENT": 2,
-            },
-            "10": {
-                "MUST_LINK": ["8", "11", "10", "12", "9"],
-                "CANNOT_LINK": ["22", "18", "20", "21", "17", "19"],
-                "COMPONENT": 2,
-            },
-            "11": {
-                "MUST_LINK": ["8", "11", "10", "12", "9"],
-                "CANNOT_LINK": ["22", "18", "20", "21", "17", "19"],
-                "COMPONENT": 2,
-            },
-            "12": {
-                "MUST_LINK": ["8", "11", "10", "12", "9"],
-                "CANNOT_LINK": ["22", "18", "20", "21", "17", "19"],
-                "COMPONENT": 2,
-            },
-            "13": {"MUST_LINK": ["13"], "CANNOT_LINK": ["16"], "COMPONENT": 3},
-            "15": {"MUST_LINK": ["15"], "CANNOT_LINK": ["16"], "COMPONENT": 4},
-            "16": {"MUST_LINK": ["16"], "CANNOT_LINK": ["15", "13"], "COMPONENT": 5},
-            "17": {
-                "MUST_LINK": ["18", "19", "17", "21", "20", "22"],
-                "CANNOT_LINK": ["8", "11", "10", "12", "9", "6", "1", "2", "3", "0", "4", "7"],
-                "COMPONENT": 6,
-            },
-            "18": {
-                "MUST_LINK": ["18", "19", "17", "21", "20", "22"],
-                "CANNOT_LINK": ["8", "11", "10", "12", "9", "6", "1", "2", "3", "0", "4", "7"],
-                "COMPONENT": 6,
-            },
-            "19": {
-                "MUST_LINK": ["18", "19", "17", "21", "20", "22"],
-                "CANNOT_LINK": ["8", "11", "10", "12", "9", "6", "1", "2", "3", "0", "4", "7"],
-                "COMPONENT": 6,
-            },
-            "20": {
-                "MUST_LINK": ["18", "19", "17", "21", "20", "22"],
-                "CANNOT_LINK": ["8", "11", "10", "12", "9", "6", "1", "2", "3", "0", "4", "7"],
-                "COMPONENT": 6,
-            },
-            "21": {
-                "MUST_LINK": ["18", "19", "17", "21", "20", "22"],
-                "CANNOT_LINK": ["8", "11", "10", "12", "9", "6", "1", "2", "3", "0", "4", "7"],
-                "COMPONENT": 6,
-            },
-            "22": {
-                "MUST_LINK": ["18", "19", "17", "21", "20", "22"],
-                "CANNOT_LINK": ["8", "11", "10", "12", "9", "6", "1", "2", "3", "0", "4", "7"],
-                "COMPONENT": 6,
-            },
-            "23": {"MUST_LINK": ["23"], "CANNOT_LINK": [], "COMPONENT": 7},
+            "COMPONENT": {
+                "0": 0,
+                "1": 0,
+                "2": 0,
+                "3": 0,
+                "4": 0,
+                "5": 1,
+                "6": 0,
+                "7": 0,
+                "8": 2,
+                "9": 2,
+                "10": 2,
+                "11": 2,
+                "12": 2,
+                "13": 3,
+                "15": 4,
+                "16": 5,
+                "17": 6,
+                "18": 6,
+                "19": 6,
+                "20": 6,
+                "21": 6,
+                "22": 6,
+                "23": 7,
+            },
+            "CANNOT_LINK": {"0": [6], "2": [6], "3": [5], "4": [5], "5": [3, 4], "6": [0, 2]},
         },
     }
 
-    # Assert file content is the same.
+    # Assert file content (legacy modelization inference) is compacted.
     with open(
         tmp_path / "1l_ANNOTATION_WITH_UPTODATE_MODELIZATION" / "modelization.json", "r"
     ) as modelization_fileobject:
-        assert response_get.json()["modelization"] == json.load(modelization_fileobject)
+        assert response_get.json()["modelization"] == compact_modelization(json.load(modelization_fileobject))
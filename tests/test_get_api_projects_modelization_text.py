@@ -0,0 +1,138 @@
+# -*- coding: utf-8 -*-
+
+"""
+* Name:         interactive-clustering-gui/tests/test_get_api_projects_modelization_text.py
+* Description:  Unittests for `app` module on the `GET /api/projects/{project_id}/modelization/{text_id}` route.
+* Author:       Erwan Schild
+* Created:      18/10/2026
+* Licence:      CeCILL (https://cecill.info/licences.fr.html)
+"""
+
+# ==============================================================================
+# IMPORT PYTHON DEPENDENCIES
+# ==============================================================================
+
+import json
+
+import pytest
+
+from tests.dummies_utils import create_dummy_projects
+
+# ==============================================================================
+# test_ko_not_found
+# ==============================================================================
+
+
+@pytest.mark.asyncio()
+async def test_ko_not_found(async_client):
+    """
+    Test the `GET /api/projects/{project_id}/modelization/{text_id}` route with not existing project.
+
+    Arguments:
+        async_client: Fixture providing an HTTP client, declared in `conftest.py`.
+    """
+    # Assert HTTP client is created.
+    assert async_client
+
+    # Assert route `GET /api/projects/{project_id}/modelization/{text_id}` works.
+    response_get = await async_client.get(url="/api/projects/UNKNOWN_PROJECT/modelization/0")
+    assert response_get.status_code == 404
+    assert response_get.json() == {
+        "detail": "The project with id 'UNKNOWN_PROJECT' doesn't exist.",
+    }
+
+
+# ==============================================================================
+# test_ko_text_not_modelized
+# ==============================================================================
+
+
+@pytest.mark.asyncio()
+async def test_ko_text_not_modelized(async_client, tmp_path):
+    """
+    Test the `GET /api/projects/{project_id}/modelization/{text_id}` route with not modelized texts.
+
+    Arguments:
+        async_client: Fixture providing an HTTP client, declared in `conftest.py`.
+        tmp_path: The temporary path given for this test, declared in `conftest.py`.
+    """
+    # Assert HTTP client is created.
+    assert async_client
+
+    # Create dummy projects.
+    create_dummy_projects(
+        tmp_path=tmp_path,
+        list_of_dummy_project_ids=[
+            "1l_ANNOTATION_WITH_UPTODATE_MODELIZATION",
+        ],
+    )
+
+    # Assert route `GET /api/projects/{project_id}/modelization/{text_id}` works with a deleted text.
+    response_get_deleted = await async_client.get(
+        url="/api/projects/1l_ANNOTATION_WITH_UPTODATE_MODELIZATION/modelization/14"
+    )
+    assert response_get_deleted.status_code == 404
+    assert response_get_deleted.json() == {
+        "detail": "In project with id '1l_ANNOTATION_WITH_UPTODATE_MODELIZATION', the text with id '14' isn't modelized.",
+    }
+
+    # Assert route `GET /api/projects/{project_id}/modelization/{text_id}` works with an unknown text.
+    response_get_unknown = await async_client.get(
+        url="/api/projects/1l_ANNOTATION_WITH_UPTODATE_MODELIZATION/modelization/UNKNOWN_TEXT"
+    )
+    assert response_get_unknown.status_code == 404
+    assert response_get_unknown.json() == {
+        "detail": "In project with id '1l_ANNOTATION_WITH_UPTODATE_MODELIZATION', the text with id 'UNKNOWN_TEXT' isn't modelized.",
+    }
+
+
+# ==============================================================================
+# test_ok
+# ==============================================================================
+
+
+@pytest.mark.asyncio()
+async def test_ok(async_client, tmp_path):
+    """
+    Test the `GET /api/projects/{project_id}/modelization/{text_id}` route with some projects.
+
+    Arguments:
+        async_client: Fixture providing an HTTP client, declared in `conftest.py`.
+        tmp_path: The temporary path given for this test, declared in `conftest.py`.
+    """
+    # Assert HTTP client is created.
+    assert async_client
+
+    # Create dummy projects.
+    create_dummy_projects(
+        tmp_path=tmp_path,
+        list_of_dummy_project_ids=[
+            "1l_ANNOTATION_WITH_UPTODATE_MODELIZATION",
+        ],
+    )
+
+    # Assert route `GET /api/projects/{project_id}/modelization/{text_id}` works.
+    response_get = await async_client.get(url="/api/projects/1l_ANNOTATION_WITH_UPTODATE_MODELIZATION/modelization/16")
+    assert response_get.status_code == 200
+    assert list(response_get.json().keys()) == ["project_id", "text_id", "modelization"]
+    assert response_get.json() == {
+        "project_id": "1l_ANNOTATION_WITH_UPTODATE_MODELIZATION",
+        "text_id": "16",
+        "modelization": {"MUST_LINK": ["16"], "CANNOT_LINK": ["13", "15"], "COMPONENT": 5},
+    }
+
+    # Assert expanded modelization inference is the one of the file (legacy modelization inference).
+    with open(
+        tmp_path / "1l_ANNOTATION_WITH_UPTODATE_MODELIZATION" / "modelization.json", "r"
+    ) as modelization_fileobject:
+        legacy_modelization = json.load(modelization_fileobject)
+    for text_id, legacy_value in legacy_modelization.items():
+        response_get_text = await async_client.get(
+            url="/api/projects/1l_ANNOTATION_WITH_UPTODATE_MODELIZATION/modelization/{text_id}".format(
+                text_id=text_id,
+            )
+        )
+        assert response_get_text.status_code == 200
+        assert response_get_text.json()["modelization"]["COMPONENT"] == legacy_value["COMPONENT"]
+        assert sorted(response_get_text.json()["modelization"]["MUST_LINK"]) == sorted(legacy_value["MUST_LINK"])
+        assert sorted(response_get_text.json()["modelization"]["CANNOT_LINK"]) == sorted(legacy_value["CANNOT_LINK"])
@@ -0,0 +1,115 @@
+# -*- coding: utf-8 -*-
+
+"""
+* Name:         interactive-clustering-gui/tests/test_get_api_projects_status_stream.py
+* Description:  Unittests for `app` module on the `GET /api/projects/{project_id}/status/stream` route.
+* Author:       Erwan Schild
+* Created:      18/10/2026
+* Licence:      CeCILL (https://cecill.info/licences.fr.html)
+"""
+
+# ==============================================================================
+# IMPORT PYTHON DEPENDENCIES
+# ==============================================================================
+
+import asyncio
+import json
+
+import pytest
+
+from cognitivefactory.interactive_clustering_gui.events import project_events
+from tests.dummies_utils import create_dummy_projects
+
+# ==============================================================================
+# test_ko_not_found
+# ==============================================================================
+
+
+@pytest.mark.asyncio()
+async def test_ko_not_found(async_client):
+    """
+    Test the `GET /api/projects/{project_id}/status/stream` route with not existing project.
+
+    Arguments:
+        async_client: Fixture providing an HTTP client, declared in `conftest.py`.
+    """
+    # Assert HTTP client is created.
+    assert async_client
+
+    # Assert route `GET /api/projects/{project_id}/status/stream` works.
+    response_get = await async_client.get(url="/api/projects/UNKNOWN_PROJECT/status/stream")
+    assert response_get.status_code == 404
+    assert response_get.json() == {
+        "detail": "The project with id 'UNKNOWN_PROJECT' doesn't exist.",
+    }
+
+
+# ==============================================================================
+# test_ok_status_changes
+# ==============================================================================
+
+
+@pytest.mark.asyncio()
+async def test_ok_status_changes(async_client, tmp_path):
+    """
+    Test the `GET /api/projects/{project_id}/status/stream` route, with status changes pushed by routes and by tasks.
+
+    Arguments:
+        async_client: Fixture providing an HTTP client, declared in `conftest.py`.
+        tmp_path: The temporary path given for this test, declared in `conftest.py`.
+    """
+    # Assert HTTP client is created.
+    assert async_client
+
+    # Create dummy projects.
+    create_dummy_projects(
+        tmp_path=tmp_path,
+        list_of_dummy_project_ids=[
+            "1d_ANNOTATION_WITH_UPTODATE_MODELIZATION",
+        ],
+    )
+
+    # Open the stream (the test client returns the response once the stream ends).
+    stream_request = asyncio.create_task(
+        async_client.get(url="/api/projects/1d_ANNOTATION_WITH_UPTODATE_MODELIZATION/status/stream")
+    )
+    while project_events.get_subscribers_number(project_id="1d_ANNOTATION_WITH_UPTODATE_MODELIZATION") == 0:
+        await asyncio.sleep(0.01)
+
+    # Change the status with a route.
+    response_put = await async_client.put(
+        url="/api/projects/1d_ANNOTATION_WITH_UPTODATE_MODELIZATION/constraints/(0,4)/annotate?constraint_type=MUST_LINK"
+    )
+    assert response_put.status_code == 202
+
+    # Change the status with a task (published from another thread, as the workers pool does).
+    await asyncio.get_running_loop().run_in_executor(
+        None,
+        lambda: project_events.publish(
+            project_id="1d_ANNOTATION_WITH_UPTODATE_MODELIZATION",
+            project_status={
+                "iteration_id": 1,
+                "state": "ANNOTATION_WITH_WORKING_MODELIZATION_WITHOUT_CONFLICTS",
+                "task": {"progression": 42, "detail": "Vectorize texts."},
+            },
+        ),
+    )
+    await asyncio.sleep(0.1)
+
+    # Delete the project: the stream ends.
+    response_delete = await async_client.delete(url="/api/projects/1d_ANNOTATION_WITH_UPTODATE_MODELIZATION")
+    assert response_delete.status_code == 202
+    response_get = await stream_request
+    assert response_get.status_code == 200
+    assert response_get.headers["content-type"].startswith("text/event-stream")
+    assert project_events.get_subscribers_number(project_id="1d_ANNOTATION_WITH_UPTODATE_MODELIZATION") == 0
+
+    # Assert all status have been sent.
+    events = [json.loads(line[len("data: ") :]) for line in response_get.text.split("\n") if line.startswith("data: ")]
+    assert [event["status"]["state"] for event in events] == [
+        "ANNOTATION_WITH_UPTODATE_MODELIZATION",
+        "ANNOTATION_WITH_OUTDATED_MODELIZATION_WITHOUT_CONFLICTS",
+        "ANNOTATION_WITH_WORKING_MODELIZATION_WITHOUT_CONFLICTS",
+    ]
+    assert events[2]["status"]["task"] == {"progression": 42, "detail": "Vectorize texts."}
+    assert events[2]["status"]["state_details"]["step"] == "ANNOTATION"
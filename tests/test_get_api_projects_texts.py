@@ -216,6 +216,15 @@ async def test_ok_default(async_client, tmp_path):
             "without_deleted_texts": True,
             "sorted_by": "alphabetical",
             "sorted_reverse": False,
+            "filter_text": None,
+            "fields": None,
+            "offset": 0,
+            "limit": None,
+            "cursor": None,
+        },
+        "pagination": {
+            "total": 23,
+            "next_cursor": None,
         },
     }
 
@@ -403,6 +412,15 @@ async def test_ok_with_deleted(async_client, tmp_path):
             "without_deleted_texts": False,
             "sorted_by": "alphabetical",
             "sorted_reverse": False,
+            "filter_text": None,
+            "fields": None,
+            "offset": 0,
+            "limit": None,
+            "cursor": None,
+        },
+        "pagination": {
+            "total": 24,
+            "next_cursor": None,
         },
     }
 
@@ -585,6 +603,15 @@ async def test_ok_by_id(async_client, tmp_path):
             "without_deleted_texts": True,
             "sorted_by": "id",
             "sorted_reverse": False,
+            "filter_text": None,
+            "fields": None,
+            "offset": 0,
+            "limit": None,
+            "cursor": None,
+        },
+        "pagination": {
+            "total": 23,
+            "next_cursor": None,
         },
     }
 
@@ -769,6 +796,15 @@ async def test_ok_by_alphabetical(async_client, tmp_path):
             "without_deleted_texts": True,
             "sorted_by": "alphabetical",
             "sorted_reverse": False,
+            "filter_text": None,
+            "fields": None,
+            "offset": 0,
+            "limit": None,
+            "cursor": None,
+        },
+        "pagination": {
+            "total": 23,
+            "next_cursor": None,
         },
     }
 
@@ -957,6 +993,15 @@ async def test_ok_by_is_deleted(async_client, tmp_path):
             "without_deleted_texts": False,
             "sorted_by": "is_deleted",
             "sorted_reverse": False,
+            "filter_text": None,
+            "fields": None,
+            "offset": 0,
+            "limit": None,
+            "cursor": None,
+        },
+        "pagination": {
+            "total": 24,
+            "next_cursor": None,
         },
     }
 
@@ -1141,5 +1186,174 @@ async def test_ok_sorted_reverse(async_client, tmp_path):
             "without_deleted_texts": True,
             "sorted_by": "alphabetical",
             "sorted_reverse": True,
+            "filter_text": None,
+            "fields": None,
+            "offset": 0,
+            "limit": None,
+            "cursor": None,
+        },
+        "pagination": {
+            "total": 23,
+            "next_cursor": None,
         },
     }
+
+
+# ==============================================================================
+# test_ko_invalid_cursor
+# ==============================================================================
+
+
+@pytest.mark.asyncio()
+async def test_ko_invalid_cursor(async_client, tmp_path):
+    """
+    Test the `GET /api/projects/{project_id}/texts` route with invalid cursor.
+
+    Arguments:
+        async_client: Fixture providing an HTTP client, declared in `conftest.py`.
+        tmp_path: The temporary path given for this test, declared in `conftest.py`.
+    """
+    # Assert HTTP client is created.
+    assert async_client
+
+    # Create dummy projects.
+    create_dummy_projects(
+        tmp_path=tmp_path,
+        list_of_dummy_project_ids=[
+            "1l_ANNOTATION_WITH_UPTODATE_MODELIZATION",
+        ],
+    )
+
+    # Assert route `GET /api/projects/{project_id}/texts` works.
+    response_get = await async_client.get(
+        url="/api/projects/1l_ANNOTATION_WITH_UPTODATE_MODELIZATION/texts?limit=5&cursor=UNKNOWN_CURSOR"
+    )
+    assert response_get.status_code == 400
+    assert response_get.json() == {
+        "detail": "The cursor 'UNKNOWN_CURSOR' is invalid.",
+    }
+
+
+# ==============================================================================
+# test_ok_filter_text_and_fields
+# ==============================================================================
+
+
+@pytest.mark.asyncio()
+async def test_ok_filter_text_and_fields(async_client, tmp_path):
+    """
+    Test the `GET /api/projects/{project_id}/texts` route with text filter and fields selection.
+
+    Arguments:
+        async_client: Fixture providing an HTTP client, declared in `conftest.py`.
+        tmp_path: The temporary path given for this test, declared in `conftest.py`.
+    """
+    # Assert HTTP client is created.
+    assert async_client
+
+    # Create dummy projects.
+    create_dummy_projects(
+        tmp_path=tmp_path,
+        list_of_dummy_project_ids=[
+            "1l_ANNOTATION_WITH_UPTODATE_MODELIZATION",
+        ],
+    )
+
+    # Assert route `GET /api/projects/{project_id}/texts` works.
+    response_get = await async_client.get(
+        url="/api/projects/1l_ANNOTATION_WITH_UPTODATE_MODELIZATION/texts?sorted_by=id&filter_text=gab&fields=text&fields=is_deleted"
+    )
+    assert response_get.status_code == 200
+    assert response_get.json() == {
+        "project_id": "1l_ANNOTATION_WITH_UPTODATE_MODELIZATION",
+        "texts": {
+            "18": {
+                "text": "J'ai voulu retirer de l'argent, et le gab a gardé ma carte bancaire.",
+                "is_deleted": False,
+            },
+            "20": {
+                "text": "Le GAB a gardé ma carte de crédit, que faire ?",
+                "is_deleted": False,
+            },
+        },
+        "parameters": {
+            "without_deleted_texts": True,
+            "sorted_by": "id",
+            "sorted_reverse": False,
+            "filter_text": "gab",
+            "fields": ["text", "is_deleted"],
+            "offset": 0,
+            "limit": None,
+            "cursor": None,
+        },
+        "pagination": {
+            "total": 2,
+            "next_cursor": None,
+        },
+    }
+
+
+# ==============================================================================
+# test_ok_pagination
+# ==============================================================================
+
+
+@pytest.mark.parametrize(
+    "sorted_by,sorted_reverse",
+    [
+        ("id", False),
+        ("alphabetical", True),
+        ("is_deleted", False),
+        ("is_deleted", True),
+    ],
+)
+@pytest.mark.asyncio()
+async def test_ok_pagination(async_client, tmp_path, sorted_by, sorted_reverse):
+    """
+    Test the `GET /api/projects/{project_id}/texts` route with offset, limit and cursor.
+
+    Arguments:
+        async_client: Fixture providing an HTTP client, declared in `conftest.py`.
+        tmp_path: The temporary path given for this test, declared in `conftest.py`.
+        sorted_by: The option to sort texts.
+        sorted_reverse: The option to reverse texts order.
+    """
+    # Assert HTTP client is created.
+    assert async_client
+
+    # Create dummy projects.
+    create_dummy_projects(
+        tmp_path=tmp_path,
+        list_of_dummy_project_ids=[
+            "1l_ANNOTATION_WITH_UPTODATE_MODELIZATION",
+        ],
+    )
+    url = "/api/projects/1l_ANNOTATION_WITH_UPTODATE_MODELIZATION/texts?without_deleted_texts=false&sorted_by={sorted_by}&sorted_reverse={sorted_reverse}".format(
+        sorted_by=sorted_by,
+        sorted_reverse=str(sorted_reverse).lower(),
+    )
+
+    # Get all texts.
+    response_get_all = await async_client.get(url=url)
+    assert response_get_all.status_code == 200
+    list_of_all_text_ids = list(response_get_all.json()["texts"].keys())
+    assert len(list_of_all_text_ids) == 24
+
+    # Assert pages with offset and limit are slices of all texts.
+    response_get_offset = await async_client.get(url=url + "&offset=5&limit=7")
+    assert response_get_offset.status_code == 200
+    assert list(response_get_offset.json()["texts"].keys()) == list_of_all_text_ids[5:12]
+    assert response_get_offset.json()["pagination"]["total"] == 24
+
+    # Assert pages with cursor cover all texts, in the same order.
+    list_of_paginated_text_ids = []
+    cursor = None
+    for _ in range(3):
+        response_get_page = await async_client.get(
+            url=url + "&limit=10" + ("&cursor=" + cursor if cursor is not None else "")
+        )
+        assert response_get_page.status_code == 200
+        list_of_paginated_text_ids.extend(response_get_page.json()["texts"].keys())
+        cursor = response_get_page.json()["pagination"]["next_cursor"]
+    assert cursor is None
+    assert list_of_paginated_text_ids == list_of_all_text_ids
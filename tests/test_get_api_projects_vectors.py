@@ -12,10 +12,13 @@
 # IMPORT PYTHON DEPENDENCIES
 # ==============================================================================
 
+import asyncio
 import json
+import os
 
 import pytest
 
+from cognitivefactory.interactive_clustering_gui import backgroundtasks
 from tests.dummies_utils import create_dummy_projects
 
 # ==============================================================================
@@ -196,3 +199,102 @@ async def test_ok(async_client, tmp_path):
         assert response_get.json()["vectors_2d"] == json.load(vectors_2d_fileobject)
     with open(tmp_path / "1l_ANNOTATION_WITH_UPTODATE_MODELIZATION" / "vectors_3D.json", "r") as vectors_3d_fileobject:
         assert response_get.json()["vectors_3d"] == json.load(vectors_3d_fileobject)
+
+
+# ==============================================================================
+# test_ok_lazy_projection
+# ==============================================================================
+
+
+@pytest.mark.asyncio()
+async def test_ok_lazy_projection(async_client, tmp_path):
+    """
+    Test the `GET /api/projects/{project_id}/vectors` route with projections not computed yet.
+
+    Arguments:
+        async_client: Fixture providing an HTTP client, declared in `conftest.py`.
+        tmp_path: The temporary path given for this test, declared in `conftest.py`.
+    """
+    # Assert HTTP client is created.
+    assert async_client
+
+    # Create dummy projects, and remove their projections.
+    create_dummy_projects(
+        tmp_path=tmp_path,
+        list_of_dummy_project_ids=[
+            "1l_ANNOTATION_WITH_UPTODATE_MODELIZATION",
+        ],
+    )
+    os.remove(tmp_path / "1l_ANNOTATION_WITH_UPTODATE_MODELIZATION" / "vectors_2D.json")
+    os.remove(tmp_path / "1l_ANNOTATION_WITH_UPTODATE_MODELIZATION" / "vectors_3D.json")
+
+    # Assert route `GET /api/projects/{project_id}/vectors` launches the projection task.
+    response_get = await async_client.get(url="/api/projects/1l_ANNOTATION_WITH_UPTODATE_MODELIZATION/vectors")
+    assert response_get.status_code == 202
+    assert list(response_get.json().keys()) == ["project_id", "task", "detail"]
+    assert response_get.json()["detail"] == (
+        "In project with id '1l_ANNOTATION_WITH_UPTODATE_MODELIZATION', the projection of vectors has been requested and is waiting for a background task."
+    )
+
+    # Assert route `GET /api/projects/{project_id}/vectors` returns projections once computed.
+    for _ in range(600):
+        response_get = await async_client.get(url="/api/projects/1l_ANNOTATION_WITH_UPTODATE_MODELIZATION/vectors")
+        if response_get.status_code != 202:
+            break
+        await asyncio.sleep(0.1)
+    assert response_get.status_code == 200
+    assert list(response_get.json().keys()) == ["project_id", "vectors_2d", "vectors_3d"]
+    assert len(response_get.json()["vectors_2d"]) == len(response_get.json()["vectors_3d"]) == 23
+
+    # Assert route `GET /api/projects/{project_id}/status` is still the same.
+    response_get_status = await async_client.get(url="/api/projects/1l_ANNOTATION_WITH_UPTODATE_MODELIZATION/status")
+    assert response_get_status.status_code == 200
+    assert response_get_status.json()["status"]["state"] == "ANNOTATION_WITH_UPTODATE_MODELIZATION"
+
+
+# ==============================================================================
+# test_ko_projection_error
+# ==============================================================================
+
+
+@pytest.mark.asyncio()
+async def test_ko_projection_error(async_client, tmp_path):
+    """
+    Test the `GET /api/projects/{project_id}/vectors` route with a failed projection task.
+
+    Arguments:
+        async_client: Fixture providing an HTTP client, declared in `conftest.py`.
+        tmp_path: The temporary path given for this test, declared in `conftest.py`.
+    """
+    # Assert HTTP client is created.
+    assert async_client
+
+    # Create dummy projects, remove their projections, and store a failure of the projection task.
+    create_dummy_projects(
+        tmp_path=tmp_path,
+        list_of_dummy_project_ids=[
+            "1l_ANNOTATION_WITH_UPTODATE_MODELIZATION",
+        ],
+    )
+    os.remove(tmp_path / "1l_ANNOTATION_WITH_UPTODATE_MODELIZATION" / "vectors_2D.json")
+    os.remove(tmp_path / "1l_ANNOTATION_WITH_UPTODATE_MODELIZATION" / "vectors_3D.json")
+    with open(
+        tmp_path / "1l_ANNOTATION_WITH_UPTODATE_MODELIZATION" / backgroundtasks.PROJECTION_STATUS_NAME, "w"
+    ) as projection_status_fileobject:
+        json.dump(
+            {
+                "progression": None,
+                "detail": "The projection of vectors failed.",
+                "error": "ValueError: perplexity must be less than n_samples",
+            },
+            projection_status_fileobject,
+        )
+
+    # Assert route `GET /api/projects/{project_id}/vectors` returns the failure, without launching the projection task again.
+    response_get = await async_client.get(url="/api/projects/1l_ANNOTATION_WITH_UPTODATE_MODELIZATION/vectors")
+    assert response_get.status_code == 500
+    assert response_get.json() == {
+        "detail": "In project with id '1l_ANNOTATION_WITH_UPTODATE_MODELIZATION', the projection of vectors failed (ValueError: perplexity must be less than n_samples). Update the modelization to request it again.",
+    }
+    await asyncio.sleep(1)
+    assert "vectors_2D.json" not in os.listdir(tmp_path / "1l_ANNOTATION_WITH_UPTODATE_MODELIZATION")
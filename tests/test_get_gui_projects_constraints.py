@@ -163,3 +163,48 @@ async def test_ok_2(async_client, tmp_path):
     for constraint_id in response_get_constraints.json()["constraints"].keys():
         assert "<!-- CONSTRAINT " + constraint_id + " -->" in parsed_response_get
         assert 'id="' + constraint_id + '">' in parsed_response_get
+
+
+# ==============================================================================
+# test_ok_pagination
+# ==============================================================================
+
+
+@pytest.mark.asyncio()
+async def test_ok_pagination(async_client, tmp_path):
+    """
+    Test the `GET /gui/projects/{project_id}/constraints` route with pagination.
+
+    Arguments:
+        async_client: Fixture providing an HTTP client, declared in `conftest.py`.
+        tmp_path: The temporary path given for this test, declared in `conftest.py`.
+    """
+    # Assert HTTP client is created.
+    assert async_client
+
+    # Create dummy projects.
+    create_dummy_projects(
+        tmp_path=tmp_path,
+        list_of_dummy_project_ids=[
+            "1l_ANNOTATION_WITH_UPTODATE_MODELIZATION",
+        ],
+    )
+
+    # Get constraints before test.
+    response_get_constraints = await async_client.get(
+        url="/api/projects/1l_ANNOTATION_WITH_UPTODATE_MODELIZATION/constraints?without_hidden_constraints=true&sorted_by=id&offset=5&limit=4"
+    )
+    assert response_get_constraints.status_code == 200
+    assert len(response_get_constraints.json()["constraints"]) == 4
+
+    # Assert route `GET /gui/projects/{project_id}/constraints` works.
+    response_get = await async_client.get(
+        url="/gui/projects/1l_ANNOTATION_WITH_UPTODATE_MODELIZATION/constraints?sorted_by=id&offset=5&limit=4"
+    )
+    parsed_response_get = html.unescape(bytes.decode(response_get.content, encoding="utf-8"))
+    assert response_get.status_code == 200
+    assert "<!-- CONTAINER CONSTRAINTS LIST - PAGINATION -->" in parsed_response_get
+    assert "Constraints 6 to 9 (on 23)" in parsed_response_get
+    assert parsed_response_get.count("<!-- CONSTRAINT ") == 4
+    for constraint_id in response_get_constraints.json()["constraints"].keys():
+        assert "<!-- CONSTRAINT " + constraint_id + " -->" in parsed_response_get
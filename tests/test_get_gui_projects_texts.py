@@ -165,3 +165,48 @@ async def test_ok_2(async_client, tmp_path):
         assert "<!-- TEXT " + text_id + " -->" in parsed_response_get
         assert 'id="' + text_id + '">' in parsed_response_get
         assert text_value["text_preprocessed"] in parsed_response_get
+
+
+# ==============================================================================
+# test_ok_pagination
+# ==============================================================================
+
+
+@pytest.mark.asyncio()
+async def test_ok_pagination(async_client, tmp_path):
+    """
+    Test the `GET /gui/projects/{project_id}/texts` route with text filter and pagination.
+
+    Arguments:
+        async_client: Fixture providing an HTTP client, declared in `conftest.py`.
+        tmp_path: The temporary path given for this test, declared in `conftest.py`.
+    """
+    # Assert HTTP client is created.
+    assert async_client
+
+    # Create dummy projects.
+    create_dummy_projects(
+        tmp_path=tmp_path,
+        list_of_dummy_project_ids=[
+            "1l_ANNOTATION_WITH_UPTODATE_MODELIZATION",
+        ],
+    )
+
+    # Get texts before test.
+    response_get_texts = await async_client.get(
+        url="/api/projects/1l_ANNOTATION_WITH_UPTODATE_MODELIZATION/texts?without_deleted_texts=false&sorted_by=id&filter_text=carte&offset=2&limit=3"
+    )
+    assert response_get_texts.status_code == 200
+    assert len(response_get_texts.json()["texts"]) == 3
+
+    # Assert route `GET /gui/projects/{project_id}/texts` works.
+    response_get = await async_client.get(
+        url="/gui/projects/1l_ANNOTATION_WITH_UPTODATE_MODELIZATION/texts?sorted_by=id&filter_text=carte&offset=2&limit=3"
+    )
+    parsed_response_get = html.unescape(bytes.decode(response_get.content, encoding="utf-8"))
+    assert response_get.status_code == 200
+    assert "<!-- CONTAINER TEXTS LIST - PAGINATION -->" in parsed_response_get
+    assert "<b>23 texts</b>" in parsed_response_get
+    assert parsed_response_get.count("<!-- TEXT ") == 3
+    for text_id in response_get_texts.json()["texts"].keys():
+        assert "<!-- TEXT " + text_id + " -->" in parsed_response_get
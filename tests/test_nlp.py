@@ -0,0 +1,140 @@
+# -*- coding: utf-8 -*-
+
+"""
+* Name:         interactive-clustering-gui/tests/test_nlp.py
+* Description:  Unittests for the `nlp` module.
+* Author:       Erwan Schild
+* Created:      18/10/2026
+* Licence:      CeCILL (https://cecill.info/licences.fr.html)
+"""
+
+# ==============================================================================
+# IMPORT PYTHON DEPENDENCIES
+# ==============================================================================
+
+from typing import List
+
+import pytest
+import spacy
+
+from cognitivefactory.interactive_clustering.utils.preprocessing import preprocess as library_preprocess
+from cognitivefactory.interactive_clustering_gui import nlp
+
+# ==============================================================================
+# fake_spacy_load
+# ==============================================================================
+
+
+@pytest.fixture()
+def fake_spacy_load(monkeypatch):
+    """
+    Replace spaCy models (not installed in tests) by a blank french pipeline, and record loaded models.
+
+    Args:
+        monkeypatch: Pytest fixture to replace `spacy.load`.
+
+    Yields:
+        List[str]: The names of loaded models.
+    """
+    loaded_models: List[str] = []
+    blank_load = spacy.blank
+
+    def fake_load(name: str, **kwargs):
+        if name != "fr_core_news_md":
+            raise OSError("[E050] Can't find model '" + name + "'.")
+        loaded_models.append(name)
+        return blank_load("fr")
+
+    monkeypatch.setattr(spacy, "load", fake_load)
+    nlp.load_spacy_pipeline.cache_clear()
+    yield loaded_models
+    nlp.load_spacy_pipeline.cache_clear()
+
+
+# ==============================================================================
+# test_preprocess
+# ==============================================================================
+
+
+@pytest.mark.parametrize("n_process", [1, 2])
+@pytest.mark.parametrize("apply_stopwords_deletion", [False, True])
+def test_preprocess(fake_spacy_load, n_process, apply_stopwords_deletion):
+    """
+    Test that batched preprocessing gives the same results as the preprocessing of `interactive-clustering`, and that the spaCy pipeline is loaded once.
+
+    Args:
+        fake_spacy_load: Fixture replacing spaCy models by a blank pipeline.
+        n_process: The number of processes used by the spaCy pipeline.
+        apply_stopwords_deletion: The option to delete stopwords.
+    """
+    dict_of_texts = {
+        "0": "Comment signaler une perte de carte de paiement ?",
+        "1": "Quelle est la procédure pour chercher une carte de crédit avalée ?",
+        "2": "Ma carte Visa a un plafond de paiment trop bas, puis-je l'augmenter ?",
+        "3": "Où trouver le RIB de mon compte ?",
+        "4": "Je n'ai pas reçu ma carte...",
+    }
+    expected_results = library_preprocess(
+        dict_of_texts=dict_of_texts,
+        apply_stopwords_deletion=apply_stopwords_deletion,
+        spacy_language_model="fr_core_news_md",
+    )
+    fake_spacy_load.clear()
+
+    # Preprocess texts twice, by batches of 2 texts.
+    for _ in range(2):
+        assert (
+            nlp.preprocess(
+                dict_of_texts=dict_of_texts,
+                apply_stopwords_deletion=apply_stopwords_deletion,
+                spacy_language_model="fr_core_news_md",
+                batch_size=2,
+                n_process=n_process,
+            )
+            == expected_results
+        )
+    assert fake_spacy_load == ["fr_core_news_md"]
+
+
+# ==============================================================================
+# test_vectorize
+# ==============================================================================
+
+
+def test_vectorize(fake_spacy_load):
+    """
+    Test that batched spaCy vectorization gives a vector per text, and that the spaCy pipeline is shared with preprocessing.
+
+    Args:
+        fake_spacy_load: Fixture replacing spaCy models by a blank pipeline.
+    """
+    dict_of_texts = {"0": "signaler perte carte", "1": "chercher carte credit"}
+    nlp.preprocess(dict_of_texts=dict_of_texts, spacy_language_model="fr_core_news_md")
+    dict_of_vectors = nlp.vectorize(
+        dict_of_texts=dict_of_texts,
+        vectorizer_type="spacy",
+        spacy_language_model="fr_core_news_md",
+        batch_size=1,
+    )
+    assert list(dict_of_vectors.keys()) == ["0", "1"]
+    assert all(vector.shape[0] == 1 for vector in dict_of_vectors.values())
+    assert fake_spacy_load == ["fr_core_news_md"]
+
+    # TF-IDF vectorization is delegated to `interactive-clustering`.
+    assert nlp.vectorize(dict_of_texts=dict_of_texts, vectorizer_type="tfidf")["0"].shape[0] == 1
+
+
+# ==============================================================================
+# test_load_spacy_pipeline_not_installed
+# ==============================================================================
+
+
+def test_load_spacy_pipeline_not_installed(fake_spacy_load):
+    """
+    Test that a not installed spaCy model raises an error.
+
+    Args:
+        fake_spacy_load: Fixture replacing spaCy models by a blank pipeline.
+    """
+    with pytest.raises(ValueError, match="The `spacy_language_model` 'UNKNOWN' is not installed."):
+        nlp.preprocess(dict_of_texts={"0": "text"}, spacy_language_model="UNKNOWN")
@@ -233,13 +233,12 @@ async def test_ok_csv(async_client, tmp_path):
     # Assert created project has needed stored files.
     assert sorted(os.listdir(tmp_path / created_project_id)) == [
         "clustering.json",
-        "constraints.json",
         "metadata.json",
         "modelization.json",
+        "project.db",
         "sampling.json",
         "settings.json",
         "status.json",
-        "texts.json",
     ]
 
     # Case of `metadata.json`.
@@ -303,13 +302,12 @@ async def test_ok_xlsx(async_client, tmp_path):
     # Assert created project has needed stored files.
     assert sorted(os.listdir(tmp_path / created_project_id)) == [
         "clustering.json",
-        "constraints.json",
         "metadata.json",
         "modelization.json",
+        "project.db",
         "sampling.json",
         "settings.json",
         "status.json",
-        "texts.json",
     ]
 
     # Case of `metadata.json`.
@@ -0,0 +1,229 @@
+# -*- coding: utf-8 -*-
+
+"""
+* Name:         interactive-clustering-gui/tests/test_post_api_projects_clustering_sweep.py
+* Description:  Unittests for `app` module on the `POST /api/projects/{project_id}/clustering/sweep` route.
+* Author:       Erwan Schild
+* Created:      18/10/2026
+* Licence:      CeCILL (https://cecill.info/licences.fr.html)
+"""
+
+import asyncio
+
+import pytest
+
+from tests.dummies_utils import create_dummy_projects
+
+# ==============================================================================
+# test_ko_not_found
+# ==============================================================================
+
+
+@pytest.mark.asyncio()
+async def test_ko_not_found(async_client):
+    """
+    Test the `POST /api/projects/{project_id}/clustering/sweep` route with not existing project.
+
+    Arguments:
+        async_client: Fixture providing an HTTP client, declared in `conftest.py`.
+    """
+    # Assert HTTP client is created.
+    assert async_client
+
+    # Assert route `POST /api/projects/{project_id}/clustering/sweep` works.
+    response_post = await async_client.post(url="/api/projects/UNKNOWN_PROJECT/clustering/sweep")
+    assert response_post.status_code == 404
+    assert response_post.json() == {
+        "detail": "The project with id 'UNKNOWN_PROJECT' doesn't exist.",
+    }
+
+
+# ==============================================================================
+# test_ko_bad_state
+# ==============================================================================
+
+
+@pytest.mark.asyncio()
+async def test_ko_bad_state(async_client, tmp_path):
+    """
+    Test the `POST /api/projects/{project_id}/clustering/sweep` route with bad state.
+
+    Arguments:
+        async_client: Fixture providing an HTTP client, declared in `conftest.py`.
+        tmp_path: The temporary path given for this test, declared in `conftest.py`.
+    """
+    # Assert HTTP client is created.
+    assert async_client
+
+    # Create dummy projects.
+    create_dummy_projects(
+        tmp_path=tmp_path,
+        list_of_dummy_project_ids=[
+            "0a_INITIALIZATION_WITHOUT_MODELIZATION",
+        ],
+    )
+
+    # Assert route `POST /api/projects/{project_id}/clustering/sweep` works.
+    response_post = await async_client.post(url="/api/projects/0a_INITIALIZATION_WITHOUT_MODELIZATION/clustering/sweep")
+    assert response_post.status_code == 403
+    assert response_post.json() == {
+        "detail": "The project with id '0a_INITIALIZATION_WITHOUT_MODELIZATION' hasn't completed its modelization update step.",
+    }
+
+
+# ==============================================================================
+# test_ko_modelization_in_progress
+# ==============================================================================
+
+
+@pytest.mark.asyncio()
+async def test_ko_modelization_in_progress(async_client, tmp_path):
+    """
+    Test the `POST /api/projects/{project_id}/clustering/sweep` route during a modelization update.
+
+    Arguments:
+        async_client: Fixture providing an HTTP client, declared in `conftest.py`.
+        tmp_path: The temporary path given for this test, declared in `conftest.py`.
+    """
+    # Assert HTTP client is created.
+    assert async_client
+
+    # Create dummy projects.
+    create_dummy_projects(
+        tmp_path=tmp_path,
+        list_of_dummy_project_ids=[
+            "1f_ANNOTATION_WITH_PENDING_MODELIZATION_WITHOUT_CONFLICTS",
+            "1k_ANNOTATION_WITH_WORKING_MODELIZATION_WITH_CONFLICTS",
+        ],
+    )
+
+    # Assert route `POST /api/projects/{project_id}/clustering/sweep` works.
+    for project_id in (
+        "1f_ANNOTATION_WITH_PENDING_MODELIZATION_WITHOUT_CONFLICTS",
+        "1k_ANNOTATION_WITH_WORKING_MODELIZATION_WITH_CONFLICTS",
+    ):
+        response_post = await async_client.post(url="/api/projects/" + project_id + "/clustering/sweep")
+        assert response_post.status_code == 403
+        assert response_post.json() == {
+            "detail": "In project with id '"
+            + project_id
+            + "', a modelization update is in progress. Request the sweep over numbers of clusters once it is over.",
+        }
+
+
+# ==============================================================================
+# test_ko_bad_parameters
+# ==============================================================================
+
+
+@pytest.mark.asyncio()
+async def test_ko_bad_parameters(async_client, tmp_path):
+    """
+    Test the `POST /api/projects/{project_id}/clustering/sweep` route with bad parameters.
+
+    Arguments:
+        async_client: Fixture providing an HTTP client, declared in `conftest.py`.
+        tmp_path: The temporary path given for this test, declared in `conftest.py`.
+    """
+    # Assert HTTP client is created.
+    assert async_client
+
+    # Create dummy projects.
+    create_dummy_projects(
+        tmp_path=tmp_path,
+        list_of_dummy_project_ids=[
+            "1l_ANNOTATION_WITH_UPTODATE_MODELIZATION",
+        ],
+    )
+
+    # Assert route `POST /api/projects/{project_id}/clustering/sweep` works.
+    response_post_1 = await async_client.post(
+        url="/api/projects/1l_ANNOTATION_WITH_UPTODATE_MODELIZATION/clustering/sweep",
+        params={"nb_clusters_min": 1},
+    )
+    assert response_post_1.status_code == 422
+
+    # Assert route `POST /api/projects/{project_id}/clustering/sweep` works.
+    response_post_2 = await async_client.post(
+        url="/api/projects/1l_ANNOTATION_WITH_UPTODATE_MODELIZATION/clustering/sweep",
+        params={"nb_clusters_min": 5, "nb_clusters_max": 3},
+    )
+    assert response_post_2.status_code == 400
+    assert response_post_2.json() == {
+        "detail": "The parameter `nb_clusters_max` ('3') must be greater than or equal to `nb_clusters_min` ('5').",
+    }
+
+    # Assert route `POST /api/projects/{project_id}/clustering/sweep` works.
+    response_post_3 = await async_client.post(
+        url="/api/projects/1l_ANNOTATION_WITH_UPTODATE_MODELIZATION/clustering/sweep",
+        params={"nb_clusters_min": 2, "nb_clusters_max": 100000},
+    )
+    assert response_post_3.status_code == 400
+    assert response_post_3.json() == {
+        "detail": "The sweep from `nb_clusters_min` ('2') to `nb_clusters_max` ('100000') must have at most 50 numbers of clusters.",
+    }
+
+    # Assert route `POST /api/projects/{project_id}/clustering/sweep` works.
+    response_post_4 = await async_client.post(
+        url="/api/projects/1l_ANNOTATION_WITH_UPTODATE_MODELIZATION/clustering/sweep",
+        params={"nb_clusters_min": 20, "nb_clusters_max": 24},
+    )
+    assert response_post_4.status_code == 400
+    assert response_post_4.json() == {
+        "detail": "The parameter `nb_clusters_max` ('24') must be smaller than or equal to the number of texts ('23').",
+    }
+
+
+# ==============================================================================
+# test_ok
+# ==============================================================================
+
+
+@pytest.mark.asyncio()
+async def test_ok(async_client, tmp_path):
+    """
+    Test the `POST /api/projects/{project_id}/clustering/sweep` route with good parameters.
+
+    Arguments:
+        async_client: Fixture providing an HTTP client, declared in `conftest.py`.
+        tmp_path: The temporary path given for this test, declared in `conftest.py`.
+    """
+    # Assert HTTP client is created.
+    assert async_client
+
+    # Create dummy projects.
+    create_dummy_projects(
+        tmp_path=tmp_path,
+        list_of_dummy_project_ids=[
+            "1l_ANNOTATION_WITH_UPTODATE_MODELIZATION",
+        ],
+    )
+
+    # Assert route `POST /api/projects/{project_id}/clustering/sweep` works.
+    response_post = await async_client.post(
+        url="/api/projects/1l_ANNOTATION_WITH_UPTODATE_MODELIZATION/clustering/sweep",
+        params={"nb_clusters_min": 2, "nb_clusters_max": 5},
+    )
+    assert response_post.status_code == 202
+    assert response_post.json() == {
+        "project_id": "1l_ANNOTATION_WITH_UPTODATE_MODELIZATION",
+        "detail": "In project with id '1l_ANNOTATION_WITH_UPTODATE_MODELIZATION', the sweep over numbers of clusters task has been requested and is waiting for a background task.",
+    }
+
+    # Assert route `GET /api/projects/{project_id}/clustering/sweep` returns the sweep once computed.
+    for _ in range(600):
+        response_get = await async_client.get(
+            url="/api/projects/1l_ANNOTATION_WITH_UPTODATE_MODELIZATION/clustering/sweep"
+        )
+        if response_get.status_code != 202:
+            break
+        await asyncio.sleep(0.1)
+    assert response_get.status_code == 200
+    assert response_get.json()["parameters"] == {"iteration_id": 1, "nb_clusters_min": 2, "nb_clusters_max": 5}
+    assert response_get.json()["task"] is None
+    assert list(response_get.json()["results"].keys()) == ["2", "3", "4", "5"]
+
+    # Assert route `GET /api/projects/{project_id}/status` is still the same.
+    response_get_status = await async_client.get(url="/api/projects/1l_ANNOTATION_WITH_UPTODATE_MODELIZATION/status")
+    assert response_get_status.status_code == 200
+    assert response_get_status.json()["status"]["state"] == "ANNOTATION_WITH_UPTODATE_MODELIZATION"
@@ -0,0 +1,61 @@
+# -*- coding: utf-8 -*-
+
+"""
+* Name:         interactive-clustering-gui/tests/test_projection.py
+* Description:  Unittests for the `projection` module.
+* Author:       Erwan Schild
+* Created:      18/10/2026
+* Licence:      CeCILL (https://cecill.info/licences.fr.html)
+"""
+
+# ==============================================================================
+# IMPORT PYTHON DEPENDENCIES
+# ==============================================================================
+
+import pytest
+from scipy.sparse import random as sparse_random
+
+from cognitivefactory.interactive_clustering_gui.projection import compute_projections
+
+# ==============================================================================
+# test_compute_projections
+# ==============================================================================
+
+
+@pytest.mark.parametrize(
+    "projection_algorithm",
+    ["tsne", "tsne_pca_init", "svd_tsne", "spectral"],
+)
+def test_compute_projections(projection_algorithm):
+    """
+    Test that each projection algorithm reduces vectors to 2 and 3 dimensions.
+
+    Args:
+        projection_algorithm: The projection algorithm to test.
+    """
+    vectors_ND = sparse_random(40, 100, density=0.1, format="csr", random_state=42)
+    vectors_2D, vectors_3D = compute_projections(
+        vectors_ND=vectors_ND,
+        projection_algorithm=projection_algorithm,
+        random_seed=42,
+    )
+    assert vectors_2D.shape == (40, 2)
+    assert vectors_3D.shape == (40, 3)
+
+
+# ==============================================================================
+# test_compute_projections_not_implemented
+# ==============================================================================
+
+
+def test_compute_projections_not_implemented():
+    """
+    Test that an unknown projection algorithm raises an error.
+    """
+    vectors_ND = sparse_random(10, 20, density=0.5, format="csr", random_state=42)
+    with pytest.raises(ValueError, match="The `projection_algorithm` 'UNKNOWN' is not implemented."):
+        compute_projections(
+            vectors_ND=vectors_ND,
+            projection_algorithm="UNKNOWN",
+            random_seed=42,
+        )
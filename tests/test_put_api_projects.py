@@ -12,6 +12,8 @@
 # IMPORT PYTHON DEPENDENCIES
 # ==============================================================================
 
+import json
+import zipfile
 from pathlib import Path
 
 import pytest
@@ -375,6 +377,103 @@ async def test_ko_status_bad_state(async_client):
     assert response_get.json() == []  # noqa: WPS520
 
 
+# ==============================================================================
+# test_ko_unsupported_archive_format_version
+# ==============================================================================
+
+
+@pytest.mark.asyncio()
+async def test_ko_unsupported_archive_format_version(async_client, tmp_path):
+    """
+    Test the `PUT /api/projects` route with unsupported format version of archive.
+
+    Arguments:
+        async_client: Fixture providing an HTTP client, declared in `conftest.py`.
+        tmp_path: The temporary path given for this test, declared in `conftest.py`.
+    """
+    # Assert HTTP client is created.
+    assert async_client
+
+    # Create an archive with an unsupported format version.
+    with zipfile.ZipFile(
+        Path(__file__).parent / "dummies" / "archive-0a_INITIALIZATION_WITHOUT_MODELIZATION.zip", "r"
+    ) as archive_file:
+        with zipfile.ZipFile(tmp_path / "archive-ERROR_unsupported_version.zip", "w") as new_archive_file:
+            for file_name in archive_file.namelist():
+                file_content = json.loads(archive_file.read(file_name))
+                if file_name == "metadata.json":
+                    file_content["archive_format_version"] = 99
+                new_archive_file.writestr(file_name, json.dumps(file_content))
+
+    # Assert route `PUT /api/projects` works.
+    with open(tmp_path / "archive-ERROR_unsupported_version.zip", "rb") as archive_fileobject:
+        response_put = await async_client.put(
+            url="/api/projects",
+            files={
+                "project_archive": (
+                    "archive-ERROR_unsupported_version.zip",
+                    archive_fileobject,
+                    "application/x-zip-compressed",
+                ),
+            },
+        )
+    assert response_put.status_code == 400
+    assert response_put.json() == {
+        "detail": "The project archive file has an unsupported format version ('99').",
+    }
+
+
+# ==============================================================================
+# test_ko_modelization_bad_format
+# ==============================================================================
+
+
+@pytest.mark.asyncio()
+async def test_ko_modelization_bad_format(async_client, tmp_path):
+    """
+    Test the `PUT /api/projects` route with legacy modelization inference in an archive of current format version.
+
+    Arguments:
+        async_client: Fixture providing an HTTP client, declared in `conftest.py`.
+        tmp_path: The temporary path given for this test, declared in `conftest.py`.
+    """
+    # Assert HTTP client is created.
+    assert async_client
+
+    # Create an archive of current format version with legacy modelization inference.
+    with zipfile.ZipFile(
+        Path(__file__).parent / "dummies" / "archive-1d_ANNOTATION_WITH_UPTODATE_MODELIZATION.zip", "r"
+    ) as archive_file:
+        with zipfile.ZipFile(tmp_path / "archive-ERROR_modelization_bad_format.zip", "w") as new_archive_file:
+            for file_name in archive_file.namelist():
+                file_content = json.loads(archive_file.read(file_name))
+                if file_name == "metadata.json":
+                    file_content["archive_format_version"] = 2
+                new_archive_file.writestr(file_name, json.dumps(file_content))
+
+    # Assert route `PUT /api/projects` works.
+    with open(tmp_path / "archive-ERROR_modelization_bad_format.zip", "rb") as archive_fileobject:
+        response_put = await async_client.put(
+            url="/api/projects",
+            files={
+                "project_archive": (
+                    "archive-ERROR_modelization_bad_format.zip",
+                    archive_fileobject,
+                    "application/x-zip-compressed",
+                ),
+            },
+        )
+    assert response_put.status_code == 400
+    assert response_put.json() == {
+        "detail": "The project archive file has an invalid `modelization.json` file.",
+    }
+
+    # Assert route `GET /api/projects` is kept empty.
+    response_get = await async_client.get(url="/api/projects")
+    assert response_get.status_code == 200
+    assert response_get.json() == []  # noqa: WPS520
+
+
 # ==============================================================================
 # test_ok_during_initialization
 # ==============================================================================
@@ -0,0 +1,225 @@
+# -*- coding: utf-8 -*-
+
+"""
+* Name:         interactive-clustering-gui/tests/test_put_api_projects_constraints_bulk.py
+* Description:  Unittests for `app` module on the `PUT /api/projects/{project_id}/constraints/bulk` route.
+* Author:       Erwan Schild
+* Created:      18/10/2026
+* Licence:      CeCILL (https://cecill.info/licences.fr.html)
+"""
+
+# ==============================================================================
+# IMPORT PYTHON DEPENDENCIES
+# ==============================================================================
+
+import pytest
+
+from tests.dummies_utils import create_dummy_projects
+
+# ==============================================================================
+# test_ko_not_found
+# ==============================================================================
+
+
+@pytest.mark.asyncio()
+async def test_ko_not_found(async_client):
+    """
+    Test the `PUT /api/projects/{project_id}/constraints/bulk` route with not existing project.
+
+    Arguments:
+        async_client: Fixture providing an HTTP client, declared in `conftest.py`.
+    """
+    # Assert HTTP client is created.
+    assert async_client
+
+    # Assert route `PUT /api/projects/{project_id}/constraints/bulk` works.
+    response_put = await async_client.put(
+        url="/api/projects/UNKNOWN_PROJECT/constraints/bulk",
+        json=[{"constraint_id": "(0,4)", "constraint_type": "MUST_LINK"}],
+    )
+    assert response_put.status_code == 404
+    assert response_put.json() == {
+        "detail": "The project with id 'UNKNOWN_PROJECT' doesn't exist.",
+    }
+
+
+# ==============================================================================
+# test_ko_constraint_not_found
+# ==============================================================================
+
+
+@pytest.mark.asyncio()
+async def test_ko_constraint_not_found(async_client, tmp_path):
+    """
+    Test the `PUT /api/projects/{project_id}/constraints/bulk` route with not existing constraints: no operation is applied.
+
+    Arguments:
+        async_client: Fixture providing an HTTP client, declared in `conftest.py`.
+        tmp_path: The temporary path given for this test, declared in `conftest.py`.
+    """
+    # Assert HTTP client is created.
+    assert async_client
+
+    # Create dummy projects.
+    create_dummy_projects(
+        tmp_path=tmp_path,
+        list_of_dummy_project_ids=[
+            "1d_ANNOTATION_WITH_UPTODATE_MODELIZATION",
+        ],
+    )
+
+    # Assert route `PUT /api/projects/{project_id}/constraints/bulk` works.
+    response_put = await async_client.put(
+        url="/api/projects/1d_ANNOTATION_WITH_UPTODATE_MODELIZATION/constraints/bulk",
+        json=[
+            {"constraint_id": "(0,4)", "constraint_type": "MUST_LINK"},
+            {"constraint_id": "UNKNOWN_CONSTRAINT_1", "comment": "Unknown."},
+            {"constraint_id": "UNKNOWN_CONSTRAINT_2", "to_review": True},
+        ],
+    )
+    assert response_put.status_code == 404
+    assert response_put.json() == {
+        "detail": "In project with id '1d_ANNOTATION_WITH_UPTODATE_MODELIZATION', the constraints with ids 'UNKNOWN_CONSTRAINT_1', 'UNKNOWN_CONSTRAINT_2' to update don't exist.",
+    }
+
+    # Assert the valid operation hasn't been applied.
+    response_get_constraints = await async_client.get(
+        url="/api/projects/1d_ANNOTATION_WITH_UPTODATE_MODELIZATION/constraints?without_hidden_constraints=false"
+    )
+    assert response_get_constraints.json()["constraints"]["(0,4)"]["constraint_type"] is None
+    response_get_status = await async_client.get(url="/api/projects/1d_ANNOTATION_WITH_UPTODATE_MODELIZATION/status")
+    assert response_get_status.json()["status"]["state"] == "ANNOTATION_WITH_UPTODATE_MODELIZATION"
+
+
+# ==============================================================================
+# test_ko_bad_state
+# ==============================================================================
+
+
+@pytest.mark.asyncio()
+async def test_ko_bad_state(async_client, tmp_path):
+    """
+    Test the `PUT /api/projects/{project_id}/constraints/bulk` route with annotations in a bad state (comments and reviews are allowed).
+
+    Arguments:
+        async_client: Fixture providing an HTTP client, declared in `conftest.py`.
+        tmp_path: The temporary path given for this test, declared in `conftest.py`.
+    """
+    # Assert HTTP client is created.
+    assert async_client
+
+    # Create dummy projects.
+    create_dummy_projects(
+        tmp_path=tmp_path,
+        list_of_dummy_project_ids=[
+            "1m_CLUSTERING_TODO",
+        ],
+    )
+
+    # Assert route `PUT /api/projects/{project_id}/constraints/bulk` refuses annotations.
+    response_put = await async_client.put(
+        url="/api/projects/1m_CLUSTERING_TODO/constraints/bulk",
+        json=[
+            {"constraint_id": "(1,2)", "comment": "Same intent."},
+            {"constraint_id": "(1,2)", "constraint_type": None},
+        ],
+    )
+    assert response_put.status_code == 403
+    assert response_put.json() == {
+        "detail": "The project with id '1m_CLUSTERING_TODO' doesn't allow modification during this state (state='CLUSTERING_TODO').",
+    }
+
+    # Assert route `PUT /api/projects/{project_id}/constraints/bulk` accepts comments and reviews.
+    response_put = await async_client.put(
+        url="/api/projects/1m_CLUSTERING_TODO/constraints/bulk",
+        json=[
+            {"constraint_id": "(1,2)", "comment": "Same intent.", "to_review": True},
+        ],
+    )
+    assert response_put.status_code == 202
+    assert response_put.json()["results"] == [
+        {"constraint_id": "(1,2)", "updated_fields": ["comment", "to_review"]},
+    ]
+
+
+# ==============================================================================
+# test_ok
+# ==============================================================================
+
+
+@pytest.mark.asyncio()
+async def test_ok(async_client, tmp_path):
+    """
+    Test the `PUT /api/projects/{project_id}/constraints/bulk` route with good state.
+
+    Arguments:
+        async_client: Fixture providing an HTTP client, declared in `conftest.py`.
+        tmp_path: The temporary path given for this test, declared in `conftest.py`.
+    """
+    # Assert HTTP client is created.
+    assert async_client
+
+    # Create dummy projects.
+    create_dummy_projects(
+        tmp_path=tmp_path,
+        list_of_dummy_project_ids=[
+            "1d_ANNOTATION_WITH_UPTODATE_MODELIZATION",
+        ],
+    )
+
+    # Get constraints before test.
+    response_get_constraints_before = await async_client.get(
+        url="/api/projects/1d_ANNOTATION_WITH_UPTODATE_MODELIZATION/constraints?without_hidden_constraints=false"
+    )
+    assert response_get_constraints_before.status_code == 200
+
+    # Assert route `PUT /api/projects/{project_id}/constraints/bulk` works.
+    response_put = await async_client.put(
+        url="/api/projects/1d_ANNOTATION_WITH_UPTODATE_MODELIZATION/constraints/bulk",
+        json=[
+            {"constraint_id": "(0,4)", "constraint_type": "MUST_LINK", "comment": "Same intent."},
+            {"constraint_id": "(12,9)", "constraint_type": None, "to_review": True},
+            {"constraint_id": "(0,4)", "constraint_type": "CANNOT_LINK"},
+            {"constraint_id": "(10,9)", "to_review": True},
+        ],
+    )
+    assert response_put.status_code == 202
+    assert response_put.json() == {
+        "project_id": "1d_ANNOTATION_WITH_UPTODATE_MODELIZATION",
+        "results": [
+            {"constraint_id": "(0,4)", "updated_fields": ["constraint_type", "comment"]},
+            {"constraint_id": "(12,9)", "updated_fields": ["constraint_type", "to_review"]},
+            {"constraint_id": "(0,4)", "updated_fields": ["constraint_type"]},
+            {"constraint_id": "(10,9)", "updated_fields": ["to_review"]},
+        ],
+        "detail": "In project with id '1d_ANNOTATION_WITH_UPTODATE_MODELIZATION', 3 constraints have been updated.",
+    }
+
+    # Assert route `GET /api/projects/{project_id}/constraints` is updated.
+    response_get_constraints_after = await async_client.get(
+        url="/api/projects/1d_ANNOTATION_WITH_UPTODATE_MODELIZATION/constraints?without_hidden_constraints=false"
+    )
+    assert response_get_constraints_after.status_code == 200
+    constraints_before = response_get_constraints_before.json()["constraints"]
+    constraints_after = response_get_constraints_after.json()["constraints"]
+    for constraint_id in constraints_before.keys():
+        if constraint_id not in {"(0,4)", "(12,9)", "(10,9)"}:
+            assert constraints_after[constraint_id] == constraints_before[constraint_id]
+    assert constraints_after["(0,4)"]["constraint_type"] == "CANNOT_LINK"
+    assert constraints_after["(0,4)"]["constraint_type_previous"] == [None, "MUST_LINK"]
+    assert constraints_after["(0,4)"]["comment"] == "Same intent."
+    assert constraints_after["(0,4)"]["to_annotate"] is False
+    assert constraints_after["(0,4)"]["date_of_update"] is not None
+    assert constraints_after["(12,9)"]["constraint_type"] is None
+    assert constraints_after["(12,9)"]["constraint_type_previous"] == [
+        *constraints_before["(12,9)"]["constraint_type_previous"],
+        constraints_before["(12,9)"]["constraint_type"],
+    ]
+    assert constraints_after["(12,9)"]["to_review"] is True
+    assert constraints_after["(10,9)"]["to_review"] is True
+    assert constraints_after["(10,9)"]["constraint_type"] == constraints_before["(10,9)"]["constraint_type"]
+
+    # Assert route `GET /api/projects/{project_id}/status` is updated.
+    response_get_status = await async_client.get(url="/api/projects/1d_ANNOTATION_WITH_UPTODATE_MODELIZATION/status")
+    assert response_get_status.status_code == 200
+    assert response_get_status.json()["status"]["state"] == "ANNOTATION_WITH_OUTDATED_MODELIZATION_WITHOUT_CONFLICTS"
@@ -514,6 +514,13 @@ async def test_ko_vectorization_bad_value(async_client, tmp_path):
         json={"vectorization": {"vectorizer_type": "tfidf", "random_seed": -99}},
     )
     assert response_put_4.status_code == 422
+
+    # Assert route `PUT /api/projects/{project_id}/settings` works.
+    response_put_5 = await async_client.put(
+        url="/api/projects/2d_ANNOTATION_WITH_UPTODATE_MODELIZATION/settings",
+        json={"vectorization": {"vectorizer_type": "tfidf", "random_seed": 88, "projection_algorithm": "UNKNOWN"}},
+    )
+    assert response_put_5.status_code == 422
     # Assert route `GET /api/projects/{project_id}/status` is still the same.
     response_get = await async_client.get(url="/api/projects/2d_ANNOTATION_WITH_UPTODATE_MODELIZATION/status")
     assert response_get.status_code == 200
@@ -922,6 +929,21 @@ async def test_ko_clustering_bad_value(async_client, tmp_path):
     )
     assert response_put_6.status_code == 422
 
+    # Assert route `PUT /api/projects/{project_id}/settings` works.
+    response_put_7 = await async_client.put(
+        url="/api/projects/2d_ANNOTATION_WITH_UPTODATE_MODELIZATION/settings",
+        json={
+            "clustering": {
+                "algorithm": "kmeans",
+                "random_seed": 88,
+                "nb_clusters": 3,
+                "init_kargs": {"model": "COP", "max_iteration": 200, "tolerance": 0.1},
+                "nb_seeds": 0,
+            }
+        },
+    )
+    assert response_put_7.status_code == 422
+
     # Assert route `GET /api/projects/{project_id}/status` is still the same.
     response_get = await async_client.get(url="/api/projects/2d_ANNOTATION_WITH_UPTODATE_MODELIZATION/status")
     assert response_get.status_code == 200
@@ -1062,6 +1084,34 @@ async def test_ko_clustering_missing_value(async_client, tmp_path):
     )
     assert response_put_8.status_code == 422
 
+    # Assert route `PUT /api/projects/{project_id}/settings` works.
+    response_put_9 = await async_client.put(
+        url="/api/projects/2d_ANNOTATION_WITH_UPTODATE_MODELIZATION/settings",
+        json={
+            "clustering": {
+                "algorithm": "minibatch_kmeans",
+                "random_seed": 42,
+                "nb_clusters": 2,
+                "init_kargs": {"model": "COP", "max_iteration": 150, "tolerance": 0.0001},
+            }
+        },
+    )
+    assert response_put_9.status_code == 422
+
+    # Assert route `PUT /api/projects/{project_id}/settings` works.
+    response_put_10 = await async_client.put(
+        url="/api/projects/2d_ANNOTATION_WITH_UPTODATE_MODELIZATION/settings",
+        json={
+            "clustering": {
+                "algorithm": "minibatch_kmeans",
+                "random_seed": 42,
+                "nb_clusters": 2,
+                "init_kargs": {"batch_size": 0, "max_iteration": 100, "tolerance": 0.0001},
+            }
+        },
+    )
+    assert response_put_10.status_code == 422
+
     # Assert route `GET /api/projects/{project_id}/status` is still the same.
     response_get = await async_client.get(url="/api/projects/2d_ANNOTATION_WITH_UPTODATE_MODELIZATION/status")
     assert response_get.status_code == 200
@@ -1149,6 +1199,8 @@ async def test_ok_all_1(async_client, tmp_path):
         "random_seed": 41,
         "nb_clusters": 3,
         "init_kargs": {"linkage": "complete"},
+        "warm_start": False,
+        "nb_seeds": 1,
     }
 
 
@@ -1227,6 +1279,7 @@ async def test_ok_all_2(async_client, tmp_path):
         "vectorizer_type": "spacy",
         "spacy_language_model": "fr_core_news_md",
         "random_seed": 88,
+        "projection_algorithm": "tsne",
     }
     assert (
         response_get_settings_after.json()["settings"]["sampling"]
@@ -1237,6 +1290,8 @@ async def test_ok_all_2(async_client, tmp_path):
         "random_seed": 41,
         "nb_clusters": 3,
         "init_kargs": {"linkage": "complete"},
+        "warm_start": False,
+        "nb_seeds": 1,
     }
 
 
@@ -1311,6 +1366,7 @@ async def test_ok_preprocessing_1(async_client, tmp_path):
         "vectorizer_type": "tfidf",
         "spacy_language_model": None,
         "random_seed": 88,
+        "projection_algorithm": "tsne",
     }
     assert (
         response_get_settings_after.json()["settings"]["sampling"]
@@ -1381,6 +1437,7 @@ async def test_ok_vectorization_1(async_client, tmp_path):
         "vectorizer_type": "tfidf",
         "spacy_language_model": None,
         "random_seed": 88,
+        "projection_algorithm": "tsne",
     }
     assert (
         response_get_settings_after.json()["settings"]["sampling"]
@@ -1614,6 +1671,65 @@ async def test_ok_clustering_1(async_client, tmp_path):
         "random_seed": 88,
         "nb_clusters": 8,
         "init_kargs": {"model": "COP", "tolerance": 0.1, "max_iteration": 12},
+        "warm_start": False,
+        "nb_seeds": 1,
+    }
+
+    # Assert route `PUT /api/projects/{project_id}/settings` works with warm start.
+    response_put_warm_start = await async_client.put(
+        url="/api/projects/2a_SAMPLING_TODO/settings",
+        json={
+            "clustering": {
+                "algorithm": "kmeans",
+                "random_seed": 88,
+                "nb_clusters": 8,
+                "init_kargs": {"model": "COP", "tolerance": 0.1, "max_iteration": 12},
+                "warm_start": True,
+            }
+        },
+    )
+    assert response_put_warm_start.status_code == 201
+    response_get_settings_warm_start = await async_client.get(url="/api/projects/2a_SAMPLING_TODO/settings")
+    assert response_get_settings_warm_start.json()["settings"]["clustering"]["warm_start"] is True
+
+    # Assert route `PUT /api/projects/{project_id}/settings` works with several random seeds.
+    response_put_nb_seeds = await async_client.put(
+        url="/api/projects/2a_SAMPLING_TODO/settings",
+        json={
+            "clustering": {
+                "algorithm": "kmeans",
+                "random_seed": 88,
+                "nb_clusters": 8,
+                "init_kargs": {"model": "COP", "tolerance": 0.1, "max_iteration": 12},
+                "nb_seeds": 4,
+            }
+        },
+    )
+    assert response_put_nb_seeds.status_code == 201
+    response_get_settings_nb_seeds = await async_client.get(url="/api/projects/2a_SAMPLING_TODO/settings")
+    assert response_get_settings_nb_seeds.json()["settings"]["clustering"]["nb_seeds"] == 4
+
+    # Assert route `PUT /api/projects/{project_id}/settings` works with mini-batch kmeans.
+    response_put_minibatch_kmeans = await async_client.put(
+        url="/api/projects/2a_SAMPLING_TODO/settings",
+        json={
+            "clustering": {
+                "algorithm": "minibatch_kmeans",
+                "random_seed": 88,
+                "nb_clusters": 8,
+                "init_kargs": {"batch_size": 256, "max_iteration": 50, "tolerance": 0.001},
+            }
+        },
+    )
+    assert response_put_minibatch_kmeans.status_code == 201
+    response_get_settings_minibatch_kmeans = await async_client.get(url="/api/projects/2a_SAMPLING_TODO/settings")
+    assert response_get_settings_minibatch_kmeans.json()["settings"]["clustering"] == {
+        "algorithm": "minibatch_kmeans",
+        "random_seed": 88,
+        "nb_clusters": 8,
+        "init_kargs": {"batch_size": 256, "max_iteration": 50, "tolerance": 0.001},
+        "warm_start": False,
+        "nb_seeds": 1,
     }
 
 
@@ -1688,6 +1804,8 @@ async def test_ok_clustering_2(async_client, tmp_path):
         "random_seed": 88,
         "nb_clusters": 8,
         "init_kargs": {"linkage": "average"},
+        "warm_start": False,
+        "nb_seeds": 1,
     }
 
 
@@ -1762,6 +1880,8 @@ async def test_ok_clustering_3(async_client, tmp_path):
         "random_seed": 40,
         "nb_clusters": 4,
         "init_kargs": {"model": "SPEC", "nb_components": 12},
+        "warm_start": False,
+        "nb_seeds": 1,
     }
 
 
@@ -1836,4 +1956,6 @@ async def test_ok_clustering_4(async_client, tmp_path):
         "random_seed": 40,
         "nb_clusters": 4,
         "init_kargs": {"model": "SPEC", "nb_components": None},
+        "warm_start": False,
+        "nb_seeds": 1,
     }
@@ -0,0 +1,128 @@
+# -*- coding: utf-8 -*-
+
+"""
+* Name:         interactive-clustering-gui/tests/test_put_api_projects_task_cancel.py
+* Description:  Unittests for `app` module on the `PUT /api/projects/{project_id}/task/cancel` route.
+* Author:       Erwan Schild
+* Created:      18/10/2026
+* Licence:      CeCILL (https://cecill.info/licences.fr.html)
+"""
+
+import pytest
+
+from tests.dummies_utils import create_dummy_projects
+
+# ==============================================================================
+# test_ko_not_found
+# ==============================================================================
+
+
+@pytest.mark.asyncio()
+async def test_ko_not_found(async_client):
+    """
+    Test the `PUT /api/projects/{project_id}/task/cancel` route with not existing project.
+
+    Arguments:
+        async_client: Fixture providing an HTTP client, declared in `conftest.py`.
+    """
+    # Assert HTTP client is created.
+    assert async_client
+
+    # Assert route `PUT /api/projects/{project_id}/task/cancel` works.
+    response_put = await async_client.put(url="/api/projects/UNKNOWN_PROJECT/task/cancel")
+    assert response_put.status_code == 404
+    assert response_put.json() == {
+        "detail": "The project with id 'UNKNOWN_PROJECT' doesn't exist.",
+    }
+
+
+# ==============================================================================
+# test_ko_bad_state
+# ==============================================================================
+
+
+@pytest.mark.asyncio()
+async def test_ko_bad_state(async_client, tmp_path):
+    """
+    Test the `PUT /api/projects/{project_id}/task/cancel` route with bad state.
+
+    Arguments:
+        async_client: Fixture providing an HTTP client, declared in `conftest.py`.
+        tmp_path: The temporary path given for this test, declared in `conftest.py`.
+    """
+    # Assert HTTP client is created.
+    assert async_client
+
+    # Create dummy projects.
+    create_dummy_projects(
+        tmp_path=tmp_path,
+        list_of_dummy_project_ids=[
+            "1a_SAMPLING_TODO",
+        ],
+    )
+
+    # Assert route `PUT /api/projects/{project_id}/task/cancel` works.
+    response_put = await async_client.put(url="/api/projects/1a_SAMPLING_TODO/task/cancel")
+    assert response_put.status_code == 403
+    assert response_put.json() == {
+        "detail": "The project with id '1a_SAMPLING_TODO' has no task to cancel during this state (state='SAMPLING_TODO')."
+    }
+
+    # Assert route `GET /api/projects/{project_id}/status` is still the same.
+    response_get = await async_client.get(url="/api/projects/1a_SAMPLING_TODO/status")
+    assert response_get.status_code == 200
+    assert response_get.json()["status"]["state"] == "SAMPLING_TODO"
+
+
+# ==============================================================================
+# test_ok
+# ==============================================================================
+
+
+@pytest.mark.asyncio()
+@pytest.mark.parametrize(
+    "project_id,restored_state",
+    [
+        ("0b_INITIALIZATION_WITH_PENDING_MODELIZATION", "INITIALIZATION_WITHOUT_MODELIZATION"),
+        ("1c_SAMPLING_WORKING", "SAMPLING_TODO"),
+        (
+            "1j_ANNOTATION_WITH_PENDING_MODELIZATION_WITH_CONFLICTS",
+            "ANNOTATION_WITH_OUTDATED_MODELIZATION_WITH_CONFLICTS",
+        ),
+        ("1o_CLUSTERING_WORKING", "CLUSTERING_TODO"),
+    ],
+)
+async def test_ok(async_client, tmp_path, project_id, restored_state):
+    """
+    Test the `PUT /api/projects/{project_id}/task/cancel` route with good parameters.
+
+    Arguments:
+        async_client: Fixture providing an HTTP client, declared in `conftest.py`.
+        tmp_path: The temporary path given for this test, declared in `conftest.py`.
+        project_id: The ID of the dummy project with a pending or working task.
+        restored_state: The state expected after the cancellation.
+    """
+    # Assert HTTP client is created.
+    assert async_client
+
+    # Create dummy projects.
+    create_dummy_projects(
+        tmp_path=tmp_path,
+        list_of_dummy_project_ids=[
+            project_id,
+        ],
+    )
+
+    # Assert route `PUT /api/projects/{project_id}/task/cancel` works.
+    response_put = await async_client.put(url="/api/projects/{project_id}/task/cancel".format(project_id=project_id))
+    assert response_put.status_code == 202
+    assert response_put.json() == {
+        "project_id": project_id,
+        "detail": "In project with id '{project_id}', the task has been cancelled.".format(project_id=project_id),
+    }
+
+    # Assert route `GET /api/projects/{project_id}/status` is restored.
+    response_get = await async_client.get(url="/api/projects/{project_id}/status".format(project_id=project_id))
+    assert response_get.status_code == 200
+    assert response_get.json()["status"]["state"] == restored_state
+    assert response_get.json()["status"]["task"] is None
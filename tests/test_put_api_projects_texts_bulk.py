@@ -0,0 +1,204 @@
+# -*- coding: utf-8 -*-
+
+"""
+* Name:         interactive-clustering-gui/tests/test_put_api_projects_texts_bulk.py
+* Description:  Unittests for `app` module on the `PUT /api/projects/{project_id}/texts/bulk` route.
+* Author:       Erwan Schild
+* Created:      18/10/2026
+* Licence:      CeCILL (https://cecill.info/licences.fr.html)
+"""
+
+# ==============================================================================
+# IMPORT PYTHON DEPENDENCIES
+# ==============================================================================
+
+import pytest
+
+from tests.dummies_utils import create_dummy_projects
+
+# ==============================================================================
+# test_ko_not_found
+# ==============================================================================
+
+
+@pytest.mark.asyncio()
+async def test_ko_not_found(async_client):
+    """
+    Test the `PUT /api/projects/{project_id}/texts/bulk` route with not existing project.
+
+    Arguments:
+        async_client: Fixture providing an HTTP client, declared in `conftest.py`.
+    """
+    # Assert HTTP client is created.
+    assert async_client
+
+    # Assert route `PUT /api/projects/{project_id}/texts/bulk` works.
+    response_put = await async_client.put(
+        url="/api/projects/UNKNOWN_PROJECT/texts/bulk",
+        json=[{"text_id": "0", "is_deleted": True}],
+    )
+    assert response_put.status_code == 404
+    assert response_put.json() == {
+        "detail": "The project with id 'UNKNOWN_PROJECT' doesn't exist.",
+    }
+
+
+# ==============================================================================
+# test_ko_text_not_found
+# ==============================================================================
+
+
+@pytest.mark.asyncio()
+async def test_ko_text_not_found(async_client, tmp_path):
+    """
+    Test the `PUT /api/projects/{project_id}/texts/bulk` route with not existing texts: no operation is applied.
+
+    Arguments:
+        async_client: Fixture providing an HTTP client, declared in `conftest.py`.
+        tmp_path: The temporary path given for this test, declared in `conftest.py`.
+    """
+    # Assert HTTP client is created.
+    assert async_client
+
+    # Create dummy projects.
+    create_dummy_projects(
+        tmp_path=tmp_path,
+        list_of_dummy_project_ids=[
+            "1d_ANNOTATION_WITH_UPTODATE_MODELIZATION",
+        ],
+    )
+
+    # Assert route `PUT /api/projects/{project_id}/texts/bulk` works.
+    response_put = await async_client.put(
+        url="/api/projects/1d_ANNOTATION_WITH_UPTODATE_MODELIZATION/texts/bulk",
+        json=[
+            {"text_id": "0", "is_deleted": True},
+            {"text_id": "UNKNOWN_TEXT_1", "text": "Unknown."},
+            {"text_id": "UNKNOWN_TEXT_2", "is_deleted": False},
+        ],
+    )
+    assert response_put.status_code == 404
+    assert response_put.json() == {
+        "detail": "In project with id '1d_ANNOTATION_WITH_UPTODATE_MODELIZATION', the texts with ids 'UNKNOWN_TEXT_1', 'UNKNOWN_TEXT_2' to update don't exist.",
+    }
+
+    # Assert the valid operation hasn't been applied.
+    response_get_texts = await async_client.get(
+        url="/api/projects/1d_ANNOTATION_WITH_UPTODATE_MODELIZATION/texts?without_deleted_texts=false"
+    )
+    assert response_get_texts.json()["texts"]["0"]["is_deleted"] is False
+    response_get_status = await async_client.get(url="/api/projects/1d_ANNOTATION_WITH_UPTODATE_MODELIZATION/status")
+    assert response_get_status.json()["status"]["state"] == "ANNOTATION_WITH_UPTODATE_MODELIZATION"
+
+
+# ==============================================================================
+# test_ko_bad_state
+# ==============================================================================
+
+
+@pytest.mark.asyncio()
+async def test_ko_bad_state(async_client, tmp_path):
+    """
+    Test the `PUT /api/projects/{project_id}/texts/bulk` route with bad state.
+
+    Arguments:
+        async_client: Fixture providing an HTTP client, declared in `conftest.py`.
+        tmp_path: The temporary path given for this test, declared in `conftest.py`.
+    """
+    # Assert HTTP client is created.
+    assert async_client
+
+    # Create dummy projects.
+    create_dummy_projects(
+        tmp_path=tmp_path,
+        list_of_dummy_project_ids=[
+            "1m_CLUSTERING_TODO",
+        ],
+    )
+
+    # Assert route `PUT /api/projects/{project_id}/texts/bulk` works.
+    response_put = await async_client.put(
+        url="/api/projects/1m_CLUSTERING_TODO/texts/bulk",
+        json=[{"text_id": "0", "text": "Renamed text."}],
+    )
+    assert response_put.status_code == 403
+    assert response_put.json() == {
+        "detail": "The project with id '1m_CLUSTERING_TODO' doesn't allow modification during this state (state='CLUSTERING_TODO').",
+    }
+
+
+# ==============================================================================
+# test_ok
+# ==============================================================================
+
+
+@pytest.mark.asyncio()
+async def test_ok(async_client, tmp_path):
+    """
+    Test the `PUT /api/projects/{project_id}/texts/bulk` route with good state: texts are deleted, undeleted and renamed, and constraints are hidden or unhidden.
+
+    Arguments:
+        async_client: Fixture providing an HTTP client, declared in `conftest.py`.
+        tmp_path: The temporary path given for this test, declared in `conftest.py`.
+    """
+    # Assert HTTP client is created.
+    assert async_client
+
+    # Create dummy projects.
+    create_dummy_projects(
+        tmp_path=tmp_path,
+        list_of_dummy_project_ids=[
+            "1l_ANNOTATION_WITH_UPTODATE_MODELIZATION",
+        ],
+    )
+
+    # Get texts before test.
+    response_get_texts_before = await async_client.get(
+        url="/api/projects/1l_ANNOTATION_WITH_UPTODATE_MODELIZATION/texts?without_deleted_texts=false"
+    )
+    assert response_get_texts_before.json()["texts"]["0"]["is_deleted"] is False
+    assert response_get_texts_before.json()["texts"]["14"]["is_deleted"] is True
+
+    # Assert route `PUT /api/projects/{project_id}/texts/bulk` works.
+    response_put = await async_client.put(
+        url="/api/projects/1l_ANNOTATION_WITH_UPTODATE_MODELIZATION/texts/bulk",
+        json=[
+            {"text_id": "0", "is_deleted": True},
+            {"text_id": "14", "is_deleted": False, "text": "Renamed text."},
+            {"text_id": "1", "text": "Another renamed text."},
+        ],
+    )
+    assert response_put.status_code == 202
+    assert response_put.json()["project_id"] == "1l_ANNOTATION_WITH_UPTODATE_MODELIZATION"
+    assert response_put.json()["results"] == [
+        {"text_id": "0", "updated_fields": ["is_deleted"]},
+        {"text_id": "14", "updated_fields": ["is_deleted", "text"]},
+        {"text_id": "1", "updated_fields": ["text"]},
+    ]
+    assert response_put.json()["detail"].startswith(
+        "In project with id '1l_ANNOTATION_WITH_UPTODATE_MODELIZATION', 3 texts have been updated."
+    )
+
+    # Assert route `GET /api/projects/{project_id}/texts` is updated.
+    response_get_texts_after = await async_client.get(
+        url="/api/projects/1l_ANNOTATION_WITH_UPTODATE_MODELIZATION/texts?without_deleted_texts=false"
+    )
+    texts_after = response_get_texts_after.json()["texts"]
+    assert texts_after["0"]["is_deleted"] is True
+    assert texts_after["14"]["is_deleted"] is False
+    assert texts_after["14"]["text"] == "Renamed text."
+    assert texts_after["1"]["text"] == "Another renamed text."
+
+    # Assert route `GET /api/projects/{project_id}/status` is updated.
+    response_get_status = await async_client.get(url="/api/projects/1l_ANNOTATION_WITH_UPTODATE_MODELIZATION/status")
+    assert response_get_status.json()["status"]["state"] == "ANNOTATION_WITH_OUTDATED_MODELIZATION_WITHOUT_CONFLICTS"
+
+    # Assert route `GET /api/projects/{project_id}/constraints` is updated.
+    response_get_constraints = await async_client.get(
+        url="/api/projects/1l_ANNOTATION_WITH_UPTODATE_MODELIZATION/constraints?without_hidden_constraints=false"
+    )
+    for constraint_value in response_get_constraints.json()["constraints"].values():
+        assert constraint_value["is_hidden"] is (
+            texts_after[constraint_value["data"]["id_1"]]["is_deleted"]
+            or texts_after[constraint_value["data"]["id_2"]]["is_deleted"]
+        )
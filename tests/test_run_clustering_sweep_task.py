@@ -0,0 +1,233 @@
+# -*- coding: utf-8 -*-
+
+"""
+* Name:         interactive-clustering-gui/tests/test_run_clustering_sweep_task.py
+* Description:  Unittests for the `run_clustering_sweep_task` background task.
+* Author:       Erwan Schild
+* Created:      18/10/2026
+* Licence:      CeCILL (https://cecill.info/licences.fr.html)
+"""
+
+# ==============================================================================
+# IMPORT PYTHON DEPENDENCIES
+# ==============================================================================
+
+
+import json
+import os
+
+from tests.dummies_utils import create_dummy_projects
+
+# ==============================================================================
+# test_ko_not_found
+# ==============================================================================
+
+
+def test_ko_not_found(fake_backgroundtasks):
+    """
+    Test the `clustering sweep` task with project not existing.
+
+    Args:
+        fake_backgroundtasks: Fixture providing a backgroundtasks module, declared in `conftest.py`.
+    """
+
+    # Run the task.
+    fake_backgroundtasks.run_clustering_sweep_task(project_id="UNKNOWN_PROJECT")
+
+
+# ==============================================================================
+# test_ko_not_requested
+# ==============================================================================
+
+
+def test_ko_not_requested(fake_backgroundtasks, tmp_path):
+    """
+    Test the `clustering sweep` task without requested sweep.
+
+    Args:
+        fake_backgroundtasks: Fixture providing a backgroundtasks module, declared in `conftest.py`.
+        tmp_path: Pytest fixture: points to a temporary directory.
+    """
+
+    # Create dummy projects.
+    create_dummy_projects(
+        tmp_path=tmp_path,
+        list_of_dummy_project_ids=[
+            "1l_ANNOTATION_WITH_UPTODATE_MODELIZATION",
+        ],
+    )
+
+    # Run the task.
+    fake_backgroundtasks.run_clustering_sweep_task(project_id="1l_ANNOTATION_WITH_UPTODATE_MODELIZATION")
+
+    # Assert sweep is not computed.
+    assert fake_backgroundtasks.CLUSTERING_SWEEP_NAME not in os.listdir(
+        tmp_path / "1l_ANNOTATION_WITH_UPTODATE_MODELIZATION"
+    )
+
+
+# ==============================================================================
+# test_ko_sweep_error
+# ==============================================================================
+
+
+def test_ko_sweep_error(fake_backgroundtasks, tmp_path, monkeypatch):
+    """
+    Test the `clustering sweep` task with a failing clustering.
+
+    Args:
+        fake_backgroundtasks: Fixture providing a backgroundtasks module, declared in `conftest.py`.
+        tmp_path: Pytest fixture: points to a temporary directory.
+        monkeypatch: Pytest fixture: allows to monkeypatch objects.
+    """
+
+    # Create dummy projects, and request a sweep.
+    create_dummy_projects(
+        tmp_path=tmp_path,
+        list_of_dummy_project_ids=[
+            "1l_ANNOTATION_WITH_UPTODATE_MODELIZATION",
+        ],
+    )
+    parameters = {"iteration_id": 1, "nb_clusters_min": 2, "nb_clusters_max": 30}
+    with open(
+        tmp_path / "1l_ANNOTATION_WITH_UPTODATE_MODELIZATION" / fake_backgroundtasks.CLUSTERING_SWEEP_NAME, "w"
+    ) as clustering_sweep_fileobject_w:
+        json.dump(
+            {"parameters": parameters, "task": {"progression": 1, "detail": "..."}, "results": None, "metrics": None},
+            clustering_sweep_fileobject_w,
+        )
+
+    # Make the clustering fail.
+    def sweep_failing_nb_clusters(**kwargs):
+        raise ValueError("n_samples=23 should be >= n_clusters=30.")
+
+    monkeypatch.setattr(fake_backgroundtasks, "sweep_nb_clusters", sweep_failing_nb_clusters)
+
+    # Run the task.
+    fake_backgroundtasks.run_clustering_sweep_task(project_id="1l_ANNOTATION_WITH_UPTODATE_MODELIZATION")
+
+    # Assert the failure is stored, and the sweep isn't shown as running anymore.
+    with open(
+        tmp_path / "1l_ANNOTATION_WITH_UPTODATE_MODELIZATION" / fake_backgroundtasks.CLUSTERING_SWEEP_NAME, "r"
+    ) as clustering_sweep_fileobject_r:
+        assert json.load(clustering_sweep_fileobject_r) == {
+            "parameters": parameters,
+            "task": None,
+            "results": None,
+            "metrics": None,
+            "error": "ValueError: n_samples=23 should be >= n_clusters=30.",
+        }
+
+
+# ==============================================================================
+# test_ok
+# ==============================================================================
+
+
+def test_ok(fake_backgroundtasks, tmp_path):
+    """
+    Test the `clustering sweep` task with good parameters.
+
+    Args:
+        fake_backgroundtasks: Fixture providing a backgroundtasks module, declared in `conftest.py`.
+        tmp_path: Pytest fixture: points to a temporary directory.
+    """
+
+    # Create dummy projects, and request a sweep.
+    create_dummy_projects(
+        tmp_path=tmp_path,
+        list_of_dummy_project_ids=[
+            "1l_ANNOTATION_WITH_UPTODATE_MODELIZATION",
+        ],
+    )
+    parameters = {"iteration_id": 1, "nb_clusters_min": 2, "nb_clusters_max": 4}
+    with open(
+        tmp_path / "1l_ANNOTATION_WITH_UPTODATE_MODELIZATION" / fake_backgroundtasks.CLUSTERING_SWEEP_NAME, "w"
+    ) as clustering_sweep_fileobject_w:
+        json.dump(
+            {"parameters": parameters, "task": {"progression": 1, "detail": "..."}, "results": None, "metrics": None},
+            clustering_sweep_fileobject_w,
+        )
+
+    # Run the task.
+    fake_backgroundtasks.run_clustering_sweep_task(project_id="1l_ANNOTATION_WITH_UPTODATE_MODELIZATION")
+
+    # Assert sweep is computed, and the project state is unchanged.
+    with open(
+        tmp_path / "1l_ANNOTATION_WITH_UPTODATE_MODELIZATION" / fake_backgroundtasks.CLUSTERING_SWEEP_NAME, "r"
+    ) as clustering_sweep_fileobject_r:
+        clustering_sweep = json.load(clustering_sweep_fileobject_r)
+    assert clustering_sweep["parameters"] == parameters
+    assert clustering_sweep["task"] is None
+    assert list(clustering_sweep["results"].keys()) == ["2", "3", "4"]
+    assert list(clustering_sweep["results"]["2"].keys()) == ["silhouette", "constraints_violations", "inertia"]
+    assert clustering_sweep["results"]["2"]["inertia"] >= clustering_sweep["results"]["4"]["inertia"]
+    assert clustering_sweep["metrics"]["sweep_speedup"] > 0
+    with open(tmp_path / "1l_ANNOTATION_WITH_UPTODATE_MODELIZATION" / "status.json", "r") as status_fileobject:
+        assert json.load(status_fileobject)["state"] == "ANNOTATION_WITH_UPTODATE_MODELIZATION"
+
+
+# ==============================================================================
+# test_ok_update_clustering_sweep
+# ==============================================================================
+
+
+def test_ok_update_clustering_sweep(fake_backgroundtasks, tmp_path):
+    """
+    Test that the sweep isn't updated by the task if it has been requested again with other parameters.
+
+    Args:
+        fake_backgroundtasks: Fixture providing a backgroundtasks module, declared in `conftest.py`.
+        tmp_path: Pytest fixture: points to a temporary directory.
+    """
+
+    # Create dummy projects, and request a sweep.
+    create_dummy_projects(
+        tmp_path=tmp_path,
+        list_of_dummy_project_ids=[
+            "1l_ANNOTATION_WITH_UPTODATE_MODELIZATION",
+        ],
+    )
+    parameters = {"iteration_id": 1, "nb_clusters_min": 2, "nb_clusters_max": 4}
+    with open(
+        tmp_path / "1l_ANNOTATION_WITH_UPTODATE_MODELIZATION" / fake_backgroundtasks.CLUSTERING_SWEEP_NAME, "w"
+    ) as clustering_sweep_fileobject_w:
+        json.dump(
+            {"parameters": parameters, "task": {"progression": 1, "detail": "..."}, "results": None, "metrics": None},
+            clustering_sweep_fileobject_w,
+        )
+
+    # Assert the sweep is updated with the same parameters.
+    assert fake_backgroundtasks.update_clustering_sweep(
+        project_id="1l_ANNOTATION_WITH_UPTODATE_MODELIZATION",
+        parameters=parameters,
+        task_progression=30,
+        task_detail="Run.",
+    )
+
+    # Assert the sweep isn't updated with other parameters.
+    assert not fake_backgroundtasks.update_clustering_sweep(
+        project_id="1l_ANNOTATION_WITH_UPTODATE_MODELIZATION",
+        parameters={"iteration_id": 1, "nb_clusters_min": 3, "nb_clusters_max": 4},
+        task_progression=None,
+        task_detail=None,
+        results={},
+    )
+    with open(
+        tmp_path / "1l_ANNOTATION_WITH_UPTODATE_MODELIZATION" / fake_backgroundtasks.CLUSTERING_SWEEP_NAME, "r"
+    ) as clustering_sweep_fileobject_r:
+        assert json.load(clustering_sweep_fileobject_r) == {
+            "parameters": parameters,
+            "task": {"progression": 30, "detail": "Run."},
+            "results": None,
+            "metrics": None,
+        }
+
+    # Assert the sweep isn't updated once removed.
+    os.remove(tmp_path / "1l_ANNOTATION_WITH_UPTODATE_MODELIZATION" / fake_backgroundtasks.CLUSTERING_SWEEP_NAME)
+    assert not fake_backgroundtasks.update_clustering_sweep(
+        project_id="1l_ANNOTATION_WITH_UPTODATE_MODELIZATION",
+        parameters=parameters,
+        task_progression=30,
+        task_detail="Run.",
+    )
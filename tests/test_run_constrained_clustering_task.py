@@ -15,6 +15,7 @@
 
 import json
 
+from cognitivefactory.interactive_clustering_gui.storage.factory import storage_factory
 from tests.dummies_utils import create_dummy_projects
 
 # ==============================================================================
@@ -225,9 +226,9 @@ def test_ok(fake_backgroundtasks, tmp_path):
                 "10": 0,
                 "11": 0,
                 "12": 0,
-                "13": 0,
-                "15": 0,
-                "16": 1,
+                "13": 1,
+                "15": 1,
+                "16": 2,
                 "17": 2,
                 "18": 2,
                 "19": 2,
@@ -238,10 +239,147 @@ def test_ok(fake_backgroundtasks, tmp_path):
                 "23": 2,
                 "3": 0,
                 "4": 0,
-                "5": 0,
+                "5": 2,
                 "6": 0,
                 "7": 0,
                 "8": 0,
                 "9": 0,
             },
         }
+
+
+# ==============================================================================
+# test_ok_warm_start
+# ==============================================================================
+
+
+def test_ok_warm_start(fake_backgroundtasks, tmp_path):
+    """
+    Test the `constrained clustering` task works when KMeans is warm started from the previous iteration.
+
+    Args:
+        fake_backgroundtasks: Fixture providing a backgroundtasks module, declared in `conftest.py`.
+        tmp_path: Pytest fixture: points to a temporary directory.
+    """
+
+    # Create dummy projects.
+    create_dummy_projects(
+        tmp_path=tmp_path,
+        list_of_dummy_project_ids=[
+            "1n_CLUSTERING_PENDING",
+        ],
+    )
+
+    # Enable warm start.
+    with open(tmp_path / "1n_CLUSTERING_PENDING" / "settings.json", "r") as settings_fileobject_r:
+        settings = json.load(settings_fileobject_r)
+    settings["1"]["clustering"]["warm_start"] = True
+    with open(tmp_path / "1n_CLUSTERING_PENDING" / "settings.json", "w") as settings_fileobject_w:
+        json.dump(settings, settings_fileobject_w)
+
+    # Run the task.
+    fake_backgroundtasks.run_constrained_clustering_task(project_id="1n_CLUSTERING_PENDING")
+
+    # Assert status is updated.
+    with open(tmp_path / "1n_CLUSTERING_PENDING" / "status.json", "r") as status_after_fileobject:
+        assert json.load(status_after_fileobject) == {"iteration_id": 1, "state": "ITERATION_END", "task": None}
+
+    # Assert clustering file content is updated, with all managed texts (text "14" is deleted).
+    with open(tmp_path / "1n_CLUSTERING_PENDING" / "clustering.json", "r") as clustering_after_fileobject:
+        clustering_after = json.load(clustering_after_fileobject)
+    assert sorted(clustering_after["1"].keys()) == sorted(str(i) for i in range(24) if i != 14)
+    assert set(clustering_after["1"].values()) == {0, 1, 2}
+
+
+# ==============================================================================
+# test_ok_several_random_seeds
+# ==============================================================================
+
+
+def test_ok_several_random_seeds(fake_backgroundtasks, tmp_path):
+    """
+    Test the `constrained clustering` task works with several random seeds, and keeps the best run.
+
+    Args:
+        fake_backgroundtasks: Fixture providing a backgroundtasks module, declared in `conftest.py`.
+        tmp_path: Pytest fixture: points to a temporary directory.
+    """
+
+    # Create dummy projects.
+    create_dummy_projects(
+        tmp_path=tmp_path,
+        list_of_dummy_project_ids=[
+            "1n_CLUSTERING_PENDING",
+        ],
+    )
+
+    # Run clustering with several random seeds.
+    with open(tmp_path / "1n_CLUSTERING_PENDING" / "settings.json", "r") as settings_fileobject_r:
+        settings = json.load(settings_fileobject_r)
+    settings["1"]["clustering"]["nb_seeds"] = 3
+    with open(tmp_path / "1n_CLUSTERING_PENDING" / "settings.json", "w") as settings_fileobject_w:
+        json.dump(settings, settings_fileobject_w)
+
+    # Run the task.
+    fake_backgroundtasks.run_constrained_clustering_task(project_id="1n_CLUSTERING_PENDING")
+
+    # Assert status is updated.
+    with open(tmp_path / "1n_CLUSTERING_PENDING" / "status.json", "r") as status_after_fileobject:
+        assert json.load(status_after_fileobject) == {"iteration_id": 1, "state": "ITERATION_END", "task": None}
+
+    # Assert clustering file content is updated, with all managed texts (text "14" is deleted).
+    with open(tmp_path / "1n_CLUSTERING_PENDING" / "clustering.json", "r") as clustering_after_fileobject:
+        clustering_after = json.load(clustering_after_fileobject)
+    assert sorted(clustering_after["1"].keys()) == sorted(str(i) for i in range(24) if i != 14)
+    assert set(clustering_after["1"].values()) == {0, 1, 2}
+
+
+# ==============================================================================
+# test_ok_minibatch_kmeans
+# ==============================================================================
+
+
+def test_ok_minibatch_kmeans(fake_backgroundtasks, tmp_path):
+    """
+    Test the `constrained clustering` task works with mini-batch KMeans, and respects annotated constraints.
+
+    Args:
+        fake_backgroundtasks: Fixture providing a backgroundtasks module, declared in `conftest.py`.
+        tmp_path: Pytest fixture: points to a temporary directory.
+    """
+
+    # Create dummy projects.
+    create_dummy_projects(
+        tmp_path=tmp_path,
+        list_of_dummy_project_ids=[
+            "1n_CLUSTERING_PENDING",
+        ],
+    )
+
+    # Use mini-batch KMeans.
+    with open(tmp_path / "1n_CLUSTERING_PENDING" / "settings.json", "r") as settings_fileobject_r:
+        settings = json.load(settings_fileobject_r)
+    settings["1"]["clustering"]["algorithm"] = "minibatch_kmeans"
+    settings["1"]["clustering"]["init_kargs"] = {"batch_size": 8, "max_iteration": 50, "tolerance": 0.0001}
+    with open(tmp_path / "1n_CLUSTERING_PENDING" / "settings.json", "w") as settings_fileobject_w:
+        json.dump(settings, settings_fileobject_w)
+
+    # Run the task.
+    fake_backgroundtasks.run_constrained_clustering_task(project_id="1n_CLUSTERING_PENDING")
+
+    # Assert status is updated.
+    with open(tmp_path / "1n_CLUSTERING_PENDING" / "status.json", "r") as status_after_fileobject:
+        assert json.load(status_after_fileobject) == {"iteration_id": 1, "state": "ITERATION_END", "task": None}
+
+    # Assert clustering file content is updated, with all managed texts (text "14" is deleted).
+    with open(tmp_path / "1n_CLUSTERING_PENDING" / "clustering.json", "r") as clustering_after_fileobject:
+        clustering_after = json.load(clustering_after_fileobject)
+    assert sorted(clustering_after["1"].keys()) == sorted(str(i) for i in range(24) if i != 14)
+
+    # Assert annotated constraints are respected.
+    constraints = storage_factory(project_directory=tmp_path / "1n_CLUSTERING_PENDING").get_constraints()
+    for constraint in constraints.values():
+        if constraint["is_hidden"] is False and constraint["constraint_type"] in {"MUST_LINK", "CANNOT_LINK"}:
+            assert (
+                clustering_after["1"][constraint["data"]["id_1"]] == clustering_after["1"][constraint["data"]["id_2"]]
+            ) == (constraint["constraint_type"] == "MUST_LINK")
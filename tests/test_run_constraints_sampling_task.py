@@ -15,6 +15,8 @@
 
 import json
 
+from cognitivefactory.interactive_clustering_gui.storage import neighbors_index
+from cognitivefactory.interactive_clustering_gui.storage.factory import storage_factory
 from tests.dummies_utils import create_dummy_projects
 
 # ==============================================================================
@@ -143,9 +145,8 @@ def test_ok_1(fake_backgroundtasks, tmp_path):
         }
 
     # Assert constraints file content is updated.
-    with open(tmp_path / "1b_SAMPLING_PENDING" / "constraints.json", "r") as constraints_after_fileobject:
-        constraints_results = json.load(constraints_after_fileobject)
-        assert sorted(constraints_results.keys()) == sorted(sampling_results["1"])
+    constraints_results = storage_factory(project_directory=tmp_path / "1b_SAMPLING_PENDING").get_constraints()
+    assert sorted(constraints_results.keys()) == sorted(sampling_results["1"])
 
 
 # ==============================================================================
@@ -206,9 +207,8 @@ def test_ok_2(fake_backgroundtasks, tmp_path):
         }
 
     # Assert constraints file content is updated.
-    with open(tmp_path / "2b_SAMPLING_PENDING" / "constraints.json", "r") as constraints_before_fileobject:
-        constraints_results_before = json.load(constraints_before_fileobject)
-        assert sorted(constraints_results_before.keys()) == sorted(sampling_results_before["1"])
+    constraints_results_before = storage_factory(project_directory=tmp_path / "2b_SAMPLING_PENDING").get_constraints()
+    assert sorted(constraints_results_before.keys()) == sorted(sampling_results_before["1"])
 
     # Run the task.
     fake_backgroundtasks.run_constraints_sampling_task(project_id="2b_SAMPLING_PENDING")
@@ -390,11 +390,10 @@ def test_ok_2(fake_backgroundtasks, tmp_path):
         }
 
     # Assert constraints file content is updated.
-    with open(tmp_path / "2b_SAMPLING_PENDING" / "constraints.json", "r") as constraints_after_fileobject:
-        constraints_results_after = json.load(constraints_after_fileobject)
-        assert sorted(constraints_results_after.keys()) == sorted(
-            set(sampling_results_after["1"] + sampling_results_after["2"])
-        )
+    constraints_results_after = storage_factory(project_directory=tmp_path / "2b_SAMPLING_PENDING").get_constraints()
+    assert sorted(constraints_results_after.keys()) == sorted(
+        set(sampling_results_after["1"] + sampling_results_after["2"])
+    )
 
 
 # ==============================================================================
@@ -453,9 +452,8 @@ def test_ok_3(fake_backgroundtasks, tmp_path):
         }
 
     # Assert constraints file content is updated.
-    with open(tmp_path / "2b2_SAMPLING_PENDING" / "constraints.json", "r") as constraints_before_fileobject:
-        constraints_results_before = json.load(constraints_before_fileobject)
-        assert sorted(constraints_results_before.keys()) == sorted(sampling_results_before["1"])
+    constraints_results_before = storage_factory(project_directory=tmp_path / "2b2_SAMPLING_PENDING").get_constraints()
+    assert sorted(constraints_results_before.keys()) == sorted(sampling_results_before["1"])
 
     # Run the task.
     fake_backgroundtasks.run_constraints_sampling_task(project_id="2b2_SAMPLING_PENDING")
@@ -780,8 +778,52 @@ def test_ok_3(fake_backgroundtasks, tmp_path):
         }
 
     # Assert constraints file content is updated.
-    with open(tmp_path / "2b2_SAMPLING_PENDING" / "constraints.json", "r") as constraints_after_fileobject:
-        constraints_results_after = json.load(constraints_after_fileobject)
-        assert sorted(constraints_results_after.keys()) == sorted(
-            set(sampling_results_after["1"] + sampling_results_after["2"])
-        )
+    constraints_results_after = storage_factory(project_directory=tmp_path / "2b2_SAMPLING_PENDING").get_constraints()
+    assert sorted(constraints_results_after.keys()) == sorted(
+        set(sampling_results_after["1"] + sampling_results_after["2"])
+    )
+
+
+# ==============================================================================
+# test_ok_with_neighbors_index
+# ==============================================================================
+
+
+def test_ok_with_neighbors_index(fake_backgroundtasks, tmp_path, monkeypatch):
+    """
+    Test the `constraints sampling` task works with the neighbors index of vectors (built when missing).
+
+    Args:
+        fake_backgroundtasks: Fixture providing a backgroundtasks module, declared in `conftest.py`.
+        tmp_path: Pytest fixture: points to a temporary directory.
+        monkeypatch: Pytest fixture to use the neighbors index on small projects.
+    """
+
+    # Create dummy projects.
+    create_dummy_projects(
+        tmp_path=tmp_path,
+        list_of_dummy_project_ids=[
+            "2b_SAMPLING_PENDING",
+        ],
+    )
+    monkeypatch.setattr(neighbors_index, "NEIGHBORS_INDEX_MIN_TEXTS", 1)
+
+    # Run the task.
+    fake_backgroundtasks.run_constraints_sampling_task(project_id="2b_SAMPLING_PENDING")
+
+    # Assert status is updated.
+    with open(tmp_path / "2b_SAMPLING_PENDING" / "status.json", "r") as status_after_fileobject:
+        assert json.load(status_after_fileobject) == {
+            "iteration_id": 2,
+            "state": "ANNOTATION_WITH_UPTODATE_MODELIZATION",
+            "task": None,
+        }
+
+    # Assert neighbors index is stored.
+    assert (tmp_path / "2b_SAMPLING_PENDING" / neighbors_index.NEIGHBORS_INDEX_NAME).exists()
+
+    # Assert sampling file content is updated with new pairs (all possible pairs, as in `test_ok_2`).
+    with open(tmp_path / "2b_SAMPLING_PENDING" / "sampling.json", "r") as sampling_after_fileobject:
+        sampling_results_after = json.load(sampling_after_fileobject)
+    assert len(sampling_results_after["2"]) == len(set(sampling_results_after["2"])) == 133
+    assert not set(sampling_results_after["1"]) & set(sampling_results_after["2"])
@@ -0,0 +1,205 @@
+# -*- coding: utf-8 -*-
+
+"""
+* Name:         interactive-clustering-gui/tests/test_run_projection_task.py
+* Description:  Unittests for the `run_projection_task` background task.
+* Author:       Erwan Schild
+* Created:      18/10/2026
+* Licence:      CeCILL (https://cecill.info/licences.fr.html)
+"""
+
+# ==============================================================================
+# IMPORT PYTHON DEPENDENCIES
+# ==============================================================================
+
+
+import json
+import os
+
+from tests.dummies_utils import create_dummy_projects
+
+# ==============================================================================
+# test_ko_not_found
+# ==============================================================================
+
+
+def test_ko_not_found(fake_backgroundtasks):
+    """
+    Test the `projection` task with project not existing.
+
+    Args:
+        fake_backgroundtasks: Fixture providing a backgroundtasks module, declared in `conftest.py`.
+    """
+
+    # Run the task.
+    fake_backgroundtasks.run_projection_task(project_id="UNKNOWN_PROJECT")
+
+
+# ==============================================================================
+# test_ko_without_modelization
+# ==============================================================================
+
+
+def test_ko_without_modelization(fake_backgroundtasks, tmp_path):
+    """
+    Test the `projection` task with project without modelization.
+
+    Args:
+        fake_backgroundtasks: Fixture providing a backgroundtasks module, declared in `conftest.py`.
+        tmp_path: Pytest fixture: points to a temporary directory.
+    """
+
+    # Create dummy projects.
+    create_dummy_projects(
+        tmp_path=tmp_path,
+        list_of_dummy_project_ids=[
+            "0a_INITIALIZATION_WITHOUT_MODELIZATION",
+        ],
+    )
+
+    # Run the task.
+    fake_backgroundtasks.run_projection_task(project_id="0a_INITIALIZATION_WITHOUT_MODELIZATION")
+
+    # Assert projections are not computed.
+    assert "vectors_2D.json" not in os.listdir(tmp_path / "0a_INITIALIZATION_WITHOUT_MODELIZATION")
+    assert "vectors_3D.json" not in os.listdir(tmp_path / "0a_INITIALIZATION_WITHOUT_MODELIZATION")
+
+
+# ==============================================================================
+# test_ok
+# ==============================================================================
+
+
+def test_ok(fake_backgroundtasks, tmp_path):
+    """
+    Test the `projection` task with good parameters.
+
+    Args:
+        fake_backgroundtasks: Fixture providing a backgroundtasks module, declared in `conftest.py`.
+        tmp_path: Pytest fixture: points to a temporary directory.
+    """
+
+    # Create dummy projects, and remove their projections.
+    create_dummy_projects(
+        tmp_path=tmp_path,
+        list_of_dummy_project_ids=[
+            "1l_ANNOTATION_WITH_UPTODATE_MODELIZATION",
+        ],
+    )
+    os.remove(tmp_path / "1l_ANNOTATION_WITH_UPTODATE_MODELIZATION" / "vectors_2D.json")
+    os.remove(tmp_path / "1l_ANNOTATION_WITH_UPTODATE_MODELIZATION" / "vectors_3D.json")
+
+    # Run the task.
+    fake_backgroundtasks.run_projection_task(project_id="1l_ANNOTATION_WITH_UPTODATE_MODELIZATION")
+
+    # Assert projections are computed, and the project state is unchanged.
+    with open(tmp_path / "1l_ANNOTATION_WITH_UPTODATE_MODELIZATION" / "vectors_2D.json", "r") as vectors_2D_fileobject:
+        vectors_2D = json.load(vectors_2D_fileobject)
+    with open(tmp_path / "1l_ANNOTATION_WITH_UPTODATE_MODELIZATION" / "vectors_3D.json", "r") as vectors_3D_fileobject:
+        vectors_3D = json.load(vectors_3D_fileobject)
+    assert len(vectors_2D) == len(vectors_3D) == 23
+    assert list(vectors_2D["0"].keys()) == ["x", "y"]
+    assert list(vectors_3D["0"].keys()) == ["x", "y", "z"]
+    assert fake_backgroundtasks.PROJECTION_STATUS_NAME not in os.listdir(
+        tmp_path / "1l_ANNOTATION_WITH_UPTODATE_MODELIZATION"
+    )
+    with open(tmp_path / "1l_ANNOTATION_WITH_UPTODATE_MODELIZATION" / "status.json", "r") as status_fileobject:
+        assert json.load(status_fileobject)["state"] == "ANNOTATION_WITH_UPTODATE_MODELIZATION"
+
+
+# ==============================================================================
+# test_ko_projection_error
+# ==============================================================================
+
+
+def test_ko_projection_error(fake_backgroundtasks, tmp_path, monkeypatch):
+    """
+    Test the `projection` task with a failing projection algorithm.
+
+    Args:
+        fake_backgroundtasks: Fixture providing a backgroundtasks module, declared in `conftest.py`.
+        tmp_path: Pytest fixture: points to a temporary directory.
+        monkeypatch: Pytest fixture: allows to monkeypatch objects.
+    """
+
+    # Create dummy projects, and remove their projections.
+    create_dummy_projects(
+        tmp_path=tmp_path,
+        list_of_dummy_project_ids=[
+            "1l_ANNOTATION_WITH_UPTODATE_MODELIZATION",
+        ],
+    )
+    os.remove(tmp_path / "1l_ANNOTATION_WITH_UPTODATE_MODELIZATION" / "vectors_2D.json")
+    os.remove(tmp_path / "1l_ANNOTATION_WITH_UPTODATE_MODELIZATION" / "vectors_3D.json")
+
+    # Make the projection algorithm fail.
+    def compute_failing_projections(**kwargs):
+        raise ValueError("perplexity must be less than n_samples")
+
+    monkeypatch.setattr(fake_backgroundtasks, "compute_projections", compute_failing_projections)
+
+    # Run the task.
+    fake_backgroundtasks.run_projection_task(project_id="1l_ANNOTATION_WITH_UPTODATE_MODELIZATION")
+
+    # Assert projections are not computed, and the failure is stored.
+    assert "vectors_2D.json" not in os.listdir(tmp_path / "1l_ANNOTATION_WITH_UPTODATE_MODELIZATION")
+    assert "vectors_3D.json" not in os.listdir(tmp_path / "1l_ANNOTATION_WITH_UPTODATE_MODELIZATION")
+    with open(
+        tmp_path / "1l_ANNOTATION_WITH_UPTODATE_MODELIZATION" / fake_backgroundtasks.PROJECTION_STATUS_NAME, "r"
+    ) as projection_status_fileobject:
+        assert json.load(projection_status_fileobject) == {
+            "progression": None,
+            "detail": "The projection of vectors failed.",
+            "error": "ValueError: perplexity must be less than n_samples",
+        }
+
+
+# ==============================================================================
+# test_ok_outdated_projections
+# ==============================================================================
+
+
+def test_ok_outdated_projections(fake_backgroundtasks, tmp_path, monkeypatch):
+    """
+    Test the `projection` task with vectors updated during the task.
+
+    Args:
+        fake_backgroundtasks: Fixture providing a backgroundtasks module, declared in `conftest.py`.
+        tmp_path: Pytest fixture: points to a temporary directory.
+        monkeypatch: Pytest fixture: allows to monkeypatch objects.
+    """
+
+    # Create dummy projects, and remove their projections.
+    create_dummy_projects(
+        tmp_path=tmp_path,
+        list_of_dummy_project_ids=[
+            "1l_ANNOTATION_WITH_UPTODATE_MODELIZATION",
+        ],
+    )
+    os.remove(tmp_path / "1l_ANNOTATION_WITH_UPTODATE_MODELIZATION" / "vectors_2D.json")
+    os.remove(tmp_path / "1l_ANNOTATION_WITH_UPTODATE_MODELIZATION" / "vectors_3D.json")
+
+    # Update vectors version while projections are stored.
+    update_projection_status = fake_backgroundtasks.update_projection_status
+    get_vectors_version = fake_backgroundtasks.get_vectors_version
+    storage_progressions = []
+
+    def update_projection_status_and_vectors(**kwargs):
+        storage_progressions.append(kwargs["task_progression"])
+        update_projection_status(**kwargs)
+
+    def get_updated_vectors_version(project_directory):
+        return get_vectors_version(project_directory=project_directory) + (1 if 90 in storage_progressions else 0)
+
+    monkeypatch.setattr(fake_backgroundtasks, "update_projection_status", update_projection_status_and_vectors)
+    monkeypatch.setattr(fake_backgroundtasks, "get_vectors_version", get_updated_vectors_version)
+
+    # Run the task.
+    fake_backgroundtasks.run_projection_task(project_id="1l_ANNOTATION_WITH_UPTODATE_MODELIZATION")
+
+    # Assert outdated projections are discarded.
+    assert 90 in storage_progressions
+    assert "vectors_2D.json" not in os.listdir(tmp_path / "1l_ANNOTATION_WITH_UPTODATE_MODELIZATION")
+    assert "vectors_3D.json" not in os.listdir(tmp_path / "1l_ANNOTATION_WITH_UPTODATE_MODELIZATION")
+    assert "vectors_2D.json.tmp" not in os.listdir(tmp_path / "1l_ANNOTATION_WITH_UPTODATE_MODELIZATION")
+    assert "vectors_3D.json.tmp" not in os.listdir(tmp_path / "1l_ANNOTATION_WITH_UPTODATE_MODELIZATION")
@@ -0,0 +1,192 @@
+# -*- coding: utf-8 -*-
+
+"""
+* Name:         interactive-clustering-gui/tests/test_sampling.py
+* Description:  Unittests for the `sampling` module.
+* Author:       Erwan Schild
+* Created:      18/10/2026
+* Licence:      CeCILL (https://cecill.info/licences.fr.html)
+"""
+
+# ==============================================================================
+# IMPORT PYTHON DEPENDENCIES
+# ==============================================================================
+
+import numpy as np
+import pytest
+from scipy.sparse import csr_matrix
+
+from cognitivefactory.interactive_clustering.constraints.binary import BinaryConstraintsManager
+from cognitivefactory.interactive_clustering.sampling.clusters_based import ClustersBasedConstraintsSampling
+from cognitivefactory.interactive_clustering_gui.sampling import NeighborsIndexConstraintsSampling
+from cognitivefactory.interactive_clustering_gui.storage.distances import Distances
+from cognitivefactory.interactive_clustering_gui.storage.neighbors_index import NeighborsIndex
+
+# ==============================================================================
+# test_sample
+# ==============================================================================
+
+
+@pytest.mark.parametrize(
+    "clusters_restriction,distance_restriction",
+    [
+        (None, "closest_neighbors"),
+        ("different_clusters", "closest_neighbors"),
+        ("same_cluster", "farthest_neighbors"),
+    ],
+)
+def test_sample(clusters_restriction, distance_restriction):
+    """
+    Test that sampling on candidates of a neighbors index respects restrictions and finds most pairs of the sampling over all pairs.
+
+    Args:
+        clusters_restriction: The clusters restriction of the sampler.
+        distance_restriction: The distance restriction of the sampler.
+    """
+    rng = np.random.default_rng(0)
+    array = np.concatenate([rng.normal(loc=center, size=(100, 10)) for center in (-3.0, 0.0, 3.0)])
+    list_of_data_IDs = [str(i) for i in range(300)]
+    dict_of_vectors = {data_ID: csr_matrix(array[i]) for i, data_ID in enumerate(list_of_data_IDs)}
+    clustering_result = {data_ID: (i // 100 + int(i % 10 == 0)) % 3 for i, data_ID in enumerate(list_of_data_IDs)}
+    constraints_manager = BinaryConstraintsManager(list_of_data_IDs=list_of_data_IDs)
+    for i in range(0, 40, 2):
+        constraints_manager.add_constraint(data_ID1=str(i), data_ID2=str(i + 1), constraint_type="MUST_LINK")
+    index = NeighborsIndex.build(list_of_data_IDs=list_of_data_IDs, matrix=csr_matrix(array))
+    sampler_kwargs = {
+        "random_seed": 1,
+        "clusters_restriction": clusters_restriction,
+        "distance_restriction": distance_restriction,
+    }
+
+    # Sample with and without the neighbors index.
+    expected_pairs = ClustersBasedConstraintsSampling(**sampler_kwargs).sample(
+        constraints_manager=constraints_manager,
+        nb_to_select=20,
+        clustering_result=clustering_result,
+        vectors=dict_of_vectors,
+    )
+    sampled_pairs = NeighborsIndexConstraintsSampling(**sampler_kwargs).sample(
+        constraints_manager=constraints_manager,
+        nb_to_select=20,
+        clustering_result=clustering_result,
+        vectors=dict_of_vectors,
+        neighbors_index=index,
+    )
+    assert len(sampled_pairs) == len(set(sampled_pairs)) == 20
+    assert len(set(sampled_pairs) & set(expected_pairs)) >= 15
+    for data_ID1, data_ID2 in sampled_pairs:
+        assert data_ID1 < data_ID2
+        assert constraints_manager.get_inferred_constraint(data_ID1=data_ID1, data_ID2=data_ID2) is None
+        if clusters_restriction == "same_cluster":
+            assert clustering_result[data_ID1] == clustering_result[data_ID2]
+        if clusters_restriction == "different_clusters":
+            assert clustering_result[data_ID1] != clustering_result[data_ID2]
+
+    # Without neighbors index: sampling over all pairs.
+    assert (
+        NeighborsIndexConstraintsSampling(**sampler_kwargs).sample(
+            constraints_manager=constraints_manager,
+            nb_to_select=20,
+            clustering_result=clustering_result,
+            vectors=dict_of_vectors,
+        )
+        == expected_pairs
+    )
+
+
+# ==============================================================================
+# test_sample_with_pairwise_distances
+# ==============================================================================
+
+
+@pytest.mark.parametrize(
+    "clusters_restriction,distance_restriction",
+    [
+        (None, "closest_neighbors"),
+        ("different_clusters", "closest_neighbors"),
+        ("same_cluster", "farthest_neighbors"),
+        (None, "farthest_neighbors"),
+    ],
+)
+def test_sample_with_pairwise_distances(clusters_restriction, distance_restriction):
+    """
+    Test that sampling on stored pairwise distances gives the same results as the sampling over all pairs (even with equal distances).
+
+    Args:
+        clusters_restriction: The clusters restriction of the sampler.
+        distance_restriction: The distance restriction of the sampler.
+    """
+    rng = np.random.default_rng(0)
+    array = rng.integers(0, 3, size=(40, 3)).astype(float)  # Duplicated vectors give equal distances.
+    list_of_data_IDs = [str(i) for i in range(40)]
+    dict_of_vectors = {data_ID: csr_matrix(array[i]) for i, data_ID in enumerate(list_of_data_IDs)}
+    clustering_result = {data_ID: i % 4 for i, data_ID in enumerate(list_of_data_IDs)}
+    constraints_manager = BinaryConstraintsManager(list_of_data_IDs=list_of_data_IDs[::-1][:35])
+    constraints_manager.add_constraint(data_ID1="5", data_ID2="9", constraint_type="MUST_LINK")
+    constraints_manager.add_constraint(data_ID1="6", data_ID2="7", constraint_type="CANNOT_LINK")
+    distances = Distances.build(list_of_data_IDs=list_of_data_IDs, matrix=csr_matrix(array))
+    sampler_kwargs = {
+        "random_seed": 1,
+        "clusters_restriction": clusters_restriction,
+        "distance_restriction": distance_restriction,
+    }
+
+    # Sample with and without stored distances.
+    for nb_to_select in (30, 9999):
+        assert NeighborsIndexConstraintsSampling(**sampler_kwargs).sample(
+            constraints_manager=constraints_manager,
+            nb_to_select=nb_to_select,
+            clustering_result=clustering_result,
+            vectors=dict_of_vectors,
+            distances=distances,
+        ) == ClustersBasedConstraintsSampling(**sampler_kwargs).sample(
+            constraints_manager=constraints_manager,
+            nb_to_select=nb_to_select,
+            clustering_result=clustering_result,
+            vectors=dict_of_vectors,
+        )
+
+
+# ==============================================================================
+# test_sample_with_not_enough_candidates
+# ==============================================================================
+
+
+@pytest.mark.parametrize(
+    "distance_restriction",
+    [
+        "closest_neighbors",
+        "farthest_neighbors",
+    ],
+)
+def test_sample_with_not_enough_candidates(monkeypatch, distance_restriction):
+    """
+    Test that sampling on candidates of a neighbors index returns the pairs found if candidates don't give enough pairs (without sampling over all pairs).
+
+    Args:
+        monkeypatch: Fixture to modify objects during the test.
+        distance_restriction: The distance restriction of the sampler.
+    """
+    rng = np.random.default_rng(0)
+    array = rng.normal(size=(300, 10))
+    list_of_data_IDs = [str(i) for i in range(300)]
+    dict_of_vectors = {data_ID: csr_matrix(array[i]) for i, data_ID in enumerate(list_of_data_IDs)}
+    constraints_manager = BinaryConstraintsManager(list_of_data_IDs=list_of_data_IDs)
+    index = NeighborsIndex.build(list_of_data_IDs=list_of_data_IDs, matrix=csr_matrix(array))
+
+    # Forbid the sampling over all pairs.
+    def sample_over_all_pairs(*args, **kwargs):
+        raise AssertionError("The sampling over all pairs mustn't be applied.")
+
+    monkeypatch.setattr(ClustersBasedConstraintsSampling, "sample", sample_over_all_pairs)
+
+    # Sample more pairs than candidates.
+    sampled_pairs = NeighborsIndexConstraintsSampling(random_seed=1, distance_restriction=distance_restriction,).sample(
+        constraints_manager=constraints_manager,
+        nb_to_select=len(list_of_data_IDs) ** 2,
+        vectors=dict_of_vectors,
+        neighbors_index=index,
+    )
+    assert 0 < len(sampled_pairs) == len(set(sampled_pairs)) < len(list_of_data_IDs) * (len(list_of_data_IDs) - 1) // 2
+    for data_ID1, data_ID2 in sampled_pairs:
+        assert data_ID1 < data_ID2
@@ -0,0 +1,408 @@
+# -*- coding: utf-8 -*-
+
+"""
+* Name:         interactive-clustering-gui/tests/test_utils_storage.py
+* Description:  Unittests for `storage` module (SQLite and JSON files project storages, factory and migration).
+* Author:       Erwan Schild
+* Created:      18/10/2026
+* Licence:      CeCILL (https://cecill.info/licences.fr.html)
+"""
+
+# ==============================================================================
+# IMPORT PYTHON DEPENDENCIES
+# ==============================================================================
+
+import json
+import os
+import sqlite3
+
+import pytest
+
+from cognitivefactory.interactive_clustering_gui.cli import main
+from cognitivefactory.interactive_clustering_gui.storage.factory import (
+    migrate_all_projects_storage,
+    migrate_project_storage,
+    storage_factory,
+)
+from cognitivefactory.interactive_clustering_gui.storage.jsonfiles import JsonFilesProjectStorage
+from cognitivefactory.interactive_clustering_gui.storage.sqlite import (
+    SQLITE_SCHEMA,
+    SQLITE_SCHEMA_VERSION,
+    SqliteProjectStorage,
+)
+from tests.dummies_utils import create_dummy_projects
+
+# ==============================================================================
+# test_storage_factory
+# ==============================================================================
+
+
+def test_storage_factory(tmp_path):
+    """
+    Test the project storage factory.
+
+    Args:
+        tmp_path: Pytest fixture providing a temporary directory.
+    """
+
+    # Check implemented backends.
+    assert isinstance(storage_factory(project_directory=tmp_path, backend="sqlite"), SqliteProjectStorage)
+    assert isinstance(storage_factory(project_directory=tmp_path, backend="jsonfiles"), JsonFilesProjectStorage)
+
+    # Check unknown backend.
+    with pytest.raises(ValueError, match="The `backend` 'UNKNOWN' is not implemented."):
+        storage_factory(project_directory=tmp_path, backend="UNKNOWN")
+
+
+# ==============================================================================
+# test_storage_operations
+# ==============================================================================
+
+
+@pytest.mark.parametrize("backend", ["sqlite", "jsonfiles"])
+def test_storage_operations(tmp_path, backend):
+    """
+    Test reads and row-level updates of texts and constraints, for all project storages.
+
+    Args:
+        tmp_path: Pytest fixture providing a temporary directory.
+        backend: The storage backend to test.
+    """
+
+    # Initialize the storage.
+    project_storage = storage_factory(project_directory=tmp_path, backend=backend)
+    project_storage.set_texts(
+        texts={
+            str(i): {"text_original": text, "text": text, "text_preprocessed": text, "is_deleted": False}
+            for i, text in enumerate(["b", "a", "c"])
+        }
+    )
+    project_storage.set_constraints(constraints={})
+
+    # Check texts reads (insertion order is kept).
+    assert list(project_storage.get_texts().keys()) == ["0", "1", "2"]
+    assert list(project_storage.get_texts(text_ids=["2", "0", "UNKNOWN"]).keys()) == ["0", "2"]
+    assert project_storage.get_text(text_id="1") == {
+        "text_original": "a",
+        "text": "a",
+        "text_preprocessed": "a",
+        "is_deleted": False,
+    }
+    assert project_storage.get_text(text_id="UNKNOWN") is None
+
+    # Check texts updates.
+    project_storage.update_texts(texts_updates={"1": {"text": "renamed", "is_deleted": True}})
+    assert project_storage.get_text(text_id="1") == {
+        "text_original": "a",
+        "text": "renamed",
+        "text_preprocessed": "a",
+        "is_deleted": True,
+    }
+
+    # Check constraints additions.
+    constraint: dict = {
+        "data": {"id_1": "0", "id_2": "1"},
+        "constraint_type": None,
+        "constraint_type_previous": [],
+        "is_hidden": False,
+        "to_annotate": True,
+        "to_review": False,
+        "to_fix_conflict": False,
+        "comment": "",
+        "date_of_update": None,
+        "iteration_of_sampling": 1,
+    }
+    project_storage.add_constraints(
+        constraints={
+            "(0,1)": constraint,
+            "(1,2)": {**constraint, "data": {"id_1": "1", "id_2": "2"}},
+        }
+    )
+    project_storage.add_constraints(
+        constraints={
+            "(0,2)": {**constraint, "data": {"id_1": "0", "id_2": "2"}},
+            "(0,1)": {**constraint, "to_annotate": False},
+        }
+    )
+    assert list(project_storage.get_constraints().keys()) == ["(0,1)", "(1,2)", "(0,2)"]
+    assert project_storage.get_constraint(constraint_id="(0,1)") == {**constraint, "to_annotate": False}
+    assert project_storage.get_constraint(constraint_id="UNKNOWN") is None
+
+    # Check constraints lookup by texts.
+    assert list(project_storage.get_constraints_of_texts(text_ids=["2"]).keys()) == ["(1,2)", "(0,2)"]
+    assert list(project_storage.get_constraints_of_texts(text_ids=["UNKNOWN"]).keys()) == []
+    with project_storage.transaction():
+        assert list(project_storage.get_constraints_of_texts(text_ids=["2", "0"]).keys()) == ["(0,1)", "(1,2)", "(0,2)"]
+        assert list(project_storage.get_constraints_of_texts(text_ids=["1"]).keys()) == ["(0,1)", "(1,2)"]
+
+    # Check constraints updates.
+    project_storage.update_constraints(
+        constraints_updates={
+            "(1,2)": {
+                "constraint_type": "MUST_LINK",
+                "constraint_type_previous": [None],
+                "comment": "ok",
+                "date_of_update": 1.5,
+            },
+        }
+    )
+    assert project_storage.get_constraint(constraint_id="(1,2)") == {
+        **constraint,
+        "data": {"id_1": "1", "id_2": "2"},
+        "constraint_type": "MUST_LINK",
+        "constraint_type_previous": [None],
+        "comment": "ok",
+        "date_of_update": 1.5,
+    }
+
+    # Check transaction commit.
+    with project_storage.transaction():
+        project_storage.update_texts(texts_updates={"0": {"is_deleted": True}})
+        project_storage.update_constraints(constraints_updates={"(0,1)": {"is_hidden": True}})
+    assert project_storage.get_text(text_id="0")["is_deleted"] is True
+    assert project_storage.get_constraint(constraint_id="(0,1)")["is_hidden"] is True
+
+    # Check transaction rollback.
+    with pytest.raises(KeyError):
+        with project_storage.transaction():
+            project_storage.update_texts(texts_updates={"0": {"is_deleted": False}})
+            raise KeyError("rollback")
+    assert project_storage.get_text(text_id="0")["is_deleted"] is True
+
+
+# ==============================================================================
+# test_storage_query_texts
+# ==============================================================================
+
+
+@pytest.mark.parametrize("backend", ["sqlite", "jsonfiles"])
+def test_storage_query_texts(tmp_path, backend):
+    """
+    Test filtered, sorted and paginated reads of texts, for all project storages.
+
+    Args:
+        tmp_path: Pytest fixture providing a temporary directory.
+        backend: The storage backend to test.
+    """
+
+    # Initialize the storage.
+    project_storage = storage_factory(project_directory=tmp_path, backend=backend)
+    project_storage.set_texts(
+        texts={
+            str(i): {"text_original": text, "text": text, "text_preprocessed": text.lower(), "is_deleted": (i == 1)}
+            for i, text in enumerate(["Été", "b", "A", "b", "élan"])
+        }
+    )
+
+    # Check sort with equal values (insertion order is kept, even when reversed), and fields selection.
+    texts, positions, total = project_storage.query_texts(sorted_by="alphabetical", sorted_reverse=True)
+    assert list(texts.keys()) == ["0", "4", "1", "3", "2"]
+    assert total == 5
+    texts, positions, total = project_storage.query_texts(sorted_by="is_deleted", fields=["is_deleted"])
+    assert texts == {
+        "0": {"is_deleted": False},
+        "2": {"is_deleted": False},
+        "3": {"is_deleted": False},
+        "4": {"is_deleted": False},
+        "1": {"is_deleted": True},
+    }
+
+    # Check filters (case insensitive, including non-ASCII characters).
+    texts, positions, total = project_storage.query_texts(filter_text="ÉT")
+    assert list(texts.keys()) == ["0"]
+    texts, positions, total = project_storage.query_texts(without_deleted_texts=True, filter_text="B")
+    assert list(texts.keys()) == ["3"]
+    assert total == 1
+
+    # Check pagination with offset, limit and position.
+    texts, positions, total = project_storage.query_texts(sorted_by="is_deleted", sorted_reverse=True, limit=2)
+    assert list(texts.keys()) == ["1", "0"]
+    assert total == 5
+    texts, positions, total = project_storage.query_texts(
+        sorted_by="is_deleted", sorted_reverse=True, after_position=positions[-1], offset=1, limit=2
+    )
+    assert list(texts.keys()) == ["3", "4"]
+    assert total == 5
+
+
+# ==============================================================================
+# test_storage_query_constraints
+# ==============================================================================
+
+
+@pytest.mark.parametrize("backend", ["sqlite", "jsonfiles"])
+def test_storage_query_constraints(tmp_path, backend):
+    """
+    Test filtered, sorted and paginated reads of constraints, for all project storages.
+
+    Args:
+        tmp_path: Pytest fixture providing a temporary directory.
+        backend: The storage backend to test.
+    """
+
+    # Initialize the storage.
+    project_storage = storage_factory(project_directory=tmp_path, backend=backend)
+    project_storage.set_texts(
+        texts={
+            str(i): {"text_original": text, "text": text, "text_preprocessed": text, "is_deleted": False}
+            for i, text in enumerate(["b", "a", "c"])
+        }
+    )
+    constraint: dict = {
+        "data": {"id_1": "0", "id_2": "1"},
+        "constraint_type": None,
+        "constraint_type_previous": [],
+        "is_hidden": False,
+        "to_annotate": True,
+        "to_review": False,
+        "to_fix_conflict": False,
+        "comment": "",
+        "date_of_update": None,
+        "iteration_of_sampling": 1,
+    }
+    project_storage.set_constraints(
+        constraints={
+            "(0,1)": constraint,
+            "(0,2)": {**constraint, "data": {"id_1": "0", "id_2": "2"}, "constraint_type": "MUST_LINK"},
+            "(1,2)": {**constraint, "data": {"id_1": "1", "id_2": "2"}, "constraint_type": "CANNOT_LINK"},
+        }
+    )
+
+    # Check sorts (by texts, updated when texts are renamed).
+    constraints, positions, total = project_storage.query_constraints(sorted_by="text")
+    assert list(constraints.keys()) == ["(1,2)", "(0,1)", "(0,2)"]
+    assert positions[0][0] == ["a", "c"]
+    assert total == 3
+    project_storage.update_texts(texts_updates={"1": {"text": "z"}})
+    constraints, positions, total = project_storage.query_constraints(sorted_by="text")
+    assert list(constraints.keys()) == ["(0,2)", "(0,1)", "(1,2)"]
+    constraints, positions, total = project_storage.query_constraints(sorted_by="constraint_type", sorted_reverse=True)
+    assert list(constraints.keys()) == ["(0,1)", "(1,2)", "(0,2)"]
+
+    # Check filters.
+    project_storage.update_constraints(constraints_updates={"(0,2)": {"to_annotate": False, "is_hidden": True}})
+    constraints, positions, total = project_storage.query_constraints(to_annotate=True, constraint_types=[None])
+    assert list(constraints.keys()) == ["(0,1)"]
+    constraints, positions, total = project_storage.query_constraints(without_hidden_constraints=True)
+    assert list(constraints.keys()) == ["(0,1)", "(1,2)"]
+    constraints, positions, total = project_storage.query_constraints(iteration_of_sampling=2)
+    assert (constraints, total) == ({}, 0)
+
+    # Check pagination with position.
+    constraints, positions, total = project_storage.query_constraints(sorted_by="to_annotate", limit=1)
+    assert list(constraints.keys()) == ["(0,1)"]
+    constraints, positions, total = project_storage.query_constraints(
+        sorted_by="to_annotate", after_position=positions[-1], limit=1
+    )
+    assert list(constraints.keys()) == ["(1,2)"]
+    assert total == 3
+
+
+# ==============================================================================
+# test_sqlite_schema_migration
+# ==============================================================================
+
+
+def test_sqlite_schema_migration(tmp_path):
+    """
+    Test the migration of a SQLite database created without texts of constraints.
+
+    Args:
+        tmp_path: Pytest fixture providing a temporary directory.
+    """
+
+    # Create a database with the first version of the schema.
+    connection = sqlite3.connect(str(tmp_path / "project.db"))
+    connection.executescript(SQLITE_SCHEMA)
+    connection.execute("INSERT INTO texts VALUES ('0', 'a', 'a', 'a', 0), ('1', 'b', 'b', 'b', 0)")
+    connection.execute("INSERT INTO constraints VALUES ('(0,1)', '0', '1', 'MUST_LINK', '[]', 0, 0, 0, 0, '', NULL, 1)")
+    connection.commit()
+    connection.close()
+
+    # Check the migration.
+    project_storage = SqliteProjectStorage(project_directory=tmp_path)
+    constraints, positions, total = project_storage.query_constraints(sorted_by="text")
+    assert list(constraints.keys()) == ["(0,1)"]
+    assert positions == [(["a", "b"], 1)]
+    connection = sqlite3.connect(str(tmp_path / "project.db"))
+    assert connection.execute("PRAGMA user_version").fetchone()[0] == SQLITE_SCHEMA_VERSION
+    connection.close()
+
+
+# ==============================================================================
+# test_migrate_project_storage
+# ==============================================================================
+
+
+def test_migrate_project_storage(tmp_path):
+    """
+    Test the in place migration of a legacy project into a SQLite database.
+
+    Args:
+        tmp_path: Pytest fixture providing a temporary directory.
+    """
+
+    # Create a legacy project.
+    create_dummy_projects(
+        tmp_path=tmp_path,
+        list_of_dummy_project_ids=[
+            "1d_ANNOTATION_WITH_UPTODATE_MODELIZATION",
+        ],
+    )
+    project_directory = tmp_path / "1d_ANNOTATION_WITH_UPTODATE_MODELIZATION"
+    with open(project_directory / "texts.json", "r") as texts_fileobject:
+        texts = json.load(texts_fileobject)
+    with open(project_directory / "constraints.json", "r") as constraints_fileobject:
+        constraints = json.load(constraints_fileobject)
+
+    # Migrate the project.
+    assert migrate_project_storage(project_directory=project_directory) is True
+    assert "texts.json" not in os.listdir(project_directory)
+    assert "constraints.json" not in os.listdir(project_directory)
+    assert "project.db" in os.listdir(project_directory)
+
+    # Check migrated data.
+    project_storage = storage_factory(project_directory=project_directory, backend="sqlite")
+    assert project_storage.get_texts() == texts
+    assert list(project_storage.get_texts().keys()) == list(texts.keys())
+    assert project_storage.get_constraints() == constraints
+    assert list(project_storage.get_constraints().keys()) == list(constraints.keys())
+
+    # Check that a migrated project is not migrated again.
+    assert migrate_project_storage(project_directory=project_directory) is False
+
+
+# ==============================================================================
+# test_cli_migrate_storage
+# ==============================================================================
+
+
+def test_cli_migrate_storage(tmp_path, monkeypatch, capsys):
+    """
+    Test the CLI migration of all legacy projects of `DATA_DIRECTORY`.
+
+    Args:
+        tmp_path: Pytest fixture providing a temporary directory.
+        monkeypatch: Pytest fixture to set environment variables.
+        capsys: Pytest fixture to capture output.
+    """
+
+    # Create legacy projects.
+    create_dummy_projects(
+        tmp_path=tmp_path,
+        list_of_dummy_project_ids=[
+            "0a_INITIALIZATION_WITHOUT_MODELIZATION",
+            "1b_SAMPLING_PENDING",
+        ],
+    )
+
+    # Migrate projects with the CLI.
+    monkeypatch.setenv("DATA_DIRECTORY", str(tmp_path))
+    assert main(["--migrate-storage"]) == 0
+    captured = capsys.readouterr()
+    assert "2 project(s) migrated" in captured.out
+    assert "project.db" in os.listdir(tmp_path / "0a_INITIALIZATION_WITHOUT_MODELIZATION")
+    assert "project.db" in os.listdir(tmp_path / "1b_SAMPLING_PENDING")
+
+    # Check that migrated projects are not migrated again.
+    assert migrate_all_projects_storage(data_directory=tmp_path) == 0
@@ -0,0 +1,123 @@
+# -*- coding: utf-8 -*-
+
+"""
+* Name:         interactive-clustering-gui/tests/test_utils_storage_artifacts_cache.py
+* Description:  Unittests for `storage.artifacts_cache` module (LRU cache of parsed project artifacts).
+* Author:       Erwan Schild
+* Created:      18/10/2026
+* Licence:      CeCILL (https://cecill.info/licences.fr.html)
+"""
+
+# ==============================================================================
+# IMPORT PYTHON DEPENDENCIES
+# ==============================================================================
+
+import json
+import os
+
+from cognitivefactory.interactive_clustering_gui.storage.artifacts_cache import ArtifactsCache
+
+# ==============================================================================
+# test_load_and_store_json
+# ==============================================================================
+
+
+def test_load_and_store_json(tmp_path):
+    """
+    Test that loaded files are cached, that stored files are cached without being parsed again, and that mutable copies don't alter the cache.
+
+    Args:
+        tmp_path: Pytest fixture providing a temporary directory.
+    """
+
+    # Create a file.
+    cache = ArtifactsCache(max_size=1024)
+    with open(tmp_path / "status.json", "w") as status_fileobject:
+        json.dump({"state": "SAMPLING_TODO"}, status_fileobject)
+
+    # Load the file twice: the second load is a hit.
+    assert cache.load_json(tmp_path / "status.json") == {"state": "SAMPLING_TODO"}
+    assert cache.load_json(tmp_path / "status.json") is cache.load_json(tmp_path / "status.json")
+    assert cache.get_statistics()["misses"] == 1
+    assert cache.get_statistics()["hits"] == 2
+
+    # Modify a mutable copy: the cache is unchanged.
+    status = cache.load_json(tmp_path / "status.json", mutable=True)
+    status["state"] = "SAMPLING_PENDING"
+    assert cache.load_json(tmp_path / "status.json") == {"state": "SAMPLING_TODO"}
+
+    # Store the file: the stored content is cached as it would be loaded.
+    cache.store_json(tmp_path / "status.json", {"state": "SAMPLING_PENDING", "task": (1, 2)})
+    assert cache.load_json(tmp_path / "status.json") == {"state": "SAMPLING_PENDING", "task": [1, 2]}
+    assert cache.get_statistics()["misses"] == 1
+    assert os.listdir(tmp_path) == ["status.json"]
+
+
+# ==============================================================================
+# test_external_modification
+# ==============================================================================
+
+
+def test_external_modification(tmp_path):
+    """
+    Test that a file modified by another writer is parsed again, even with the same size in the same clock tick.
+
+    Args:
+        tmp_path: Pytest fixture providing a temporary directory.
+    """
+
+    # Store a file.
+    cache = ArtifactsCache(max_size=1024)
+    cache.store_json(tmp_path / "status.json", {"state": "CLUSTERING_PENDING"})
+    stored_stat = os.stat(tmp_path / "status.json")
+
+    # Modify the file in place, with the same size and the same modification time.
+    with open(tmp_path / "status.json", "w") as status_fileobject:
+        json.dump({"state": "CLUSTERING_WORKING"}, status_fileobject, indent=4)
+    os.utime(tmp_path / "status.json", ns=(stored_stat.st_atime_ns, stored_stat.st_mtime_ns))
+    assert os.stat(tmp_path / "status.json").st_size == stored_stat.st_size
+
+    # Load the file: the modification is detected.
+    assert cache.load_json(tmp_path / "status.json") == {"state": "CLUSTERING_WORKING"}
+
+    # Modify the file again: its new version is detected.
+    with open(tmp_path / "status.json", "w") as status_fileobject:
+        json.dump({"state": "ITERATION_END"}, status_fileobject)
+    assert cache.load_json(tmp_path / "status.json") == {"state": "ITERATION_END"}
+
+
+# ==============================================================================
+# test_memory_budget
+# ==============================================================================
+
+
+def test_memory_budget(tmp_path):
+    """
+    Test that least recently used files are evicted to respect the memory budget, and that a directory can be invalidated.
+
+    Args:
+        tmp_path: Pytest fixture providing a temporary directory.
+    """
+
+    # Store files of 40 bytes in a cache of 100 bytes.
+    cache = ArtifactsCache(max_size=100)
+    for file_name in ("a.json", "b.json", "c.json"):
+        cache.store_json(tmp_path / file_name, {"content": "x" * 19})
+        assert os.stat(tmp_path / file_name).st_size == 40
+    assert cache.get_statistics()["entries"] == 2
+    assert cache.get_statistics()["size"] == 80
+
+    # The least recently used file has been evicted.
+    cache.load_json(tmp_path / "a.json")
+    assert cache.get_statistics()["misses"] == 1
+    cache.load_json(tmp_path / "c.json")
+    assert cache.get_statistics()["hits"] == 1
+
+    # Files larger than the memory budget are never cached.
+    cache.store_json(tmp_path / "large.json", {"content": "x" * 200})
+    assert cache.get_statistics()["entries"] == 2
+
+    # Invalidate the directory.
+    cache.invalidate(directory_path=tmp_path)
+    assert cache.get_statistics()["entries"] == 0
+    assert cache.get_statistics()["size"] == 0
@@ -0,0 +1,150 @@
+# -*- coding: utf-8 -*-
+
+"""
+* Name:         interactive-clustering-gui/tests/test_utils_storage_constraints_journal.py
+* Description:  Unittests for `storage.constraints_journal` module (incremental update of the constraints manager).
+* Author:       Erwan Schild
+* Created:      18/10/2026
+* Licence:      CeCILL (https://cecill.info/licences.fr.html)
+"""
+
+# ==============================================================================
+# IMPORT PYTHON DEPENDENCIES
+# ==============================================================================
+
+from typing import Any, Dict, List, Optional
+
+from cognitivefactory.interactive_clustering_gui.storage import constraints_journal
+
+# ==============================================================================
+# UTILS
+# ==============================================================================
+
+
+def create_constraint(id_1: str, id_2: str, constraint_type: Optional[str]) -> Dict[str, Any]:
+    """
+    Create a constraint as stored in a project.
+
+    Args:
+        id_1 (str): The first text ID.
+        id_2 (str): The second text ID.
+        constraint_type (Optional[str]): The type of the constraint.
+
+    Returns:
+        Dict[str, Any]: The constraint.
+    """
+    return {
+        "data": {"id_1": id_1, "id_2": id_2},
+        "constraint_type": constraint_type,
+        "constraint_type_previous": [],
+        "is_hidden": False,
+        "to_annotate": False,
+        "to_review": False,
+        "to_fix_conflict": False,
+        "comment": "",
+        "date_of_update": None,
+        "iteration_of_sampling": 1,
+    }
+
+
+def assert_same_inference(list_of_data_IDs: List[str], manager_1, manager_2) -> None:
+    """
+    Check that two constraints managers infer the same constraints and components.
+
+    Args:
+        list_of_data_IDs (List[str]): The IDs of managed texts.
+        manager_1: The first constraints manager.
+        manager_2: The second constraints manager.
+    """
+    for data_ID1 in list_of_data_IDs:
+        for data_ID2 in list_of_data_IDs:
+            assert manager_1.get_inferred_constraint(data_ID1, data_ID2) == manager_2.get_inferred_constraint(
+                data_ID1, data_ID2
+            )
+    assert sorted(sorted(component) for component in manager_1.get_connected_components()) == sorted(
+        sorted(component) for component in manager_2.get_connected_components()
+    )
+
+
+# ==============================================================================
+# test_update_constraints_manager
+# ==============================================================================
+
+
+def test_update_constraints_manager(tmp_path, monkeypatch):
+    """
+    Test that the constraints manager is updated incrementally on additions, and rebuilt on retractions.
+
+    Args:
+        tmp_path: Pytest fixture providing a temporary directory.
+        monkeypatch: Pytest fixture to count full rebuilds.
+    """
+
+    # Count full rebuilds.
+    rebuilds: List[int] = []
+    rebuild_constraints_manager = constraints_journal.rebuild_constraints_manager
+
+    def counted_rebuild_constraints_manager(**kwargs):
+        rebuilds.append(1)
+        return rebuild_constraints_manager(**kwargs)
+
+    monkeypatch.setattr(constraints_journal, "rebuild_constraints_manager", counted_rebuild_constraints_manager)
+
+    # First update: full rebuild.
+    list_of_data_IDs: List[str] = ["0", "1", "2", "3", "4", "5"]
+    constraints: Dict[str, Dict[str, Any]] = {
+        "(0,1)": create_constraint("0", "1", "MUST_LINK"),
+        "(1,2)": create_constraint("1", "2", "CANNOT_LINK"),
+        "(3,4)": create_constraint("3", "4", None),
+    }
+    _, conflicts = constraints_journal.update_constraints_manager(
+        project_directory=tmp_path, list_of_data_IDs=list_of_data_IDs, constraints=constraints
+    )
+    assert conflicts == []
+    assert len(rebuilds) == 1
+
+    # Annotation of new constraints: incremental update, with the same inference as a full rebuild.
+    constraints["(3,4)"]["constraint_type"] = "MUST_LINK"
+    constraints["(4,0)"] = create_constraint("4", "0", "CANNOT_LINK")
+    manager, conflicts = constraints_journal.update_constraints_manager(
+        project_directory=tmp_path, list_of_data_IDs=list_of_data_IDs, constraints=constraints
+    )
+    assert conflicts == []
+    assert len(rebuilds) == 1
+    assert_same_inference(
+        list_of_data_IDs,
+        manager,
+        rebuild_constraints_manager(list_of_data_IDs=list_of_data_IDs, constraints=constraints)[0],
+    )
+
+    # Annotation of a conflicting constraint: full rebuild.
+    constraints["(0,2)"] = create_constraint("0", "2", "MUST_LINK")
+    _, conflicts = constraints_journal.update_constraints_manager(
+        project_directory=tmp_path, list_of_data_IDs=list_of_data_IDs, constraints=constraints
+    )
+    assert conflicts == ["(0,2)"]
+    assert len(rebuilds) == 2
+
+    # No change: incremental update that keeps previous conflicts.
+    _, conflicts = constraints_journal.update_constraints_manager(
+        project_directory=tmp_path, list_of_data_IDs=list_of_data_IDs, constraints=constraints
+    )
+    assert conflicts == ["(0,2)"]
+    assert len(rebuilds) == 2
+
+    # Retraction of a constraint: full rebuild.
+    constraints["(1,2)"]["constraint_type"] = None
+    _, conflicts = constraints_journal.update_constraints_manager(
+        project_directory=tmp_path, list_of_data_IDs=list_of_data_IDs, constraints=constraints
+    )
+    assert conflicts == []
+    assert len(rebuilds) == 3
+
+    # Deletion of a text: full rebuild.
+    constraints["(3,4)"]["is_hidden"] = True
+    constraints["(4,0)"]["is_hidden"] = True
+    manager, _ = constraints_journal.update_constraints_manager(
+        project_directory=tmp_path, list_of_data_IDs=["0", "1", "2", "3", "5"], constraints=constraints
+    )
+    assert len(rebuilds) == 4
+    assert manager.get_list_of_managed_data_IDs() == ["0", "1", "2", "3", "5"]
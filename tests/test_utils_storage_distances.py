@@ -0,0 +1,164 @@
+# -*- coding: utf-8 -*-
+
+"""
+* Name:         interactive-clustering-gui/tests/test_utils_storage_distances.py
+* Description:  Unittests for `storage.distances` module (distances between texts vectors, shared by sampling and clustering).
+* Author:       Erwan Schild
+* Created:      18/10/2026
+* Licence:      CeCILL (https://cecill.info/licences.fr.html)
+"""
+
+# ==============================================================================
+# IMPORT PYTHON DEPENDENCIES
+# ==============================================================================
+
+import os
+
+import numpy as np
+from scipy.sparse import csr_matrix, vstack
+from sklearn.metrics import pairwise_distances, pairwise_kernels
+
+from cognitivefactory.interactive_clustering_gui.storage import distances, neighbors_index, vectors
+
+# ==============================================================================
+# test_pairwise_distances
+# ==============================================================================
+
+
+def test_pairwise_distances():
+    """
+    Test that stored pairwise distances give the same distances and RBF kernel as `sklearn`, for any subset and order of texts.
+    """
+    rng = np.random.default_rng(0)
+    dict_of_vectors = {str(i): csr_matrix(rng.normal(size=(1, 8))) for i in range(30)}
+    list_of_data_IDs = list(dict_of_vectors.keys())
+    pairwise = distances.Distances.build(list_of_data_IDs=list_of_data_IDs, matrix=vstack(dict_of_vectors.values()))
+    assert pairwise.knn_graph is None
+
+    # Distances of a subset of texts, in another order.
+    list_of_managed_data_IDs = sorted(list_of_data_IDs[2:])
+    managed_matrix = vstack([dict_of_vectors[data_ID] for data_ID in list_of_managed_data_IDs])
+    assert np.array_equal(
+        pairwise.get_euclidean_distances(list_of_data_IDs=list_of_managed_data_IDs),
+        pairwise_distances(X=managed_matrix, metric="euclidean"),
+    )
+    assert np.array_equal(
+        pairwise.get_rbf_kernel(list_of_data_IDs=list_of_managed_data_IDs, gamma=1.0 / 8),
+        pairwise_kernels(X=managed_matrix, metric="rbf"),
+    )
+
+    # All pairs, or pairs in the same group.
+    rows_1, rows_2, pairs_distances = pairwise.get_closest_candidates()
+    assert len(rows_1) == 30 * 29 / 2
+    assert np.allclose(pairs_distances, pairwise_distances(X=vstack(dict_of_vectors.values()))[rows_1, rows_2])
+    groups = np.arange(30) % 3
+    rows_1, rows_2, _ = pairwise.get_all_pairs(groups=groups)
+    assert len(rows_1) == 3 * 10 * 9 / 2
+    assert np.all(groups[rows_1] == groups[rows_2])
+
+
+# ==============================================================================
+# test_knn_graph
+# ==============================================================================
+
+
+def test_knn_graph(monkeypatch):
+    """
+    Test that large projects get a kNN graph that contains most of the exact nearest neighbors.
+
+    Args:
+        monkeypatch: Pytest fixture to set the maximal number of texts of pairwise distances.
+    """
+    monkeypatch.setattr(distances, "PAIRWISE_DISTANCES_MAX_TEXTS", 100)
+    rng = np.random.default_rng(0)
+    array = np.concatenate([rng.normal(loc=center, size=(100, 10)) for center in (-5.0, 0.0, 5.0)])
+    list_of_data_IDs = [str(i) for i in range(300)]
+    graph = distances.Distances.build(
+        list_of_data_IDs=list_of_data_IDs,
+        matrix=csr_matrix(array),
+        neighbors_index=neighbors_index.NeighborsIndex.build(
+            list_of_data_IDs=list_of_data_IDs, matrix=csr_matrix(array)
+        ),
+    )
+    assert graph.squared_distances is None
+    rows_1, rows_2, pairs_distances = graph.get_closest_candidates()
+    assert np.all(rows_1 < rows_2)
+    assert len(rows_1) <= 300 * distances.KNN_GRAPH_NB_NEIGHBORS
+
+    # Compare with the exact nearest neighbors.
+    exact_distances = pairwise_distances(array)
+    assert np.allclose(pairs_distances, exact_distances[rows_1, rows_2])
+    np.fill_diagonal(exact_distances, np.inf)
+    exact_neighbors = {(min(i, j), max(i, j)) for i in range(300) for j in np.argsort(exact_distances[i])[:5]}
+    assert len(exact_neighbors & set(zip(rows_1, rows_2))) >= 0.8 * len(exact_neighbors)
+
+
+# ==============================================================================
+# test_knn_graph_without_neighbors_index
+# ==============================================================================
+
+
+def test_knn_graph_without_neighbors_index(monkeypatch):
+    """
+    Test that large projects without neighbors index still get a kNN graph instead of pairwise distances.
+
+    Args:
+        monkeypatch: Pytest fixture to set the maximal number of texts of pairwise distances.
+    """
+    monkeypatch.setattr(distances, "PAIRWISE_DISTANCES_MAX_TEXTS", 100)
+    rng = np.random.default_rng(0)
+    array = rng.normal(size=(300, 10))
+    graph = distances.Distances.build(
+        list_of_data_IDs=[str(i) for i in range(300)],
+        matrix=csr_matrix(array),
+        neighbors_index=None,
+    )
+    assert graph.squared_distances is None
+    assert graph.knn_graph is not None
+    rows_1, rows_2, pairs_distances = graph.get_closest_candidates()
+    assert np.all(rows_1 < rows_2)
+    assert np.allclose(pairs_distances, pairwise_distances(array)[rows_1, rows_2])
+
+
+# ==============================================================================
+# test_store_and_load
+# ==============================================================================
+
+
+def test_store_and_load(tmp_path):
+    """
+    Test that distances are loaded unchanged (memory-mapped) until vectors are updated.
+
+    Args:
+        tmp_path: Pytest fixture providing a temporary directory.
+    """
+    dict_of_vectors = {str(i): csr_matrix(np.random.default_rng(i).normal(size=(1, 5))) for i in range(20)}
+    vectors.store_vectors(project_directory=tmp_path, dict_of_vectors=dict_of_vectors)
+
+    # Distances are computed when missing.
+    computed_distances = distances.get_distances(project_directory=tmp_path)
+    assert distances.DISTANCES_INDEX_NAME in os.listdir(tmp_path)
+    loaded_distances = distances.Distances.load(
+        project_directory=tmp_path,
+        vectors_version=vectors.get_vectors_version(project_directory=tmp_path),
+    )
+    assert loaded_distances is not None
+    assert loaded_distances.list_of_data_IDs == list(dict_of_vectors.keys())
+    assert isinstance(loaded_distances.squared_distances, np.memmap)
+    assert np.array_equal(loaded_distances.squared_distances, computed_distances.squared_distances)
+
+    # Updated vectors: distances are outdated, and computed again when needed.
+    os.utime(tmp_path / vectors.VECTORS_INDEX_NAME, ns=(0, 0))
+    assert (
+        distances.Distances.load(
+            project_directory=tmp_path,
+            vectors_version=vectors.get_vectors_version(project_directory=tmp_path),
+        )
+        is None
+    )
+    assert distances.get_distances(project_directory=tmp_path).squared_distances is not None
+
+    # Removed distances.
+    distances.remove_distances(project_directory=tmp_path)
+    assert distances.DISTANCES_INDEX_NAME not in os.listdir(tmp_path)
+    assert distances.PAIRWISE_DISTANCES_NAME not in os.listdir(tmp_path)
@@ -0,0 +1,96 @@
+# -*- coding: utf-8 -*-
+
+"""
+* Name:         interactive-clustering-gui/tests/test_utils_storage_executor.py
+* Description:  Unittests for `storage.executor` module (threads pool of blocking storage accesses).
+* Author:       Erwan Schild
+* Created:      18/10/2026
+* Licence:      CeCILL (https://cecill.info/licences.fr.html)
+"""
+
+# ==============================================================================
+# IMPORT PYTHON DEPENDENCIES
+# ==============================================================================
+
+import asyncio
+import gc
+import os
+import threading
+import time
+from typing import List
+
+import pytest
+
+from cognitivefactory.interactive_clustering_gui.storage import executor
+from cognitivefactory.interactive_clustering_gui.storage.executor import run_io, run_io_with_project_lock
+
+# ==============================================================================
+# test_run_io
+# ==============================================================================
+
+
+@pytest.mark.asyncio()
+async def test_run_io():
+    """
+    Test that blocking functions run outside of the event loop thread, with their arguments and their exceptions.
+    """
+
+    # Run a function with a keyword argument named `function`.
+    def get_thread_name(function: str) -> str:  # noqa: WPS430 (nested function)
+        """
+        Get the name of the current thread.
+
+        Args:
+            function (str): A keyword argument.
+
+        Returns:
+            str: The name of the current thread, followed by the keyword argument.
+        """
+
+        return threading.current_thread().name + function
+
+    assert (await run_io(get_thread_name, function="!")).startswith("storage-io")
+    assert (await run_io(get_thread_name, function="!")).endswith("!")
+
+    # Exceptions are raised in the caller.
+    with pytest.raises(ValueError, match="invalid"):
+        await run_io(int, "invalid")
+
+
+# ==============================================================================
+# test_run_io_with_project_lock
+# ==============================================================================
+
+
+@pytest.mark.asyncio()
+async def test_run_io_with_project_lock(tmp_path):
+    """
+    Test that locked functions on the same project never run at the same time.
+
+    Args:
+        tmp_path: Pytest fixture providing a temporary directory.
+    """
+
+    # Count running functions.
+    running: List[int] = [0]
+    max_running: List[int] = [0]
+
+    def update_project_data() -> None:  # noqa: WPS430 (nested function)
+        """
+        Simulate a slow update of project data.
+        """
+
+        running[0] += 1
+        max_running[0] = max(max_running[0], running[0])
+        time.sleep(0.01)
+        running[0] -= 1
+
+    # Run concurrent updates.
+    await asyncio.gather(
+        *[run_io_with_project_lock(project_directory=tmp_path, function=update_project_data) for _ in range(10)]
+    )
+    assert max_running[0] == 1
+
+    # The lock of the project is forgotten once no thread uses it (cf. project deletion).
+    gc.collect()
+    assert os.path.abspath(tmp_path) not in executor._project_thread_locks  # noqa: WPS437
@@ -0,0 +1,113 @@
+# -*- coding: utf-8 -*-
+
+"""
+* Name:         interactive-clustering-gui/tests/test_utils_storage_modelization.py
+* Description:  Unittests for `storage.modelization` module (compact storage of modelization inference).
+* Author:       Erwan Schild
+* Created:      18/10/2026
+* Licence:      CeCILL (https://cecill.info/licences.fr.html)
+"""
+
+# ==============================================================================
+# IMPORT PYTHON DEPENDENCIES
+# ==============================================================================
+
+import numpy as np
+
+from cognitivefactory.interactive_clustering.constraints.binary import BinaryConstraintsManager
+from cognitivefactory.interactive_clustering_gui.clustering import get_constraints_components
+from cognitivefactory.interactive_clustering_gui.storage import modelization
+
+# ==============================================================================
+# test_build_and_expand_modelization
+# ==============================================================================
+
+
+def test_build_and_expand_modelization():
+    """
+    Test that the compact modelization inference is expanded as the transitivity of the constraints manager.
+    """
+
+    # Build a constraints manager.
+    list_of_data_IDs = ["a", "b", "c", "d", "e", "f"]
+    list_of_constraints = [
+        ("a", "b", "MUST_LINK"),
+        ("b", "c", "MUST_LINK"),
+        ("d", "e", "MUST_LINK"),
+        ("c", "d", "CANNOT_LINK"),
+        ("a", "e", "CANNOT_LINK"),
+        ("f", "a", "CANNOT_LINK"),
+    ]
+    constraints_manager = BinaryConstraintsManager(list_of_data_IDs=list_of_data_IDs)
+    for data_ID1, data_ID2, constraint_type in list_of_constraints:
+        constraints_manager.add_constraint(data_ID1=data_ID1, data_ID2=data_ID2, constraint_type=constraint_type)
+
+    # Build the compact modelization inference.
+    components, cannot_links = get_constraints_components(
+        constraints_manager=constraints_manager,
+        list_of_constraints=list_of_constraints,
+    )
+    compact = modelization.build_modelization(
+        list_of_data_IDs=list_of_data_IDs,
+        components=components,
+        cannot_links=cannot_links,
+    )
+    assert compact == {
+        "COMPONENT": {"a": 0, "b": 0, "c": 0, "d": 1, "e": 1, "f": 2},
+        "CANNOT_LINK": {"0": [1, 2], "1": [0], "2": [0]},
+    }
+    assert modelization.compact_modelization(compact) is compact
+    assert modelization.is_compact_modelization(compact) is True
+    assert modelization.is_legacy_modelization(compact) is False
+
+    # Expand the modelization inference of each text.
+    constraints_transitivity = constraints_manager._constraints_transitivity  # noqa: WPS437
+    for data_ID in list_of_data_IDs:
+        expanded = modelization.expand_modelization(modelization=compact, data_ID=data_ID)
+        assert expanded is not None
+        assert expanded["COMPONENT"] == compact["COMPONENT"][data_ID]
+        assert set(expanded["MUST_LINK"]) == set(constraints_transitivity[data_ID]["MUST_LINK"].keys())
+        assert set(expanded["CANNOT_LINK"]) == set(constraints_transitivity[data_ID]["CANNOT_LINK"].keys())
+
+    # Case of text not modelized.
+    assert modelization.expand_modelization(modelization=compact, data_ID="UNKNOWN") is None
+
+
+# ==============================================================================
+# test_compact_legacy_modelization
+# ==============================================================================
+
+
+def test_compact_legacy_modelization():
+    """
+    Test that a legacy modelization inference (lists of inferred constraints of each text) is compacted.
+    """
+
+    # Compact a legacy modelization inference.
+    legacy = {
+        "0": {"MUST_LINK": ["1", "0"], "CANNOT_LINK": ["3"], "COMPONENT": 0},
+        "1": {"MUST_LINK": ["1", "0"], "CANNOT_LINK": ["3"], "COMPONENT": 0},
+        "3": {"MUST_LINK": ["3"], "CANNOT_LINK": ["1", "0"], "COMPONENT": 1},
+        "4": {"MUST_LINK": ["4"], "CANNOT_LINK": [], "COMPONENT": 2},
+    }
+    assert modelization.is_legacy_modelization(legacy) is True
+    assert modelization.is_compact_modelization(legacy) is False
+    compact = modelization.compact_modelization(legacy)
+    assert compact == {
+        "COMPONENT": {"0": 0, "1": 0, "3": 1, "4": 2},
+        "CANNOT_LINK": {"0": [1], "1": [0]},
+    }
+
+    # Expansion is the legacy modelization inference.
+    for data_ID, legacy_value in legacy.items():
+        expanded = modelization.expand_modelization(modelization=compact, data_ID=data_ID)
+        assert expanded is not None
+        assert expanded["COMPONENT"] == legacy_value["COMPONENT"]
+        assert sorted(expanded["MUST_LINK"]) == sorted(legacy_value["MUST_LINK"])
+        assert sorted(expanded["CANNOT_LINK"]) == sorted(legacy_value["CANNOT_LINK"])
+
+    # Case of texts without constraints.
+    assert modelization.build_modelization(list_of_data_IDs=["0", "1"], components=np.arange(2)) == {
+        "COMPONENT": {"0": 0, "1": 1},
+        "CANNOT_LINK": {},
+    }
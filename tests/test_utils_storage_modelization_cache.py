@@ -0,0 +1,132 @@
+# -*- coding: utf-8 -*-
+
+"""
+* Name:         interactive-clustering-gui/tests/test_utils_storage_modelization_cache.py
+* Description:  Unittests for `storage.modelization_cache` module (cached preprocessing and vectorization).
+* Author:       Erwan Schild
+* Created:      18/10/2026
+* Licence:      CeCILL (https://cecill.info/licences.fr.html)
+"""
+
+# ==============================================================================
+# IMPORT PYTHON DEPENDENCIES
+# ==============================================================================
+
+from typing import Dict, List
+
+from scipy.sparse import csr_matrix
+
+from cognitivefactory.interactive_clustering_gui.storage import modelization_cache
+
+# ==============================================================================
+# test_preprocess_with_cache
+# ==============================================================================
+
+
+def test_preprocess_with_cache(tmp_path, monkeypatch):
+    """
+    Test that only new or renamed texts are preprocessed, and that settings changes invalidate the cache.
+
+    Args:
+        tmp_path: Pytest fixture providing a temporary directory.
+        monkeypatch: Pytest fixture to replace the preprocessing method.
+    """
+
+    # Replace preprocessing by a fake one that records preprocessed texts.
+    preprocessed_calls: List[List[str]] = []
+
+    def fake_preprocess(dict_of_texts: Dict[str, str], **kwargs) -> Dict[str, str]:
+        preprocessed_calls.append(sorted(dict_of_texts.values()))
+        return {key: text.lower() for key, text in dict_of_texts.items()}
+
+    monkeypatch.setattr(modelization_cache, "preprocess", fake_preprocess)
+    settings = {
+        "apply_stopwords_deletion": False,
+        "apply_parsing_filter": False,
+        "apply_lemmatization": False,
+        "spacy_language_model": "fr_core_news_md",
+    }
+
+    # First run: all distinct texts are preprocessed.
+    assert modelization_cache.preprocess_with_cache(
+        project_directory=tmp_path,
+        dict_of_texts={"0": "A", "1": "B", "2": "A"},
+        **settings,
+    ) == {"0": "a", "1": "b", "2": "a"}
+    assert preprocessed_calls == [["A", "B"]]
+
+    # Second run with a renamed text: only the renamed text is preprocessed (and measured).
+    task_metrics: Dict[str, float] = {}
+    assert modelization_cache.preprocess_with_cache(
+        project_directory=tmp_path,
+        dict_of_texts={"0": "A", "1": "C", "2": "A"},
+        task_metrics=task_metrics,
+        **settings,
+    ) == {"0": "a", "1": "c", "2": "a"}
+    assert preprocessed_calls == [["A", "B"], ["C"]]
+    assert task_metrics["preprocessed_texts"] == 1
+    assert task_metrics["preprocessing_throughput"] > 0
+
+    # Third run without changes: nothing is preprocessed (and measured).
+    task_metrics = {}
+    modelization_cache.preprocess_with_cache(
+        project_directory=tmp_path,
+        dict_of_texts={"0": "A", "1": "C", "2": "A"},
+        task_metrics=task_metrics,
+        **settings,
+    )
+    assert preprocessed_calls == [["A", "B"], ["C"]]
+    assert task_metrics == {}
+
+    # Fourth run with other settings: all texts are preprocessed again.
+    modelization_cache.preprocess_with_cache(
+        project_directory=tmp_path,
+        dict_of_texts={"0": "A", "1": "C", "2": "A"},
+        **{**settings, "apply_lemmatization": True},
+    )
+    assert preprocessed_calls == [["A", "B"], ["C"], ["A", "C"]]
+
+
+# ==============================================================================
+# test_vectorize_with_cache
+# ==============================================================================
+
+
+def test_vectorize_with_cache(tmp_path, monkeypatch):
+    """
+    Test that only `spacy` vectors of new texts are computed, and that `tfidf` vectors are never cached.
+
+    Args:
+        tmp_path: Pytest fixture providing a temporary directory.
+        monkeypatch: Pytest fixture to replace the vectorization method.
+    """
+
+    # Replace vectorization by a fake one that records vectorized texts.
+    vectorized_calls: List[List[str]] = []
+
+    def fake_vectorize(dict_of_texts: Dict[str, str], vectorizer_type: str, **kwargs) -> Dict[str, csr_matrix]:
+        vectorized_calls.append(sorted(dict_of_texts.values()))
+        return {key: csr_matrix([[len(text), 1.0]]) for key, text in dict_of_texts.items()}
+
+    monkeypatch.setattr(modelization_cache, "vectorize", fake_vectorize)
+
+    # Case of `spacy` vectorizer: vectors are cached.
+    for _ in range(2):
+        vectors = modelization_cache.vectorize_with_cache(
+            project_directory=tmp_path,
+            dict_of_texts={"0": "aa", "1": "b"},
+            vectorizer_type="spacy",
+            spacy_language_model="fr_core_news_md",
+        )
+        assert vectors["0"].toarray().tolist() == [[2.0, 1.0]]
+    assert vectorized_calls == [["aa", "b"]]
+
+    # Case of `tfidf` vectorizer: vectors are always recomputed.
+    for _ in range(2):
+        modelization_cache.vectorize_with_cache(
+            project_directory=tmp_path,
+            dict_of_texts={"0": "aa", "1": "b"},
+            vectorizer_type="tfidf",
+            spacy_language_model="fr_core_news_md",
+        )
+    assert vectorized_calls == [["aa", "b"], ["aa", "b"], ["aa", "b"]]
@@ -0,0 +1,113 @@
+# -*- coding: utf-8 -*-
+
+"""
+* Name:         interactive-clustering-gui/tests/test_utils_storage_neighbors_index.py
+* Description:  Unittests for `storage.neighbors_index` module (approximate neighbors index of texts vectors).
+* Author:       Erwan Schild
+* Created:      18/10/2026
+* Licence:      CeCILL (https://cecill.info/licences.fr.html)
+"""
+
+# ==============================================================================
+# IMPORT PYTHON DEPENDENCIES
+# ==============================================================================
+
+import os
+
+import numpy as np
+from scipy.sparse import csr_matrix
+from sklearn.metrics import pairwise_distances
+
+from cognitivefactory.interactive_clustering_gui.storage import neighbors_index, vectors
+
+# ==============================================================================
+# test_candidates
+# ==============================================================================
+
+
+def test_candidates():
+    """
+    Test that candidate pairs are unique ordered pairs with exact distances, and that they contain the closest and farthest pairs.
+    """
+    rng = np.random.default_rng(0)
+    array = np.concatenate([rng.normal(loc=center, size=(100, 10)) for center in (-5.0, 0.0, 5.0)])
+    matrix = csr_matrix(array)
+    exact_distances = pairwise_distances(array)
+    index = neighbors_index.NeighborsIndex.build(list_of_data_IDs=[str(i) for i in range(300)], matrix=matrix)
+    assert index.projections.shape == (300, neighbors_index.NB_PROJECTIONS)
+    assert index.leaves.shape == (300, neighbors_index.NB_TREES)
+    assert np.bincount(index.leaves[:, 0]).max() <= neighbors_index.LEAF_SIZE
+
+    # Closest candidates: a small part of all pairs, with the closest pair.
+    rows_1, rows_2, distances = index.get_closest_candidates(matrix=matrix)
+    assert np.all(rows_1 < rows_2)
+    assert len(set(zip(rows_1, rows_2))) == len(rows_1) < 300 * 299 / 4
+    assert np.allclose(distances, exact_distances[rows_1, rows_2])
+    assert np.isclose(distances.min(), exact_distances[np.triu_indices(300, 1)].min())
+
+    # Farthest candidates: the farthest pair, and only pairs in the same group if groups are given.
+    rows_1, rows_2, distances = index.get_farthest_candidates(matrix=matrix)
+    assert np.all(rows_1 < rows_2)
+    assert np.allclose(distances, exact_distances[rows_1, rows_2])
+    assert np.isclose(distances.max(), exact_distances.max())
+    groups = np.repeat([0, 1, 2], 100)
+    rows_1, rows_2, distances = index.get_farthest_candidates(matrix=matrix, groups=groups)
+    assert np.all(groups[rows_1] == groups[rows_2])
+
+
+# ==============================================================================
+# test_store_and_load
+# ==============================================================================
+
+
+def test_store_and_load(tmp_path, monkeypatch):
+    """
+    Test that the neighbors index is only built for large projects, and that it is loaded unchanged until vectors are updated.
+
+    Args:
+        tmp_path: Pytest fixture providing a temporary directory.
+        monkeypatch: Pytest fixture to set the minimal number of texts of the index.
+    """
+    dict_of_vectors = {str(i): csr_matrix(np.random.default_rng(i).normal(size=(1, 5))) for i in range(50)}
+    vectors.store_vectors(project_directory=tmp_path, dict_of_vectors=dict_of_vectors)
+
+    # Small project: no index.
+    monkeypatch.setattr(neighbors_index, "NEIGHBORS_INDEX_MIN_TEXTS", 100)
+    assert neighbors_index.get_neighbors_index(project_directory=tmp_path) is None
+    assert neighbors_index.NEIGHBORS_INDEX_NAME not in os.listdir(tmp_path)
+
+    # Large project: index is built, stored and loaded unchanged.
+    monkeypatch.setattr(neighbors_index, "NEIGHBORS_INDEX_MIN_TEXTS", 10)
+    built_index = neighbors_index.update_neighbors_index(project_directory=tmp_path)
+    assert built_index is not None
+    assert neighbors_index.NEIGHBORS_INDEX_NAME in os.listdir(tmp_path)
+    loaded_index = neighbors_index.NeighborsIndex.load(
+        project_directory=tmp_path,
+        vectors_version=vectors.get_vectors_version(project_directory=tmp_path),
+    )
+    assert loaded_index is not None
+    assert loaded_index.list_of_data_IDs == list(dict_of_vectors.keys())
+    assert np.array_equal(loaded_index.projections, built_index.projections)
+    assert np.array_equal(loaded_index.leaves, built_index.leaves)
+
+    # Updated vectors: index is outdated, and rebuilt when needed.
+    os.utime(tmp_path / vectors.VECTORS_INDEX_NAME, ns=(0, 0))
+    assert (
+        neighbors_index.NeighborsIndex.load(
+            project_directory=tmp_path,
+            vectors_version=vectors.get_vectors_version(project_directory=tmp_path),
+        )
+        is None
+    )
+    assert neighbors_index.get_neighbors_index(project_directory=tmp_path) is not None
+    assert (
+        neighbors_index.NeighborsIndex.load(
+            project_directory=tmp_path,
+            vectors_version=vectors.get_vectors_version(project_directory=tmp_path),
+        )
+        is not None
+    )
+
+    # Removed index.
+    neighbors_index.remove_neighbors_index(project_directory=tmp_path)
+    assert neighbors_index.NEIGHBORS_INDEX_NAME not in os.listdir(tmp_path)
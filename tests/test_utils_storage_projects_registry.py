@@ -0,0 +1,88 @@
+# -*- coding: utf-8 -*-
+
+"""
+* Name:         interactive-clustering-gui/tests/test_utils_storage_projects_registry.py
+* Description:  Unittests for `storage.projects_registry` module (registry of existing projects).
+* Author:       Erwan Schild
+* Created:      18/10/2026
+* Licence:      CeCILL (https://cecill.info/licences.fr.html)
+"""
+
+# ==============================================================================
+# IMPORT PYTHON DEPENDENCIES
+# ==============================================================================
+
+import json
+import os
+
+from cognitivefactory.interactive_clustering_gui.storage.projects_registry import ProjectsRegistry
+
+# ==============================================================================
+# test_project_ids
+# ==============================================================================
+
+
+def test_project_ids(tmp_path):
+    """
+    Test that the data directory is only listed again when it is modified, and that projects copied by hand are detected.
+
+    Args:
+        tmp_path: Pytest fixture providing a temporary directory.
+    """
+
+    # Create projects, and age the data directory (a recent modification is always listed again).
+    registry = ProjectsRegistry()
+    os.mkdir(tmp_path / "0a")
+    os.mkdir(tmp_path / "0b")
+    with open(tmp_path / "not_a_project.txt", "w") as fileobject:
+        fileobject.write("")
+    os.utime(tmp_path, ns=(0, 10**9))
+
+    # Existence checks don't list the data directory again.
+    assert sorted(registry.get_project_ids(data_directory=tmp_path)) == ["0a", "0b"]
+    assert registry.exists(data_directory=tmp_path, project_id="0a")
+    assert not registry.exists(data_directory=tmp_path, project_id="not_a_project.txt")
+    assert registry.listings == 1
+
+    # Unregister a project before deleting it.
+    registry.remove(data_directory=tmp_path, project_id="0b")
+    assert not registry.exists(data_directory=tmp_path, project_id="0b")
+    os.rmdir(tmp_path / "0b")
+
+    # Copy a project by hand: it is detected.
+    os.mkdir(tmp_path / "0c")
+    assert sorted(registry.get_project_ids(data_directory=tmp_path)) == ["0a", "0c"]
+    assert registry.listings == 2
+
+
+# ==============================================================================
+# test_summaries
+# ==============================================================================
+
+
+def test_summaries(tmp_path):
+    """
+    Test that listing summaries are kept until project files are modified, and that incomplete projects are ignored.
+
+    Args:
+        tmp_path: Pytest fixture providing a temporary directory.
+    """
+
+    # Create a project and an incomplete project.
+    registry = ProjectsRegistry()
+    os.mkdir(tmp_path / "0a")
+    os.mkdir(tmp_path / "0b")
+    for file_name, content in (("metadata.json", {"project_name": "a"}), ("status.json", {"state": "SAMPLING_TODO"})):
+        with open(tmp_path / "0a" / file_name, "w") as fileobject:
+            json.dump(content, fileobject)
+        os.utime(tmp_path / "0a" / file_name, ns=(0, 10**9))
+
+    # Get summaries twice: the summary is kept.
+    summaries = registry.get_summaries(data_directory=tmp_path)
+    assert summaries == {"0a": {"metadata": {"project_name": "a"}, "status": {"state": "SAMPLING_TODO"}}}
+    assert registry.get_summaries(data_directory=tmp_path)["0a"] is summaries["0a"]
+
+    # Modify the status: the summary is updated.
+    with open(tmp_path / "0a" / "status.json", "w") as fileobject:
+        json.dump({"state": "SAMPLING_PENDING"}, fileobject)
+    assert registry.get_summaries(data_directory=tmp_path)["0a"]["status"] == {"state": "SAMPLING_PENDING"}
@@ -0,0 +1,98 @@
+# -*- coding: utf-8 -*-
+
+"""
+* Name:         interactive-clustering-gui/tests/test_utils_storage_vectors.py
+* Description:  Unittests for `storage.vectors` module (columnar storage of texts vectors).
+* Author:       Erwan Schild
+* Created:      18/10/2026
+* Licence:      CeCILL (https://cecill.info/licences.fr.html)
+"""
+
+# ==============================================================================
+# IMPORT PYTHON DEPENDENCIES
+# ==============================================================================
+
+import os
+import pickle  # noqa: S403
+
+import numpy as np
+from scipy.sparse import csr_matrix
+
+from cognitivefactory.interactive_clustering_gui.storage import vectors
+
+# ==============================================================================
+# test_store_and_load_vectors
+# ==============================================================================
+
+
+def test_store_and_load_vectors(tmp_path):
+    """
+    Test that stored vectors are loaded unchanged, as a memory-mapped matrix and as a dictionary of rows.
+
+    Args:
+        tmp_path: Pytest fixture providing a temporary directory.
+    """
+
+    # Store vectors.
+    dict_of_vectors = {
+        "0": csr_matrix([[1.0, 0.0, 2.0]]),
+        "2": csr_matrix([[0.0, 0.0, 0.0]]),
+        "1": csr_matrix([[0.0, 3.0, 0.0]]),
+    }
+    assert vectors.get_vectors_version(project_directory=tmp_path) is None
+    vectors.store_vectors(project_directory=tmp_path, dict_of_vectors=dict_of_vectors)
+    assert vectors.get_vectors_version(project_directory=tmp_path) is not None
+    assert vectors.VECTORS_INDEX_NAME in os.listdir(tmp_path)
+
+    # Load vectors as a matrix: IDs keep their order, and components are memory-mapped.
+    list_of_data_IDs, matrix = vectors.load_vectors_matrix(project_directory=tmp_path)
+    assert list_of_data_IDs == ["0", "2", "1"]
+    assert matrix.shape == (3, 3)
+    assert not matrix.data.flags.owndata
+    assert np.array_equal(matrix.toarray(), [[1.0, 0.0, 2.0], [0.0, 0.0, 0.0], [0.0, 3.0, 0.0]])
+
+    # Load vectors as a dictionary of rows.
+    loaded_vectors = vectors.load_vectors(project_directory=tmp_path)
+    assert list(loaded_vectors.keys()) == ["0", "2", "1"]
+    for data_ID, vector in dict_of_vectors.items():
+        assert loaded_vectors[data_ID].shape == (1, 3)
+        assert np.array_equal(loaded_vectors[data_ID].toarray(), vector.toarray())
+    assert (loaded_vectors["0"] @ loaded_vectors["1"].T).toarray()[0, 0] == 0.0
+
+    # Remove vectors.
+    vectors.remove_vectors(project_directory=tmp_path)
+    assert vectors.get_vectors_version(project_directory=tmp_path) is None
+    assert os.listdir(tmp_path) == []
+
+
+# ==============================================================================
+# test_load_legacy_vectors
+# ==============================================================================
+
+
+def test_load_legacy_vectors(tmp_path):
+    """
+    Test that legacy vectors (a pickled dictionary of rows) are loaded, and replaced on next storage.
+
+    Args:
+        tmp_path: Pytest fixture providing a temporary directory.
+    """
+
+    # Store legacy vectors.
+    dict_of_vectors = {
+        "0": csr_matrix([[1.0, 0.0]]),
+        "1": csr_matrix([[0.0, 2.0]]),
+    }
+    with open(tmp_path / vectors.LEGACY_VECTORS_NAME, "wb") as legacy_vectors_fileobject:
+        pickle.dump(dict_of_vectors, legacy_vectors_fileobject, pickle.HIGHEST_PROTOCOL)
+    assert vectors.get_vectors_version(project_directory=tmp_path) is not None
+
+    # Load legacy vectors.
+    list_of_data_IDs, matrix = vectors.load_vectors_matrix(project_directory=tmp_path)
+    assert list_of_data_IDs == ["0", "1"]
+    assert np.array_equal(matrix.toarray(), [[1.0, 0.0], [0.0, 2.0]])
+    assert np.array_equal(vectors.load_vectors(project_directory=tmp_path)["1"].toarray(), [[0.0, 2.0]])
+
+    # Store vectors: legacy vectors are removed.
+    vectors.store_vectors(project_directory=tmp_path, dict_of_vectors=dict_of_vectors)
+    assert vectors.LEGACY_VECTORS_NAME not in os.listdir(tmp_path)
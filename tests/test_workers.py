@@ -0,0 +1,167 @@
+# -*- coding: utf-8 -*-
+
+"""
+* Name:         interactive-clustering-gui/tests/test_workers.py
+* Description:  Unittests for the `workers` module.
+* Author:       Erwan Schild
+* Created:      18/10/2026
+* Licence:      CeCILL (https://cecill.info/licences.fr.html)
+"""
+
+# ==============================================================================
+# IMPORT PYTHON DEPENDENCIES
+# ==============================================================================
+
+import json
+import time
+
+from cognitivefactory.interactive_clustering_gui import nlp, workers
+from tests.dummies_utils import create_dummy_projects
+
+# ==============================================================================
+# test_recover
+# ==============================================================================
+
+
+def test_recover(tmp_path, monkeypatch):
+    """
+    Test that interrupted tasks are requeued in the order of their requests (then sweeps not computed), and that other job files are removed.
+
+    Args:
+        tmp_path: Pytest fixture providing a temporary directory.
+        monkeypatch: Pytest fixture to avoid starting worker processes.
+    """
+
+    # Create dummy projects.
+    create_dummy_projects(
+        tmp_path=tmp_path,
+        list_of_dummy_project_ids=[
+            "0a_INITIALIZATION_WITHOUT_MODELIZATION",
+            "0c_INITIALIZATION_WITH_WORKING_MODELIZATION",
+            "1b_SAMPLING_PENDING",
+            "1o_CLUSTERING_WORKING",
+            "1d_ANNOTATION_WITH_UPTODATE_MODELIZATION",
+            "1l_ANNOTATION_WITH_UPTODATE_MODELIZATION",
+        ],
+    )
+    (tmp_path / "0a_INITIALIZATION_WITHOUT_MODELIZATION" / workers.JOB_FILE_NAME).write_text("{}")
+    for project_id, sweep_task in (
+        ("1d_ANNOTATION_WITH_UPTODATE_MODELIZATION", None),
+        ("1l_ANNOTATION_WITH_UPTODATE_MODELIZATION", {"progression": 30, "detail": "..."}),
+    ):
+        (tmp_path / project_id / workers.backgroundtasks.CLUSTERING_SWEEP_NAME).write_text(
+            json.dumps({"parameters": {}, "task": sweep_task, "results": None, "metrics": None})
+        )
+    for project_id, enqueue_timestamp in (
+        ("0c_INITIALIZATION_WITH_WORKING_MODELIZATION", 3.0),
+        ("1b_SAMPLING_PENDING", 2.0),
+        ("1o_CLUSTERING_WORKING", 1.0),
+    ):
+        (tmp_path / project_id / workers.JOB_FILE_NAME).write_text(
+            json.dumps({"task_name": "unknown", "enqueue_timestamp": enqueue_timestamp})
+        )
+
+    # Recover tasks without starting worker processes.
+    workers_pool = workers.WorkersPool(workers_number=1)
+    monkeypatch.setattr(workers_pool, "_start_supervisor", lambda: None)
+    assert workers_pool.recover(data_directory=tmp_path) == [
+        "1o_CLUSTERING_WORKING",
+        "1b_SAMPLING_PENDING",
+        "0c_INITIALIZATION_WITH_WORKING_MODELIZATION",
+        "1l_ANNOTATION_WITH_UPTODATE_MODELIZATION",
+    ]
+    assert [(project_id, task_name) for _, project_id, task_name in workers_pool._queue] == [
+        ("1o_CLUSTERING_WORKING", "constrained_clustering"),
+        ("1b_SAMPLING_PENDING", "constraints_sampling"),
+        ("0c_INITIALIZATION_WITH_WORKING_MODELIZATION", "modelization_update"),
+        ("1l_ANNOTATION_WITH_UPTODATE_MODELIZATION", "clustering_sweep"),
+    ]
+
+    # Check that "working" states are back to "pending" states.
+    with open(tmp_path / "1o_CLUSTERING_WORKING" / "status.json", "r") as status_fileobject:
+        assert json.load(status_fileobject)["state"] == "CLUSTERING_PENDING"
+    with open(tmp_path / "0c_INITIALIZATION_WITH_WORKING_MODELIZATION" / "status.json", "r") as status_fileobject:
+        assert json.load(status_fileobject)["state"] == "INITIALIZATION_WITH_PENDING_MODELIZATION"
+
+    # Check job files.
+    assert not (tmp_path / "0a_INITIALIZATION_WITHOUT_MODELIZATION" / workers.JOB_FILE_NAME).exists()
+    assert (tmp_path / "1b_SAMPLING_PENDING" / workers.JOB_FILE_NAME).exists()
+
+    # Cancel a task that doesn't lock the project state: the state and the job file are kept.
+    assert (
+        workers_pool.cancel(data_directory=tmp_path, project_id="1b_SAMPLING_PENDING", task_names={"clustering_sweep"})
+        is False
+    )
+    assert len(workers_pool._queue) == 4
+    assert (tmp_path / "1b_SAMPLING_PENDING" / workers.JOB_FILE_NAME).exists()
+    with open(tmp_path / "1b_SAMPLING_PENDING" / "status.json", "r") as status_fileobject:
+        assert json.load(status_fileobject)["state"] == "SAMPLING_PENDING"
+
+    # Cancel a queued task.
+    assert workers_pool.cancel(data_directory=tmp_path, project_id="1b_SAMPLING_PENDING") is True
+    assert len(workers_pool._queue) == 3
+    assert not (tmp_path / "1b_SAMPLING_PENDING" / workers.JOB_FILE_NAME).exists()
+    with open(tmp_path / "1b_SAMPLING_PENDING" / "status.json", "r") as status_fileobject:
+        assert json.load(status_fileobject)["state"] == "SAMPLING_TODO"
+
+
+# ==============================================================================
+# test_failed_task
+# ==============================================================================
+
+
+def test_failed_task(tmp_path):
+    """
+    Test that a task failing in its worker process restores the project state before the task request.
+
+    Args:
+        tmp_path: Pytest fixture providing a temporary directory.
+    """
+
+    # Create dummy projects (its status file refers to missing settings, so the sampling task fails).
+    create_dummy_projects(
+        tmp_path=tmp_path,
+        list_of_dummy_project_ids=[
+            "1b_SAMPLING_PENDING",
+        ],
+    )
+    (tmp_path / "1b_SAMPLING_PENDING" / "settings.json").write_text("{}")
+
+    # Run the task in a worker process, and wait for its end.
+    workers_pool = workers.WorkersPool(workers_number=1)
+    workers_pool.enqueue(data_directory=tmp_path, project_id="1b_SAMPLING_PENDING", task_name="constraints_sampling")
+    for _ in range(600):
+        with workers_pool._lock:
+            if len(workers_pool._queue) == 0 and len(workers_pool._running) == 0:  # noqa: WPS507
+                break
+        time.sleep(0.1)
+    workers_pool.shutdown()
+
+    # Check that the state is restored.
+    with open(tmp_path / "1b_SAMPLING_PENDING" / "status.json", "r") as status_fileobject:
+        project_status = json.load(status_fileobject)
+    assert project_status["state"] == "SAMPLING_TODO"
+    assert project_status["task"] is None
+    assert not (tmp_path / "1b_SAMPLING_PENDING" / workers.JOB_FILE_NAME).exists()
+
+
+# ==============================================================================
+# test_warm_up
+# ==============================================================================
+
+
+def test_warm_up():
+    """
+    Test that the workers pool waits for the preloading of tasks dependencies, and reports the preloaded spaCy models.
+    """
+
+    # Warm up the workers pool (only installed models are preloaded).
+    workers_pool = workers.WorkersPool(workers_number=1)
+    preloaded_models = workers_pool.warm_up()
+    assert set(preloaded_models) <= set(nlp.SPACY_PRELOADED_MODELS)
+
+    # Next worker processes start without loading delay.
+    start = time.perf_counter()
+    assert workers_pool.warm_up() == preloaded_models
+    if workers.START_METHOD == "forkserver":
+        assert time.perf_counter() - start < 1.0